@@ -15,6 +15,7 @@ from datetime import datetime
 import json
 
 from marcus_app.core.database import get_db
+from marcus_app.core.counters import read_counters
 from marcus_app.core.models import Item, Mission, Class
 from marcus_app.services.agent_router import AgentRouter
 
@@ -69,7 +70,7 @@ confirmation_counter = 0
 # ============================================================================
 
 @router.post("/command", response_model=CommandResponse)
-async def process_command(
+def process_command(
     request: CommandRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -121,7 +122,7 @@ async def process_command(
         )
 
     # Execute action immediately
-    result = await execute_action(
+    result = execute_action(
         route_result['intent'],
         route_result['action'],
         db
@@ -131,7 +132,7 @@ async def process_command(
 
 
 @router.post("/confirm", response_model=CommandResponse)
-async def confirm_action(
+def confirm_action(
     request: ConfirmActionRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -153,7 +154,7 @@ async def confirm_action(
         )
 
     # Execute confirmed action
-    result = await execute_action(
+    result = execute_action(
         pending['intent'],
         pending['action'],
         db
@@ -166,35 +167,35 @@ async def confirm_action(
 # ACTION EXECUTORS
 # ============================================================================
 
-async def execute_action(intent: str, action: dict, db: Session) -> CommandResponse:
+def execute_action(intent: str, action: dict, db: Session) -> CommandResponse:
     """
     Execute action based on intent.
     Returns CommandResponse with result message and action card.
     """
 
     if intent in ('create_task', 'create_note', 'create_event'):
-        return await execute_create_item(action, db)
+        return execute_create_item(action, db)
 
     elif intent == 'create_mission':
-        return await execute_create_mission(action, db)
+        return execute_create_mission(action, db)
 
     elif intent == 'show_inbox':
-        return await execute_show_inbox(db)
+        return execute_show_inbox(db)
 
     elif intent == 'clear_inbox':
-        return await execute_clear_inbox(db)
+        return execute_clear_inbox(db)
 
     elif intent == 'whats_next':
-        return await execute_whats_next(db)
+        return execute_whats_next(db)
 
     elif intent == 'whats_due':
-        return await execute_whats_due(action, db)
+        return execute_whats_due(action, db)
 
     elif intent == 'show_blocked':
-        return await execute_show_blocked(db)
+        return execute_show_blocked(db)
 
     elif intent == 'mission_status':
-        return await execute_mission_status(db)
+        return execute_mission_status(db)
 
     else:
         return CommandResponse(
@@ -205,7 +206,7 @@ async def execute_action(intent: str, action: dict, db: Session) -> CommandRespo
         )
 
 
-async def execute_create_item(action: dict, db: Session) -> CommandResponse:
+def execute_create_item(action: dict, db: Session) -> CommandResponse:
     """Create an item (task/note/event)."""
 
     item = Item(
@@ -253,7 +254,7 @@ async def execute_create_item(action: dict, db: Session) -> CommandResponse:
     )
 
 
-async def execute_create_mission(action: dict, db: Session) -> CommandResponse:
+def execute_create_mission(action: dict, db: Session) -> CommandResponse:
     """Create a mission."""
 
     mission = Mission(
@@ -272,7 +273,7 @@ async def execute_create_mission(action: dict, db: Session) -> CommandResponse:
     if action.get('class_id'):
         cls = db.query(Class).filter(Class.id == action['class_id']).first()
         if cls:
-            class_display = f" for {cls.class_code}"
+            class_display = f" for {cls.code}"
 
     message = f"Created mission \"{action['name']}\"{class_display}. State: draft."
 
@@ -297,7 +298,7 @@ async def execute_create_mission(action: dict, db: Session) -> CommandResponse:
     )
 
 
-async def execute_show_inbox(db: Session) -> CommandResponse:
+def execute_show_inbox(db: Session) -> CommandResponse:
     """Show inbox items."""
 
     items = db.query(Item).filter(Item.status == 'inbox').order_by(Item.created_at.desc()).limit(10).all()
@@ -342,7 +343,7 @@ async def execute_show_inbox(db: Session) -> CommandResponse:
     )
 
 
-async def execute_clear_inbox(db: Session) -> CommandResponse:
+def execute_clear_inbox(db: Session) -> CommandResponse:
     """Accept all inbox items."""
 
     items = db.query(Item).filter(Item.status == 'inbox').all()
@@ -372,7 +373,7 @@ async def execute_clear_inbox(db: Session) -> CommandResponse:
     )
 
 
-async def execute_whats_next(db: Session) -> CommandResponse:
+def execute_whats_next(db: Session) -> CommandResponse:
     """Show next tasks/items."""
 
     # Get active items, prioritize by due date and context
@@ -423,7 +424,7 @@ async def execute_whats_next(db: Session) -> CommandResponse:
     )
 
 
-async def execute_whats_due(action: dict, db: Session) -> CommandResponse:
+def execute_whats_due(action: dict, db: Session) -> CommandResponse:
     """Show items due soon."""
 
     time_filter = action['filters'].get('time_filter', 'all')
@@ -489,7 +490,7 @@ async def execute_whats_due(action: dict, db: Session) -> CommandResponse:
     )
 
 
-async def execute_show_blocked(db: Session) -> CommandResponse:
+def execute_show_blocked(db: Session) -> CommandResponse:
     """Show blocked missions."""
 
     missions = db.query(Mission).filter(Mission.state == 'blocked').all()
@@ -508,7 +509,7 @@ async def execute_show_blocked(db: Session) -> CommandResponse:
         if mission.class_id:
             cls = db.query(Class).filter(Class.id == mission.class_id).first()
             if cls:
-                class_display = f" ({cls.class_code})"
+                class_display = f" ({cls.code})"
 
         mission_list.append({
             'id': mission.id,
@@ -535,13 +536,14 @@ async def execute_show_blocked(db: Session) -> CommandResponse:
     )
 
 
-async def execute_mission_status(db: Session) -> CommandResponse:
+def execute_mission_status(db: Session) -> CommandResponse:
     """Show overall mission status."""
 
-    draft_count = db.query(Mission).filter(Mission.state == 'draft').count()
-    active_count = db.query(Mission).filter(Mission.state == 'active').count()
-    blocked_count = db.query(Mission).filter(Mission.state == 'blocked').count()
-    done_count = db.query(Mission).filter(Mission.state == 'done').count()
+    counts = read_counters(db, 'mission_state')
+    draft_count = counts.get('draft', 0)
+    active_count = counts.get('active', 0)
+    blocked_count = counts.get('blocked', 0)
+    done_count = counts.get('done', 0)
 
     total = draft_count + active_count + blocked_count + done_count
 
@@ -586,7 +588,7 @@ def format_context_display(context_kind: str, context_id: Optional[int], db: Ses
     """Format context for display."""
     if context_kind == 'class' and context_id:
         cls = db.query(Class).filter(Class.id == context_id).first()
-        return cls.class_code if cls else f"Class #{context_id}"
+        return cls.code if cls else f"Class #{context_id}"
     elif context_kind == 'personal':
         return "Personal"
     else:
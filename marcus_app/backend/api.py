@@ -4,7 +4,6 @@ Main API routes and application setup.
 """
 
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, Cookie, Response, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -12,9 +11,12 @@ from sqlalchemy.orm import Session
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
+from functools import lru_cache
+import asyncio
 import json
 
-from ..core.database import get_db, init_db, ACTIVE_MOUNT
+from ..core.database import get_db, init_db, get_active_mount
+from ..core.executors import run_in_pool, run_blocking, pool_stats, shutdown_process_pools
 from ..core.models import (
     Class, Assignment, Artifact, ExtractedText, Plan, AuditLog, SystemConfig,
     Claim, ClaimVerification, InboxItem, Deadline, TextChunk, StudyPack
@@ -49,32 +51,57 @@ from dotenv import load_dotenv
 import os
 load_dotenv(Path(__file__).parent.parent.parent / "marcus.env")
 
-# Paths - ALWAYS use ACTIVE_MOUNT (M:\Marcus or dev storage/packaging_temp)
+# Paths - vault ALWAYS lives on the active mount (M:\Marcus or dev storage/packaging_temp)
 # Don't rely on env vars since they're hardcoded to M:\
 BASE_PATH = Path(__file__).parent.parent.parent
-VAULT_PATH = ACTIVE_MOUNT / "vault"
 PROJECTS_PATH = BASE_PATH / "projects"
 EXPORTS_PATH = BASE_PATH / "exports"
 INBOX_PATH = BASE_PATH / "inbox"
 FRONTEND_PATH = BASE_PATH / "marcus_app" / "frontend"
 
 # Ensure directories exist
-VAULT_PATH.mkdir(exist_ok=True, parents=True)
 PROJECTS_PATH.mkdir(exist_ok=True, parents=True)
 EXPORTS_PATH.mkdir(exist_ok=True, parents=True)
 INBOX_PATH.mkdir(exist_ok=True, parents=True)
 
-# Initialize services
-file_service = FileService(VAULT_PATH)
+# Initialize services (cheap ones only - storage/model-backed services are lazy below)
 extraction_service = ExtractionService()
 export_service = ExportService(EXPORTS_PATH)
 claim_service = ClaimService()
 inbox_service = InboxService(INBOX_PATH)
 deadline_service = DeadlineService()
 chunking_service = ChunkingService()
-search_service = SearchService()
 auth_service = AuthService()
 
+
+@lru_cache(maxsize=None)
+def get_vault_path() -> Path:
+    """Vault directory on the active mount. Resolves the mount on first call."""
+    vault_path = get_active_mount() / "vault"
+    vault_path.mkdir(exist_ok=True, parents=True)
+    return vault_path
+
+
+@lru_cache(maxsize=None)
+def get_file_service() -> FileService:
+    return FileService(get_vault_path())
+
+
+@lru_cache(maxsize=None)
+def get_search_service() -> SearchService:
+    """
+    Search service is created in the startup hook (or on first search), not at
+    import. The embedding model loads on a background thread; set
+    MARCUS_EMBEDDING_IDLE_UNLOAD_SECONDS to evict it when semantic search is idle,
+    and MARCUS_EMBEDDING_BACKEND (sentence-transformers | onnx | onnx-int8) to
+    pick the embedding backend.
+    """
+    idle_unload = float(os.getenv("MARCUS_EMBEDDING_IDLE_UNLOAD_SECONDS", "0") or 0)
+    return SearchService(
+        idle_unload_seconds=idle_unload or None,
+        embedding_backend=os.getenv("MARCUS_EMBEDDING_BACKEND") or None
+    )
+
 # Create FastAPI app
 app = FastAPI(title="Marcus API", version="0.36.0")
 
@@ -100,10 +127,18 @@ def get_current_session(session_token: Optional[str] = Cookie(None, alias="marcu
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    reclaim_stale_boxes()
+    reconcile_dashboard_counters()
+    app.state.counter_reconciler = asyncio.create_task(reconcile_counters_periodically())
+    app.state.undo_sweeper = asyncio.create_task(sweep_undo_events_periodically())
+    app.state.session_sweeper = asyncio.create_task(sweep_sessions_periodically())
+    vault_path = get_vault_path()
+    from ..services.box_runner import BoxRunner
+    BoxRunner.search_service = get_search_service()  # Starts embedding warm-up; AskBox shares it
     print("=" * 70)
     print("Marcus v0.36 - Auth Wall Enabled")
     print("=" * 70)
-    print(f"Vault: {VAULT_PATH}")
+    print(f"Vault: {vault_path}")
     print(f"Projects: {PROJECTS_PATH}")
     print(f"Exports: {EXPORTS_PATH}")
     print("")
@@ -115,6 +150,92 @@ async def startup_event():
     print("=" * 70)
 
 
+def reclaim_stale_boxes():
+    """Free mission boxes left RUNNING by a crashed/killed previous process."""
+    from ..core.database import SessionLocal
+    from ..services.box_runner import BoxRunner
+
+    db = SessionLocal()
+    try:
+        reclaimed = BoxRunner.reclaim_stale_boxes(db)
+        if reclaimed:
+            print(f"[Startup] Reclaimed {reclaimed} interrupted mission box(es)")
+    finally:
+        db.close()
+
+
+# Dashboard counter reconciliation interval (catches writes that bypass the ORM)
+COUNTER_RECONCILE_SECONDS = int(os.getenv("MARCUS_COUNTER_RECONCILE_SECONDS", "900"))
+
+
+def reconcile_dashboard_counters():
+    """Recount dashboard counters from items/missions and fix any drift."""
+    from ..core.database import SessionLocal
+    from ..core.counters import reconcile_counters
+
+    db = SessionLocal()
+    try:
+        drift = reconcile_counters(db)
+        if drift:
+            print(f"[Counters] Corrected {len(drift)} dashboard counter(s)")
+    finally:
+        db.close()
+
+
+async def reconcile_counters_periodically():
+    while True:
+        await asyncio.sleep(COUNTER_RECONCILE_SECONDS)
+        try:
+            await run_blocking("maintenance", reconcile_dashboard_counters)
+        except Exception as e:
+            print(f"[Counters] Reconciliation failed: {e}")
+
+
+# Expired undo event sweep interval (undo window is 10 seconds)
+UNDO_SWEEP_SECONDS = int(os.getenv("MARCUS_UNDO_SWEEP_SECONDS", "300"))
+
+
+def sweep_undo_events():
+    """Bulk-delete expired undo events."""
+    from ..core.database import SessionLocal
+    from ..services.undo_service import UndoService
+
+    db = SessionLocal()
+    try:
+        UndoService(db).cleanup_expired_events()
+    finally:
+        db.close()
+
+
+async def sweep_undo_events_periodically():
+    while True:
+        await asyncio.sleep(UNDO_SWEEP_SECONDS)
+        try:
+            await run_blocking("maintenance", sweep_undo_events)
+        except Exception as e:
+            print(f"[Undo] Sweep failed: {e}")
+
+
+# Idle session sweep interval (sessions time out after 15 minutes idle)
+SESSION_SWEEP_SECONDS = int(os.getenv("MARCUS_SESSION_SWEEP_SECONDS", "60"))
+
+
+async def sweep_sessions_periodically():
+    # In-memory heap pops only; cheap enough for the event loop
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_SECONDS)
+        auth_service.sweep_expired_sessions()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    for name in ("counter_reconciler", "undo_sweeper", "session_sweeper"):
+        task = getattr(app.state, name, None)
+        if task:
+            task.cancel()
+    shutdown_process_pools()
+
+
 # ============================================================================
 # HEALTH CHECK ENDPOINT (Public - no auth required)
 # ============================================================================
@@ -125,11 +246,17 @@ async def health_check():
     Health check endpoint for monitoring and launcher verification.
     Returns immediately without requiring authentication or database.
     Used by desktop launcher to verify backend is running.
+
+    `search` reports whether semantic search is ready (hybrid) or still
+    warming up / unloaded (fts5). `pools` shows active/queued work on the
+    bounded git/extraction pools.
     """
     return {
         "status": "ok",
         "version": app.version,
-        "service": app.title
+        "service": app.title,
+        "search": get_search_service().get_status(),
+        "pools": pool_stats()
     }
 
 
@@ -304,7 +431,7 @@ def get_status(db: Session = Depends(get_db)):
     return SystemStatus(
         online_mode=online_mode,
         db_path=str(BASE_PATH / "storage" / "marcus.db"),
-        vault_path=str(VAULT_PATH),
+        vault_path=str(get_vault_path()),
         total_classes=total_classes,
         total_assignments=total_assignments,
         total_artifacts=total_artifacts
@@ -466,7 +593,7 @@ async def upload_artifact(
     file_content = await file.read()
 
     # Save file
-    artifact = file_service.save_file(
+    artifact = get_file_service().save_file(
         file_content=file_content,
         original_filename=file.filename,
         assignment_id=assignment_id,
@@ -495,6 +622,7 @@ async def upload_artifact(
 # ============================================================================
 
 @app.post("/api/artifacts/{artifact_id}/extract", response_model=ExtractedTextResponse)
+@run_in_pool("extraction")
 def extract_text(artifact_id: int, db: Session = Depends(get_db)):
     """Extract text from an artifact."""
     artifact = db.query(Artifact).filter(Artifact.id == artifact_id).first()
@@ -729,6 +857,34 @@ async def upload_to_inbox(file: UploadFile = File(...), db: Session = Depends(ge
     return inbox_item
 
 
+@app.post("/api/inbox/upload/batch", response_model=List[InboxItemResponse])
+def upload_batch_to_inbox(files: List[UploadFile] = File(...), db: Session = Depends(get_db)):
+    """
+    Drop several files into the inbox at once.
+    All files are classified against one class/assignment snapshot and
+    stored in a single commit.
+    """
+    inbox_items = inbox_service.add_many_to_inbox(
+        [(upload.filename, upload.file.read()) for upload in files],
+        db=db
+    )
+
+    # Log the upload
+    audit_log = AuditLog(
+        event_type="inbox_upload",
+        online_mode="offline",
+        user_action=f"Uploaded {len(files)} files to inbox",
+        extra_data=json.dumps({
+            "inbox_item_ids": [item.id for item in inbox_items],
+            "suggested_class_ids": [item.suggested_class_id for item in inbox_items]
+        })
+    )
+    db.add(audit_log)
+    db.commit()
+
+    return inbox_items
+
+
 @app.post("/api/inbox/{inbox_item_id}/classify", response_model=ArtifactResponse)
 def classify_inbox_item(
     inbox_item_id: int,
@@ -868,7 +1024,7 @@ def search_chunks(request: SearchRequest, db: Session = Depends(get_db)):
     Search through text chunks with hybrid ranking.
     Falls back to FTS5 if embeddings unavailable.
     """
-    results = search_service.search(
+    results = get_search_service().search(
         query=request.query,
         class_id=request.class_id,
         assignment_id=request.assignment_id,
@@ -901,7 +1057,7 @@ def get_chunk_context(chunk_id: int, context_chunks: int = 1, db: Session = Depe
     Get a chunk with surrounding context.
     Used when user clicks a search result.
     """
-    context = search_service.get_chunk_with_context(
+    context = get_search_service().get_chunk_with_context(
         chunk_id=chunk_id,
         context_chunks=context_chunks,
         db=db
@@ -914,6 +1070,7 @@ def get_chunk_context(chunk_id: int, context_chunks: int = 1, db: Session = Depe
 
 
 @app.post("/api/artifacts/{artifact_id}/chunk")
+@run_in_pool("extraction")
 def chunk_artifact(artifact_id: int, db: Session = Depends(get_db)):
     """
     Chunk an artifact's extracted text.
@@ -934,8 +1091,8 @@ def chunk_artifact(artifact_id: int, db: Session = Depends(get_db)):
     # Chunk each extracted text
     total_chunks = 0
     for extracted_text in extracted_texts:
-        chunks = chunking_service.chunk_extracted_text(extracted_text, db)
-        total_chunks += len(chunks)
+        chunk_ids = chunking_service.chunk_extracted_text(extracted_text, db)
+        total_chunks += len(chunk_ids)
 
     # Log chunking
     audit_log = AuditLog(
@@ -958,20 +1115,30 @@ def chunk_artifact(artifact_id: int, db: Session = Depends(get_db)):
 
 
 @app.post("/api/chunks/batch-process")
+@run_in_pool("extraction")
 def batch_chunk_all(force_rechunk: bool = False, db: Session = Depends(get_db)):
     """
     Process all extracted texts that don't have chunks yet.
     Useful for migrations and bulk operations.
+
+    If the embedding model is ready, also embeds chunks that have no vector
+    from the active backend (recorded in TextChunk.embedding_model).
     """
     chunked_count = chunking_service.chunk_all_extracted_texts(db, force_rechunk)
 
+    search_service = get_search_service()
+    embedded_count = 0
+    if search_service.embeddings_available:
+        embedded_count = search_service.embedding_service.embed_pending_chunks(db)
+
     audit_log = AuditLog(
         event_type="batch_chunking",
         online_mode="offline",
         user_action=f"Batch chunked {chunked_count} extracted texts",
         extra_data=json.dumps({
             "force_rechunk": force_rechunk,
-            "chunked_count": chunked_count
+            "chunked_count": chunked_count,
+            "embedded_count": embedded_count
         })
     )
     db.add(audit_log)
@@ -979,6 +1146,7 @@ def batch_chunk_all(force_rechunk: bool = False, db: Session = Depends(get_db)):
 
     return {
         "chunked_count": chunked_count,
+        "embedded_count": embedded_count,
         "message": "Batch chunking complete"
     }
 
@@ -1154,7 +1322,7 @@ async def upload_file_for_chat(
         db.refresh(artifact)
         
         # Save file to vault
-        vault_file = VAULT_PATH / f"artifact_{artifact.id}_{file.filename}"
+        vault_file = get_vault_path() / f"artifact_{artifact.id}_{file.filename}"
         vault_file.write_bytes(file_content)
         
         # Try to extract text if it's a PDF or text file
@@ -1162,7 +1330,7 @@ async def upload_file_for_chat(
         if file.filename.lower().endswith('.pdf'):
             try:
                 from ..services.extraction_service import ExtractionService
-                extraction_svc = ExtractionService(VAULT_PATH)
+                extraction_svc = ExtractionService(get_vault_path())
                 text_content = extraction_svc.extract_text_from_pdf(vault_file)
                 extracted_text = ExtractedText(
                     artifact_id=artifact.id,
@@ -1445,7 +1613,10 @@ def chat_endpoint(
 
 # Login page (public)
 @app.get("/login")
-async def serve_login():
+async def serve_login(request: Request):
+    login_page = static_files.manifest.get("login.html") if static_files else None
+    if login_page:
+        return asset_response(login_page, request.headers)
     login_path = FRONTEND_PATH / "login.html"
     if login_path.exists():
         return FileResponse(login_path)
@@ -1462,36 +1633,24 @@ async def serve_frontend(
     if not session_token or not auth_service.validate_session(session_token):
         return RedirectResponse(url="/login")
 
-    # Serve main app
+    # Serve main app (asset URLs rewritten to content-versioned ones)
+    index_page = static_files.manifest.get("index.html") if static_files else None
+    if index_page:
+        return asset_response(index_page, request.headers)
     index_path = FRONTEND_PATH / "index.html"
     if index_path.exists():
         return FileResponse(index_path)
     return {"message": "Marcus API is running. Frontend not found."}
 
 
-# Protected static files - require auth for all UI pages
-class AuthStaticFiles(StaticFiles):
-    async def __call__(self, scope, receive, send):
-        request = Request(scope, receive=receive)
-
-        # Allow login page
-        if request.url.path.endswith("login.html"):
-            return await super().__call__(scope, receive, send)
-
-        # Check auth for all other pages
-        session_token = request.cookies.get("marcus_session")
-        if not session_token or not auth_service.validate_session(session_token):
-            # Redirect to login
-            response = RedirectResponse(url="/login")
-            await response(scope, receive, send)
-            return
-
-        return await super().__call__(scope, receive, send)
-
+# Mount static files with auth check (require auth for all UI pages except login;
+# assets are hashed, precompressed and cached at startup, see static_assets.py)
+from .static_assets import AuthStaticFiles, asset_response
 
-# Mount static files with auth check
+static_files = None
 if FRONTEND_PATH.exists():
-    app.mount("/static", AuthStaticFiles(directory=str(FRONTEND_PATH)), name="static")
+    static_files = AuthStaticFiles(directory=str(FRONTEND_PATH), validate_session=auth_service.validate_session)
+    app.mount("/static", static_files, name="static")
 
 
 # ============================================================================
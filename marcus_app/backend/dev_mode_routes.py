@@ -18,6 +18,7 @@ import json
 from datetime import datetime
 
 from marcus_app.core.database import get_db
+from marcus_app.core.executors import run_in_pool
 from marcus_app.core.models import DevChangeSet, DevChangeSetFile, Project
 from marcus_app.core.schemas import (
     GitStatusResponse, GitDiffResponse, GitBranchCreateRequest,
@@ -65,7 +66,8 @@ def require_online_mode(
 # ============================================================================
 
 @router.get("/{project_id}/git/status", response_model=GitStatusResponse)
-async def get_git_status(
+@run_in_pool("git")
+def get_git_status(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -83,7 +85,8 @@ async def get_git_status(
 
 
 @router.get("/{project_id}/git/diff", response_model=GitDiffResponse)
-async def get_git_diff(
+@run_in_pool("git")
+def get_git_diff(
     project_id: int,
     staged_only: bool = False,
     db: Session = Depends(get_db),
@@ -113,7 +116,8 @@ async def get_git_diff(
 # ============================================================================
 
 @router.post("/{project_id}/git/init")
-async def init_git_repo(
+@run_in_pool("git")
+def init_git_repo(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -136,7 +140,8 @@ async def init_git_repo(
 
 
 @router.post("/{project_id}/git/branch", response_model=dict)
-async def create_branch(
+@run_in_pool("git")
+def create_branch(
     project_id: int,
     request: GitBranchCreateRequest,
     db: Session = Depends(get_db),
@@ -160,7 +165,8 @@ async def create_branch(
 
 
 @router.get("/{project_id}/git/branches", response_model=List[str])
-async def list_branches(
+@run_in_pool("git")
+def list_branches(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -178,7 +184,8 @@ async def list_branches(
 
 
 @router.post("/{project_id}/git/checkout", response_model=dict)
-async def checkout_branch(
+@run_in_pool("git")
+def checkout_branch(
     project_id: int,
     branch_name: str,
     db: Session = Depends(get_db),
@@ -206,7 +213,8 @@ async def checkout_branch(
 # ============================================================================
 
 @router.post("/{project_id}/git/stage")
-async def stage_files(
+@run_in_pool("git")
+def stage_files(
     project_id: int,
     request: GitStageRequest,
     db: Session = Depends(get_db),
@@ -230,7 +238,8 @@ async def stage_files(
 
 
 @router.post("/{project_id}/git/stage-all")
-async def stage_all(
+@run_in_pool("git")
+def stage_all(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -249,7 +258,8 @@ async def stage_all(
 
 
 @router.post("/{project_id}/git/commit")
-async def commit_changes(
+@run_in_pool("git")
+def commit_changes(
     project_id: int,
     request: GitCommitRequest,
     db: Session = Depends(get_db),
@@ -283,7 +293,8 @@ async def commit_changes(
 # ============================================================================
 
 @router.post("/{project_id}/git/revert-file")
-async def revert_file(
+@run_in_pool("git")
+def revert_file(
     project_id: int,
     filepath: str,
     db: Session = Depends(get_db),
@@ -307,7 +318,8 @@ async def revert_file(
 # ============================================================================
 
 @router.post("/{project_id}/changesets", response_model=DevChangeSetResponse)
-async def create_changeset(
+@run_in_pool("git")
+def create_changeset(
     project_id: int,
     request: DevChangeSetCreateRequest,
     db: Session = Depends(get_db),
@@ -382,7 +394,7 @@ async def create_changeset(
 
 
 @router.get("/{project_id}/changesets", response_model=List[DevChangeSetResponse])
-async def list_changesets(
+def list_changesets(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -400,7 +412,7 @@ async def list_changesets(
 
 
 @router.get("/{project_id}/changesets/{changeset_id}", response_model=DevChangeSetResponse)
-async def get_changeset(
+def get_changeset(
     project_id: int,
     changeset_id: int,
     db: Session = Depends(get_db),
@@ -419,7 +431,7 @@ async def get_changeset(
 
 
 @router.post("/{project_id}/changesets/{changeset_id}/export")
-async def export_changeset(
+def export_changeset(
     project_id: int,
     changeset_id: int,
     request: DevChangeSetExportRequest,
@@ -452,7 +464,7 @@ async def export_changeset(
 
 
 @router.delete("/{project_id}/changesets/{changeset_id}")
-async def delete_changeset(
+def delete_changeset(
     project_id: int,
     changeset_id: int,
     db: Session = Depends(get_db),
@@ -476,7 +488,8 @@ async def delete_changeset(
 # ============================================================================
 
 @router.post("/{project_id}/git/push")
-async def push_branch(
+@run_in_pool("git")
+def push_branch(
     project_id: int,
     branch_name: Optional[str] = None,
     force: bool = False,
@@ -561,7 +574,8 @@ async def push_branch(
 
 
 @router.post("/{project_id}/github/create-pr")
-async def create_pull_request(
+@run_in_pool("git")
+def create_pull_request(
     project_id: int,
     title: str,
     body: Optional[str] = None,
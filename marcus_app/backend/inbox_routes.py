@@ -5,14 +5,17 @@ API endpoints for unified inbox and item management.
 Supports Quick Add, Inbox workflow, and item operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select, or_, and_
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel
 from datetime import datetime
+import hashlib
 import json
 
 from marcus_app.core.database import get_db
+from marcus_app.core.counters import inbox_stats
 from marcus_app.core.models import Item
 from marcus_app.services.item_classifier import classify_item, should_auto_file
 
@@ -82,7 +85,7 @@ class PinItemRequest(BaseModel):
 # ============================================================================
 
 @router.post("/quick-add")
-async def quick_add_item(
+def quick_add_item(
     request: QuickAddRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -145,50 +148,143 @@ async def quick_add_item(
 # INBOX LIST ENDPOINT
 # ============================================================================
 
+# ItemResponse fields selectable with ?fields=, and the column each is read from
+ITEM_FIELDS = {
+    'id': Item.id,
+    'item_type': Item.item_type,
+    'title': Item.title,
+    'content_md': Item.content_md,
+    'status': Item.status,
+    'context_kind': Item.context_kind,
+    'context_id': Item.context_id,
+    'confidence': Item.confidence,
+    'suggested_route_json': Item.suggested_route_json,
+    'tags': Item.tags_json,
+    'pinned': Item.pinned,
+    'due_at': Item.due_at,
+    'created_at': Item.created_at,
+    'filed_at': Item.filed_at,
+}
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+FIELD_FORMATTERS = {
+    'tags': lambda tags_json: json.loads(tags_json) if tags_json else [],
+    'pinned': bool,
+    'due_at': _iso,
+    'created_at': _iso,
+    'filed_at': _iso,
+}
+
+
+def _parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """Requested field names in ItemResponse order (all when not given)."""
+    if not fields:
+        return tuple(ITEM_FIELDS)
+    requested = {name.strip() for name in fields.split(',') if name.strip()}
+    unknown = requested - set(ITEM_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(name for name in ITEM_FIELDS if name in requested)
+
+
+def encode_item_cursor(created_at: datetime, item_id: int) -> str:
+    """Keyset cursor: '<created_at ISO>|<id>'."""
+    return f"{created_at.isoformat()}|{item_id}"
+
+
+def decode_item_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, item_id = cursor.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, AttributeError):
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
+def _page_etag(field_names: Tuple[str, ...], keys, limit: int) -> str:
+    """ETag of a page: requested fields, (id, updated_at) of its rows, has-more flag."""
+    digest = hashlib.sha1(','.join(field_names).encode())
+    for item_id, updated_at in keys[:limit]:
+        digest.update(f"|{item_id}:{updated_at}".encode())
+    digest.update(b"+" if len(keys) > limit else b".")
+    return f'W/"{digest.hexdigest()[:20]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {tag.strip() for tag in if_none_match.split(',')}
+    return '*' in candidates or etag in candidates or etag[2:] in candidates
+
+
 @router.get("/items")
-async def list_inbox_items(
+def list_inbox_items(
+    request: Request,
+    response: Response,
     status: str = 'inbox',
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
 ):
     """
-    List items by status.
+    List items by status, newest first (created_at DESC, id DESC).
 
     Query params:
     - status: inbox|active|done|archived|snoozed (default: inbox)
-    - limit: max items to return (default: 100)
-    """
+    - limit: page size (default: 100, max: 500)
+    - cursor: Keyset cursor from the previous page's X-Next-Cursor header
+    - fields: Comma-separated item fields to return (default: all). Other
+      columns are not read, e.g. fields=id,title,created_at skips content_md
 
-    query = db.query(Item).filter(Item.status == status)
+    Pages carry an ETag; a matching If-None-Match gets 304 Not Modified
+    after a key-only query, without loading or serializing items.
+    """
+    field_names = _parse_fields(fields)
 
+    conditions = [Item.status == status]
     # Exclude snoozed items that haven't reached snooze_until
     if status == 'inbox':
-        query = query.filter(
-            (Item.snooze_until.is_(None)) |
-            (Item.snooze_until <= datetime.utcnow())
-        )
-
-    items = query.order_by(Item.created_at.desc()).limit(limit).all()
+        conditions.append(or_(Item.snooze_until.is_(None), Item.snooze_until <= datetime.utcnow()))
+    if cursor:
+        created_at, item_id = decode_item_cursor(cursor)
+        conditions.append(or_(
+            Item.created_at < created_at,
+            and_(Item.created_at == created_at, Item.id < item_id)
+        ))
+    order = (Item.created_at.desc(), Item.id.desc())
+
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match:
+        keys = db.execute(
+            select(Item.id, Item.updated_at).where(*conditions).order_by(*order).limit(limit + 1)
+        ).all()
+        etag = _page_etag(field_names, keys, limit)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': 'private, no-cache'})
+
+    columns = list(dict.fromkeys(
+        [Item.id, Item.created_at, Item.updated_at] + [ITEM_FIELDS[name] for name in field_names]
+    ))
+    # One extra row tells whether there is a next page
+    rows = db.execute(select(*columns).where(*conditions).order_by(*order).limit(limit + 1)).all()
+
+    response.headers['ETag'] = _page_etag(
+        field_names, [(row._mapping[Item.id], row._mapping[Item.updated_at]) for row in rows], limit
+    )
+    response.headers['Cache-Control'] = 'private, no-cache'
+    if len(rows) > limit:
+        last = rows[limit - 1]._mapping
+        response.headers['X-Next-Cursor'] = encode_item_cursor(last[Item.created_at], last[Item.id])
 
     return [
-        ItemResponse(
-            id=item.id,
-            item_type=item.item_type,
-            title=item.title,
-            content_md=item.content_md,
-            status=item.status,
-            context_kind=item.context_kind,
-            context_id=item.context_id,
-            confidence=item.confidence,
-            suggested_route_json=item.suggested_route_json,
-            tags=json.loads(item.tags_json) if item.tags_json else [],
-            pinned=bool(item.pinned),
-            due_at=item.due_at.isoformat() if item.due_at else None,
-            created_at=item.created_at.isoformat(),
-            filed_at=item.filed_at.isoformat() if item.filed_at else None
-        )
-        for item in items
+        {
+            name: FIELD_FORMATTERS.get(name, lambda value: value)(row._mapping[ITEM_FIELDS[name]])
+            for name in field_names
+        }
+        for row in rows[:limit]
     ]
 
 
@@ -197,7 +293,7 @@ async def list_inbox_items(
 # ============================================================================
 
 @router.post("/accept")
-async def accept_item(
+def accept_item(
     request: AcceptItemRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -229,7 +325,7 @@ async def accept_item(
 
 
 @router.post("/change-route")
-async def change_item_route(
+def change_item_route(
     request: ChangeRouteRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -261,7 +357,7 @@ async def change_item_route(
 
 
 @router.post("/snooze")
-async def snooze_item(
+def snooze_item(
     request: SnoozeItemRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -296,7 +392,7 @@ async def snooze_item(
 
 
 @router.post("/pin")
-async def pin_item(
+def pin_item(
     request: PinItemRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -327,7 +423,7 @@ async def pin_item(
 # ============================================================================
 
 @router.get("/items/{item_id}")
-async def get_item(
+def get_item(
     item_id: int,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -357,7 +453,7 @@ async def get_item(
 
 
 @router.delete("/items/{item_id}")
-async def delete_item(
+def delete_item(
     item_id: int,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -379,7 +475,7 @@ async def delete_item(
 # ============================================================================
 
 @router.get("/stats")
-async def get_inbox_stats(
+def get_inbox_stats(
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
 ):
@@ -388,30 +484,10 @@ async def get_inbox_stats(
 
     Returns counts for:
     - Inbox items (needs review)
-    - Due soon (next 24 hours)
+    - Due soon (rest of today)
     - Overdue
-    """
-
-    now = datetime.utcnow()
-    tomorrow = datetime.utcnow().replace(hour=23, minute=59, second=59)
-
-    inbox_count = db.query(Item).filter(Item.status == 'inbox').count()
-
-    due_soon_count = db.query(Item).filter(
-        Item.status == 'active',
-        Item.due_at.isnot(None),
-        Item.due_at <= tomorrow,
-        Item.due_at >= now
-    ).count()
 
-    overdue_count = db.query(Item).filter(
-        Item.status == 'active',
-        Item.due_at.isnot(None),
-        Item.due_at < now
-    ).count()
-
-    return {
-        'inbox_count': inbox_count,
-        'due_soon_count': due_soon_count,
-        'overdue_count': overdue_count
-    }
+    Read from the dashboard counters (core/counters.py); only items due
+    today are counted from the items table.
+    """
+    return inbox_stats(db)
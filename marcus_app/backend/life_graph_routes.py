@@ -10,20 +10,23 @@ V0.40: LIFE-GRAPH ENDPOINT (Stub)
 
 Currently a MINIMAL MVP - feature-flagged OFF by default.
 
+v0.53: the graph is maintained incrementally (marcus_app.core.life_graph);
+clients can fetch changes since a version or a k-hop neighbourhood.
+
 Future work: Real-time graph UI, 3D visualization, graph algorithms, etc.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Cookie
+from fastapi import APIRouter, Depends, HTTPException, Cookie, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict
+from typing import Optional
 from datetime import datetime
 
 from marcus_app.core.database import get_db
-from marcus_app.core.models import (
-    LifeGraphNode, LifeGraphEdge,
-    Class, Project, StudyPack, Artifact,
-    SystemConfig, Mission, MissionBox, MissionArtifact
+from marcus_app.core.life_graph import (
+    ensure_life_graph, bump_version, changes_since, live_graph, neighbourhood
 )
+from marcus_app.core.models import LifeGraphNode, LifeGraphEdge, SystemConfig
 from marcus_app.core.schemas import LifeGraphNodeResponse, LifeGraphEdgeResponse, LifeGraphResponse
 
 
@@ -51,16 +54,26 @@ def is_life_graph_enabled(db: Session) -> bool:
 # ============================================================================
 
 @router.get("/life-graph", response_model=LifeGraphResponse)
-async def get_life_graph(
+def get_life_graph(
+    since_version: Optional[int] = Query(None, ge=0),
+    focus_node_id: Optional[int] = None,
+    hops: int = Query(1, ge=1, le=4),
+    max_nodes: int = Query(500, ge=1, le=5000),
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
 ):
     """
-    Retrieve the complete life-graph of knowledge.
+    Retrieve the life-graph of knowledge.
     
-    Returns nodes (classes, projects, study packs, artifacts) and edges (relationships).
+    Returns nodes (classes, projects, study packs, artifacts, missions) and
+    edges (relationships). The graph is built on first request and kept
+    current as entities change.
     
-    Currently a STUB - returns minimal MVP with basic structure.
+    - since_version: only nodes/edges changed after that version, removals
+      included as deleted=true
+    - focus_node_id: only the subgraph within `hops` edges of that node
+      (at most max_nodes nodes)
+    - neither: the whole live graph
     """
     # Check if enabled
     if not is_life_graph_enabled(db):
@@ -69,13 +82,20 @@ async def get_life_graph(
             detail="Life-Graph feature is currently disabled. Contact admin to enable."
         )
     
-    # Get all nodes
-    nodes = db.query(LifeGraphNode).all()
-    edges = db.query(LifeGraphEdge).all()
-    
-    # If no data yet, generate from existing entities
-    if not nodes:
-        nodes = _generate_initial_graph(db)
+    version = ensure_life_graph(db)
+    
+    if since_version is not None:
+        nodes, edges = changes_since(db, since_version)
+    elif focus_node_id is not None:
+        focus = db.query(LifeGraphNode.id).filter(
+            LifeGraphNode.id == focus_node_id,
+            LifeGraphNode.deleted == False
+        ).first()
+        if not focus:
+            raise HTTPException(status_code=404, detail="Focus node not found")
+        nodes, edges = neighbourhood(db, focus_node_id, hops=hops, max_nodes=max_nodes)
+    else:
+        nodes, edges = live_graph(db)
     
     # Convert to response models
     node_responses = [
@@ -87,7 +107,8 @@ async def get_life_graph(
             description=n.description or "",
             x=n.x or 0,
             y=n.y or 0,
-            z=n.z or 0
+            z=n.z or 0,
+            deleted=bool(n.deleted)
         )
         for n in nodes
     ]
@@ -97,7 +118,8 @@ async def get_life_graph(
             id=e.id,
             source_node_id=e.source_node_id,
             target_node_id=e.target_node_id,
-            edge_type=e.edge_type
+            edge_type=e.edge_type,
+            deleted=bool(e.deleted)
         )
         for e in edges
     ]
@@ -107,184 +129,13 @@ async def get_life_graph(
         edges=edge_responses,
         node_count=len(node_responses),
         edge_count=len(edge_responses),
-        generated_at=datetime.utcnow()
+        generated_at=datetime.utcnow(),
+        version=version
     )
 
 
-def _generate_initial_graph(db: Session) -> List[LifeGraphNode]:
-    """
-    Generate initial graph from existing entities.
-
-    Creates nodes for:
-    - Classes (highest level)
-    - Projects (user's dev projects)
-    - Study Packs (learning artifacts)
-    - Artifacts (vault files, notes, etc)
-    - Missions (v0.44-final: workflow missions)
-    - MissionBoxes (v0.44-final: box operations)
-    - MissionArtifacts (v0.44-final: mission outputs)
-
-    And edges for relationships between them.
-    """
-    nodes = []
-    edges = []
-    next_node_id = 1
-    next_edge_id = 1
-    node_map = {}  # Track entity_type:entity_id -> node_id
-
-    # 1. Add Class nodes
-    classes = db.query(Class).limit(20).all()  # Limit to avoid huge graph
-    for cls in classes:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='class',
-            entity_id=cls.id,
-            label=cls.name,
-            description=f"Class: {cls.number if hasattr(cls, 'number') else 'Unknown'}",
-            x=0, y=0, z=0
-        )
-        nodes.append(node)
-        node_map[f'class:{cls.id}'] = next_node_id
-        next_node_id += 1
-
-    # 2. Add Project nodes
-    projects = db.query(Project).limit(20).all()
-    for proj in projects:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='project',
-            entity_id=proj.id,
-            label=proj.name,
-            description=f"Project: {proj.description[:50] if proj.description else 'No description'}",
-            x=10, y=0, z=0
-        )
-        nodes.append(node)
-        node_map[f'project:{proj.id}'] = next_node_id
-        next_node_id += 1
-
-    # 3. Add StudyPack nodes
-    study_packs = db.query(StudyPack).limit(20).all()
-    for pack in study_packs:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='study_pack',
-            entity_id=pack.id,
-            label=pack.name,
-            description=f"Study Pack: {pack.description[:50] if pack.description else 'No description'}",
-            x=5, y=10, z=0
-        )
-        nodes.append(node)
-        node_map[f'study_pack:{pack.id}'] = next_node_id
-        next_node_id += 1
-
-    # 4. Add Artifact nodes
-    artifacts = db.query(Artifact).limit(20).all()
-    for artifact in artifacts:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='artifact',
-            entity_id=artifact.id,
-            label=artifact.name,
-            description=f"Artifact: {artifact.artifact_type}",
-            x=7, y=5, z=0
-        )
-        nodes.append(node)
-        node_map[f'artifact:{artifact.id}'] = next_node_id
-        next_node_id += 1
-
-    # 5. Add Mission nodes (v0.44-final)
-    missions = db.query(Mission).limit(20).all()
-    for mission in missions:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='mission',
-            entity_id=mission.id,
-            label=mission.name,
-            description=f"Mission: {mission.mission_type} ({mission.state})",
-            x=-5, y=5, z=5
-        )
-        nodes.append(node)
-        node_map[f'mission:{mission.id}'] = next_node_id
-
-        # Create edge: class -> mission (if mission has class_id)
-        if mission.class_id and f'class:{mission.class_id}' in node_map:
-            edge = LifeGraphEdge(
-                id=next_edge_id,
-                source_node_id=node_map[f'class:{mission.class_id}'],
-                target_node_id=next_node_id,
-                edge_type='contains'
-            )
-            edges.append(edge)
-            next_edge_id += 1
-
-        next_node_id += 1
-
-    # 6. Add MissionBox nodes (v0.44-final)
-    mission_boxes = db.query(MissionBox).limit(50).all()
-    for box in mission_boxes:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='mission_box',
-            entity_id=box.id,
-            label=f"{box.box_type}",
-            description=f"Box: {box.box_type} ({box.state})",
-            x=-3, y=7, z=5
-        )
-        nodes.append(node)
-        node_map[f'mission_box:{box.id}'] = next_node_id
-
-        # Create edge: mission -> box
-        if f'mission:{box.mission_id}' in node_map:
-            edge = LifeGraphEdge(
-                id=next_edge_id,
-                source_node_id=node_map[f'mission:{box.mission_id}'],
-                target_node_id=next_node_id,
-                edge_type='contains'
-            )
-            edges.append(edge)
-            next_edge_id += 1
-
-        next_node_id += 1
-
-    # 7. Add MissionArtifact nodes (v0.44-final)
-    mission_artifacts = db.query(MissionArtifact).limit(50).all()
-    for ma in mission_artifacts:
-        node = LifeGraphNode(
-            id=next_node_id,
-            node_type='mission_artifact',
-            entity_id=ma.id,
-            label=ma.title[:30],
-            description=f"Artifact: {ma.artifact_type}",
-            x=-1, y=9, z=5
-        )
-        nodes.append(node)
-        node_map[f'mission_artifact:{ma.id}'] = next_node_id
-
-        # Create edge: box -> artifact
-        if ma.box_id and f'mission_box:{ma.box_id}' in node_map:
-            edge = LifeGraphEdge(
-                id=next_edge_id,
-                source_node_id=node_map[f'mission_box:{ma.box_id}'],
-                target_node_id=next_node_id,
-                edge_type='contains'
-            )
-            edges.append(edge)
-            next_edge_id += 1
-
-        next_node_id += 1
-
-    # Save all nodes and edges
-    for node in nodes:
-        db.add(node)
-    for edge in edges:
-        db.add(edge)
-    db.commit()
-
-    return nodes
-
-
 @router.get("/life-graph/stats")
-async def get_life_graph_stats(
+def get_life_graph_stats(
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
 ):
@@ -292,16 +143,16 @@ async def get_life_graph_stats(
     if not is_life_graph_enabled(db):
         raise HTTPException(status_code=423, detail="Life-Graph feature is disabled")
     
-    node_count = db.query(LifeGraphNode).count()
-    edge_count = db.query(LifeGraphEdge).count()
-    
-    node_types = {}
-    for node in db.query(LifeGraphNode.node_type).distinct():
-        count = db.query(LifeGraphNode).filter(LifeGraphNode.node_type == node[0]).count()
-        node_types[node[0]] = count
+    node_types = dict(
+        db.query(LifeGraphNode.node_type, func.count(LifeGraphNode.id))
+        .filter(LifeGraphNode.deleted == False)
+        .group_by(LifeGraphNode.node_type)
+        .all()
+    )
+    edge_count = db.query(func.count(LifeGraphEdge.id)).filter(LifeGraphEdge.deleted == False).scalar()
     
     return {
-        "total_nodes": node_count,
+        "total_nodes": sum(node_types.values()),
         "total_edges": edge_count,
         "node_types": node_types,
         "enabled": True
@@ -309,7 +160,7 @@ async def get_life_graph_stats(
 
 
 @router.post("/life-graph/enable")
-async def enable_life_graph(
+def enable_life_graph(
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
 ):
@@ -330,7 +181,7 @@ async def enable_life_graph(
 
 
 @router.post("/life-graph/disable")
-async def disable_life_graph(
+def disable_life_graph(
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
 ):
@@ -347,7 +198,7 @@ async def disable_life_graph(
 
 
 @router.get("/life-graph/nodes")
-async def get_graph_nodes(
+def get_graph_nodes(
     node_type: Optional[str] = None,
     entity_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -357,7 +208,7 @@ async def get_graph_nodes(
     if not is_life_graph_enabled(db):
         raise HTTPException(status_code=423, detail="Life-Graph feature is disabled")
     
-    query = db.query(LifeGraphNode)
+    query = db.query(LifeGraphNode).filter(LifeGraphNode.deleted == False)
     
     if node_type:
         query = query.filter(LifeGraphNode.node_type == node_type)
@@ -380,7 +231,7 @@ async def get_graph_nodes(
 
 
 @router.get("/life-graph/edges")
-async def get_graph_edges(
+def get_graph_edges(
     source_id: Optional[int] = None,
     target_id: Optional[int] = None,
     edge_type: Optional[str] = None,
@@ -391,7 +242,7 @@ async def get_graph_edges(
     if not is_life_graph_enabled(db):
         raise HTTPException(status_code=423, detail="Life-Graph feature is disabled")
     
-    query = db.query(LifeGraphEdge)
+    query = db.query(LifeGraphEdge).filter(LifeGraphEdge.deleted == False)
     
     if source_id:
         query = query.filter(LifeGraphEdge.source_node_id == source_id)
@@ -416,7 +267,7 @@ async def get_graph_edges(
 
 
 @router.post("/life-graph/add-edge")
-async def add_graph_edge(
+def add_graph_edge(
     source_id: int,
     target_id: int,
     edge_type: str,
@@ -440,8 +291,8 @@ async def add_graph_edge(
         raise HTTPException(status_code=400, detail=f"Invalid edge_type. Must be one of: {', '.join(valid_types)}")
     
     # Check that nodes exist
-    source = db.query(LifeGraphNode).filter(LifeGraphNode.id == source_id).first()
-    target = db.query(LifeGraphNode).filter(LifeGraphNode.id == target_id).first()
+    source = db.query(LifeGraphNode).filter(LifeGraphNode.id == source_id, LifeGraphNode.deleted == False).first()
+    target = db.query(LifeGraphNode).filter(LifeGraphNode.id == target_id, LifeGraphNode.deleted == False).first()
     
     if not source or not target:
         raise HTTPException(status_code=404, detail="Source or target node not found")
@@ -453,17 +304,24 @@ async def add_graph_edge(
         LifeGraphEdge.edge_type == edge_type
     ).first()
     
-    if existing:
+    if existing and not existing.deleted:
         raise HTTPException(status_code=409, detail="Edge already exists")
     
-    edge = LifeGraphEdge(
-        source_node_id=source_id,
-        target_node_id=target_id,
-        edge_type=edge_type,
-        created_at=datetime.utcnow()
-    )
-    
-    db.add(edge)
+    version = bump_version(db.connection()) or 0
+    if existing:
+        # Revive the tombstone so clients syncing by version see it again
+        edge = existing
+        edge.deleted = False
+        edge.version = version
+    else:
+        edge = LifeGraphEdge(
+            source_node_id=source_id,
+            target_node_id=target_id,
+            edge_type=edge_type,
+            version=version,
+            created_at=datetime.utcnow()
+        )
+        db.add(edge)
     db.commit()
     
     return {
@@ -5,12 +5,15 @@ API endpoints for mission management (read-only + template creation).
 Box execution will be added in v0.44-beta.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
+import json
 from pydantic import BaseModel
 
 from marcus_app.core.database import get_db
+from marcus_app.core.executors import run_in_pool, run_blocking
 from marcus_app.services.mission_service import MissionService, MissionServiceError
 
 
@@ -55,7 +58,7 @@ def require_auth():
 # ============================================================================
 
 @router.post("/create")
-async def create_mission(
+def create_mission(
     request: CreateMissionRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -89,7 +92,7 @@ async def create_mission(
 
 
 @router.post("/create-from-template")
-async def create_from_template(
+def create_from_template(
     request: CreateFromTemplateRequest,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -136,10 +139,13 @@ async def create_from_template(
 
 
 @router.get("")
-async def list_missions(
+def list_missions(
+    response: Response,
     class_id: Optional[int] = None,
     mission_type: Optional[str] = None,
     state: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
 ):
@@ -150,37 +156,46 @@ async def list_missions(
     - class_id: Filter by class
     - mission_type: Filter by type (exam_prep, code_review, research)
     - state: Filter by state (draft, active, blocked, done)
+    - limit: Page size (omit for all missions)
+    - cursor: Keyset cursor from the previous page's X-Next-Cursor header
     """
     try:
-        missions = MissionService.list_missions(
+        missions, next_cursor = MissionService.list_missions_with_counts(
             db=db,
             class_id=class_id,
             mission_type=mission_type,
-            state=state
+            state=state,
+            limit=limit,
+            cursor=cursor
         )
 
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+
         return [
             {
-                'id': mission.id,
-                'name': mission.name,
-                'mission_type': mission.mission_type,
-                'state': mission.state,
-                'class_id': mission.class_id,
-                'assignment_id': mission.assignment_id,
-                'box_count': len(mission.boxes),
-                'artifact_count': len(mission.artifacts),
-                'created_at': mission.created_at.isoformat(),
-                'updated_at': mission.updated_at.isoformat()
+                'id': row['mission'].id,
+                'name': row['mission'].name,
+                'mission_type': row['mission'].mission_type,
+                'state': row['mission'].state,
+                'class_id': row['mission'].class_id,
+                'assignment_id': row['mission'].assignment_id,
+                'box_count': row['box_count'],
+                'artifact_count': row['artifact_count'],
+                'created_at': row['mission'].created_at.isoformat(),
+                'updated_at': row['mission'].updated_at.isoformat()
             }
-            for mission in missions
+            for row in missions
         ]
 
+    except MissionServiceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list missions: {str(e)}")
 
 
 @router.get("/{mission_id}")
-async def get_mission_detail(
+def get_mission_detail(
     mission_id: int,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -232,7 +247,7 @@ async def get_mission_detail(
                 {
                     'id': session.id,
                     'state': session.state,
-                    'item_count': len(session.items),
+                    'item_count': detail['practice_item_counts'].get(session.id, 0),
                     'created_at': session.created_at.isoformat()
                 }
                 for session in detail['practice_sessions']
@@ -246,7 +261,7 @@ async def get_mission_detail(
 
 
 @router.patch("/{mission_id}")
-async def update_mission_state(
+def update_mission_state(
     mission_id: int,
     request: UpdateStateRequest,
     db: Session = Depends(get_db),
@@ -277,7 +292,7 @@ async def update_mission_state(
 
 
 @router.delete("/{mission_id}")
-async def delete_mission(
+def delete_mission(
     mission_id: int,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -304,7 +319,7 @@ async def delete_mission(
 # ============================================================================
 
 @router.get("/{mission_id}/boxes/{box_id}")
-async def get_box_detail(
+def get_box_detail(
     mission_id: int,
     box_id: int,
     db: Session = Depends(get_db),
@@ -314,6 +329,7 @@ async def get_box_detail(
     Get box detail.
     """
     from marcus_app.core.models import MissionBox
+    from marcus_app.services.box_runner import BoxRunner
 
     box = db.query(MissionBox).filter(
         MissionBox.id == box_id,
@@ -332,16 +348,75 @@ async def get_box_detail(
         'config': box.config_json,
         'last_run_at': box.last_run_at.isoformat() if box.last_run_at else None,
         'last_error': box.last_error,
-        'artifact_count': len(box.artifacts)
+        'artifact_count': len(box.artifacts),
+        'cache': BoxRunner.get_cache_stats(db, box.id)
     }
 
 
+SSE_KEEPALIVE_SECONDS = 15
+
+
+@router.get("/{mission_id}/events")
+def stream_box_events(
+    mission_id: int,
+    box_id: Optional[int] = None,
+    _: bool = Depends(require_auth)
+):
+    """
+    Server-Sent Events stream of box progress for a mission (v0.53).
+
+    The stream opens with a named `connected` event, sent once the
+    subscription is in place. Then each message is `data: <json>` with
+    event started/progress/done/error (see services/box_events.py).
+    progress carries done/total/detail; done carries the final artifacts.
+
+    With box_id, only that box's events are sent and the stream closes
+    after its done/error event; otherwise it stays open until the client
+    disconnects. Wait for `connected`, then trigger the run.
+    """
+    import asyncio
+    from marcus_app.services.box_events import get_box_event_bus, TERMINAL_EVENTS
+
+    bus = get_box_event_bus()
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def forward(event):
+            if box_id is None or event['box_id'] == box_id:
+                loop.call_soon_threadsafe(events.put_nowait, event)
+
+        token = bus.subscribe(mission_id, forward)
+        try:
+            yield "event: connected\ndata: {}\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(events.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {json.dumps(event)}\n\n"
+                if box_id is not None and event['event'] in TERMINAL_EVENTS:
+                    return
+        finally:
+            bus.unsubscribe(mission_id, token)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 class RunBoxRequest(BaseModel):
     input_payload: Optional[dict] = None
+    force: bool = False
 
 
 @router.post("/{mission_id}/boxes/{box_id}/run")
-async def run_box(
+@run_in_pool("extraction")
+def run_box(
     mission_id: int,
     box_id: int,
     request: RunBoxRequest,
@@ -358,6 +433,8 @@ async def run_box(
     - inbox: {artifact_ids: [1, 2, 3]}
     - extract: {} (no input required)
     - ask: {question: str, use_search: bool}
+
+    force=true recomputes even when an identical earlier run is cached.
     """
     from marcus_app.services.box_runner import BoxRunner, BoxRunnerError
 
@@ -366,7 +443,8 @@ async def run_box(
             db=db,
             mission_id=mission_id,
             box_id=box_id,
-            input_payload=request.input_payload
+            input_payload=request.input_payload,
+            force=request.force
         )
 
         return result
@@ -377,10 +455,103 @@ async def run_box(
         raise HTTPException(status_code=500, detail=f"Box execution failed: {str(e)}")
 
 
+# Streaming mission runs in flight (strong refs, so the tasks are not collected)
+_mission_runs = set()
+
+
+class RunMissionRequest(BaseModel):
+    inputs: Optional[dict] = None
+    resume: bool = True
+    rerun: bool = False
+    stream: bool = False
+
+
+@router.post("/{mission_id}/run")
+@run_in_pool("extraction")
+def run_mission(
+    mission_id: int,
+    request: RunMissionRequest,
+    _: bool = Depends(require_auth)
+):
+    """
+    Execute every box in the mission as a dependency graph (v0.53).
+
+    Independent boxes (e.g. ask + practice after extract) run concurrently.
+    An unfinished earlier run is resumed unless resume=false.
+
+    inputs are keyed by box type or box id:
+    - {"inbox": {"artifact_ids": [1, 2]}, "ask": {"question": "..."}}
+
+    With stream=true the response is NDJSON: one line per box state
+    transition, ending with the run-level done/error event. The run itself
+    still executes on the extraction pool.
+    """
+    import asyncio
+    from marcus_app.core.database import SessionLocal
+    from marcus_app.services.mission_executor import MissionExecutor, MissionExecutorError
+
+    if not request.stream:
+        try:
+            return MissionExecutor(SessionLocal).run(
+                mission_id, inputs=request.inputs, resume=request.resume, rerun=request.rerun
+            )
+        except MissionExecutorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    finished = object()
+
+    async def stream_events():
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def forward(event):
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        def execute():
+            try:
+                MissionExecutor(SessionLocal, on_event=forward).run(
+                    mission_id, inputs=request.inputs, resume=request.resume, rerun=request.rerun
+                )
+            except Exception as e:
+                forward({'mission_id': mission_id, 'box_id': None, 'state': 'error', 'error': str(e)})
+            finally:
+                forward(finished)
+
+        # Keeps running if the client disconnects
+        run = asyncio.create_task(run_blocking("extraction", execute))
+        _mission_runs.add(run)
+        run.add_done_callback(_mission_runs.discard)
+
+        while True:
+            event = await events.get()
+            if event is finished:
+                return
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
+
+@router.get("/{mission_id}/runs/{run_id}")
+def get_mission_run(
+    mission_id: int,
+    run_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(require_auth)
+):
+    """Get a mission run record with per-box state."""
+    from marcus_app.services.mission_executor import MissionExecutor
+
+    run = MissionExecutor.get_run(db, mission_id, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
+
+
 # Convenience endpoints
 
 @router.post("/{mission_id}/inbox/link")
-async def link_artifacts_to_mission(
+@run_in_pool("extraction")
+def link_artifacts_to_mission(
     mission_id: int,
     artifact_ids: List[int],
     db: Session = Depends(get_db),
@@ -422,10 +593,12 @@ async def link_artifacts_to_mission(
 class AskQuestionRequest(BaseModel):
     question: str
     use_search: bool = True
+    force: bool = False
 
 
 @router.post("/{mission_id}/ask")
-async def ask_question(
+@run_in_pool("extraction")
+def ask_question(
     mission_id: int,
     request: AskQuestionRequest,
     db: Session = Depends(get_db),
@@ -456,7 +629,8 @@ async def ask_question(
             input_payload={
                 'question': request.question,
                 'use_search': request.use_search
-            }
+            },
+            force=request.force
         )
 
         return result
@@ -477,7 +651,8 @@ class CreatePracticeRequest(BaseModel):
 
 
 @router.post("/{mission_id}/practice/create")
-async def create_practice_session(
+@run_in_pool("extraction")
+def create_practice_session(
     mission_id: int,
     request: CreatePracticeRequest,
     db: Session = Depends(get_db),
@@ -524,7 +699,7 @@ class AnswerQuestionRequest(BaseModel):
 
 
 @router.post("/practice/{session_id}/items/{item_id}/answer")
-async def submit_answer(
+def submit_answer(
     session_id: int,
     item_id: int,
     request: AnswerQuestionRequest,
@@ -561,7 +736,8 @@ async def submit_answer(
 
 
 @router.post("/practice/{session_id}/items/{item_id}/check")
-async def check_answer(
+@run_in_pool("extraction")
+def check_answer(
     session_id: int,
     item_id: int,
     db: Session = Depends(get_db),
@@ -624,8 +800,94 @@ async def check_answer(
         raise HTTPException(status_code=500, detail=f"Failed to check answer: {str(e)}")
 
 
+class BatchAnswer(BaseModel):
+    item_id: int
+    user_answer: Optional[str] = None  # None: use the answer stored via /answer
+
+
+class CheckAnswersRequest(BaseModel):
+    answers: Optional[List[BatchAnswer]] = None  # None: every answered item
+
+
+@router.post("/practice/{session_id}/check")
+@run_in_pool("extraction")
+def check_answers(
+    session_id: int,
+    request: Optional[CheckAnswersRequest] = None,
+    db: Session = Depends(get_db),
+    _: bool = Depends(require_auth)
+):
+    """
+    Check many answers of a practice session in one CheckerBox run.
+
+    Grades each item exactly like /items/{item_id}/check, but in one
+    transaction with a single score update and one consolidated
+    verification artifact. Without a body, checks every item in the
+    'answered' state.
+    """
+    from marcus_app.core.models import PracticeSession, PracticeItem, MissionBox
+    from marcus_app.services.box_runner import BoxRunner, BoxRunnerError
+
+    session = db.query(PracticeSession).filter(
+        PracticeSession.id == session_id
+    ).first()
+
+    if not session:
+        raise HTTPException(status_code=404, detail="Practice session not found")
+
+    if request and request.answers:
+        stored = dict(db.query(PracticeItem.id, PracticeItem.user_answer).filter(
+            PracticeItem.session_id == session_id,
+            PracticeItem.id.in_([a.item_id for a in request.answers])
+        ).all())
+        missing = [a.item_id for a in request.answers if a.item_id not in stored]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Practice items not found: {missing}")
+
+        answers = [
+            {'item_id': a.item_id, 'user_answer': a.user_answer if a.user_answer is not None else stored[a.item_id]}
+            for a in request.answers
+        ]
+    else:
+        answers = [
+            {'item_id': item_id, 'user_answer': user_answer}
+            for item_id, user_answer in db.query(PracticeItem.id, PracticeItem.user_answer).filter(
+                PracticeItem.session_id == session_id,
+                PracticeItem.state == 'answered'
+            ).order_by(PracticeItem.id).all()
+        ]
+
+    unanswered = [a['item_id'] for a in answers if not a['user_answer']]
+    if not answers or unanswered:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No answer submitted yet for items: {unanswered}" if unanswered else "No answered items to check"
+        )
+
+    checker_box = db.query(MissionBox).filter(
+        MissionBox.mission_id == session.mission_id,
+        MissionBox.box_type == 'checker'
+    ).first()
+
+    if not checker_box:
+        raise HTTPException(status_code=404, detail="CheckerBox not found in mission")
+
+    try:
+        return BoxRunner.run_box(
+            db=db,
+            mission_id=session.mission_id,
+            box_id=checker_box.id,
+            input_payload={'session_id': session_id, 'answers': answers}
+        )
+
+    except BoxRunnerError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to check answers: {str(e)}")
+
+
 @router.get("/practice/{session_id}")
-async def get_practice_session(
+def get_practice_session(
     session_id: int,
     db: Session = Depends(get_db),
     _: bool = Depends(require_auth)
@@ -38,7 +38,7 @@ def require_auth(session_token: Optional[str] = Cookie(None, alias="marcus_sessi
 # ============================================================================
 
 @router.post("", response_model=ProjectResponse)
-async def create_project(
+def create_project(
     request: ProjectCreateRequest,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -52,7 +52,7 @@ async def create_project(
 
 
 @router.get("", response_model=List[ProjectResponse])
-async def list_projects(
+def list_projects(
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
 ):
@@ -62,7 +62,7 @@ async def list_projects(
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(
+def get_project(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -75,7 +75,7 @@ async def get_project(
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
-async def update_project(
+def update_project(
     project_id: int,
     request: ProjectUpdateRequest,
     db: Session = Depends(get_db),
@@ -101,7 +101,7 @@ async def update_project(
 
 
 @router.delete("/{project_id}")
-async def delete_project(
+def delete_project(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -118,7 +118,7 @@ async def delete_project(
 # ============================================================================
 
 @router.post("/{project_id}/files", response_model=ProjectFileResponse)
-async def create_project_file(
+def create_project_file(
     project_id: int,
     request: ProjectFileCreateRequest,
     db: Session = Depends(get_db),
@@ -133,7 +133,7 @@ async def create_project_file(
 
 
 @router.get("/{project_id}/files", response_model=List[ProjectFileResponse])
-async def list_project_files(
+def list_project_files(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -148,7 +148,7 @@ async def list_project_files(
 
 
 @router.get("/{project_id}/files/{file_path:path}")
-async def read_project_file(
+def read_project_file(
     project_id: int,
     file_path: str,
     db: Session = Depends(get_db),
@@ -169,7 +169,7 @@ async def read_project_file(
 
 
 @router.delete("/{project_id}/files/{file_path:path}")
-async def delete_project_file(
+def delete_project_file(
     project_id: int,
     file_path: str,
     db: Session = Depends(get_db),
@@ -187,7 +187,7 @@ async def delete_project_file(
 # ============================================================================
 
 @router.post("/{project_id}/notes", response_model=ProjectNoteResponse)
-async def create_project_note(
+def create_project_note(
     project_id: int,
     request: ProjectNoteCreateRequest,
     db: Session = Depends(get_db),
@@ -202,7 +202,7 @@ async def create_project_note(
 
 
 @router.get("/{project_id}/notes", response_model=List[ProjectNoteResponse])
-async def list_project_notes(
+def list_project_notes(
     project_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(require_auth)
@@ -217,7 +217,7 @@ async def list_project_notes(
 
 
 @router.put("/{project_id}/notes/{note_id}", response_model=ProjectNoteResponse)
-async def update_project_note(
+def update_project_note(
     project_id: int,
     note_id: int,
     request: ProjectNoteUpdateRequest,
@@ -234,7 +234,7 @@ async def update_project_note(
 
 
 @router.delete("/{project_id}/notes/{note_id}")
-async def delete_project_note(
+def delete_project_note(
     project_id: int,
     note_id: int,
     db: Session = Depends(get_db),
@@ -0,0 +1,197 @@
+"""
+Static asset delivery for the frontend (v0.53).
+
+Files under marcus_app/frontend are read once at startup into an
+AssetManifest: content hash, strong ETag, and gzip (plus brotli, when the
+optional `brotli` package is installed) variants for text assets.
+
+- HTML pages reference assets as /static/<name>?v=<hash>; a URL with the
+  current hash is cached for a year (immutable), so repeat navigations
+  make no request for it
+- other URLs revalidate (no-cache) and get 304 on a matching If-None-Match
+- the session cookie is read straight from the ASGI headers, and the
+  parsed token is memoized per Cookie header value, so a repeat hit costs
+  one header scan and one SessionStore lookup
+
+Files added after startup fall back to plain StaticFiles; edits to
+existing files are picked up on restart.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.responses import RedirectResponse, Response
+from starlette.staticfiles import StaticFiles
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    brotli = None
+
+
+SESSION_COOKIE = "marcus_session"
+PUBLIC_PAGES = ("login.html",)
+
+IMMUTABLE_CACHE = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE = "private, no-cache"
+
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+MIN_COMPRESS_BYTES = 256
+
+# src="/static/app.js" / href='/static/ui_theme.css' (no query or fragment yet)
+STATIC_REF = re.compile(r'((?:src|href)=["\'])/static/([^"\'?#]+)(["\'])')
+
+
+class Asset:
+    """One file: content version and encoded bodies keyed by content-coding."""
+
+    __slots__ = ("name", "media_type", "version", "variants")
+
+    def __init__(self, name: str, media_type: str, body: bytes):
+        self.name = name
+        self.media_type = media_type
+        self.version = hashlib.sha256(body).hexdigest()[:12]
+        # encoding -> (body, strong ETag); '' is identity
+        self.variants: Dict[str, Tuple[bytes, str]] = {"": (body, f'"{self.version}"')}
+
+        if len(body) >= MIN_COMPRESS_BYTES and media_type.startswith(COMPRESSIBLE_TYPES):
+            encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+            if BROTLI_AVAILABLE:
+                encoded["br"] = brotli.compress(body, quality=11)
+            for encoding, compressed in encoded.items():
+                if len(compressed) < len(body):
+                    self.variants[encoding] = (compressed, f'"{self.version}-{encoding}"')
+
+    def negotiate(self, accept_encoding: str) -> str:
+        """Smallest variant the client accepts ('' for identity)."""
+        accepted = set()
+        for part in accept_encoding.split(","):
+            coding, _, params = part.partition(";")
+            name, _, value = params.partition("=")
+            try:
+                quality = float(value) if name.strip() == "q" else 1.0
+            except ValueError:
+                quality = 0.0
+            if quality > 0:
+                accepted.add(coding.strip().lower())
+        candidates = [e for e in self.variants if e and (e in accepted or "*" in accepted)]
+        if not candidates:
+            return ""
+        return min(candidates, key=lambda e: len(self.variants[e][0]))
+
+    def etags(self):
+        return {etag for _, etag in self.variants.values()}
+
+
+class AssetManifest:
+    """Every file under directory, loaded and encoded once."""
+
+    def __init__(self, directory: Path, url_prefix: str = "/static"):
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix
+        self.assets: Dict[str, Asset] = {}
+
+        files = sorted(p for p in self.directory.rglob("*") if p.is_file())
+        # HTML last, so references can be rewritten to versioned URLs
+        for path in sorted(files, key=lambda p: p.suffix.lower() in (".html", ".htm")):
+            name = path.relative_to(self.directory).as_posix()
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            body = path.read_bytes()
+            if media_type == "text/html":
+                body = self.rewrite_html(body.decode("utf-8")).encode("utf-8")
+            self.assets[name] = Asset(name, media_type, body)
+
+    def get(self, name: str) -> Optional[Asset]:
+        return self.assets.get(name)
+
+    def versioned_url(self, name: str) -> str:
+        asset = self.assets.get(name)
+        url = f"{self.url_prefix}/{name}"
+        return f"{url}?v={asset.version}" if asset else url
+
+    def rewrite_html(self, html: str) -> str:
+        """Point /static references at their content-versioned URLs."""
+        return STATIC_REF.sub(
+            lambda m: f"{m.group(1)}{self.versioned_url(m.group(2))}{m.group(3)}", html
+        )
+
+    def total_bytes(self, encoding: str = "") -> int:
+        return sum(len(a.variants.get(encoding, a.variants[""])[0]) for a in self.assets.values())
+
+
+def asset_response(asset: Asset, headers: Headers, versioned: bool = False) -> Response:
+    """200 with the negotiated variant, or 304 when If-None-Match matches."""
+    encoding = asset.negotiate(headers.get("accept-encoding", ""))
+    body, etag = asset.variants[encoding]
+
+    response_headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE if versioned else REVALIDATE_CACHE,
+    }
+    if len(asset.variants) > 1:
+        response_headers["Vary"] = "Accept-Encoding"
+
+    if_none_match = headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or tags & asset.etags():
+            return Response(status_code=304, headers=response_headers)
+
+    if encoding:
+        response_headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=asset.media_type, headers=response_headers)
+
+
+class AuthStaticFiles(StaticFiles):
+    """
+    /static mount: session check, then manifest assets with caching headers.
+    Unknown names and non-GET/HEAD methods go through StaticFiles.
+    """
+
+    def __init__(self, directory: str, validate_session: Callable[[str], bool]):
+        super().__init__(directory=directory)
+        self.manifest = AssetManifest(Path(directory))
+        self.validate_session = validate_session
+        self._last_cookie: Tuple[Optional[bytes], Optional[str]] = (None, None)
+
+    def session_token(self, scope) -> Optional[str]:
+        """marcus_session cookie from the raw headers, memoized per Cookie value."""
+        for key, value in scope["headers"]:
+            if key == b"cookie":
+                last_value, last_token = self._last_cookie
+                if value == last_value:
+                    return last_token
+                token = cookie_parser(value.decode("latin-1")).get(SESSION_COOKIE)
+                self._last_cookie = (value, token)
+                return token
+        return None
+
+    async def __call__(self, scope, receive, send):
+        # Allow login page
+        if not scope["path"].endswith(PUBLIC_PAGES):
+            token = self.session_token(scope)
+            if not token or not self.validate_session(token):
+                # Redirect to login
+                response = RedirectResponse(url="/login")
+                await response(scope, receive, send)
+                return
+
+        asset = None
+        if scope["method"] in ("GET", "HEAD"):
+            asset = self.manifest.get(self.get_path(scope).replace(os.sep, "/"))
+        if asset is None:
+            return await super().__call__(scope, receive, send)
+
+        query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        response = asset_response(asset, Headers(scope=scope), versioned=query.get("v") == asset.version)
+        await response(scope, receive, send)
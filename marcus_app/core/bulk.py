@@ -0,0 +1,53 @@
+"""
+Bulk persistence helpers.
+
+High-cardinality inserts (text chunks, practice items, mission artifacts)
+bypass the ORM unit of work and go through a single executemany INSERT
+with RETURNING ids, so thousands of rows cost one round-trip per page
+instead of one flush per object. Rows of models on the life-graph get
+their nodes refreshed explicitly, since the flush hook never sees them.
+"""
+
+from typing import Any, Dict, List, Sequence
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from .life_graph import upsert_entities
+
+
+def bulk_insert(db: Session, model: Any, rows: Sequence[Dict[str, Any]]) -> List[int]:
+    """
+    Insert many rows for an ORM model and return their primary keys.
+
+    Column defaults (e.g. created_at) are applied exactly as with db.add().
+    Ids are returned in the same order as `rows`. Does not commit - the
+    caller owns the transaction.
+
+    Args:
+        db: Database session
+        model: ORM model class with an integer `id` primary key
+        rows: List of column dicts
+
+    Returns:
+        List of inserted ids, aligned with `rows`
+    """
+    if not rows:
+        return []
+
+    dialect = db.get_bind().dialect
+
+    if getattr(dialect, 'insert_executemany_returning_sort_by_parameter_order', False):
+        result = db.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            list(rows)
+        )
+        ids = [row[0] for row in result]
+    else:
+        # Older SQLite (< 3.35) has no RETURNING - fall back to per-row Core inserts
+        ids = []
+        for row in rows:
+            result = db.execute(insert(model.__table__).values(**row))
+            ids.append(result.inserted_primary_key[0])
+
+    upsert_entities(db.connection(), model, ids)
+    return ids
@@ -0,0 +1,239 @@
+"""
+Materialized dashboard counters.
+
+Home widgets and agent status commands read a handful of rows from
+`dashboard_counters` instead of COUNT(*) scans over items/missions:
+
+- item_status:   items per status (inbox, active, done, ...)
+- item_due_day:  active items with a due date, per UTC due day (YYYY-MM-DD)
+- mission_state: missions per state
+
+Counters are kept current by a before_flush hook on the session factory
+(install_counter_hooks), in the same transaction as the item/mission
+change, so they commit and roll back with it. Writes that bypass the ORM
+(raw SQL, Query.update) are not seen; reconcile_counters() recounts from
+scratch and runs at startup and periodically to correct any drift.
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, func, select, case, and_, or_, inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from .models import Item, Mission, DashboardCounter
+
+# Tracked columns per model
+TRACKED = {
+    Item: ('status', 'due_at'),
+    Mission: ('state',),
+}
+
+CounterKey = Tuple[str, str]
+
+
+def counter_keys(obj, values: Dict) -> Tuple[CounterKey, ...]:
+    """Counters an item/mission with the given tracked values contributes to."""
+    if isinstance(obj, Mission):
+        return (('mission_state', values['state']),) if values['state'] is not None else ()
+    if values['status'] is None:
+        return ()
+    keys = (('item_status', values['status']),)
+    if values['status'] == 'active' and values['due_at'] is not None:
+        keys += (('item_due_day', _day_key(values['due_at'])),)
+    return keys
+
+
+def _day_key(value) -> str:
+    return (value.date() if isinstance(value, datetime) else value).isoformat()
+
+
+def _current_values(obj, attrs) -> Dict:
+    """Values being flushed; unset columns fall back to their scalar default."""
+    values = {}
+    for attr in attrs:
+        value = getattr(obj, attr)
+        if value is None:
+            default = type(obj).__table__.c[attr].default
+            if default is not None and default.is_scalar:
+                value = default.arg
+        values[attr] = value
+    return values
+
+
+def _previous_values(session: Session, obj, attrs) -> Dict:
+    """Values as stored in the database before this flush."""
+    state = inspect(obj)
+    values = {}
+    for attr in attrs:
+        history = state.attrs[attr].history
+        if history.deleted:
+            values[attr] = history.deleted[0]
+        elif history.added:
+            # Assigned while expired: the old value was never loaded
+            model = type(obj)
+            row = session.connection().execute(
+                select(*(getattr(model, a) for a in attrs)).where(model.id == obj.id)
+            ).one()
+            return dict(zip(attrs, row))
+        elif history.unchanged:
+            values[attr] = history.unchanged[0]
+        else:
+            values[attr] = getattr(obj, attr)
+    return values
+
+
+def _flush_deltas(session: Session) -> Counter:
+    deltas = Counter()
+    for obj in session.new:
+        attrs = TRACKED.get(type(obj))
+        if attrs:
+            for key in counter_keys(obj, _current_values(obj, attrs)):
+                deltas[key] += 1
+    for obj in session.dirty:
+        attrs = TRACKED.get(type(obj))
+        if not attrs:
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[attr].history.added for attr in attrs):
+            continue
+        for key in counter_keys(obj, _previous_values(session, obj, attrs)):
+            deltas[key] -= 1
+        for key in counter_keys(obj, _current_values(obj, attrs)):
+            deltas[key] += 1
+    for obj in session.deleted:
+        attrs = TRACKED.get(type(obj))
+        if attrs:
+            for key in counter_keys(obj, _previous_values(session, obj, attrs)):
+                deltas[key] -= 1
+    return deltas
+
+
+def apply_deltas(connection, deltas: Dict[CounterKey, int]):
+    """Add deltas to the stored counters (upsert, within the caller's transaction)."""
+    rows = [
+        {'scope': scope, 'key': key, 'count': delta, 'updated_at': datetime.utcnow()}
+        for (scope, key), delta in sorted(deltas.items()) if delta
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(DashboardCounter.__table__)
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=['scope', 'key'],
+            set_={
+                'count': DashboardCounter.__table__.c.count + stmt.excluded.count,
+                'updated_at': stmt.excluded.updated_at,
+            }
+        ),
+        rows
+    )
+
+
+def _before_flush(session: Session, flush_context, instances):
+    deltas = _flush_deltas(session)
+    if any(deltas.values()):
+        apply_deltas(session.connection(), deltas)
+
+
+def install_counter_hooks(session_factory):
+    """Maintain dashboard counters for sessions made by session_factory."""
+    if not event.contains(session_factory, 'before_flush', _before_flush):
+        event.listen(session_factory, 'before_flush', _before_flush)
+
+
+def read_counters(db: Session, scope: str) -> Dict[str, int]:
+    """All counters in a scope, {key: count}."""
+    rows = db.execute(
+        select(DashboardCounter.key, DashboardCounter.count).where(DashboardCounter.scope == scope)
+    ).all()
+    return {key: count for key, count in rows}
+
+
+def inbox_stats(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Home dashboard counts (inbox, due soon = rest of today, overdue).
+
+    Whole past days come from item_due_day counters; only items due today
+    are counted from `items` (index range on status, due_at), since the
+    due-soon/overdue split moves with the clock.
+    """
+    now = now or datetime.utcnow()
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_of_day = now.replace(hour=23, minute=59, second=59)
+
+    inbox_count, past_overdue = db.execute(
+        select(
+            func.sum(case((DashboardCounter.scope == 'item_status', DashboardCounter.count), else_=0)),
+            func.sum(case((DashboardCounter.scope == 'item_due_day', DashboardCounter.count), else_=0)),
+        ).where(or_(
+            and_(DashboardCounter.scope == 'item_status', DashboardCounter.key == 'inbox'),
+            and_(DashboardCounter.scope == 'item_due_day', DashboardCounter.key < _day_key(now)),
+        ))
+    ).one()
+
+    overdue_today, due_soon = db.execute(
+        select(
+            func.sum(case((Item.due_at < now, 1), else_=0)),
+            func.sum(case((Item.due_at >= now, 1), else_=0)),
+        ).where(Item.status == 'active', Item.due_at >= day_start, Item.due_at <= end_of_day)
+    ).one()
+
+    return {
+        'inbox_count': inbox_count or 0,
+        'due_soon_count': due_soon or 0,
+        'overdue_count': (past_overdue or 0) + (overdue_today or 0),
+    }
+
+
+def count_from_source(db: Session) -> Dict[CounterKey, int]:
+    """Every counter recomputed with GROUP BY over items and missions."""
+    actual = {}
+    for status, count in db.execute(
+        select(Item.status, func.count()).where(Item.status.isnot(None)).group_by(Item.status)
+    ):
+        actual[('item_status', status)] = count
+    due_day = func.date(Item.due_at)
+    for day, count in db.execute(
+        select(due_day, func.count())
+        .where(Item.status == 'active', Item.due_at.isnot(None))
+        .group_by(due_day)
+    ):
+        actual[('item_due_day', day)] = count
+    for state, count in db.execute(
+        select(Mission.state, func.count()).where(Mission.state.isnot(None)).group_by(Mission.state)
+    ):
+        actual[('mission_state', state)] = count
+    return actual
+
+
+def reconcile_counters(db: Session) -> Dict[CounterKey, Tuple[int, int]]:
+    """
+    Recount from source and correct stored counters; commits.
+
+    Returns drift as {(scope, key): (stored, actual)} for every counter that
+    was wrong. Zero counters are removed.
+    """
+    actual = count_from_source(db)
+    stored = {
+        (scope, key): count
+        for scope, key, count in db.execute(
+            select(DashboardCounter.scope, DashboardCounter.key, DashboardCounter.count)
+        )
+    }
+
+    drift = {}
+    for counter_key in sorted(set(actual) | set(stored)):
+        stored_count, actual_count = stored.get(counter_key, 0), actual.get(counter_key, 0)
+        if counter_key in stored and not actual_count:
+            db.query(DashboardCounter).filter(
+                DashboardCounter.scope == counter_key[0], DashboardCounter.key == counter_key[1]
+            ).delete(synchronize_session=False)
+        elif stored_count != actual_count:
+            db.merge(DashboardCounter(scope=counter_key[0], key=counter_key[1], count=actual_count))
+        if stored_count != actual_count:
+            drift[counter_key] = (stored_count, actual_count)
+    db.commit()
+    return drift
@@ -1,91 +1,194 @@
 """
 Database initialization and session management.
+
+Nothing here touches the filesystem at import time. The storage mount check
+and engine are created on first use (or by init_db() in the startup hook),
+so importing models/routes stays cheap for tests and tooling.
 """
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from pathlib import Path
-import os
+from typing import Optional
 import sys
+import threading
 from .models import Base
+from .counters import install_counter_hooks
+from .life_graph import install_life_graph_hooks
 
-# Load environment configuration
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent.parent / "marcus.env")
-
-# Check if encrypted storage is mounted
 # REQUIRED: M:\Marcus\ must exist and be writable (or use dev storage for testing)
 REQUIRED_MOUNT = Path("M:\\Marcus")
 
-# Find dev storage - when running as bundled EXE, look in current directory or project path
-_dev_storage = None
+# Dev storage candidates - when running as bundled EXE, look in current directory or project path
 _search_paths = [
     Path(__file__).parent.parent.parent / "storage" / "packaging_temp",  # From source
     Path.cwd() / "storage" / "packaging_temp",  # Where EXE is run from
     Path("C:\\Users\\conno\\marcus") / "storage" / "packaging_temp",  # Project fallback
 ]
-for _p in _search_paths:
-    if _p.exists():
-        _dev_storage = _p
-        break
-
-# Use whichever exists (dev for testing, production M: for real use)
-if REQUIRED_MOUNT.exists():
-    ACTIVE_MOUNT = REQUIRED_MOUNT
-elif _dev_storage:
-    ACTIVE_MOUNT = _dev_storage
-else:
-    print("=" * 70)
-    print("[SECURITY] Marcus encrypted storage NOT MOUNTED")
-    print("=" * 70)
-    print(f"Expected encrypted drive at: {REQUIRED_MOUNT}")
-    print(f"Or dev storage at: {DEV_MOUNT}")
-    print("")
-    print("To start Marcus:")
-    print("1. For production: Mount VeraCrypt container to M:\\Marcus")
-    print("2. For development: Create test storage at storage/packaging_temp")
-    print("3. Verify M:\\Marcus\\ or storage/packaging_temp exists and is accessible")
-    print("4. Restart Marcus")
-    print("=" * 70)
-    sys.exit(1)
-
-# Verify mount is writable (catches permission issues)
-try:
-    test_file = ACTIVE_MOUNT / f".marcus_write_test_{id(Path)}.tmp"
-    test_file.write_text("test")
-    test_file.unlink()
-except Exception as e:
-    print("=" * 70)
-    print("[SECURITY] Marcus encrypted storage NOT WRITABLE")
-    print("=" * 70)
-    print(f"Path exists: {ACTIVE_MOUNT}")
-    print(f"But not writable: {e}")
-    print("")
-    print("To fix:")
-    print("1. Check that the VeraCrypt container is fully mounted")
-    print("2. Verify file permissions allow write access")
-    print("3. Restart Marcus")
-    print("=" * 70)
-    sys.exit(1)
-
-# Set paths based on active mount (M:\Marcus or storage/packaging_temp)
-MARCUS_DATA_ROOT = str(ACTIVE_MOUNT)
-
-# Database file location (on encrypted drive or dev storage)
-# Always build from ACTIVE_MOUNT, ignore env var to avoid M: path issues
-DB_PATH = Path(ACTIVE_MOUNT / "marcus.db")
-DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-DATABASE_URL = f"sqlite:///{DB_PATH}"
-
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+_init_lock = threading.Lock()
+_active_mount: Optional[Path] = None
+_engine = None
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+install_counter_hooks(_session_factory)
+install_life_graph_hooks(_session_factory)
+
+
+def _resolve_mount() -> Path:
+    """
+    Load marcus.env, find the active mount and verify it is writable.
+    Exits the process (as before) if encrypted storage is unavailable.
+    """
+    # Load environment configuration
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent.parent / "marcus.env")
+
+    dev_storage = next((p for p in _search_paths if p.exists()), None)
+
+    # Use whichever exists (dev for testing, production M: for real use)
+    if REQUIRED_MOUNT.exists():
+        mount = REQUIRED_MOUNT
+    elif dev_storage:
+        mount = dev_storage
+    else:
+        print("=" * 70)
+        print("[SECURITY] Marcus encrypted storage NOT MOUNTED")
+        print("=" * 70)
+        print(f"Expected encrypted drive at: {REQUIRED_MOUNT}")
+        print(f"Or dev storage at: {_search_paths[0]}")
+        print("")
+        print("To start Marcus:")
+        print("1. For production: Mount VeraCrypt container to M:\\Marcus")
+        print("2. For development: Create test storage at storage/packaging_temp")
+        print("3. Verify M:\\Marcus\\ or storage/packaging_temp exists and is accessible")
+        print("4. Restart Marcus")
+        print("=" * 70)
+        sys.exit(1)
+
+    # Verify mount is writable (catches permission issues)
+    try:
+        test_file = mount / f".marcus_write_test_{id(Path)}.tmp"
+        test_file.write_text("test")
+        test_file.unlink()
+    except Exception as e:
+        print("=" * 70)
+        print("[SECURITY] Marcus encrypted storage NOT WRITABLE")
+        print("=" * 70)
+        print(f"Path exists: {mount}")
+        print(f"But not writable: {e}")
+        print("")
+        print("To fix:")
+        print("1. Check that the VeraCrypt container is fully mounted")
+        print("2. Verify file permissions allow write access")
+        print("3. Restart Marcus")
+        print("=" * 70)
+        sys.exit(1)
+
+    return mount
+
+
+def get_active_mount() -> Path:
+    """Active storage root (M:\\Marcus or storage/packaging_temp), checked once."""
+    global _active_mount
+    if _active_mount is None:
+        with _init_lock:
+            if _active_mount is None:
+                _active_mount = _resolve_mount()
+    return _active_mount
+
+
+def get_db_path() -> Path:
+    """Database file location (on encrypted drive or dev storage)."""
+    # Always build from the active mount, ignore env var to avoid M: path issues
+    return get_active_mount() / "marcus.db"
+
+
+def get_engine():
+    """Create the engine on first use and bind the session factory to it."""
+    global _engine
+    if _engine is None:
+        db_path = get_db_path()
+        with _init_lock:
+            if _engine is None:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                engine = create_engine(
+                    f"sqlite:///{db_path}",
+                    connect_args={"check_same_thread": False},
+                    echo=False
+                )
+                _session_factory.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+
+class _LazySessionLocal:
+    """Callable stand-in for the sessionmaker; binds the engine on first call."""
+
+    def __call__(self, **kwargs) -> Session:
+        get_engine()
+        return _session_factory(**kwargs)
+
+
+SessionLocal = _LazySessionLocal()
+
+
+def __getattr__(name: str):
+    # Backwards-compatible module attributes, resolved lazily
+    if name == "engine":
+        return get_engine()
+    if name == "ACTIVE_MOUNT":
+        return get_active_mount()
+    if name == "MARCUS_DATA_ROOT":
+        return str(get_active_mount())
+    if name == "DB_PATH":
+        return get_db_path()
+    if name == "DATABASE_URL":
+        return f"sqlite:///{get_db_path()}"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Columns added to tables that existing databases already have. create_all()
+# only creates missing tables, so init_db() adds these when absent.
+ADDED_COLUMNS = {
+    "mission_boxes": {
+        "lease_owner": "VARCHAR(64)",
+        "lease_expires_at": "DATETIME",
+    },
+    "life_graph_nodes": {
+        "version": "INTEGER NOT NULL DEFAULT 0",
+        "deleted": "BOOLEAN NOT NULL DEFAULT 0",
+    },
+    "life_graph_edges": {
+        "version": "INTEGER NOT NULL DEFAULT 0",
+        "deleted": "BOOLEAN NOT NULL DEFAULT 0",
+    },
+}
+
+
+def add_missing_columns(engine) -> list:
+    """ALTER TABLE ADD COLUMN for each ADDED_COLUMNS entry the table lacks."""
+    from sqlalchemy import inspect, text
+
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as conn:
+        for table, columns in ADDED_COLUMNS.items():
+            if not inspector.has_table(table):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, ddl in columns.items():
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+                    added.append(f"{table}.{name}")
+    return added
 
 
 def init_db():
     """Initialize database and create all tables."""
+    engine = get_engine()
     Base.metadata.create_all(bind=engine)
-    print(f"Database initialized at: {DB_PATH}")
+    add_missing_columns(engine)
+    print(f"Database initialized at: {get_db_path()}")
 
 
 def get_db() -> Session:
@@ -0,0 +1,142 @@
+"""
+Bounded thread pools for blocking work behind async routes.
+
+Plain `def` route handlers already run on Starlette's shared threadpool.
+Work that can be slow and bursty gets its own small pool, so a few long
+`git diff`s or ExtractBox runs queue behind each other instead of using up
+the shared pool (and never run on the event loop thread):
+
+- git:        GitService / git + gh subprocesses (MARCUS_GIT_WORKERS, default 2)
+- extraction: text extraction, chunking and mission box execution
+              (MARCUS_EXTRACTION_WORKERS, default 2)
+- maintenance: periodic background jobs (dashboard counter reconcile,
+              expired undo sweep) so they never queue behind box runs
+              (MARCUS_MAINTENANCE_WORKERS, default 1)
+
+CPU-bound per-document work (PDF parsing, chunking) fans out to a process
+pool instead, since threads would serialize on the GIL:
+
+- documents:  ExtractBox per-document extraction + chunking
+              (MARCUS_DOCUMENT_PROCESSES, default min(4, CPU count))
+
+Usage:
+    @router.get("/{project_id}/git/diff")
+    @run_in_pool("git")
+    def get_git_diff(project_id: int, db: Session = Depends(get_db)):
+        ...
+
+    result = await run_blocking("git", client.get_status)
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+POOL_LIMITS = {
+    "git": ("MARCUS_GIT_WORKERS", 2),
+    "extraction": ("MARCUS_EXTRACTION_WORKERS", 2),
+    "maintenance": ("MARCUS_MAINTENANCE_WORKERS", 1),
+}
+
+PROCESS_POOL_LIMITS = {
+    "documents": ("MARCUS_DOCUMENT_PROCESSES", min(4, os.cpu_count() or 1)),
+}
+
+_pools: Dict[str, ThreadPoolExecutor] = {}
+_process_pools: Dict[str, ProcessPoolExecutor] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def get_pool(name: str) -> ThreadPoolExecutor:
+    """Named pool, created on first use. Raises KeyError for unknown names."""
+    pool = _pools.get(name)
+    if pool is None:
+        env_var, default = POOL_LIMITS[name]
+        with _lock:
+            pool = _pools.get(name)
+            if pool is None:
+                max_workers = int(os.getenv(env_var, default) or default)
+                pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"marcus-{name}")
+                _pools[name] = pool
+                _stats[name] = {"max_workers": max_workers, "active": 0, "queued": 0, "completed": 0}
+    return pool
+
+
+async def run_blocking(pool_name: str, fn: Callable, *args, **kwargs) -> Any:
+    """Run fn(*args, **kwargs) on the named pool and await the result."""
+    pool = get_pool(pool_name)
+    stats = _stats[pool_name]
+
+    def call():
+        with _lock:
+            stats["queued"] -= 1
+            stats["active"] += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with _lock:
+                stats["active"] -= 1
+                stats["completed"] += 1
+
+    with _lock:
+        stats["queued"] += 1
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, call)
+
+
+def run_in_pool(pool_name: str):
+    """
+    Decorator for sync route handlers: FastAPI sees an async endpoint (same
+    signature, via functools.wraps) that awaits the handler on pool_name.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def endpoint(*args, **kwargs):
+            return await run_blocking(pool_name, fn, *args, **kwargs)
+        return endpoint
+    return decorator
+
+
+def process_pool_size(name: str) -> int:
+    """Configured worker count for a process pool (<= 1 means run in-process)."""
+    env_var, default = PROCESS_POOL_LIMITS[name]
+    return int(os.getenv(env_var, default) or default)
+
+
+def get_process_pool(name: str) -> ProcessPoolExecutor:
+    """
+    Named process pool, created on first use and kept for reuse (worker
+    start-up imports the app). Uses spawn, the only start method on Windows,
+    so behaviour is the same on every platform.
+    """
+    pool = _process_pools.get(name)
+    if pool is None:
+        with _lock:
+            pool = _process_pools.get(name)
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=process_pool_size(name),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                _process_pools[name] = pool
+    return pool
+
+
+def shutdown_process_pools():
+    """Stop all process pools (app shutdown / tests)."""
+    with _lock:
+        pools = list(_process_pools.values())
+        _process_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot of pools created so far (for /health)."""
+    with _lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
@@ -0,0 +1,479 @@
+"""
+Incrementally maintained life-graph.
+
+Classes, projects, study packs, artifacts, missions, mission boxes and
+mission artifacts each have one node in `life_graph_nodes`. Ownership
+(class -> study pack, class -> mission -> box -> mission artifact) is a
+'contains' edge in `life_graph_edges`.
+
+The graph is built once by sync_life_graph() (first GET /api/life-graph,
+or the v0.53 migration for graphs generated by earlier versions). After
+that an after_flush hook on the session factory (install_life_graph_hooks)
+upserts or tombstones nodes and edges in the same transaction as the
+entity change, so they commit and roll back with it.
+
+Every change is stamped with a graph version (SystemConfig
+'life_graph_version', bumped once per flush), so clients can fetch only
+rows with version > the one they have; removals stay as tombstones
+(deleted = 1) for that reason. neighbourhood() returns the k-hop subgraph
+around a focus node, so large graphs are never loaded whole.
+
+Core writes bypass the hook: bulk paths (core.bulk.bulk_insert, BoxRunner
+state compare-and-set) call upsert_entities() with the ids they wrote.
+Anything else that bypasses the ORM is picked up by sync_life_graph().
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, select, insert, update, or_, cast, inspect, bindparam, Integer
+from sqlalchemy.orm import Session
+
+from .models import (
+    LifeGraphNode, LifeGraphEdge, SystemConfig,
+    Class, Project, StudyPack, Artifact, Mission, MissionBox, MissionArtifact
+)
+
+VERSION_KEY = 'life_graph_version'
+
+_nodes = LifeGraphNode.__table__
+_edges = LifeGraphEdge.__table__
+_config = SystemConfig.__table__
+
+
+class GraphSource(NamedTuple):
+    node_type: str
+    columns: Tuple[str, ...]  # entity columns the node is built from
+    label: Callable
+    description: Callable
+    position: Tuple[int, int, int]
+    parent: Optional[Tuple[str, str]] = None  # (parent node_type, foreign key column)
+
+
+def _excerpt(text: Optional[str]) -> str:
+    return text[:50] if text else 'No description'
+
+
+# In parent-before-child order
+SOURCES: Dict[type, GraphSource] = {
+    Class: GraphSource(
+        'class', ('name', 'code'),
+        lambda e: e.name, lambda e: f"Class: {e.code}", (0, 0, 0)
+    ),
+    Project: GraphSource(
+        'project', ('name', 'description'),
+        lambda e: e.name, lambda e: f"Project: {_excerpt(e.description)}", (10, 0, 0)
+    ),
+    StudyPack: GraphSource(
+        'study_pack', ('title', 'description', 'class_id'),
+        lambda e: e.title, lambda e: f"Study Pack: {_excerpt(e.description)}", (5, 10, 0),
+        ('class', 'class_id')
+    ),
+    Artifact: GraphSource(
+        'artifact', ('original_filename', 'file_type'),
+        lambda e: e.original_filename, lambda e: f"Artifact: {e.file_type}", (7, 5, 0)
+    ),
+    Mission: GraphSource(
+        'mission', ('name', 'mission_type', 'state', 'class_id'),
+        lambda e: e.name, lambda e: f"Mission: {e.mission_type} ({e.state})", (-5, 5, 5),
+        ('class', 'class_id')
+    ),
+    MissionBox: GraphSource(
+        'mission_box', ('box_type', 'state', 'mission_id'),
+        lambda e: e.box_type, lambda e: f"Box: {e.box_type} ({e.state})", (-3, 7, 5),
+        ('mission', 'mission_id')
+    ),
+    MissionArtifact: GraphSource(
+        'mission_artifact', ('title', 'artifact_type', 'box_id'),
+        lambda e: e.title[:30], lambda e: f"Artifact: {e.artifact_type}", (-1, 9, 5),
+        ('mission_box', 'box_id')
+    ),
+}
+_ORDER = {model: i for i, model in enumerate(SOURCES)}
+
+
+# ============================================================================
+# VERSION
+# ============================================================================
+
+def current_version(connection) -> Optional[int]:
+    """Graph version, or None while the graph has never been built."""
+    value = connection.execute(select(_config.c.value).where(_config.c.key == VERSION_KEY)).scalar()
+    return int(value) if value is not None else None
+
+
+def bump_version(connection) -> Optional[int]:
+    """Allocate the next graph version (None while the graph is not built)."""
+    result = connection.execute(
+        update(_config)
+        .where(_config.c.key == VERSION_KEY)
+        .values(value=cast(_config.c.value, Integer) + 1, updated_at=datetime.utcnow())
+    )
+    if not result.rowcount:
+        return None
+    return current_version(connection)
+
+
+# ============================================================================
+# NODE / EDGE WRITES
+# ============================================================================
+
+def _node_values(source: GraphSource, entity, version: int) -> Dict:
+    x, y, z = source.position
+    return {
+        'label': source.label(entity),
+        'description': source.description(entity),
+        'x': x, 'y': y, 'z': z,
+        'version': version,
+        'deleted': False,
+        'updated_at': datetime.utcnow(),
+    }
+
+
+def _find_node(connection, node_type: str, entity_id: int, live_only: bool = False) -> Optional[int]:
+    query = select(_nodes.c.id).where(_nodes.c.node_type == node_type, _nodes.c.entity_id == entity_id)
+    if live_only:
+        query = query.where(_nodes.c.deleted == False)
+    return connection.execute(query.order_by(_nodes.c.id).limit(1)).scalar()
+
+
+def upsert_node(connection, source: GraphSource, entity, version: int, relink: bool = True) -> int:
+    """Create or refresh the entity's node (and its parent edge); returns the node id."""
+    values = _node_values(source, entity, version)
+    node_id = _find_node(connection, source.node_type, entity.id)
+    if node_id is None:
+        node_id = connection.execute(
+            insert(_nodes).values(
+                node_type=source.node_type, entity_id=entity.id, created_at=datetime.utcnow(), **values
+            )
+        ).inserted_primary_key[0]
+    else:
+        connection.execute(update(_nodes).where(_nodes.c.id == node_id).values(**values))
+    if relink:
+        link_parent(connection, source, entity, node_id, version)
+    return node_id
+
+
+def link_parent(connection, source: GraphSource, entity, node_id: int, version: int):
+    """Point the node's 'contains' edge at its current parent; tombstone stale ones."""
+    if not source.parent:
+        return
+    parent_type, foreign_key = source.parent
+    parent_entity_id = getattr(entity, foreign_key)
+    parent_node_id = (
+        _find_node(connection, parent_type, parent_entity_id, live_only=True)
+        if parent_entity_id is not None else None
+    )
+
+    stale = update(_edges).where(
+        _edges.c.target_node_id == node_id,
+        _edges.c.edge_type == 'contains',
+        _edges.c.deleted == False,
+        _edges.c.source_node_id.in_(select(_nodes.c.id).where(_nodes.c.node_type == parent_type))
+    )
+    if parent_node_id is not None:
+        stale = stale.where(_edges.c.source_node_id != parent_node_id)
+    connection.execute(stale.values(deleted=True, version=version))
+
+    if parent_node_id is None:
+        return
+    edge = connection.execute(
+        select(_edges.c.id, _edges.c.deleted).where(
+            _edges.c.source_node_id == parent_node_id,
+            _edges.c.target_node_id == node_id,
+            _edges.c.edge_type == 'contains'
+        ).limit(1)
+    ).first()
+    if edge is None:
+        connection.execute(insert(_edges).values(
+            source_node_id=parent_node_id, target_node_id=node_id, edge_type='contains',
+            version=version, deleted=False, created_at=datetime.utcnow()
+        ))
+    elif edge.deleted:
+        connection.execute(update(_edges).where(_edges.c.id == edge.id).values(deleted=False, version=version))
+
+
+def delete_nodes(connection, node_ids: List[int], version: int):
+    """Tombstone nodes and every edge touching them."""
+    if not node_ids:
+        return
+    connection.execute(
+        update(_nodes).where(_nodes.c.id.in_(node_ids))
+        .values(deleted=True, version=version, updated_at=datetime.utcnow())
+    )
+    connection.execute(
+        update(_edges).where(
+            _edges.c.deleted == False,
+            or_(_edges.c.source_node_id.in_(node_ids), _edges.c.target_node_id.in_(node_ids))
+        ).values(deleted=True, version=version)
+    )
+
+
+def delete_entity_node(connection, node_type: str, entity_id: int, version: int):
+    node_ids = connection.execute(
+        select(_nodes.c.id).where(
+            _nodes.c.node_type == node_type, _nodes.c.entity_id == entity_id, _nodes.c.deleted == False
+        )
+    ).scalars().all()
+    delete_nodes(connection, node_ids, version)
+
+
+# ============================================================================
+# FLUSH HOOK
+# ============================================================================
+
+def _changed(obj, columns) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[column].history.has_changes() for column in columns)
+
+
+def _after_flush(session: Session, flush_context):
+    # (entity, deleted, parent may have changed)
+    changes = []
+    for obj in session.new:
+        if type(obj) in SOURCES:
+            changes.append((obj, False, True))
+    for obj in session.dirty:
+        source = SOURCES.get(type(obj))
+        if source and _changed(obj, source.columns):
+            changes.append((obj, False, bool(source.parent) and _changed(obj, source.parent[1:])))
+    for obj in session.deleted:
+        if type(obj) in SOURCES:
+            changes.append((obj, True, False))
+    if not changes:
+        return
+
+    connection = session.connection()
+    version = bump_version(connection)
+    if version is None:
+        return  # Not built yet: sync_life_graph() will include these
+
+    for obj, deleted, relink in sorted(changes, key=lambda change: _ORDER[type(change[0])]):
+        source = SOURCES[type(obj)]
+        if deleted:
+            delete_entity_node(connection, source.node_type, obj.id, version)
+        else:
+            upsert_node(connection, source, obj, version, relink=relink)
+
+
+def upsert_entities(connection, model, ids) -> int:
+    """
+    Refresh the nodes (and parent edges) of rows written with Core
+    statements, which the flush hook never sees. Call in the writing
+    transaction. Returns the number of nodes written (0 for untracked
+    models, or while the graph is not built).
+    """
+    source = SOURCES.get(model)
+    if source is None or not ids:
+        return 0
+    version = bump_version(connection)
+    if version is None:
+        return 0
+    table = model.__table__
+    entities = connection.execute(
+        select(table.c.id, *(table.c[c] for c in source.columns)).where(table.c.id.in_(list(ids)))
+    ).all()
+    for entity in entities:
+        upsert_node(connection, source, entity, version)
+    return len(entities)
+
+
+def install_life_graph_hooks(session_factory):
+    """Maintain the life-graph for sessions made by session_factory."""
+    if not event.contains(session_factory, 'after_flush', _after_flush):
+        event.listen(session_factory, 'after_flush', _after_flush)
+
+
+# ============================================================================
+# BUILD / RECONCILE
+# ============================================================================
+
+def sync_life_graph(db: Session) -> Dict[str, int]:
+    """
+    Build the graph, or bring it in line with the entity tables; commits.
+
+    Missing nodes, nodes whose label/description/position differ, parent
+    edges that moved, and nodes of removed entities (plus duplicate nodes
+    left by earlier versions) are written in batches, all under one new
+    version. Nothing is written when the graph is already current.
+    """
+    connection = db.connection()
+    if current_version(connection) is None:
+        connection.execute(insert(_config).values(key=VERSION_KEY, value='0', updated_at=datetime.utcnow()))
+
+    existing: Dict[Tuple[str, int], Tuple] = {}
+    duplicates = []
+    type_of: Dict[int, str] = {}
+    node_types = [source.node_type for source in SOURCES.values()]
+    for row in connection.execute(
+        select(_nodes.c.id, _nodes.c.node_type, _nodes.c.entity_id, _nodes.c.label, _nodes.c.description,
+               _nodes.c.x, _nodes.c.y, _nodes.c.z, _nodes.c.deleted)
+        .where(_nodes.c.node_type.in_(node_types))
+        .order_by(_nodes.c.id)
+    ):
+        type_of[row.id] = row.node_type
+        key = (row.node_type, row.entity_id)
+        if key in existing:
+            if not row.deleted:
+                duplicates.append(row.id)
+        else:
+            existing[key] = row
+    live_ids = {key: row.id for key, row in existing.items() if not row.deleted}
+
+    # target node id -> {source node id: (edge id, deleted)} for 'contains' edges
+    contained_by: Dict[int, Dict[int, Tuple[int, bool]]] = {}
+    for edge_id, source_id, target_id, deleted in connection.execute(
+        select(_edges.c.id, _edges.c.source_node_id, _edges.c.target_node_id, _edges.c.deleted)
+        .where(_edges.c.edge_type == 'contains')
+    ):
+        contained_by.setdefault(target_id, {})[source_id] = (edge_id, deleted)
+
+    version = None
+    stats = {'upserted': 0, 'relinked': 0, 'deleted': 0}
+
+    def next_version():
+        nonlocal version
+        if version is None:
+            version = bump_version(connection)
+        return version
+
+    seen = set()
+    for model, source in SOURCES.items():
+        table = model.__table__
+        entities = connection.execute(select(table.c.id, *(table.c[c] for c in source.columns))).all()
+
+        inserts, updates = [], []
+        for entity in entities:
+            key = (source.node_type, entity.id)
+            seen.add(key)
+            row = existing.get(key)
+            label, description = source.label(entity), source.description(entity)
+            if row is None:
+                inserts.append(dict(
+                    _node_values(source, entity, next_version()),
+                    node_type=source.node_type, entity_id=entity.id, created_at=datetime.utcnow()
+                ))
+            elif (row.deleted or row.label != label or row.description != description
+                    or (row.x, row.y, row.z) != source.position):
+                updates.append(dict(_node_values(source, entity, next_version()), node_id=row.id))
+                live_ids[key] = row.id
+        if inserts:
+            connection.execute(insert(_nodes), inserts)
+            for node_id, entity_id in connection.execute(
+                select(_nodes.c.id, _nodes.c.entity_id)
+                .where(_nodes.c.node_type == source.node_type, _nodes.c.version == version)
+                .order_by(_nodes.c.id)
+            ):
+                live_ids.setdefault((source.node_type, entity_id), node_id)
+                type_of[node_id] = source.node_type
+        if updates:
+            connection.execute(update(_nodes).where(_nodes.c.id == bindparam('node_id')), updates)
+        stats['upserted'] += len(inserts) + len(updates)
+
+        if not source.parent:
+            continue
+        parent_type, foreign_key = source.parent
+        stale, revived, new_edges = [], [], []
+        for entity in entities:
+            node_id = live_ids[(source.node_type, entity.id)]
+            parent_node_id = live_ids.get((parent_type, getattr(entity, foreign_key)))
+            edges = contained_by.get(node_id, {})
+            changed = False
+            for source_id, (edge_id, deleted) in edges.items():
+                if source_id != parent_node_id and not deleted and type_of.get(source_id) == parent_type:
+                    stale.append(edge_id)
+                    changed = True
+            if parent_node_id is not None:
+                if parent_node_id not in edges:
+                    new_edges.append({
+                        'source_node_id': parent_node_id, 'target_node_id': node_id, 'edge_type': 'contains',
+                        'deleted': False, 'created_at': datetime.utcnow()
+                    })
+                    changed = True
+                elif edges[parent_node_id][1]:
+                    revived.append(edges[parent_node_id][0])
+                    changed = True
+            if changed and (source.node_type, entity.id) in existing:
+                stats['relinked'] += 1
+        if stale or revived or new_edges:
+            v = next_version()
+            if stale:
+                connection.execute(update(_edges).where(_edges.c.id.in_(stale)).values(deleted=True, version=v))
+            if revived:
+                connection.execute(update(_edges).where(_edges.c.id.in_(revived)).values(deleted=False, version=v))
+            if new_edges:
+                connection.execute(insert(_edges), [dict(edge, version=v) for edge in new_edges])
+
+    removed = [row.id for key, row in existing.items() if key not in seen and not row.deleted] + duplicates
+    if removed:
+        delete_nodes(connection, removed, next_version())
+        stats['deleted'] = len(removed)
+
+    db.commit()
+    stats['version'] = current_version(db.connection())
+    return stats
+
+
+def ensure_life_graph(db: Session) -> int:
+    """Current graph version, building the graph first if it never was."""
+    version = current_version(db.connection())
+    if version is None:
+        version = sync_life_graph(db)['version']
+    return version
+
+
+# ============================================================================
+# READS
+# ============================================================================
+
+def live_graph(db: Session) -> Tuple[List, List]:
+    """Every live node and edge."""
+    nodes = db.execute(select(_nodes).where(_nodes.c.deleted == False).order_by(_nodes.c.id)).all()
+    edges = db.execute(select(_edges).where(_edges.c.deleted == False).order_by(_edges.c.id)).all()
+    return nodes, edges
+
+
+def changes_since(db: Session, version: int) -> Tuple[List, List]:
+    """Nodes and edges (tombstones included) changed after version."""
+    nodes = db.execute(select(_nodes).where(_nodes.c.version > version).order_by(_nodes.c.id)).all()
+    edges = db.execute(select(_edges).where(_edges.c.version > version).order_by(_edges.c.id)).all()
+    return nodes, edges
+
+
+def neighbourhood(db: Session, focus_node_id: int, hops: int = 1, max_nodes: int = 500) -> Tuple[List, List]:
+    """
+    Live nodes within `hops` edges of the focus node (either direction) and
+    the edges between them. Breadth-first, one indexed query per hop;
+    stops adding nodes at max_nodes.
+    """
+    seen = {focus_node_id}
+    frontier = {focus_node_id}
+    for _ in range(hops):
+        if not frontier or len(seen) >= max_nodes:
+            break
+        next_frontier = set()
+        for source_id, target_id in db.execute(
+            select(_edges.c.source_node_id, _edges.c.target_node_id)
+            .where(
+                _edges.c.deleted == False,
+                or_(_edges.c.source_node_id.in_(frontier), _edges.c.target_node_id.in_(frontier))
+            )
+            .order_by(_edges.c.id)
+        ):
+            for node_id in (source_id, target_id):
+                if node_id not in seen and len(seen) < max_nodes:
+                    seen.add(node_id)
+                    next_frontier.add(node_id)
+        frontier = next_frontier
+
+    nodes = db.execute(
+        select(_nodes).where(_nodes.c.id.in_(seen), _nodes.c.deleted == False).order_by(_nodes.c.id)
+    ).all()
+    edges = db.execute(
+        select(_edges).where(
+            _edges.c.deleted == False,
+            _edges.c.source_node_id.in_(seen),
+            _edges.c.target_node_id.in_(seen)
+        ).order_by(_edges.c.id)
+    ).all()
+    return nodes, edges
@@ -4,7 +4,7 @@ SQLAlchemy ORM models for all entities.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Enum, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Enum, Float, Index, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import enum
@@ -217,7 +217,7 @@ class TextChunk(Base):
     content = Column(Text, nullable=False)
 
     # Denormalized foreign keys for fast filtering
-    artifact_id = Column(Integer, ForeignKey("artifacts.id"), nullable=False)
+    artifact_id = Column(Integer, ForeignKey("artifacts.id"), nullable=False, index=True)  # mission scoping
     assignment_id = Column(Integer, ForeignKey("assignments.id"))
     class_id = Column(Integer, ForeignKey("classes.id"))
 
@@ -651,11 +651,21 @@ class LifeGraphNode(Base):
     x = Column(Integer, default=0)
     y = Column(Integer, default=0)
     z = Column(Integer, default=0)
+
+    # Incremental sync (v0.53): graph version of the last change; deleted
+    # nodes stay as tombstones so clients fetching changes see the removal
+    version = Column(Integer, nullable=False, default=0)
+    deleted = Column(Boolean, nullable=False, default=False)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_life_graph_nodes_type_entity", "node_type", "entity_id"),
+        Index("ix_life_graph_nodes_version", "version"),
+    )
+
 
 class LifeGraphEdge(Base):
     """
@@ -674,9 +684,19 @@ class LifeGraphEdge(Base):
     # Edge type: contains, references, requires, related_to
     edge_type = Column(String(50))
 
+    # Incremental sync (v0.53), see LifeGraphNode
+    version = Column(Integer, nullable=False, default=0)
+    deleted = Column(Boolean, nullable=False, default=False)
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_life_graph_edges_source_node_id", "source_node_id"),
+        Index("ix_life_graph_edges_target_node_id", "target_node_id"),
+        Index("ix_life_graph_edges_version", "version"),
+    )
+
 
 # ============================================================================
 # V0.44-ALPHA: MISSIONS + BOXES WORKFLOW ENGINE
@@ -708,7 +728,7 @@ class Mission(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     mission_type = Column(String(50), nullable=False)  # exam_prep, code_review, research
-    state = Column(String(20), default=MissionState.DRAFT.value)
+    state = Column(String(20), default=MissionState.DRAFT.value, index=True)
 
     # Optional links to existing entities
     class_id = Column(Integer, ForeignKey("classes.id"))
@@ -717,7 +737,7 @@ class Mission(Base):
     # Metadata (JSON)
     metadata_json = Column(Text)  # Mission-specific config
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)  # listing keyset (created_at, id)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
@@ -736,7 +756,7 @@ class MissionBox(Base):
     __tablename__ = "mission_boxes"
 
     id = Column(Integer, primary_key=True)
-    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
+    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False, index=True)
     box_type = Column(String(50), nullable=False)  # inbox, extract, ask, practice, checker, citations
     order_index = Column(Integer, nullable=False)  # Execution order
     state = Column(String(20), default=BoxState.IDLE.value)
@@ -748,6 +768,10 @@ class MissionBox(Base):
     last_run_at = Column(DateTime)
     last_error = Column(Text)
 
+    # Run lease (v0.53): owner token + expiry renewed by the runner's heartbeat
+    lease_owner = Column(String(64))
+    lease_expires_at = Column(DateTime)
+
     # Canvas positioning (for v0.45, unused in v0.44-alpha)
     position_json = Column(Text)  # {x, y} coordinates
 
@@ -757,6 +781,30 @@ class MissionBox(Base):
     # Relationships
     mission = relationship("Mission", back_populates="boxes")
     artifacts = relationship("MissionArtifact", back_populates="box", cascade="all, delete-orphan")
+    runs = relationship("BoxRun", back_populates="box", cascade="all, delete-orphan")
+
+
+class BoxRun(Base):
+    """
+    Memoized box execution (v0.53).
+    fingerprint = hash of box type, config, input payload and the mission
+    documents/chunks the box reads. A later run with the same fingerprint
+    returns result_json instead of recomputing.
+    """
+    __tablename__ = "box_runs"
+
+    id = Column(Integer, primary_key=True)
+    box_id = Column(Integer, ForeignKey("mission_boxes.id"), nullable=False, index=True)
+    fingerprint = Column(String(64), nullable=False, index=True)
+    cache_hit = Column(Boolean, default=False)
+
+    artifact_ids_json = Column(Text)  # MissionArtifact ids produced by the original run
+    result_json = Column(Text)  # run_box 'artifacts' payload to replay on a hit
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    box = relationship("MissionBox", back_populates="runs")
 
 
 class MissionArtifact(Base):
@@ -767,7 +815,7 @@ class MissionArtifact(Base):
     __tablename__ = "mission_artifacts"
 
     id = Column(Integer, primary_key=True)
-    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
+    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False, index=True)
     box_id = Column(Integer, ForeignKey("mission_boxes.id"))  # Null if ingested from outside
     artifact_type = Column(String(50), nullable=False)  # document, qa, practice_session, verification, citation, note
 
@@ -780,6 +828,32 @@ class MissionArtifact(Base):
     # Relationships
     mission = relationship("Mission", back_populates="artifacts")
     box = relationship("MissionBox", back_populates="artifacts")
+    citations = relationship("MissionCitation", back_populates="mission_artifact", cascade="all, delete-orphan")
+
+
+class MissionCitation(Base):
+    """
+    Chunk cited by a mission artifact (v0.53).
+    One row per citation of a QA answer or practice item, written with the
+    artifact, so CitationsBox aggregates with GROUP BY instead of
+    re-parsing every artifact's source_refs_json.
+    """
+    __tablename__ = "mission_citations"
+
+    id = Column(Integer, primary_key=True)
+    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
+    mission_artifact_id = Column(Integer, ForeignKey("mission_artifacts.id"), nullable=False, index=True)  # Citing artifact
+    artifact_id = Column(Integer, ForeignKey("artifacts.id"))  # Cited document
+    chunk_id = Column(Integer, ForeignKey("text_chunks.id"))
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_mission_citations_mission_chunk", "mission_id", "chunk_id"),  # top cited chunks
+    )
+
+    # Relationships
+    mission_artifact = relationship("MissionArtifact", back_populates="citations")
 
 
 class PracticeSession(Base):
@@ -790,7 +864,7 @@ class PracticeSession(Base):
     __tablename__ = "practice_sessions"
 
     id = Column(Integer, primary_key=True)
-    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
+    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False, index=True)
 
     state = Column(String(20), default="active")  # active, completed
     score_json = Column(Text)  # {attempted: N, correct: N, incorrect: N}
@@ -812,7 +886,7 @@ class PracticeItem(Base):
     __tablename__ = "practice_items"
 
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey("practice_sessions.id"), nullable=False)
+    session_id = Column(Integer, ForeignKey("practice_sessions.id"), nullable=False, index=True)
 
     prompt_md = Column(Text, nullable=False)  # Question text (markdown)
     expected_answer = Column(Text)  # Expected answer (if available)
@@ -829,6 +903,27 @@ class PracticeItem(Base):
     session = relationship("PracticeSession", back_populates="items")
 
 
+class MissionRun(Base):
+    """
+    Whole-mission execution record (v0.53).
+    Written by MissionExecutor so an interrupted run resumes from the last
+    finished box instead of starting over.
+    """
+    __tablename__ = "mission_runs"
+
+    id = Column(Integer, primary_key=True)
+    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False, index=True)
+
+    state = Column(String(20), default="running")  # running, done, error
+    inputs_json = Column(Text)  # {box_type or box_id: input_payload}
+    box_states_json = Column(Text)  # {box_id: {state, error, artifact_ids}}
+    error = Column(Text)
+
+    started_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+
 class Item(Base):
     """
     Universal item for capture/routing workflow (v0.47a).
@@ -864,4 +959,49 @@ class Item(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    filed_at = Column(DateTime)  # when moved from inbox to context
\ No newline at end of file
+    filed_at = Column(DateTime)  # when moved from inbox to context
+
+    __table_args__ = (
+        # "What's next" candidate branches (NextActionService)
+        Index("ix_items_status_due_at", "status", "due_at"),
+        Index("ix_items_status_pinned_created_at", "status", "pinned", "created_at"),
+        Index("ix_items_status_type_created_at", "status", "item_type", "created_at"),
+        # Inbox list keyset (status, created_at DESC, id DESC)
+        Index("ix_items_status_created_at", "status", "created_at"),
+    )
+
+
+class DashboardCounter(Base):
+    """
+    Materialized count for dashboards (v0.53).
+    Maintained transactionally on item/mission changes, reconciled
+    periodically (see core/counters.py).
+    """
+    __tablename__ = "dashboard_counters"
+
+    scope = Column(String(30), primary_key=True)  # item_status|item_due_day|mission_state
+    key = Column(String(30), primary_key=True)  # status/state value or due day (YYYY-MM-DD)
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class UndoEvent(Base):
+    """
+    Recorded user action that can be undone within a short window (v0.48).
+    Write-through copy of the in-memory undo buffer for crash recovery;
+    expired rows are swept in bulk (see services/undo_service.py).
+    """
+    __tablename__ = "undo_events"
+
+    id = Column(Integer, primary_key=True)
+    action_type = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False)
+    description = Column(String(500))
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
+    is_consumed = Column(Boolean, default=False)
+
+    __table_args__ = (
+        Index("ix_undo_events_is_consumed_created_at", "is_consumed", "created_at"),
+        Index("ix_undo_events_expires_at", "expires_at"),
+    )
\ No newline at end of file
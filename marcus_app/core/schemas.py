@@ -577,6 +577,7 @@ class LifeGraphNodeResponse(BaseModel):
     x: int
     y: int
     z: int
+    deleted: bool = False
 
 
 class LifeGraphEdgeResponse(BaseModel):
@@ -585,6 +586,7 @@ class LifeGraphEdgeResponse(BaseModel):
     source_node_id: int
     target_node_id: int
     edge_type: str
+    deleted: bool = False
 
 
 class LifeGraphResponse(BaseModel):
@@ -594,3 +596,4 @@ class LifeGraphResponse(BaseModel):
     node_count: int
     edge_count: int
     generated_at: datetime
+    version: int = 0  # pass back as since_version to get only later changes
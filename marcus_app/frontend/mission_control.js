@@ -514,12 +514,58 @@ function renderBoxDetail(box, missionId) {
             </div>
             ${box.last_run_at ? `<div style="color: #888; font-size: 0.85em;">Last run: ${new Date(box.last_run_at).toLocaleString()}</div>` : ''}
             ${box.last_error ? `<div style="color: #e74c3c; font-size: 0.85em; margin-top: 5px;">Error: ${box.last_error}</div>` : ''}
+            <div id="box-progress-${box.id}" style="color: #888; font-size: 0.85em; margin-top: 5px;"></div>
         </div>
     `;
 }
 
+// v0.53: Live box progress over Server-Sent Events (replaces polling box detail)
+function watchBoxProgress(missionId, boxId) {
+    const source = new EventSource(`/api/missions/${missionId}/events?box_id=${boxId}`);
+
+    source.onmessage = (message) => {
+        const event = JSON.parse(message.data);
+        const target = document.getElementById(`box-progress-${boxId}`);
+
+        if (target) {
+            if (event.event === 'started') {
+                target.textContent = 'Running...';
+            } else if (event.event === 'progress') {
+                target.textContent = `${event.detail} (${event.done}/${event.total})`;
+            } else if (event.event === 'done') {
+                target.textContent = event.cached ? 'Done (cached)' : 'Done';
+            } else if (event.event === 'error') {
+                target.textContent = `Error: ${event.error}`;
+            }
+        }
+
+        if (event.event === 'done' || event.event === 'error') {
+            source.close();
+        }
+    };
+
+    return source;
+}
+
+// Resolves once the server has subscribed the stream (its `connected`
+// event), or the stream failed to open, so the run's first events are not
+// published before anyone listens
+function waitForConnected(source, timeoutMs = 5000) {
+    return new Promise((resolve) => {
+        const ready = () => {
+            clearTimeout(timer);
+            resolve();
+        };
+        const timer = setTimeout(ready, timeoutMs);
+        source.addEventListener('connected', ready, { once: true });
+        source.addEventListener('error', ready, { once: true });
+    });
+}
+
 async function runBox(missionId, boxId) {
+    const progress = watchBoxProgress(missionId, boxId);
     try {
+        await waitForConnected(progress);
         const response = await fetch(`/api/missions/${missionId}/boxes/${boxId}/run`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
@@ -542,6 +588,8 @@ async function runBox(missionId, boxId) {
     } catch (error) {
         console.error('[Mission Control] Error running box:', error);
         showError(error.message);
+    } finally {
+        progress.close();
     }
 }
 
@@ -456,6 +456,12 @@ function renderPracticeItems(data) {
             Total: ${items.length}
         </div>
 
+        ${items.some(item => item.state === 'answered') ? `
+            <button class="btn" style="margin-bottom: 15px;" onclick="checkAllPracticeAnswers(${session.id})">
+                Check All Answers
+            </button>
+        ` : ''}
+
         ${items.map((item, idx) => renderPracticeItem(item, idx)).join('')}
     `;
 }
@@ -544,6 +550,29 @@ async function checkPracticeAnswer(sessionId, itemId) {
     }
 }
 
+async function checkAllPracticeAnswers(sessionId) {
+    try {
+        // One CheckerBox run for every answered item (single score update)
+        const response = await fetch(`/api/missions/practice/${sessionId}/check`, {
+            method: 'POST'
+        });
+
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.detail || 'Failed to check answers');
+        }
+
+        const result = await response.json();
+        const verification = result.artifacts?.[0] || {};
+
+        await loadPracticeSession(sessionId);
+        showSuccess(verification.title || 'Answers checked');
+    } catch (error) {
+        console.error('[Practice Panel] Error checking answers:', error);
+        showError(error.message);
+    }
+}
+
 function displayCheckResult(itemId, result) {
     const container = document.getElementById(`checkResult_${itemId}`);
     if (!container) return;
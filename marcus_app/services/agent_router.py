@@ -106,6 +106,50 @@ INTENT_PATTERNS = {
 }
 
 
+class IntentMatcher:
+    """
+    All intent patterns compiled into one regex, built once at import.
+
+    The regex stops only at word boundaries where some pattern matches;
+    there, one optional lookahead per pattern records which patterns match,
+    so a single finditer pass finds every pattern re.search would find.
+    """
+
+    def __init__(self, intent_patterns: Dict[str, List[str]]):
+        self.intents = list(intent_patterns)
+        self.pattern_intents = [intent for intent, patterns in intent_patterns.items() for _ in patterns]
+        patterns = [pattern for patterns in intent_patterns.values() for pattern in patterns]
+        if any('(?P<' in pattern for pattern in patterns):
+            raise ValueError("Intent patterns must not contain named groups")
+        patterns = [self._non_capturing(pattern) for pattern in patterns]
+
+        # Leading \b lets the engine skip non-boundary positions cheaply
+        boundary = r'\b' if all(pattern.startswith(r'\b') for pattern in patterns) else ''
+        anchor = '|'.join(f'(?:{pattern})' for pattern in patterns)
+        probes = ''.join(f'(?:(?=({pattern})))?' for pattern in patterns)
+        self.regex = re.compile(f'{boundary}(?={anchor}){probes}')
+
+    @staticmethod
+    def _non_capturing(pattern: str) -> str:
+        """Turn a pattern's own groups into (?:...) so group i is pattern i."""
+        return re.sub(r'(?<!\\)\((?!\?)', '(?:', pattern)
+
+    def match_counts(self, text_lower: str) -> Dict[str, int]:
+        """Number of matching patterns per intent."""
+        matched = set()
+        for match in self.regex.finditer(text_lower):
+            matched.update(i for i, group in enumerate(match.groups()) if group is not None)
+
+        counts = {}
+        for i in matched:
+            intent = self.pattern_intents[i]
+            counts[intent] = counts.get(intent, 0) + 1
+        return counts
+
+
+INTENT_MATCHER = IntentMatcher(INTENT_PATTERNS)
+
+
 # Confidence threshold for auto-execution
 CONFIDENCE_THRESHOLD = 0.75
 
@@ -121,13 +165,14 @@ def detect_intent(text: str) -> Tuple[Optional[str], float]:
     Returns:
         (intent_name, confidence)
     """
-    text_lower = text.lower()
+    counts = INTENT_MATCHER.match_counts(text.lower())
 
     best_intent = None
     best_confidence = 0.0
 
-    for intent_name, patterns in INTENT_PATTERNS.items():
-        matches = sum(1 for pattern in patterns if re.search(pattern, text_lower))
+    # Intent order decides ties, as before
+    for intent_name in INTENT_MATCHER.intents:
+        matches = counts.get(intent_name, 0)
 
         if matches > 0:
             # Confidence based on number of matching patterns
@@ -436,7 +481,7 @@ class AgentRouter:
         """Format context for display."""
         if context_kind == 'class' and context_id:
             cls = self.db.query(Class).filter(Class.id == context_id).first()
-            return f"class {cls.class_code}" if cls else f"class #{context_id}"
+            return f"class {cls.code}" if cls else f"class #{context_id}"
         elif context_kind == 'personal':
             return "Personal"
         else:
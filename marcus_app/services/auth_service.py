@@ -3,9 +3,12 @@ Authentication service for Marcus v0.36.
 Handles login, session management, and password verification.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple, Callable
 from datetime import datetime, timedelta
+import heapq
 import secrets
+import threading
+import time
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from sqlalchemy.orm import Session
@@ -13,6 +16,102 @@ from sqlalchemy.orm import Session
 from ..core.models import SystemConfig
 
 
+class SessionRecord:
+    """One login session; last_activity is a monotonic clock reading."""
+
+    __slots__ = ("user_id", "created_at", "last_activity")
+
+    def __init__(self, user_id: str, created_at: datetime, last_activity: float):
+        self.user_id = user_id
+        self.created_at = created_at
+        self.last_activity = last_activity
+
+
+class SessionStore:
+    """
+    In-memory sessions with idle expiry.
+
+    validate() is on the hot path (every API call and every /static asset),
+    so it takes one monotonic clock reading, no lock, and only writes
+    last_activity when it moved by at least `activity_resolution` seconds;
+    a page load of dozens of assets costs one write. Sessions can therefore
+    expire up to `activity_resolution` seconds early.
+
+    Expiry order is kept in a min-heap of (deadline, token) with at most one
+    entry per session. Activity does not touch the heap: sweep() pops due
+    entries and either deletes the session or re-pushes it with its current
+    deadline, so a sweep costs O(log n) per popped entry instead of a scan.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        activity_resolution: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.timeout = timeout_seconds
+        self.activity_resolution = activity_resolution
+        self.clock = clock
+        self._sessions: Dict[str, SessionRecord] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def create(self, token: str, user_id: str):
+        now = self.clock()
+        self._sessions[token] = SessionRecord(user_id, datetime.utcnow(), now)
+        with self._lock:
+            heapq.heappush(self._heap, (now + self.timeout, token))
+
+    def validate(self, token: str) -> bool:
+        session = self._sessions.get(token)
+        if session is None:
+            return False
+
+        now = self.clock()
+        idle = now - session.last_activity
+        if idle > self.timeout:
+            self._sessions.pop(token, None)
+            return False
+
+        # Coalesce activity writes
+        if idle >= self.activity_resolution:
+            session.last_activity = now
+        return True
+
+    def get(self, token: str) -> Optional[SessionRecord]:
+        return self._sessions.get(token)
+
+    def remove(self, token: str):
+        self._sessions.pop(token, None)
+
+    def idle_seconds(self, session: SessionRecord) -> float:
+        return self.clock() - session.last_activity
+
+    def sweep(self) -> int:
+        """Delete sessions idle past the timeout; returns how many were deleted."""
+        now = self.clock()
+        removed = 0
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, token = heapq.heappop(self._heap)
+                session = self._sessions.get(token)
+                if session is None:
+                    continue  # logged out or expired on validate
+                current_deadline = session.last_activity + self.timeout
+                if current_deadline <= now:
+                    del self._sessions[token]
+                    removed += 1
+                else:
+                    heapq.heappush(self._heap, (current_deadline, token))
+        return removed
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, token: str):
+        return token in self._sessions
+
+
 class AuthService:
     """
     Single-user authentication with Argon2id password hashing.
@@ -21,13 +120,14 @@ class AuthService:
     - Argon2id password hashing (OWASP recommended)
     - Secure session tokens
     - Session expiry tracking
-    - Auto-lock on idle
+    - Auto-lock on idle (SessionStore, swept periodically by api.py)
     """
 
-    def __init__(self):
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
         self.ph = PasswordHasher()
-        self.sessions: Dict[str, Dict] = {}  # In-memory sessions (stateless alternative: use JWT)
         self.session_timeout = timedelta(minutes=15)  # Auto-lock after 15 min idle
+        # In-memory sessions (stateless alternative: use JWT)
+        self.sessions = SessionStore(self.session_timeout.total_seconds(), clock=clock)
 
     def setup_password(self, password: str, db: Session) -> bool:
         """
@@ -94,13 +194,7 @@ class AuthService:
         Create a new session and return session token.
         """
         token = secrets.token_urlsafe(32)
-
-        self.sessions[token] = {
-            "user_id": user_id,
-            "created_at": datetime.utcnow(),
-            "last_activity": datetime.utcnow()
-        }
-
+        self.sessions.create(token, user_id)
         return token
 
     def validate_session(self, token: str) -> bool:
@@ -108,35 +202,26 @@ class AuthService:
         Validate session token and check if not expired.
         Updates last_activity if valid.
         """
-        if token not in self.sessions:
-            return False
-
-        session = self.sessions[token]
-
-        # Check if session expired
-        elapsed = datetime.utcnow() - session["last_activity"]
-        if elapsed > self.session_timeout:
-            del self.sessions[token]
-            return False
-
-        # Update activity
-        session["last_activity"] = datetime.utcnow()
-        return True
+        return self.sessions.validate(token)
 
     def invalidate_session(self, token: str):
         """Invalidate a session (logout)."""
-        if token in self.sessions:
-            del self.sessions[token]
+        self.sessions.remove(token)
+
+    def sweep_expired_sessions(self) -> int:
+        """Drop idle sessions that were never validated again (periodic job)."""
+        return self.sessions.sweep()
 
     def get_session_info(self, token: str) -> Optional[Dict]:
         """Get session info for debugging/audit."""
-        if token in self.sessions:
-            session = self.sessions[token]
+        session = self.sessions.get(token)
+        if session:
+            idle_seconds = self.sessions.idle_seconds(session)
             return {
-                "user_id": session["user_id"],
-                "created_at": session["created_at"].isoformat(),
-                "last_activity": session["last_activity"].isoformat(),
-                "idle_seconds": (datetime.utcnow() - session["last_activity"]).total_seconds()
+                "user_id": session.user_id,
+                "created_at": session.created_at.isoformat(),
+                "last_activity": (datetime.utcnow() - timedelta(seconds=idle_seconds)).isoformat(),
+                "idle_seconds": idle_seconds
             }
         return None
 
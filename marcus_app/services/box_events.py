@@ -0,0 +1,97 @@
+"""
+BoxEventBus - v0.53
+
+In-process publish/subscribe for box progress, keyed by mission.
+
+BoxRunner publishes as boxes run (worker threads); the SSE endpoint
+subscribes per connection and forwards events to the browser, so the UI no
+longer polls box detail while a long ExtractBox/PracticeBox is running.
+
+Event shape:
+    {
+        'mission_id': int,
+        'box_id': int,
+        'box_type': str,
+        'event': 'started' | 'progress' | 'done' | 'error',
+        'done': int, 'total': int,   # progress only
+        'detail': str,               # progress only
+        'artifacts': [...],          # done only
+        'cached': bool,              # done only
+        'error': str,                # error only
+        'at': ISO timestamp
+    }
+"""
+
+import itertools
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+TERMINAL_EVENTS = ('done', 'error')
+
+
+class BoxEventBus:
+    """Thread-safe fan-out of box events to per-mission subscribers."""
+
+    def __init__(self):
+        self._subscribers: Dict[int, Dict[int, Callable[[Dict[str, Any]], None]]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def subscribe(self, mission_id: int, callback: Callable[[Dict[str, Any]], None]) -> int:
+        """
+        Register callback for mission events. Returns a token for unsubscribe().
+
+        Callbacks run on the publishing thread and must not block (hand off
+        to a queue / loop.call_soon_threadsafe).
+        """
+        token = next(self._ids)
+        with self._lock:
+            self._subscribers.setdefault(mission_id, {})[token] = callback
+        return token
+
+    def unsubscribe(self, mission_id: int, token: int):
+        with self._lock:
+            subscribers = self._subscribers.get(mission_id)
+            if subscribers is not None:
+                subscribers.pop(token, None)
+                if not subscribers:
+                    del self._subscribers[mission_id]
+
+    def subscriber_count(self, mission_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(mission_id, {}))
+
+    def publish(self, mission_id: int, event: Dict[str, Any]):
+        """Deliver event to current subscribers; no-op when nobody listens."""
+        with self._lock:
+            callbacks = list(self._subscribers.get(mission_id, {}).values())
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                # A broken listener must never fail the box run
+                print(f"[BoxEventBus] Subscriber error: {e}")
+
+
+_bus = BoxEventBus()
+
+
+def get_box_event_bus() -> BoxEventBus:
+    """Process-wide bus shared by BoxRunner and the events endpoint."""
+    return _bus
+
+
+def publish_box_event(mission_id: int, box_id: int, box_type: str, event: str, **fields):
+    """Build and publish one box event (see module docstring for fields)."""
+    if not _bus.subscriber_count(mission_id):
+        return
+    payload: Dict[str, Any] = {
+        'mission_id': mission_id,
+        'box_id': box_id,
+        'box_type': box_type,
+        'event': event,
+    }
+    payload.update(fields)
+    payload['at'] = datetime.utcnow().isoformat()
+    _bus.publish(mission_id, payload)
@@ -5,14 +5,36 @@ Executes mission boxes with state machine enforcement.
 Prevents concurrent execution, persists state, creates artifacts.
 """
 
+import os
 import json
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import uuid
+import hashlib
+import threading
+from contextlib import contextmanager
+from concurrent.futures import as_completed
+from typing import Dict, Any, Optional, List, Iterator, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy import Integer, and_, cast, distinct, func, or_, update
 from sqlalchemy.orm import Session
 
 from marcus_app.core.models import (
-    Mission, MissionBox, MissionArtifact, BoxState
+    Mission, MissionBox, MissionArtifact, MissionCitation, BoxRun, BoxState
 )
+from marcus_app.core.bulk import bulk_insert
+from marcus_app.core.life_graph import upsert_entities
+from marcus_app.services.box_events import publish_box_event
+
+
+# Box types whose output is a pure function of their fingerprint inputs.
+# practice (new session each run) and checker (records an answer) are
+# intentionally re-executed every time.
+CACHEABLE_BOX_TYPES = {'inbox', 'extract', 'ask', 'citations'}
+
+# States a box can be (re)started from
+STARTABLE_STATES = [BoxState.IDLE.value, BoxState.READY.value, BoxState.ERROR.value, BoxState.DONE.value]
+
+# A RUNNING box whose lease is not renewed for this long is considered dead
+LEASE_SECONDS = int(os.getenv('MARCUS_BOX_LEASE_SECONDS', '120'))
 
 
 class BoxRunnerError(Exception):
@@ -28,15 +50,31 @@ class BoxRunner:
     - idle/ready → running → done OR error
 
     Concurrency guard:
-    - Prevents running same box twice
+    - Prevents running same box twice: state changes are compare-and-set
+      UPDATEs, so concurrent requests/processes cannot both claim a box
+    - RUNNING carries a lease renewed by a heartbeat; boxes whose runner
+      crashed are reclaimed at startup (reclaim_stale_boxes)
+
+    Memoization (v0.53):
+    - Cacheable boxes record a fingerprint of their inputs (BoxRun)
+    - An unchanged re-run returns the cached artifacts; force=True bypasses
+    - Degraded results (failed search, failed extraction) are not recorded
+
+    Progress (v0.53):
+    - started/progress/done/error events go to the BoxEventBus as they happen
     """
 
+    # SearchService used by AskBox; the API sets its own instance at startup
+    # so boxes share the warmed-up embedding model
+    search_service = None
+
     @staticmethod
     def run_box(
         db: Session,
         mission_id: int,
         box_id: int,
-        input_payload: Optional[Dict[str, Any]] = None
+        input_payload: Optional[Dict[str, Any]] = None,
+        force: bool = False
     ) -> Dict[str, Any]:
         """
         Execute a box and persist state/artifacts.
@@ -46,13 +84,15 @@ class BoxRunner:
             mission_id: Mission ID
             box_id: Box ID to run
             input_payload: Box-specific input data
+            force: Recompute even if an identical earlier run is cached
 
         Returns:
             {
                 'box_id': int,
                 'state': str,
                 'artifacts': List[dict],
-                'error': str | None
+                'error': str | None,
+                'cached': bool
             }
 
         Raises:
@@ -68,51 +108,375 @@ class BoxRunner:
             raise BoxRunnerError(f"Box {box_id} not found in mission {mission_id}")
 
         # Check state (prevent concurrent execution)
-        if box.state == BoxState.RUNNING.value:
+        if box.state == BoxState.RUNNING.value and not BoxRunner.lease_expired(box):
             raise BoxRunnerError(f"Box {box_id} is already running")
 
-        # Validate transition
-        valid_start_states = [BoxState.IDLE.value, BoxState.READY.value, BoxState.ERROR.value]
-        if box.state not in valid_start_states:
-            raise BoxRunnerError(
-                f"Box {box_id} cannot run from state '{box.state}'. "
-                f"Must be one of: {valid_start_states}"
-            )
+        input_payload = input_payload or {}
+        cacheable = box.box_type in CACHEABLE_BOX_TYPES
 
-        # Mark as running
-        box.state = BoxState.RUNNING.value
-        box.last_run_at = datetime.utcnow()
-        box.last_error = None
-        db.commit()
+        # Memoized result for identical inputs
+        if cacheable and not force:
+            cached = BoxRunner._find_cached_run(
+                db, box, BoxRunner._fingerprint(db, box, mission_id, input_payload)
+            )
+            if cached:
+                BoxRunner._claim(db, box, BoxState.DONE.value, {'last_error': None})
+                db.add(BoxRun(
+                    box_id=box.id,
+                    fingerprint=cached.fingerprint,
+                    cache_hit=True,
+                    artifact_ids_json=cached.artifact_ids_json,
+                    result_json=cached.result_json
+                ))
+                db.commit()
+
+                artifacts = json.loads(cached.result_json)
+                publish_box_event(mission_id, box.id, box.box_type, 'done', artifacts=artifacts, cached=True)
+
+                return {
+                    'box_id': box.id,
+                    'state': box.state,
+                    'artifacts': artifacts,
+                    'error': None,
+                    'cached': True
+                }
+
+        # Mark as running (atomic claim + lease)
+        owner = uuid.uuid4().hex
+        now = datetime.utcnow()
+        BoxRunner._claim(db, box, BoxState.RUNNING.value, {
+            'last_run_at': now,
+            'last_error': None,
+            'lease_owner': owner,
+            'lease_expires_at': now + timedelta(seconds=LEASE_SECONDS)
+        })
+        publish_box_event(mission_id, box.id, box.box_type, 'started')
 
         try:
-            # Execute box based on type
-            result = BoxRunner._execute_box_type(
-                db=db,
-                box=box,
-                mission_id=mission_id,
-                input_payload=input_payload or {}
-            )
+            with BoxRunner._lease_heartbeat(db, box.id, owner):
+                # Execute box based on type
+                result = BoxRunner._execute_box_type(
+                    db=db,
+                    box=box,
+                    mission_id=mission_id,
+                    input_payload=input_payload
+                )
+            artifacts = result.get('artifacts', [])
+
+            if cacheable and not result.get('degraded'):
+                # Fingerprint after the run: boxes like ExtractBox change the
+                # inputs they read (new chunks), and the next run sees those
+                db.add(BoxRun(
+                    box_id=box.id,
+                    fingerprint=BoxRunner._fingerprint(db, box, mission_id, input_payload),
+                    cache_hit=False,
+                    artifact_ids_json=json.dumps([a['id'] for a in artifacts]),
+                    result_json=json.dumps(artifacts, default=str)
+                ))
 
             # Mark as done
-            box.state = BoxState.DONE.value
-            db.commit()
+            BoxRunner._release(db, box, owner, BoxState.DONE.value)
+            publish_box_event(mission_id, box.id, box.box_type, 'done', artifacts=artifacts, cached=False)
 
             return {
                 'box_id': box.id,
-                'state': box.state,
-                'artifacts': result.get('artifacts', []),
-                'error': None
+                'state': BoxState.DONE.value,
+                'artifacts': artifacts,
+                'error': None,
+                'cached': False
             }
 
         except Exception as e:
             # Mark as error
-            box.state = BoxState.ERROR.value
-            box.last_error = str(e)
-            db.commit()
+            db.rollback()
+            BoxRunner._release(db, box, owner, BoxState.ERROR.value, error=str(e))
+            publish_box_event(mission_id, box.id, box.box_type, 'error', error=str(e))
 
             raise BoxRunnerError(f"Box execution failed: {str(e)}")
 
+    # ========================================================================
+    # STATE TRANSITIONS (v0.53)
+    # ========================================================================
+
+    @staticmethod
+    def lease_expired(box: MissionBox, now: Optional[datetime] = None) -> bool:
+        """
+        True if a RUNNING box's lease has lapsed (its runner died).
+        A RUNNING box without a lease (written before v0.53) counts as live
+        here; reclaim_stale_boxes() frees those at startup.
+        """
+        return box.lease_expires_at is not None and box.lease_expires_at < (now or datetime.utcnow())
+
+    @staticmethod
+    def _claim(db: Session, box: MissionBox, new_state: str, values: Dict[str, Any]):
+        """
+        Compare-and-set the box into new_state:
+        UPDATE mission_boxes SET state=... WHERE id=... AND (state IN
+        (startable states) OR (state='running' AND lease expired)).
+
+        Exactly one of several concurrent callers (threads or processes)
+        wins; the others get BoxRunnerError.
+        """
+        now = datetime.utcnow()
+        claimed = db.query(MissionBox).filter(
+            MissionBox.id == box.id,
+            or_(
+                MissionBox.state.in_(STARTABLE_STATES),
+                and_(MissionBox.state == BoxState.RUNNING.value, MissionBox.lease_expires_at < now)
+            )
+        ).update(dict(values, state=new_state), synchronize_session=False)
+        if claimed:
+            upsert_entities(db.connection(), MissionBox, [box.id])
+        db.commit()
+
+        if not claimed:
+            db.refresh(box)
+            if box.state == BoxState.RUNNING.value:
+                raise BoxRunnerError(f"Box {box.id} is already running")
+            raise BoxRunnerError(
+                f"Box {box.id} cannot run from state '{box.state}'. "
+                f"Must be one of: {STARTABLE_STATES}"
+            )
+
+    @staticmethod
+    def _release(db: Session, box: MissionBox, owner: str, new_state: str, error: Optional[str] = None):
+        """Finish a run we still hold the lease for (and commit pending results)."""
+        released = db.query(MissionBox).filter(
+            MissionBox.id == box.id,
+            MissionBox.lease_owner == owner
+        ).update({
+            'state': new_state,
+            'last_error': error,
+            'lease_owner': None,
+            'lease_expires_at': None
+        }, synchronize_session=False)
+        if released:
+            upsert_entities(db.connection(), MissionBox, [box.id])
+        db.commit()
+
+        if not released:
+            # Lease expired and the box was reclaimed; leave its state to the new owner
+            print(f"[BoxRunner] Box {box.id} lease lost before finishing ({new_state})")
+
+    @staticmethod
+    @contextmanager
+    def _lease_heartbeat(db: Session, box_id: int, owner: str):
+        """
+        Extend the lease every LEASE_SECONDS/3 from a background thread on
+        its own connection, so long boxes are not reclaimed mid-run. Skipped
+        for databases other processes cannot see (sqlite :memory:).
+        """
+        engine = db.get_bind()
+        if not BoxRunner._shareable(engine.url):
+            yield
+            return
+
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(LEASE_SECONDS / 3):
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(
+                            update(MissionBox)
+                            .where(MissionBox.id == box_id, MissionBox.lease_owner == owner)
+                            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=LEASE_SECONDS))
+                        )
+                except Exception as e:
+                    # Write lock busy etc. - retry on the next beat
+                    print(f"[BoxRunner] Lease heartbeat failed for box {box_id}: {e}")
+
+        thread = threading.Thread(target=beat, name=f"box-lease-{box_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    @staticmethod
+    def _shareable(url) -> bool:
+        """Whether other connections/processes can open this database."""
+        return url.get_backend_name() != 'sqlite' or url.database not in (None, '', ':memory:')
+
+    @staticmethod
+    def reclaim_stale_boxes(db: Session) -> int:
+        """
+        Move RUNNING boxes whose runner is gone (lease expired, or no lease
+        at all - pre-v0.53 rows) to ERROR so they can be run again.
+        Called at startup. Returns the number of boxes reclaimed.
+        """
+        stale = db.query(MissionBox.id).filter(
+            MissionBox.state == BoxState.RUNNING.value,
+            or_(MissionBox.lease_expires_at.is_(None), MissionBox.lease_expires_at < datetime.utcnow())
+        )
+        box_ids = [box_id for (box_id,) in stale]
+        reclaimed = 0
+        if box_ids:
+            reclaimed = db.query(MissionBox).filter(
+                MissionBox.id.in_(box_ids),
+                MissionBox.state == BoxState.RUNNING.value
+            ).update({
+                'state': BoxState.ERROR.value,
+                'last_error': 'Interrupted: runner stopped before finishing (lease expired)',
+                'lease_owner': None,
+                'lease_expires_at': None
+            }, synchronize_session=False)
+            upsert_entities(db.connection(), MissionBox, box_ids)
+        db.commit()
+        return reclaimed
+
+    # ========================================================================
+    # MEMOIZATION
+    # ========================================================================
+
+    @staticmethod
+    def _fingerprint(
+        db: Session,
+        box: MissionBox,
+        mission_id: int,
+        input_payload: Dict[str, Any]
+    ) -> str:
+        """
+        SHA-256 over everything a cacheable box reads:
+        - box type, config_json, input_payload
+        - mission documents (ids + file hashes), extracted texts and chunk
+          ids (document-reading boxes)
+        - other mission artifacts (CitationsBox; its own reports excluded)
+        - search mode and embedding model (AskBox with use_search)
+        """
+        from marcus_app.core.models import Artifact, ExtractedText, TextChunk
+
+        parts: Dict[str, Any] = {
+            'box_type': box.box_type,
+            'config': box.config_json,
+            'input': input_payload
+        }
+
+        if box.box_type in ('extract', 'ask'):
+            documents = db.query(MissionArtifact.id, MissionArtifact.content_json).filter(
+                MissionArtifact.mission_id == mission_id,
+                MissionArtifact.artifact_type == 'document'
+            ).order_by(MissionArtifact.id).all()
+            artifact_ids = sorted({json.loads(content)['artifact_id'] for _, content in documents})
+
+            parts['documents'] = [ma_id for ma_id, _ in documents]
+            parts['files'] = db.query(Artifact.id, Artifact.file_hash).filter(
+                Artifact.id.in_(artifact_ids)
+            ).order_by(Artifact.id).all()
+            parts['extracted'] = db.query(
+                ExtractedText.artifact_id, func.count(ExtractedText.id), func.max(ExtractedText.id)
+            ).filter(
+                ExtractedText.artifact_id.in_(artifact_ids)
+            ).group_by(ExtractedText.artifact_id).order_by(ExtractedText.artifact_id).all()
+            parts['chunks'] = db.query(
+                TextChunk.artifact_id, func.count(TextChunk.id), func.min(TextChunk.id), func.max(TextChunk.id)
+            ).filter(
+                TextChunk.artifact_id.in_(artifact_ids)
+            ).group_by(TextChunk.artifact_id).order_by(TextChunk.artifact_id).all()
+
+            if box.box_type == 'ask' and input_payload.get('use_search', True):
+                parts['search'] = BoxRunner._search_backend_state()
+
+        elif box.box_type == 'citations':
+            parts['artifacts'] = db.query(MissionArtifact.id).filter(
+                MissionArtifact.mission_id == mission_id,
+                (MissionArtifact.box_id != box.id) | (MissionArtifact.box_id.is_(None))
+            ).order_by(MissionArtifact.id).all()
+
+        encoded = json.dumps(parts, sort_keys=True, default=lambda o: list(o) if isinstance(o, tuple) else str(o))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _search_service():
+        """SearchService for AskBox (created on first use outside the API)."""
+        if BoxRunner.search_service is None:
+            from marcus_app.services.search_service import SearchService
+            BoxRunner.search_service = SearchService()
+        return BoxRunner.search_service
+
+    @staticmethod
+    def _search_backend_state() -> Dict[str, Any]:
+        """Search mode + embedding model id; hybrid answers differ from FTS5-only ones."""
+        service = BoxRunner._search_service()
+        embeddings = service.embedding_service
+        return {
+            'mode': 'hybrid' if service.embeddings_available else 'fts5',
+            'model_id': embeddings.model_id if embeddings is not None else None
+        }
+
+    @staticmethod
+    def _find_cached_run(db: Session, box: MissionBox, fingerprint: str) -> Optional[BoxRun]:
+        """Latest computed run with this fingerprint whose artifacts still exist."""
+        cached = db.query(BoxRun).filter(
+            BoxRun.box_id == box.id,
+            BoxRun.fingerprint == fingerprint,
+            BoxRun.cache_hit == False  # noqa: E712
+        ).order_by(BoxRun.id.desc()).first()
+
+        if not cached:
+            return None
+
+        artifact_ids = json.loads(cached.artifact_ids_json or '[]')
+        if artifact_ids:
+            existing = db.query(func.count(MissionArtifact.id)).filter(
+                MissionArtifact.id.in_(artifact_ids)
+            ).scalar()
+            if existing != len(artifact_ids):
+                return None
+
+        return cached
+
+    @staticmethod
+    def get_cache_stats(db: Session, box_id: int) -> Dict[str, Any]:
+        """Memoization hit rate for a box."""
+        runs, hits = db.query(
+            func.count(BoxRun.id),
+            func.coalesce(func.sum(cast(BoxRun.cache_hit, Integer)), 0)
+        ).filter(BoxRun.box_id == box_id).one()
+
+        return {
+            'runs': runs,
+            'hits': int(hits),
+            'hit_rate': round(int(hits) / runs, 4) if runs else 0.0
+        }
+
+    @staticmethod
+    def _progress(box: MissionBox, done: int, total: int, detail: str, **fields):
+        """Publish a progress event for a running box."""
+        publish_box_event(
+            box.mission_id, box.id, box.box_type, 'progress',
+            done=done, total=total, detail=detail, **fields
+        )
+
+    @staticmethod
+    def _process_documents(db: Session, documents: List[Tuple[int, str]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Run extraction + chunking for (artifact_id, filename) pairs.
+
+        Yields (index, result) as documents finish. Uses the process pool when
+        it has more than one worker, there is more than one document and the
+        database is a file other processes can open; otherwise runs in db.
+        """
+        from marcus_app.core.executors import get_process_pool, process_pool_size
+        from marcus_app.services.document_worker import process_document, process_document_in_session
+
+        url = db.get_bind().url
+
+        if len(documents) < 2 or process_pool_size('documents') < 2 or not BoxRunner._shareable(url):
+            for index, (artifact_id, filename) in enumerate(documents):
+                yield index, process_document_in_session(db, artifact_id, filename)
+            return
+
+        db_url = url.render_as_string(hide_password=False)
+        pool = get_process_pool('documents')
+        futures = {
+            pool.submit(process_document, db_url, artifact_id, filename): index
+            for index, (artifact_id, filename) in enumerate(documents)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
     @staticmethod
     def _execute_box_type(
         db: Session,
@@ -125,7 +489,8 @@ class BoxRunner:
 
         Returns:
             {
-                'artifacts': List[dict]  # Created artifacts metadata
+                'artifacts': List[dict],  # Created artifacts metadata
+                'degraded': bool          # Optional; True = do not memoize
             }
         """
         box_type = box.box_type
@@ -175,41 +540,43 @@ class BoxRunner:
         if not artifact_ids:
             raise BoxRunnerError("InboxBox requires 'artifact_ids' in input")
 
-        created_artifacts = []
-
+        # Validate all artifacts in one query
+        artifacts_by_id = {
+            a.id: a for a in db.query(Artifact).filter(Artifact.id.in_(artifact_ids)).all()
+        }
         for artifact_id in artifact_ids:
-            # Validate artifact exists
-            artifact = db.query(Artifact).filter(Artifact.id == artifact_id).first()
-            if not artifact:
+            if artifact_id not in artifacts_by_id:
                 raise BoxRunnerError(f"Artifact {artifact_id} not found")
 
-            # Create mission artifact
-            mission_artifact = MissionArtifact(
-                mission_id=mission_id,
-                box_id=box.id,
-                artifact_type='document',
-                title=artifact.original_filename,
-                content_json=json.dumps({
+        # Create mission artifacts (bulk insert)
+        rows = []
+        for artifact_id in artifact_ids:
+            artifact = artifacts_by_id[artifact_id]
+            rows.append({
+                'mission_id': mission_id,
+                'box_id': box.id,
+                'artifact_type': 'document',
+                'title': artifact.original_filename,
+                'content_json': json.dumps({
                     'artifact_id': artifact.id,
                     'filename': artifact.original_filename,
                     'file_type': artifact.file_type,
                     'file_size': artifact.file_size
                 }),
-                source_refs_json=json.dumps({
+                'source_refs_json': json.dumps({
                     'artifact_id': artifact.id,
                     'filename': artifact.original_filename
                 })
-            )
-
-            db.add(mission_artifact)
-            created_artifacts.append({
-                'id': mission_artifact.id,
-                'type': 'document',
-                'title': mission_artifact.title
             })
 
+        artifact_row_ids = bulk_insert(db, MissionArtifact, rows)
         db.commit()
 
+        created_artifacts = [
+            {'id': row_id, 'type': 'document', 'title': row['title']}
+            for row_id, row in zip(artifact_row_ids, rows)
+        ]
+
         return {'artifacts': created_artifacts}
 
     # ========================================================================
@@ -232,13 +599,13 @@ class BoxRunner:
         - For each, ensure text_chunks exist
         - Create report artifact
 
+        Documents are processed in parallel on the "documents" process pool
+        (MARCUS_DOCUMENT_PROCESSES); each worker commits its own extracted
+        text and chunks. Report lines keep mission document order.
+
         Output:
             mission_artifact(type=note) with processing report
         """
-        from marcus_app.core.models import Artifact, ExtractedText, TextChunk
-        from marcus_app.services.extraction_service import ExtractionService
-        from marcus_app.services.chunking_service import ChunkingService
-
         # Get mission document artifacts
         mission_artifacts = db.query(MissionArtifact).filter(
             MissionArtifact.mission_id == mission_id,
@@ -248,60 +615,26 @@ class BoxRunner:
         if not mission_artifacts:
             raise BoxRunnerError("No documents linked to mission. Run InboxBox first.")
 
-        report_lines = []
-        total_chunks_created = 0
-        artifacts_processed = 0
-
+        documents = []
         for mission_artifact in mission_artifacts:
             content_data = json.loads(mission_artifact.content_json)
-            artifact_id = content_data['artifact_id']
-
-            artifact = db.query(Artifact).filter(Artifact.id == artifact_id).first()
-            if not artifact:
-                report_lines.append(f"- {content_data['filename']}: Artifact not found (skipped)")
-                continue
-
-            # Check if extracted text exists
-            extracted_text = db.query(ExtractedText).filter(
-                ExtractedText.artifact_id == artifact_id
-            ).first()
-
-            if not extracted_text:
-                # Extract text (offline extraction)
-                try:
-                    result = ExtractionService.extract_text(db, artifact.id)
-                    extracted_text = db.query(ExtractedText).filter(
-                        ExtractedText.artifact_id == artifact_id
-                    ).first()
-                    report_lines.append(f"- {artifact.original_filename}: Extracted text")
-                except Exception as e:
-                    report_lines.append(f"- {artifact.original_filename}: Extraction failed ({str(e)})")
-                    continue
+            documents.append((content_data['artifact_id'], content_data['filename']))
 
-            # Check if chunks exist
-            existing_chunks = db.query(TextChunk).filter(
-                TextChunk.artifact_id == artifact_id
-            ).count()
+        BoxRunner._progress(box, 0, len(documents), f"Processing {len(documents)} documents", chunks=0)
 
-            if existing_chunks == 0 and extracted_text:
-                # Create chunks
-                try:
-                    chunking_service = ChunkingService()
-                    chunks = chunking_service.chunk_extracted_text(
-                        extracted_text=extracted_text,
-                        db=db
-                    )
-                    chunks_created = len(chunks)
-                    total_chunks_created += chunks_created
-                    report_lines.append(f"- {artifact.original_filename}: Created {chunks_created} chunks")
-                except Exception as e:
-                    report_lines.append(f"- {artifact.original_filename}: Chunking failed ({str(e)})")
-                    continue
-            else:
-                report_lines.append(f"- {artifact.original_filename}: Already chunked ({existing_chunks} chunks)")
-                total_chunks_created += existing_chunks
+        results = [None] * len(documents)
+        total_chunks_created = 0
+        for done, (index, result) in enumerate(BoxRunner._process_documents(db, documents), 1):
+            results[index] = result
+            total_chunks_created += result['chunks']
+            BoxRunner._progress(
+                box, done, len(documents), f"Processed {documents[index][1]}",
+                chunks=total_chunks_created
+            )
 
-            artifacts_processed += 1
+        report_lines = [line for result in results for line in result['lines']]
+        artifacts_processed = sum(1 for result in results if result['processed'])
+        failed = len(results) - artifacts_processed
 
         # Create report artifact
         report_md = "## Extraction Report\n\n"
@@ -330,7 +663,9 @@ class BoxRunner:
                 'type': 'note',
                 'title': report_artifact.title,
                 'summary': f"{artifacts_processed} artifacts, {total_chunks_created} chunks"
-            }]
+            }],
+            # Failed documents may extract on retry; don't memoize the report
+            'degraded': failed > 0
         }
 
     # ========================================================================
@@ -354,8 +689,6 @@ class BoxRunner:
         Output:
             mission_artifact(type=qa) with answer + citations
         """
-        from marcus_app.services.search_service import SearchService
-
         question = input_payload.get('question', '').strip()
         use_search = input_payload.get('use_search', True)
 
@@ -378,15 +711,17 @@ class BoxRunner:
         answer_md = ""
         confidence = "low"
         method = "heuristic"
+        degraded = False
 
         if use_search and artifact_ids:
             # Search scoped to mission artifacts
+            backend_state = BoxRunner._search_backend_state()
             try:
-                search_results = SearchService.search(
-                    db=db,
+                search_results = BoxRunner._search_service().search(
                     query=question,
                     artifact_ids=artifact_ids,
-                    limit=5
+                    limit=5,
+                    db=db
                 )
 
                 if search_results:
@@ -399,7 +734,7 @@ class BoxRunner:
                         citations.append({
                             'chunk_id': result['chunk_id'],
                             'artifact_id': result['artifact_id'],
-                            'filename': result.get('filename', 'Unknown'),
+                            'filename': result.get('artifact_filename') or 'Unknown',
                             'page': result.get('page_number'),
                             'relevance': result.get('score', 0)
                         })
@@ -414,6 +749,11 @@ class BoxRunner:
             except Exception as e:
                 answer_md = f"Search failed: {str(e)}\n\nFalling back to general knowledge mode."
                 confidence = "low"
+                degraded = True
+
+            # Embedding model finished loading (or was evicted) mid-run: the
+            # answer does not match the backend state the fingerprint will see
+            degraded = degraded or BoxRunner._search_backend_state() != backend_state
         else:
             # No search - general knowledge mode
             answer_md = f"## General Knowledge Response\n\nQuestion: {question}\n\n"
@@ -442,6 +782,8 @@ class BoxRunner:
         )
 
         db.add(qa_artifact)
+        db.flush()
+        BoxRunner.record_citations(db, mission_id, qa_artifact.id, citations)
         db.commit()
 
         return {
@@ -452,7 +794,8 @@ class BoxRunner:
                 'answer': answer_md,
                 'citations': citations,
                 'confidence': confidence
-            }]
+            }],
+            'degraded': degraded
         }
 
     # ========================================================================
@@ -470,14 +813,15 @@ class BoxRunner:
         PracticeBox: Generate practice questions from mission materials.
 
         Input:
-            topic_keywords: Optional[str] - Filter chunks by topic
+            topic_keywords: Optional[str] - Rank chunks by topic (FTS5)
             question_count: int (default 10)
 
         Output:
             practice_session + practice_items
             mission_artifact(type=practice_session)
         """
-        from marcus_app.core.models import TextChunk, PracticeSession, PracticeItem
+        from marcus_app.core.models import PracticeSession, PracticeItem
+        from marcus_app.services.chunk_selection import ChunkSelectionService
 
         topic_keywords = input_payload.get('topic_keywords', '')
         question_count = input_payload.get('question_count', 10)
@@ -497,14 +841,10 @@ class BoxRunner:
             content_data = json.loads(ma.content_json)
             artifact_ids.append(content_data['artifact_id'])
 
-        # Get chunks from mission artifacts
-        query = db.query(TextChunk).filter(TextChunk.artifact_id.in_(artifact_ids))
-
-        if topic_keywords:
-            # Simple keyword filter
-            query = query.filter(TextChunk.content.like(f'%{topic_keywords}%'))
-
-        chunks = query.limit(50).all()  # Get top 50 chunks
+        # Relevant, topically distinct chunks from mission artifacts
+        chunks = ChunkSelectionService.select_for_practice(
+            db, artifact_ids, question_count, topic_keywords
+        )
 
         if not chunks:
             raise BoxRunnerError("No chunks found. Run ExtractBox first.")
@@ -519,7 +859,7 @@ class BoxRunner:
         db.flush()  # Get session ID
 
         # Generate practice items (heuristic - extract key concepts)
-        practice_items_created = []
+        item_rows = []
         chunks_used = min(question_count, len(chunks))
 
         for i, chunk in enumerate(chunks[:chunks_used]):
@@ -534,23 +874,24 @@ class BoxRunner:
             else:
                 prompt = f"Q{i+1}: Explain in your own words:\n\n{content[:150]}..."
 
-            practice_item = PracticeItem(
-                session_id=practice_session.id,
-                prompt_md=prompt,
-                expected_answer=None,  # Heuristic mode - no expected answer
-                state='unanswered',
-                citations_json=json.dumps([{
+            item_rows.append({
+                'session_id': practice_session.id,
+                'prompt_md': prompt,
+                'expected_answer': None,  # Heuristic mode - no expected answer
+                'state': 'unanswered',
+                'citations_json': json.dumps([{
                     'chunk_id': chunk.id,
                     'artifact_id': chunk.artifact_id,
                     'page': chunk.page_number
                 }])
-            )
-
-            db.add(practice_item)
-            practice_items_created.append({
-                'id': practice_item.id,
-                'prompt': prompt[:100] + '...'
             })
+            BoxRunner._progress(box, i + 1, chunks_used, f"Generated Q{i+1}")
+
+        item_ids = bulk_insert(db, PracticeItem, item_rows)
+        practice_items_created = [
+            {'id': item_id, 'prompt': row['prompt_md'][:100] + '...'}
+            for item_id, row in zip(item_ids, item_rows)
+        ]
 
         db.commit()
 
@@ -572,6 +913,10 @@ class BoxRunner:
         )
 
         db.add(artifact)
+        db.flush()
+        BoxRunner.record_citations(db, mission_id, artifact.id, [
+            citation for row in item_rows for citation in json.loads(row['citations_json'])
+        ])
         db.commit()
 
         return {
@@ -602,6 +947,9 @@ class BoxRunner:
             session_id: int
             item_id: int
             user_answer: str
+          or, to grade many items at once (see _run_checker_batch):
+            session_id: int
+            answers: List[{item_id: int, user_answer: str}]
 
         Output:
             Updates practice_item state
@@ -610,6 +958,9 @@ class BoxRunner:
         """
         from marcus_app.core.models import PracticeSession, PracticeItem, Claim
 
+        if input_payload.get('answers') is not None:
+            return BoxRunner._run_checker_batch(db, box, mission_id, input_payload)
+
         session_id = input_payload.get('session_id')
         item_id = input_payload.get('item_id')
         user_answer = input_payload.get('user_answer', '').strip()
@@ -626,14 +977,7 @@ class BoxRunner:
         if not practice_item:
             raise BoxRunnerError(f"Practice item {item_id} not found")
 
-        # Update user answer
-        practice_item.user_answer = user_answer
-        practice_item.answered_at = datetime.utcnow()
-
-        # Check correctness (heuristic since no expected_answer in v0.44-final)
-        # Simple heuristic: check if answer is substantive
-        is_correct = len(user_answer) > 20  # At least 20 chars = attempted answer
-        practice_item.state = 'correct' if is_correct else 'incorrect'
+        is_correct = BoxRunner._grade_practice_item(practice_item, user_answer)
 
         # Get citations from practice item
         citations_data = json.loads(practice_item.citations_json) if practice_item.citations_json else []
@@ -642,27 +986,13 @@ class BoxRunner:
         # Note: Claims table requires plan_id, but we'll create without plan for now
         # This is a design compromise - ideally we'd have a mission_claims table
 
-        # Create checks JSON
-        checks = {
-            'answer_length': len(user_answer),
-            'has_content': len(user_answer) > 20,
-            'timestamp': datetime.utcnow().isoformat()
-        }
-        practice_item.checks_json = json.dumps(checks)
-
         # Update session score
         session = db.query(PracticeSession).filter(
             PracticeSession.id == session_id
         ).first()
 
         if session:
-            score = json.loads(session.score_json)
-            score['attempted'] = score.get('attempted', 0) + 1
-            if is_correct:
-                score['correct'] = score.get('correct', 0) + 1
-            else:
-                score['incorrect'] = score.get('incorrect', 0) + 1
-            session.score_json = json.dumps(score)
+            BoxRunner._update_practice_score(session, [is_correct])
 
         db.commit()
 
@@ -703,10 +1033,163 @@ class BoxRunner:
             }]
         }
 
+    @staticmethod
+    def _run_checker_batch(
+        db: Session,
+        box: MissionBox,
+        mission_id: int,
+        input_payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        CheckerBox batch mode: grade many answers of one session.
+
+        Each answer is graded exactly as a single check would, in the given
+        order. All items, one score update and one consolidated verification
+        artifact are committed in a single transaction.
+
+        Output:
+            mission_artifact(type=verification) covering every answer
+        """
+        from marcus_app.core.models import PracticeSession, PracticeItem
+
+        session_id = input_payload.get('session_id')
+        answers = input_payload.get('answers') or []
+
+        if not session_id or not answers:
+            raise BoxRunnerError("CheckerBox batch requires session_id and answers")
+
+        item_ids = [answer.get('item_id') for answer in answers]
+        items_by_id = {
+            item.id: item for item in db.query(PracticeItem).filter(
+                PracticeItem.session_id == session_id,
+                PracticeItem.id.in_(item_ids)
+            ).all()
+        }
+        missing = [item_id for item_id in item_ids if item_id not in items_by_id]
+        if missing:
+            raise BoxRunnerError(f"Practice items not found: {missing}")
+
+        session = db.query(PracticeSession).filter(
+            PracticeSession.id == session_id
+        ).first()
+
+        results = []
+        verification_md = f"## Verification Results ({len(answers)} answers)\n\n"
+        for answer in answers:
+            practice_item = items_by_id[answer['item_id']]
+            user_answer = (answer.get('user_answer') or '').strip()
+            is_correct = BoxRunner._grade_practice_item(practice_item, user_answer)
+            results.append({'item_id': practice_item.id, 'result': practice_item.state})
+
+            verification_md += f"### Q{practice_item.id}: {'✓ Acceptable' if is_correct else '✗ Needs more detail'}\n\n"
+            verification_md += f"**Question:** {practice_item.prompt_md[:150]}...\n\n"
+            verification_md += f"**Your Answer:** {user_answer[:200]}...\n\n"
+
+            citations_data = json.loads(practice_item.citations_json) if practice_item.citations_json else []
+            if citations_data:
+                verification_md += f"**Source Material:**\n"
+                for cite in citations_data:
+                    verification_md += f"- Chunk {cite.get('chunk_id')} (Page {cite.get('page', 'N/A')})\n"
+                verification_md += "\n"
+
+        score = None
+        if session:
+            score = BoxRunner._update_practice_score(
+                session, [r['result'] == 'correct' for r in results]
+            )
+
+        correct = sum(1 for r in results if r['result'] == 'correct')
+        artifact = MissionArtifact(
+            mission_id=mission_id,
+            box_id=box.id,
+            artifact_type='verification',
+            title=f'Check Results: {correct}/{len(results)} acceptable',
+            content_json=verification_md,
+            source_refs_json=json.dumps({
+                'session_id': session_id,
+                'item_ids': [r['item_id'] for r in results],
+                'results': results
+            })
+        )
+
+        db.add(artifact)
+        db.commit()
+
+        return {
+            'artifacts': [{
+                'id': artifact.id,
+                'type': 'verification',
+                'title': artifact.title,
+                'results': results,
+                'score': score,
+                'verification_md': verification_md
+            }]
+        }
+
+    @staticmethod
+    def _grade_practice_item(practice_item: Any, user_answer: str) -> bool:
+        """Record and grade one answer on its practice item (no commit)."""
+        # Update user answer
+        practice_item.user_answer = user_answer
+        practice_item.answered_at = datetime.utcnow()
+
+        # Check correctness (heuristic since no expected_answer in v0.44-final)
+        # Simple heuristic: check if answer is substantive
+        is_correct = len(user_answer) > 20  # At least 20 chars = attempted answer
+        practice_item.state = 'correct' if is_correct else 'incorrect'
+
+        # Create checks JSON
+        checks = {
+            'answer_length': len(user_answer),
+            'has_content': len(user_answer) > 20,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        practice_item.checks_json = json.dumps(checks)
+
+        return is_correct
+
+    @staticmethod
+    def _update_practice_score(session: Any, outcomes: List[bool]) -> Dict[str, int]:
+        """Add graded outcomes to the session's score_json (one rewrite)."""
+        score = json.loads(session.score_json)
+        score['attempted'] = score.get('attempted', 0) + len(outcomes)
+        correct = sum(1 for is_correct in outcomes if is_correct)
+        if correct:
+            score['correct'] = score.get('correct', 0) + correct
+        if len(outcomes) - correct:
+            score['incorrect'] = score.get('incorrect', 0) + len(outcomes) - correct
+        session.score_json = json.dumps(score)
+        return score
+
     # ========================================================================
     # CITATIONS BOX (v0.44-final)
     # ========================================================================
 
+    @staticmethod
+    def record_citations(
+        db: Session,
+        mission_id: int,
+        mission_artifact_id: int,
+        citations: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Index the citations of a mission artifact in mission_citations.
+
+        Call in the same transaction that creates the artifact. Does not
+        commit. Returns the number of rows written.
+        """
+        rows = [
+            {
+                'mission_id': mission_id,
+                'mission_artifact_id': mission_artifact_id,
+                'artifact_id': cite.get('artifact_id'),
+                'chunk_id': cite.get('chunk_id')
+            }
+            for cite in citations
+            if isinstance(cite, dict)
+        ]
+        return len(bulk_insert(db, MissionCitation, rows))
+
     @staticmethod
     def _run_citations_box(
         db: Session,
@@ -717,58 +1200,51 @@ class BoxRunner:
         """
         CitationsBox: Aggregate all citations used in mission.
 
+        Reads the mission_citations index written by AskBox/PracticeBox.
+
         Output:
             mission_artifact(type=citation) with citation report
         """
-        from collections import Counter
-
-        # Get all mission artifacts
-        mission_artifacts = db.query(MissionArtifact).filter(
+        # Artifact counts per type, in order of first appearance
+        artifacts_by_type = db.query(
+            MissionArtifact.artifact_type, func.count(MissionArtifact.id)
+        ).filter(
             MissionArtifact.mission_id == mission_id
-        ).all()
-
-        # Aggregate citations
-        all_citations = []
-        artifacts_by_type = Counter()
-        chunk_usage = Counter()
-
-        for artifact in mission_artifacts:
-            artifacts_by_type[artifact.artifact_type] += 1
-
-            # Parse source_refs_json for citations
-            if artifact.source_refs_json:
-                try:
-                    refs = json.loads(artifact.source_refs_json)
-                    if isinstance(refs, dict) and 'citations' in refs:
-                        citations = refs['citations']
-                        if isinstance(citations, list):
-                            all_citations.extend(citations)
-                            for cite in citations:
-                                if 'chunk_id' in cite:
-                                    chunk_usage[cite['chunk_id']] += 1
-                except:
-                    pass
+        ).group_by(MissionArtifact.artifact_type).order_by(func.min(MissionArtifact.id)).all()
+        artifact_count = sum(count for _, count in artifacts_by_type)
+
+        # Citation index (mission_citations): totals and top chunks
+        total_citations, unique_chunks = db.query(
+            func.count(MissionCitation.id), func.count(distinct(MissionCitation.chunk_id))
+        ).filter(MissionCitation.mission_id == mission_id).one()
+
+        uses = func.count(MissionCitation.id)
+        top_chunks = db.query(MissionCitation.chunk_id, uses).filter(
+            MissionCitation.mission_id == mission_id,
+            MissionCitation.chunk_id.isnot(None)
+        ).group_by(MissionCitation.chunk_id).order_by(
+            uses.desc(), func.min(MissionCitation.id)
+        ).limit(10).all()
 
         # Build citation report
         report_md = "## Citation Report\n\n"
         report_md += f"**Mission:** {mission_id}\n\n"
-        report_md += f"**Total Artifacts:** {len(mission_artifacts)}\n\n"
+        report_md += f"**Total Artifacts:** {artifact_count}\n\n"
 
         report_md += "### Artifacts by Type\n\n"
-        for artifact_type, count in artifacts_by_type.items():
+        for artifact_type, count in artifacts_by_type:
             report_md += f"- {artifact_type}: {count}\n"
 
         report_md += "\n### Top Cited Chunks\n\n"
-        if chunk_usage:
-            top_chunks = chunk_usage.most_common(10)
+        if top_chunks:
             for chunk_id, count in top_chunks:
                 report_md += f"- Chunk {chunk_id}: cited {count} time(s)\n"
         else:
             report_md += "*No citations recorded*\n"
 
         report_md += f"\n### Citation Statistics\n\n"
-        report_md += f"- Total citations: {len(all_citations)}\n"
-        report_md += f"- Unique chunks: {len(chunk_usage)}\n"
+        report_md += f"- Total citations: {total_citations}\n"
+        report_md += f"- Unique chunks: {unique_chunks}\n"
 
         # Create citation artifact
         artifact = MissionArtifact(
@@ -778,9 +1254,9 @@ class BoxRunner:
             title='Mission Citation Report',
             content_json=report_md,
             source_refs_json=json.dumps({
-                'total_citations': len(all_citations),
-                'unique_chunks': len(chunk_usage),
-                'artifacts_analyzed': len(mission_artifacts)
+                'total_citations': total_citations,
+                'unique_chunks': unique_chunks,
+                'artifacts_analyzed': artifact_count
             })
         )
 
@@ -792,7 +1268,7 @@ class BoxRunner:
                 'id': artifact.id,
                 'type': 'citation',
                 'title': artifact.title,
-                'total_citations': len(all_citations),
+                'total_citations': total_citations,
                 'report': report_md
             }]
         }
@@ -0,0 +1,239 @@
+"""
+Chunk selection for PracticeBox (v0.53).
+
+Picks the chunks practice questions are generated from:
+
+1. Candidates, scoped to the mission's artifacts (artifact_id IN ...):
+   - with topic keywords: FTS5 bm25 ranking over text_chunks_fts (best
+     few per section), falling back to the old LIKE filter if the index is missing or has
+     no matches for these artifacts
+   - without keywords: chunks evenly spaced through every document
+2. Diversity: Maximal Marginal Relevance over the candidate pool, so
+   questions cover distinct topics instead of near-duplicate chunks.
+   Chunks of the same document section count as the same topic; other
+   pairs use cosine over stored embeddings when every candidate has one
+   from the same model, otherwise token-set Jaccard.
+"""
+
+import re
+import json
+import math
+from typing import List, Optional, Callable
+
+from sqlalchemy import text, bindparam, func
+from sqlalchemy.orm import Session
+
+from marcus_app.core.models import TextChunk
+
+
+CANDIDATE_FACTOR = 5         # candidates fetched per requested question
+MIN_CANDIDATES = 50          # never consider fewer than the pre-v0.53 limit
+PER_SECTION_CANDIDATES = 3   # keyword candidates kept per document section
+MMR_LAMBDA = 0.7             # relevance vs. diversity trade-off
+
+_TOKEN_RE = re.compile(r"[a-z0-9]{3,}")
+
+
+class ChunkSelectionService:
+    """Mission-scoped, relevance-ranked, diversity-sampled chunk selection."""
+
+    @staticmethod
+    def select_for_practice(
+        db: Session,
+        artifact_ids: List[int],
+        count: int,
+        topic_keywords: Optional[str] = None
+    ) -> List[TextChunk]:
+        """
+        Return up to count chunks of artifact_ids, most relevant first.
+        """
+        if not artifact_ids or count <= 0:
+            return []
+
+        pool_size = max(count * CANDIDATE_FACTOR, MIN_CANDIDATES)
+
+        ranked = []
+        if topic_keywords:
+            ranked = ChunkSelectionService._fts_candidates(db, artifact_ids, topic_keywords, pool_size)
+            if not ranked:
+                ranked = ChunkSelectionService._like_candidates(db, artifact_ids, topic_keywords, pool_size)
+        else:
+            ranked = ChunkSelectionService._spread_candidates(db, artifact_ids, pool_size)
+
+        if not ranked:
+            return []
+
+        ids = [chunk_id for chunk_id, _ in ranked]
+        chunks_by_id = {c.id: c for c in db.query(TextChunk).filter(TextChunk.id.in_(ids)).all()}
+        candidates = [chunks_by_id[chunk_id] for chunk_id in ids if chunk_id in chunks_by_id]
+        relevance = [score for chunk_id, score in ranked if chunk_id in chunks_by_id]
+
+        order = mmr(relevance, _similarity_for(candidates), count)
+        return [candidates[i] for i in order]
+
+    @staticmethod
+    def _fts_candidates(db: Session, artifact_ids: List[int], keywords: str, limit: int) -> List[tuple]:
+        """(chunk_id, relevance) by bm25; [] if FTS5 is unavailable."""
+        terms = _TOKEN_RE.findall(keywords.lower()) or keywords.split()
+        if not terms:
+            return []
+        fts_query = ' OR '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+        # MMR treats a section's chunks as one topic, so only its best few
+        # compete for the pool
+        sql = text("""
+            SELECT id, rank FROM (
+                SELECT tc.id, text_chunks_fts.rank AS rank,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY tc.artifact_id, tc.section_title
+                           ORDER BY text_chunks_fts.rank
+                       ) AS section_rank
+                FROM text_chunks_fts
+                JOIN text_chunks tc ON tc.id = text_chunks_fts.rowid
+                WHERE text_chunks_fts MATCH :fts_query
+                  AND tc.artifact_id IN :artifact_ids
+            )
+            WHERE section_rank <= :per_section
+            ORDER BY rank, id
+            LIMIT :limit
+        """).bindparams(bindparam('artifact_ids', expanding=True))
+
+        try:
+            rows = db.execute(sql, {
+                'fts_query': fts_query,
+                'artifact_ids': list(artifact_ids),
+                'per_section': PER_SECTION_CANDIDATES,
+                'limit': limit
+            }).fetchall()
+        except Exception as e:
+            print(f"[ChunkSelection] FTS5 query failed, using LIKE: {e}")
+            return []
+
+        if not rows:
+            return []
+
+        # bm25 ranks are negative; the best (most negative) maps to 1.0
+        best = abs(rows[0][1]) or 1.0
+        return [(row[0], abs(row[1]) / best) for row in rows]
+
+    @staticmethod
+    def _like_candidates(db: Session, artifact_ids: List[int], keywords: str, limit: int) -> List[tuple]:
+        """Pre-v0.53 substring filter, scoped and in storage order."""
+        rows = db.query(TextChunk.id).filter(
+            TextChunk.artifact_id.in_(artifact_ids),
+            TextChunk.content.like(f'%{keywords}%')
+        ).order_by(TextChunk.id).limit(limit).all()
+        return [(row.id, 1.0) for row in rows]
+
+    @staticmethod
+    def _spread_candidates(db: Session, artifact_ids: List[int], limit: int) -> List[tuple]:
+        """
+        Chunks evenly spaced through each document, documents interleaved.
+
+        Documents move through their topics in order, so spacing samples
+        across sections; each pick is an (artifact_id, id) index seek
+        instead of sorting every chunk of the mission.
+        """
+        spans = db.query(
+            TextChunk.artifact_id, func.min(TextChunk.id), func.max(TextChunk.id), func.count(TextChunk.id)
+        ).filter(
+            TextChunk.artifact_id.in_(artifact_ids)
+        ).group_by(TextChunk.artifact_id).order_by(TextChunk.artifact_id).all()
+
+        if not spans:
+            return []
+
+        per_document = -(-limit // len(spans))  # ceil
+        targets = []
+        for artifact_id, low, high, count in spans:
+            slots = min(per_document, count)
+            for slot in range(slots):
+                offset = (high - low) * slot // (slots - 1) if slots > 1 else 0
+                targets.append((slot, artifact_id, low + offset))
+
+        # One statement: per target, the first chunk of that document at or after it
+        values = ', '.join(f'(:s{i}, :a{i}, :t{i})' for i in range(len(targets)))
+        params = {}
+        for i, (slot, artifact_id, target) in enumerate(targets):
+            params.update({f's{i}': slot, f'a{i}': artifact_id, f't{i}': target})
+
+        rows = db.execute(text(f"""
+            WITH targets(slot, artifact_id, target) AS (VALUES {values})
+            SELECT t.slot, t.artifact_id, (
+                SELECT MIN(tc.id) FROM text_chunks tc
+                WHERE tc.artifact_id = t.artifact_id AND tc.id >= t.target
+            ) AS chunk_id
+            FROM targets t
+            ORDER BY t.slot, t.artifact_id
+        """), params).fetchall()
+
+        ids, seen = [], set()
+        for slot, artifact_id, chunk_id in rows:
+            if chunk_id is not None and chunk_id not in seen:
+                seen.add(chunk_id)
+                ids.append(chunk_id)
+        return [(chunk_id, 1.0) for chunk_id in ids[:limit]]
+
+
+def mmr(
+    relevance: List[float],
+    similarity: Callable[[int, int], float],
+    k: int,
+    lambda_: float = MMR_LAMBDA
+) -> List[int]:
+    """
+    Maximal Marginal Relevance: greedily pick the candidate maximizing
+    lambda * relevance - (1 - lambda) * max similarity to those picked.
+
+    Ties go to the earlier candidate, so the result is deterministic.
+    Returns candidate indexes in pick order.
+    """
+    remaining = list(range(len(relevance)))
+    max_sim = [0.0] * len(relevance)
+    selected = []
+
+    while remaining and len(selected) < k:
+        best = max(remaining, key=lambda i: (lambda_ * relevance[i] - (1 - lambda_) * max_sim[i], -i))
+        selected.append(best)
+        remaining.remove(best)
+        for i in remaining:
+            max_sim[i] = max(max_sim[i], similarity(i, best))
+
+    return selected
+
+
+def _similarity_for(chunks: List[TextChunk]) -> Callable[[int, int], float]:
+    """Same section -> 1.0; else embedding cosine if available, else Jaccard."""
+    sections = [(c.artifact_id, c.section_title) if c.section_title else None for c in chunks]
+    content_similarity = _content_similarity_for(chunks)
+
+    def similarity(a: int, b: int) -> float:
+        if sections[a] is not None and sections[a] == sections[b]:
+            return 1.0
+        return content_similarity(a, b)
+
+    return similarity
+
+
+def _content_similarity_for(chunks: List[TextChunk]) -> Callable[[int, int], float]:
+    """Embedding cosine if every chunk has a same-model vector, else Jaccard."""
+    models = {c.embedding_model for c in chunks}
+    if chunks and None not in models and len(models) == 1 and all(c.embedding_vector for c in chunks):
+        try:
+            vectors = [_unit(json.loads(c.embedding_vector)) for c in chunks]
+            return lambda a, b: sum(x * y for x, y in zip(vectors[a], vectors[b]))
+        except (ValueError, TypeError):
+            pass
+
+    token_sets = [frozenset(_TOKEN_RE.findall(c.content.lower())) for c in chunks]
+
+    def jaccard(a: int, b: int) -> float:
+        union = len(token_sets[a] | token_sets[b])
+        return len(token_sets[a] & token_sets[b]) / union if union else 0.0
+
+    return jaccard
+
+
+def _unit(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
@@ -8,6 +8,7 @@ import re
 from sqlalchemy.orm import Session
 
 from ..core.models import ExtractedText, TextChunk, Artifact, Assignment
+from ..core.bulk import bulk_insert
 
 
 class ChunkingService:
@@ -37,10 +38,14 @@ class ChunkingService:
         self,
         extracted_text: ExtractedText,
         db: Session
-    ) -> List[TextChunk]:
+    ) -> List[int]:
         """
         Chunk an ExtractedText object into TextChunk records.
-        Returns created chunks.
+
+        Rows are written through a single bulk INSERT (see core.bulk) rather
+        than one db.add() per chunk - a textbook yields thousands of chunks.
+
+        Returns ids of created chunks, in chunk_index order.
         """
         # Get artifact context
         artifact = db.query(Artifact).filter(
@@ -64,27 +69,39 @@ class ChunkingService:
         raw_chunks = self._split_into_chunks(extracted_text.content)
 
         # Create TextChunk records
-        chunks = []
-        for idx, chunk_data in enumerate(raw_chunks):
-            chunk = TextChunk(
-                extracted_text_id=extracted_text.id,
-                artifact_id=artifact.id,
-                assignment_id=artifact.assignment_id,
-                class_id=class_id,
-                chunk_index=idx,
-                content=chunk_data['text'],
-                chunk_type=chunk_data['type'],
-                section_title=chunk_data.get('section_title'),
-                page_number=chunk_data.get('page_number'),
-                word_count=len(chunk_data['text'].split()),
-                char_start=chunk_data['char_start'],
-                char_end=chunk_data['char_end']
-            )
-            db.add(chunk)
-            chunks.append(chunk)
+        rows = self.build_chunk_rows(extracted_text.id, artifact, class_id, raw_chunks)
+        chunk_ids = bulk_insert(db, TextChunk, rows)
 
         db.commit()
-        return chunks
+        return chunk_ids
+
+    @staticmethod
+    def build_chunk_rows(
+        extracted_text_id: int,
+        artifact: Artifact,
+        class_id: Optional[int],
+        raw_chunks: List[Dict]
+    ) -> List[Dict]:
+        """
+        Map raw chunk dicts (from _split_into_chunks) to text_chunks column dicts.
+        """
+        return [
+            {
+                'extracted_text_id': extracted_text_id,
+                'artifact_id': artifact.id,
+                'assignment_id': artifact.assignment_id,
+                'class_id': class_id,
+                'chunk_index': idx,
+                'content': chunk_data['text'],
+                'chunk_type': chunk_data['type'],
+                'section_title': chunk_data.get('section_title'),
+                'page_number': chunk_data.get('page_number'),
+                'word_count': len(chunk_data['text'].split()),
+                'char_start': chunk_data['char_start'],
+                'char_end': chunk_data['char_end']
+            }
+            for idx, chunk_data in enumerate(raw_chunks)
+        ]
 
     def _split_into_chunks(self, text: str) -> List[Dict]:
         """
@@ -298,9 +315,9 @@ class ChunkingService:
 
             # Chunk it
             try:
-                chunks = self.chunk_extracted_text(extracted_text, db)
+                chunk_ids = self.chunk_extracted_text(extracted_text, db)
                 chunked_count += 1
-                print(f"Chunked extracted_text {extracted_text.id}: {len(chunks)} chunks")
+                print(f"Chunked extracted_text {extracted_text.id}: {len(chunk_ids)} chunks")
             except Exception as e:
                 print(f"Error chunking extracted_text {extracted_text.id}: {e}")
 
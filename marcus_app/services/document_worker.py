@@ -0,0 +1,115 @@
+"""
+Per-document ExtractBox work - v0.53
+
+Extraction + chunking for one mission document, runnable either in the
+caller's session or in a process-pool worker with its own engine/session
+(see core.executors "documents" pool). Each call commits its own results
+and returns the report lines BoxRunner assembles into the Extraction Report.
+
+Workers are spawned processes: everything crossing the boundary (db URL,
+ids, filenames, result dicts) is plain data.
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from marcus_app.core.models import Artifact, ExtractedText, TextChunk
+from marcus_app.services.chunking_service import ChunkingService
+from marcus_app.services.extraction_service import ExtractionService
+
+# Per-process state, reused across documents
+_session_factories: Dict[str, sessionmaker] = {}
+_chunking_service: Optional[ChunkingService] = None
+_extraction_service: Optional[ExtractionService] = None
+
+
+def _services():
+    global _chunking_service, _extraction_service
+    if _chunking_service is None:
+        _chunking_service = ChunkingService()
+        _extraction_service = ExtractionService()
+    return _extraction_service, _chunking_service
+
+
+def process_document(db_url: str, artifact_id: int, filename: str) -> Dict[str, Any]:
+    """Pool entry point: process one document in a session owned by this worker."""
+    factory = _session_factories.get(db_url)
+    if factory is None:
+        engine = create_engine(
+            db_url,
+            # Several workers commit chunks concurrently; wait for the SQLite write lock
+            connect_args={"check_same_thread": False, "timeout": 30},
+            echo=False
+        )
+        factory = _session_factories[db_url] = sessionmaker(bind=engine)
+
+    db = factory()
+    try:
+        return process_document_in_session(db, artifact_id, filename)
+    finally:
+        db.close()
+
+
+def process_document_in_session(db: Session, artifact_id: int, filename: str) -> Dict[str, Any]:
+    """
+    Ensure one artifact has extracted text and chunks.
+
+    Returns:
+        {
+            'lines': List[str],   # Extraction Report detail lines
+            'chunks': int,        # chunks created or already present
+            'processed': bool     # counted in "Artifacts Processed"
+        }
+    """
+    extraction_service, chunking_service = _services()
+    lines = []
+
+    artifact = db.query(Artifact).filter(Artifact.id == artifact_id).first()
+    if not artifact:
+        return {'lines': [f"- {filename}: Artifact not found (skipped)"], 'chunks': 0, 'processed': False}
+
+    # Check if extracted text exists
+    extracted_text = db.query(ExtractedText).filter(
+        ExtractedText.artifact_id == artifact_id
+    ).first()
+
+    if not extracted_text:
+        # Extract text (offline extraction)
+        try:
+            extracted_text = extraction_service.extract_from_artifact(artifact, db)
+            if extracted_text.extraction_status == 'failed':
+                raise ValueError(extracted_text.error_message or 'no text extracted')
+            lines.append(f"- {artifact.original_filename}: Extracted text")
+        except Exception as e:
+            lines.append(f"- {artifact.original_filename}: Extraction failed ({str(e)})")
+            return {'lines': lines, 'chunks': 0, 'processed': False}
+    elif extracted_text.extraction_status == 'failed':
+        # Earlier run recorded the failure; still not usable (nor cacheable)
+        lines.append(
+            f"- {artifact.original_filename}: Extraction failed ({extracted_text.error_message or 'no text extracted'})"
+        )
+        return {'lines': lines, 'chunks': 0, 'processed': False}
+
+    # Check if chunks exist
+    existing_chunks = db.query(TextChunk).filter(
+        TextChunk.artifact_id == artifact_id
+    ).count()
+
+    if existing_chunks == 0 and extracted_text:
+        # Create chunks
+        try:
+            chunks = chunking_service.chunk_extracted_text(
+                extracted_text=extracted_text,
+                db=db
+            )
+            lines.append(f"- {artifact.original_filename}: Created {len(chunks)} chunks")
+            return {'lines': lines, 'chunks': len(chunks), 'processed': True}
+        except Exception as e:
+            db.rollback()
+            lines.append(f"- {artifact.original_filename}: Chunking failed ({str(e)})")
+            return {'lines': lines, 'chunks': 0, 'processed': False}
+
+    lines.append(f"- {artifact.original_filename}: Already chunked ({existing_chunks} chunks)")
+    return {'lines': lines, 'chunks': existing_chunks, 'processed': True}
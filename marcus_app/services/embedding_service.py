@@ -2,10 +2,21 @@
 Embedding service for Marcus v0.3.
 Optional offline semantic search using sentence-transformers.
 Gracefully degrades if dependencies are missing.
+
+v0.53: The model is loaded on a background warm-up thread instead of in
+__init__, and can optionally be evicted after a period without use.
+Backends are pluggable: full-precision PyTorch (sentence-transformers) or
+ONNX Runtime on CPU, optionally int8-quantized.
 """
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Union
+from collections import OrderedDict
+from pathlib import Path
 import json
+import os
+import re
+import threading
+import time
 
 try:
     import numpy as np
@@ -15,35 +26,426 @@ except ImportError:
     np = None
 
 
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class EmbeddingBackend:
+    """
+    Interface for an embedding model implementation.
+
+    load() may raise ImportError (dependency missing) or any other exception
+    (model files missing/corrupt); EmbeddingService treats both as
+    "embeddings unavailable" and falls back to FTS5.
+    """
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.dimension: Optional[int] = None
+        self.max_seq_length: Optional[int] = None
+
+    def load(self):
+        raise NotImplementedError
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        raise NotImplementedError
+
+    def unload(self):
+        """Release model memory (idle eviction)."""
+        pass
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """Full-precision PyTorch model via sentence-transformers."""
+
+    name = "sentence-transformers"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self._model = None
+
+    def load(self):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(self.model_name)
+        self.dimension = self._model.get_sentence_embedding_dimension()
+        self.max_seq_length = self._model.max_seq_length
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        return self._model.encode(texts, convert_to_numpy=True).tolist()
+
+    def unload(self):
+        self._model = None
+
+
+class OnnxBackend(EmbeddingBackend):
+    """
+    CPU-optimized path: ONNX Runtime + HuggingFace `tokenizers`.
+
+    Expects a local model directory (offline) containing:
+    - model.onnx      (e.g. the onnx/ export of all-MiniLM-L6-v2)
+    - tokenizer.json
+
+    With quantized=True, model_int8.onnx is used; if missing it is produced
+    once from model.onnx with onnxruntime dynamic int8 quantization.
+
+    Pooling matches the sentence-transformers all-MiniLM-L6-v2 pipeline:
+    attention-masked mean pooling followed by L2 normalization.
+    """
+
+    BATCH_SIZE = 32
+
+    def __init__(
+        self,
+        model_name: str,
+        model_dir: Optional[Union[str, Path]] = None,
+        quantized: bool = False,
+        max_seq_length: int = 256
+    ):
+        super().__init__(model_name)
+        self.quantized = quantized
+        self.name = "onnx-int8" if quantized else "onnx"
+        self.max_seq_length = max_seq_length
+        self.model_dir = Path(
+            model_dir
+            or os.getenv("MARCUS_EMBEDDING_ONNX_DIR")
+            or Path(__file__).parent.parent.parent / "models" / f"{model_name}-onnx"
+        )
+        self._session = None
+        self._tokenizer = None
+        self._input_names = set()
+
+    def load(self):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy not installed")
+
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        fp32_path = self.model_dir / "model.onnx"
+        model_path = fp32_path
+        if self.quantized:
+            model_path = self.model_dir / "model_int8.onnx"
+            if not model_path.exists() and fp32_path.exists():
+                from onnxruntime.quantization import quantize_dynamic, QuantType
+                print(f"[EmbeddingService] Quantizing {fp32_path.name} to int8 (one-time)")
+                quantize_dynamic(str(fp32_path), str(model_path), weight_type=QuantType.QInt8)
+
+        if not model_path.exists():
+            raise FileNotFoundError(f"ONNX model not found: {model_path}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+        self._tokenizer = Tokenizer.from_file(str(self.model_dir / "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self._tokenizer.enable_padding()
+
+        self.dimension = len(self.encode(["dimension probe"])[0])
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            vectors.extend(self._encode_batch(texts[start:start + self.BATCH_SIZE]))
+        return vectors
+
+    def _encode_batch(self, texts: List[str]) -> List[List[float]]:
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        token_embeddings = self._session.run(None, feeds)[0]  # (batch, seq, dim)
+
+        mask = attention_mask[:, :, None].astype(token_embeddings.dtype)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return (pooled / norms).tolist()
+
+    def unload(self):
+        self._session = None
+        self._tokenizer = None
+
+
+# Backends selectable by name (MARCUS_EMBEDDING_BACKEND)
+BACKENDS = {
+    "sentence-transformers": lambda model_name: SentenceTransformerBackend(model_name),
+    "onnx": lambda model_name: OnnxBackend(model_name, quantized=False),
+    "onnx-int8": lambda model_name: OnnxBackend(model_name, quantized=True),
+}
+
+DEFAULT_BACKEND = "sentence-transformers"
+
+
+def create_backend(backend: str, model_name: str) -> EmbeddingBackend:
+    """Build a backend by name. Raises ValueError for unknown names."""
+    factory = BACKENDS.get(backend)
+    if not factory:
+        raise ValueError(f"Unknown embedding backend: {backend}. Available: {', '.join(BACKENDS)}")
+    return factory(model_name)
+
+
+# ============================================================================
+# QUERY EMBEDDING CACHE
+# ============================================================================
+
+class QueryEmbeddingCache:
+    """
+    Bounded LRU of query embeddings keyed by (model_id, normalized query).
+
+    One process-wide instance (get_query_embedding_cache) is shared by every
+    EmbeddingService, so a question repeated from AskBox, chat or search pays
+    for the forward pass once. Keys include model_id, so switching backend
+    never serves a vector from a different embedding space.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase and collapse whitespace (MiniLM is uncased)."""
+        return re.sub(r'\s+', ' ', text.strip().lower())
+
+    def get_or_compute(
+        self,
+        model_id: str,
+        normalized_query: str,
+        compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        key = (model_id, normalized_query)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(vector)
+            self.misses += 1
+
+        # Compute outside the lock - a forward pass must not block other hits
+        vector = tuple(compute(normalized_query))
+
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return list(vector)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+_query_cache: Optional[QueryEmbeddingCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Shared query cache; size from MARCUS_QUERY_EMBEDDING_CACHE_SIZE (default 1024)."""
+    global _query_cache
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                maxsize = int(os.getenv("MARCUS_QUERY_EMBEDDING_CACHE_SIZE", "1024") or 1024)
+                _query_cache = QueryEmbeddingCache(maxsize=maxsize)
+    return _query_cache
+
+
+# ============================================================================
+# SERVICE
+# ============================================================================
+
 class EmbeddingService:
     """
-    Generates embeddings using local models (sentence-transformers).
+    Generates embeddings using local models (see BACKENDS).
 
     Graceful degradation:
-    - If sentence-transformers not installed: is_available() = False
+    - If the backend's dependencies are not installed: is_available() = False
     - If model fails to load: is_available() = False
+    - While the model is still warming up: is_available() = False
     - System falls back to FTS5 search
+
+    Model lifecycle (state):
+    - idle → loading → ready OR unavailable
+    - ready → unloaded (idle eviction) → loading → ready
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    STATE_IDLE = "idle"
+    STATE_LOADING = "loading"
+    STATE_READY = "ready"
+    STATE_UNAVAILABLE = "unavailable"
+    STATE_UNLOADED = "unloaded"
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        idle_unload_seconds: Optional[float] = None,
+        backend: Union[str, EmbeddingBackend, None] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None
+    ):
         """
-        Initialize embedding service.
+        Initialize embedding service. Does not load the model - call
+        start_warmup() (background) or ensure_loaded() (blocking).
 
         Default model: all-MiniLM-L6-v2
         - Small (80MB)
         - Fast
         - Good quality for semantic search
         - Runs offline
+
+        Args:
+            model_name: Model name (sentence-transformers id / ONNX model dir stem)
+            idle_unload_seconds: Evict the model after this long without an
+                embed call (None/0 = keep loaded forever)
+            backend: Backend name from BACKENDS or an EmbeddingBackend instance
+                (default: sentence-transformers)
+            query_cache: Cache for embed_query (default: shared process-wide cache)
         """
-        self.model_name = model_name
+        if isinstance(backend, EmbeddingBackend):
+            self.backend = backend
+        else:
+            self.backend = create_backend(backend or DEFAULT_BACKEND, model_name)
+
+        self.model_name = self.backend.model_name
+        self.query_cache = query_cache or get_query_embedding_cache()
         self.model = None
         self._available = False
 
+        self.idle_unload_seconds = idle_unload_seconds or None
+        self._state = self.STATE_IDLE
+        self._lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._idle_timer: Optional[threading.Timer] = None
+        self._last_used = time.monotonic()
+        self.load_seconds: Optional[float] = None
+
+    @property
+    def model_id(self) -> str:
+        """
+        Identifier stored in TextChunk.embedding_model, e.g.
+        "onnx-int8:all-MiniLM-L6-v2". Vectors are only compared against
+        vectors produced by the same backend + model.
+        """
+        return f"{self.backend.name}:{self.model_name}"
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def start_warmup(self) -> bool:
+        """
+        Load the model on a background thread.
+
+        Returns:
+            True if a warm-up was started, False if already loading/loaded
+            or known to be unavailable.
+        """
+        with self._lock:
+            if self._state not in (self.STATE_IDLE, self.STATE_UNLOADED):
+                return False
+            self._state = self.STATE_LOADING
+            self._warmup_thread = threading.Thread(
+                target=self._warmup, name="embedding-warmup", daemon=True
+            )
+            thread = self._warmup_thread
+
+        thread.start()
+        return True
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until an in-flight warm-up finishes. Returns is_available()."""
+        thread = self._warmup_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.is_available()
+
+    def ensure_loaded(self) -> bool:
+        """Load the model synchronously if needed (scripts, batch jobs)."""
+        self.start_warmup()
+        return self.wait_until_ready()
+
+    def _warmup(self):
+        started = time.monotonic()
         try:
             self._initialize_model()
         except Exception as e:
             print(f"[EmbeddingService] Failed to initialize: {e}")
             print("[EmbeddingService] Embeddings disabled, using FTS5 only")
+            self._available = False
+
+        with self._lock:
+            if self._available and self.model is not None:
+                self._state = self.STATE_READY
+                self.load_seconds = time.monotonic() - started
+                self._last_used = time.monotonic()
+            else:
+                self._state = self.STATE_UNAVAILABLE
+
+        if self._state == self.STATE_READY and self.idle_unload_seconds:
+            self._schedule_idle_check(self.idle_unload_seconds)
+
+    def _touch(self):
+        self._last_used = time.monotonic()
+
+    def _schedule_idle_check(self, delay: float):
+        timer = threading.Timer(delay, self._check_idle)
+        timer.daemon = True
+        self._idle_timer = timer
+        timer.start()
+
+    def _check_idle(self):
+        """Evict the model if unused for idle_unload_seconds, else re-arm."""
+        with self._lock:
+            if self._state != self.STATE_READY:
+                return
+            idle_for = time.monotonic() - self._last_used
+            if idle_for < self.idle_unload_seconds:
+                remaining = self.idle_unload_seconds - idle_for
+            else:
+                self.backend.unload()
+                self.model = None
+                self._available = False
+                self._state = self.STATE_UNLOADED
+                remaining = None
+
+        if remaining is None:
+            print(f"[EmbeddingService] Model unloaded after {idle_for:.0f}s idle")
+        else:
+            self._schedule_idle_check(remaining)
 
     def _initialize_model(self):
         """Try to load the embedding model."""
@@ -54,16 +456,18 @@ class EmbeddingService:
             return
 
         try:
-            from sentence_transformers import SentenceTransformer
-
-            print(f"[EmbeddingService] Loading model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
+            print(f"[EmbeddingService] Loading model: {self.model_name} ({self.backend.name})")
+            self.backend.load()
+            self.model = self.backend
             self._available = True
             print("[EmbeddingService] Model loaded successfully")
 
-        except ImportError:
-            print("[EmbeddingService] sentence-transformers not installed")
-            print("[EmbeddingService] Install with: pip install sentence-transformers")
+        except ImportError as e:
+            print(f"[EmbeddingService] {self.backend.name} dependencies not installed ({e})")
+            if self.backend.name == "sentence-transformers":
+                print("[EmbeddingService] Install with: pip install sentence-transformers")
+            else:
+                print("[EmbeddingService] Install with: pip install onnxruntime tokenizers")
             self._available = False
 
         except Exception as e:
@@ -71,7 +475,7 @@ class EmbeddingService:
             self._available = False
 
     def is_available(self) -> bool:
-        """Check if embeddings are available."""
+        """Check if embeddings are available (model loaded and ready)."""
         return self._available and self.model is not None
 
     def embed_text(self, text: str) -> List[float]:
@@ -84,15 +488,33 @@ class EmbeddingService:
         Raises:
             RuntimeError if embeddings not available
         """
-        if not self.is_available():
+        model = self.model  # Local ref - idle eviction may clear self.model
+        if not self._available or model is None:
             raise RuntimeError("Embeddings not available")
 
         # Truncate if too long (model has max length)
         if len(text) > 5000:
             text = text[:5000]
 
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        self._touch()
+        return model.encode([text])[0]
+
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query through the shared LRU cache.
+
+        Queries are normalized before embedding, so "Torque  Calculation" and
+        "torque calculation" share one entry and one vector.
+
+        Raises:
+            RuntimeError if embeddings not available
+        """
+        if not self.is_available():
+            raise RuntimeError("Embeddings not available")
+
+        return self.query_cache.get_or_compute(
+            self.model_id, QueryEmbeddingCache.normalize(query), self.embed_text
+        )
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
@@ -101,14 +523,54 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        if not self.is_available():
+        model = self.model
+        if not self._available or model is None:
             raise RuntimeError("Embeddings not available")
 
         # Truncate long texts
         truncated_texts = [t[:5000] if len(t) > 5000 else t for t in texts]
 
-        embeddings = self.model.encode(truncated_texts, convert_to_numpy=True)
-        return embeddings.tolist()
+        self._touch()
+        return model.encode(truncated_texts)
+
+    def embed_pending_chunks(self, db, batch_size: int = 64, limit: Optional[int] = None) -> int:
+        """
+        Embed TextChunks that have no vector yet, or whose vector was produced
+        by a different backend/model, and record model_id in embedding_model.
+
+        Returns:
+            Number of chunks embedded
+        """
+        from sqlalchemy import or_
+        from ..core.models import TextChunk
+
+        query = db.query(TextChunk.id, TextChunk.content).filter(
+            or_(
+                TextChunk.embedding_vector.is_(None),
+                TextChunk.embedding_model.is_(None),
+                TextChunk.embedding_model != self.model_id
+            )
+        ).order_by(TextChunk.id)
+        if limit:
+            query = query.limit(limit)
+        pending = query.all()
+
+        embedded = 0
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            vectors = self.embed_batch([content for _, content in batch])
+            db.bulk_update_mappings(TextChunk, [
+                {
+                    'id': chunk_id,
+                    'embedding_vector': json.dumps(vector),
+                    'embedding_model': self.model_id
+                }
+                for (chunk_id, _), vector in zip(batch, vectors)
+            ])
+            db.commit()
+            embedded += len(batch)
+
+        return embedded
 
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
@@ -139,9 +601,15 @@ class EmbeddingService:
         """Return information about the current model."""
         return {
             'available': self.is_available(),
+            'state': self._state,
             'model_name': self.model_name,
-            'embedding_dim': self.model.get_sentence_embedding_dimension() if self.model else None,
-            'max_seq_length': self.model.max_seq_length if self.model else None
+            'backend': self.backend.name,
+            'model_id': self.model_id,
+            'embedding_dim': self.backend.dimension if self.model else None,
+            'max_seq_length': self.backend.max_seq_length if self.model else None,
+            'load_seconds': self.load_seconds,
+            'idle_unload_seconds': self.idle_unload_seconds,
+            'query_cache': self.query_cache.stats()
         }
 
 
@@ -157,7 +625,11 @@ def get_embedding_service() -> Optional[EmbeddingService]:
     global _embedding_service_instance
 
     if _embedding_service_instance is None:
-        _embedding_service_instance = EmbeddingService()
+        _embedding_service_instance = EmbeddingService(
+            backend=os.getenv("MARCUS_EMBEDDING_BACKEND") or None
+        )
+
+    _embedding_service_instance.ensure_loaded()
 
     if not _embedding_service_instance.is_available():
         return None
@@ -14,6 +14,91 @@ from ..core.models import InboxItem, Class, Assignment, Artifact
 from .file_service import FileService
 
 
+CLASS_CODE_PATTERN = re.compile(r'\b([A-Z]{2,5}\s?\d{3,4})\b')
+ASSIGNMENT_NUMBER_PATTERN = re.compile(r'\b(hw|lab|assignment|project|quiz|exam)\s?(\d+)\b')
+DATE_PATTERN = re.compile(r'\b(20\d{2})[_-]?(\d{2})[_-]?(\d{2})\b')
+
+# Common assignment keywords
+ASSIGNMENT_KEYWORDS = {
+    'lab': ['lab', 'laboratory', 'experiment'],
+    'homework': ['hw', 'homework', 'problem set', 'pset'],
+    'exam': ['exam', 'test', 'quiz', 'midterm', 'final'],
+    'project': ['project', 'proj'],
+    'lecture': ['lecture', 'notes', 'slides'],
+    'syllabus': ['syllabus', 'schedule']
+}
+
+
+class ClassificationIndex:
+    """
+    Snapshot of classes and assignments for classifying a batch of files.
+
+    Built from two narrow SELECTs (no text columns) instead of loading every
+    Class and Assignment row per file:
+
+    - classes in id order with a memo from extracted code to the first class
+      whose code contains it (the previous per-file scan)
+    - per-class assignments in id order and sorted by created_at, so the
+      most recent assignment is the last entry
+    - a (class, type, number) and (class, keyword) memo over assignment titles
+
+    Lookups return exactly what the per-file scans returned. A snapshot is
+    not invalidated; build a new one for the next batch.
+    """
+
+    def __init__(self, classes: List[Tuple[int, str, datetime]], assignments: List[Tuple[int, int, str, datetime]]):
+        self.classes = [(class_id, code, code.replace(' ', '').upper()) for class_id, code, _ in classes]
+        self.most_recent_class = None
+        if classes:
+            class_id, code, _ = max(classes, key=lambda c: c[2] or datetime.min)
+            self.most_recent_class = (class_id, code)
+
+        self.assignments_by_class: Dict[int, List[Tuple[int, str, str]]] = {}
+        self.most_recent_assignment: Dict[int, Tuple[int, str]] = {}
+        by_created: Dict[int, List] = {}
+        for assignment_id, class_id, title, created_at in assignments:
+            self.assignments_by_class.setdefault(class_id, []).append((assignment_id, title, title.lower()))
+            by_created.setdefault(class_id, []).append((created_at or datetime.min, -assignment_id, title))
+        for class_id, rows in by_created.items():
+            rows.sort()
+            created_at, negative_id, title = rows[-1]
+            self.most_recent_assignment[class_id] = (-negative_id, title)
+
+        self._class_memo: Dict[str, Optional[Tuple[int, str]]] = {}
+        self._title_memo: Dict[Tuple, Optional[Tuple[int, str]]] = {}
+
+    @classmethod
+    def build(cls, db: Session) -> "ClassificationIndex":
+        classes = db.query(Class.id, Class.code, Class.created_at).order_by(Class.id).all()
+        assignments = db.query(
+            Assignment.id, Assignment.class_id, Assignment.title, Assignment.created_at
+        ).order_by(Assignment.id).all()
+        return cls(classes, assignments)
+
+    def class_for_code(self, normalized_code: str) -> Optional[Tuple[int, str]]:
+        """(id, code) of the first class whose code contains normalized_code."""
+        if normalized_code not in self._class_memo:
+            self._class_memo[normalized_code] = next(
+                ((class_id, code) for class_id, code, normalized in self.classes if normalized_code in normalized),
+                None
+            )
+        return self._class_memo[normalized_code]
+
+    def assignment_with_title(self, class_id: int, *parts: str) -> Optional[Tuple[int, str]]:
+        """(id, title) of the first assignment in the class whose title contains every part."""
+        key = (class_id,) + parts
+        if key not in self._title_memo:
+            self._title_memo[key] = next(
+                (
+                    (assignment_id, title)
+                    for assignment_id, title, title_lower in self.assignments_by_class.get(class_id, [])
+                    if all(part in title_lower for part in parts)
+                ),
+                None
+            )
+        return self._title_memo[key]
+
+
 class InboxService:
     """
     Manages the inbox: file drops, auto-classification, and organization.
@@ -44,6 +129,66 @@ class InboxService:
             return existing
 
         # Save file to inbox
+        inbox_item = self._new_inbox_item(file_content, filename, file_hash, db)
+
+        db.add(inbox_item)
+        db.commit()
+        db.refresh(inbox_item)
+
+        return inbox_item
+
+    def add_many_to_inbox(
+        self,
+        files: List[Tuple[str, bytes]],
+        db: Session
+    ) -> List[InboxItem]:
+        """
+        Add a batch of (filename, content) files to the inbox in one commit.
+        All files are classified against a single ClassificationIndex.
+        Duplicates (of pending items or within the batch) return the existing item.
+        """
+        hashes = [hashlib.sha256(content).hexdigest() for _, content in files]
+        pending = {
+            item.file_hash: item
+            for item in db.query(InboxItem).filter(
+                InboxItem.file_hash.in_(set(hashes)),
+                InboxItem.status == "pending"
+            )
+        }
+
+        index = ClassificationIndex.build(db)
+        items = []
+        for (filename, content), file_hash in zip(files, hashes):
+            inbox_item = pending.get(file_hash)
+            if inbox_item is None:
+                inbox_item = self._new_inbox_item(content, filename, file_hash, db, index)
+                db.add(inbox_item)
+                pending[file_hash] = inbox_item
+            items.append(inbox_item)
+
+        db.commit()
+        for inbox_item in items:
+            db.refresh(inbox_item)
+
+        return items
+
+    def classify_filenames(self, filenames: List[str], db: Session) -> List[Dict]:
+        """Suggestions for many filenames against one snapshot, without storing anything."""
+        index = ClassificationIndex.build(db)
+        return [
+            self._auto_classify(filename, self._detect_file_type(filename), b'', db, index)
+            for filename in filenames
+        ]
+
+    def _new_inbox_item(
+        self,
+        file_content: bytes,
+        filename: str,
+        file_hash: str,
+        db: Session,
+        index: Optional[ClassificationIndex] = None
+    ) -> InboxItem:
+        """Save the file into the inbox folder and build its classified InboxItem."""
         safe_filename = self._safe_filename(filename)
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         stored_filename = f"{timestamp}_{safe_filename}"
@@ -66,17 +211,13 @@ class InboxService:
         )
 
         # Auto-classify
-        suggestion = self._auto_classify(filename, file_type, file_content, db)
+        suggestion = self._auto_classify(filename, file_type, file_content, db, index)
 
         inbox_item.suggested_class_id = suggestion.get('class_id')
         inbox_item.suggested_assignment_id = suggestion.get('assignment_id')
         inbox_item.classification_confidence = suggestion.get('confidence')
         inbox_item.classification_reasoning = suggestion.get('reasoning')
 
-        db.add(inbox_item)
-        db.commit()
-        db.refresh(inbox_item)
-
         return inbox_item
 
     def _auto_classify(
@@ -84,17 +225,18 @@ class InboxService:
         filename: str,
         file_type: str,
         file_content: bytes,
-        db: Session
+        db: Session,
+        index: Optional[ClassificationIndex] = None
     ) -> Dict:
         """
         Attempt to classify the file based on filename patterns and content.
         Returns suggested class_id, assignment_id, confidence, and reasoning.
+        Pass a ClassificationIndex to share one snapshot across a batch.
         """
-        # Get all classes and assignments
-        classes = db.query(Class).all()
-        assignments = db.query(Assignment).all()
+        if index is None:
+            index = ClassificationIndex.build(db)
 
-        if not classes:
+        if not index.classes:
             return {
                 'class_id': None,
                 'assignment_id': None,
@@ -106,130 +248,104 @@ class InboxService:
         filename_lower = filename.lower()
 
         # Try to extract class code patterns (e.g., ECE347, CYENG350, PHYS214)
-        class_code_pattern = r'\b([A-Z]{2,5}\s?\d{3,4})\b'
-        matches = re.findall(class_code_pattern, filename.upper())
+        matches = CLASS_CODE_PATTERN.findall(filename.upper())
 
         for match in matches:
             # Normalize (remove spaces)
             normalized_code = match.replace(' ', '')
 
             # Check against existing classes
-            for cls in classes:
-                if normalized_code in cls.code.replace(' ', '').upper():
-                    # Found a class match!
-                    # Now try to find assignment
-                    assignment_match = self._match_assignment(
-                        filename,
-                        cls.id,
-                        assignments
-                    )
-
-                    return {
-                        'class_id': cls.id,
-                        'assignment_id': assignment_match.get('assignment_id'),
-                        'confidence': 'high' if assignment_match.get('assignment_id') else 'medium',
-                        'reasoning': f"Detected class code '{normalized_code}' in filename. " + assignment_match.get('reasoning', '')
-                    }
+            cls = index.class_for_code(normalized_code)
+            if cls:
+                # Found a class match!
+                # Now try to find assignment
+                class_id, class_code = cls
+                assignment_match = self._match_assignment(filename, class_id, index)
 
-        # Strategy 2: Keyword matching
-        # Common assignment keywords
-        assignment_keywords = {
-            'lab': ['lab', 'laboratory', 'experiment'],
-            'homework': ['hw', 'homework', 'problem set', 'pset'],
-            'exam': ['exam', 'test', 'quiz', 'midterm', 'final'],
-            'project': ['project', 'proj'],
-            'lecture': ['lecture', 'notes', 'slides'],
-            'syllabus': ['syllabus', 'schedule']
-        }
+                return {
+                    'class_id': class_id,
+                    'assignment_id': assignment_match.get('assignment_id'),
+                    'confidence': 'high' if assignment_match.get('assignment_id') else 'medium',
+                    'reasoning': f"Detected class code '{normalized_code}' in filename. " + assignment_match.get('reasoning', '')
+                }
 
+        # Strategy 2: Keyword matching
         detected_type = None
-        for keyword_type, keywords in assignment_keywords.items():
+        for keyword_type, keywords in ASSIGNMENT_KEYWORDS.items():
             if any(kw in filename_lower for kw in keywords):
                 detected_type = keyword_type
                 break
 
         # Strategy 3: Date patterns (e.g., 2024-01-15)
-        date_pattern = r'\b(20\d{2})[_-]?(\d{2})[_-]?(\d{2})\b'
-        date_matches = re.findall(date_pattern, filename)
+        date_matches = DATE_PATTERN.findall(filename)
+
+        most_recent_id, most_recent_code = index.most_recent_class
 
         # If we found keywords but no class, suggest most recent class
         if detected_type and not matches:
-            most_recent_class = max(classes, key=lambda c: c.created_at)
-
             # Try to find matching assignment by type
-            matching_assignments = [
-                a for a in assignments
-                if a.class_id == most_recent_class.id
-                and detected_type in a.title.lower()
-            ]
-
-            if matching_assignments:
-                assignment = matching_assignments[0]
+            assignment = index.assignment_with_title(most_recent_id, detected_type)
+
+            if assignment:
                 return {
-                    'class_id': most_recent_class.id,
-                    'assignment_id': assignment.id,
+                    'class_id': most_recent_id,
+                    'assignment_id': assignment[0],
                     'confidence': 'medium',
-                    'reasoning': f"Detected '{detected_type}' keyword. Matched to existing {detected_type} assignment in {most_recent_class.code}."
+                    'reasoning': f"Detected '{detected_type}' keyword. Matched to existing {detected_type} assignment in {most_recent_code}."
                 }
             else:
                 return {
-                    'class_id': most_recent_class.id,
+                    'class_id': most_recent_id,
                     'assignment_id': None,
                     'confidence': 'low',
-                    'reasoning': f"Detected '{detected_type}' keyword. Suggested class: {most_recent_class.code}. Consider creating a new assignment."
+                    'reasoning': f"Detected '{detected_type}' keyword. Suggested class: {most_recent_code}. Consider creating a new assignment."
                 }
 
         # Fallback: suggest most recent class
-        most_recent_class = max(classes, key=lambda c: c.created_at)
         return {
-            'class_id': most_recent_class.id,
+            'class_id': most_recent_id,
             'assignment_id': None,
             'confidence': 'low',
-            'reasoning': f"No strong pattern detected. Suggesting most recent class: {most_recent_class.code}."
+            'reasoning': f"No strong pattern detected. Suggesting most recent class: {most_recent_code}."
         }
 
     def _match_assignment(
         self,
         filename: str,
         class_id: int,
-        all_assignments: List[Assignment]
+        index: ClassificationIndex
     ) -> Dict:
         """
         Try to match filename to an existing assignment within a class.
         """
         filename_lower = filename.lower()
 
-        # Get assignments for this class
-        class_assignments = [a for a in all_assignments if a.class_id == class_id]
-
-        if not class_assignments:
+        if class_id not in index.assignments_by_class:
             return {
                 'assignment_id': None,
                 'reasoning': 'No assignments exist for this class yet.'
             }
 
         # Try to extract assignment number (e.g., HW1, Lab2, Assignment 3)
-        number_pattern = r'\b(hw|lab|assignment|project|quiz|exam)\s?(\d+)\b'
-        match = re.search(number_pattern, filename_lower)
+        match = ASSIGNMENT_NUMBER_PATTERN.search(filename_lower)
 
         if match:
             assignment_type = match.group(1)
             assignment_num = match.group(2)
 
             # Look for matching assignment
-            for assignment in class_assignments:
-                assignment_title_lower = assignment.title.lower()
-                if assignment_type in assignment_title_lower and assignment_num in assignment_title_lower:
-                    return {
-                        'assignment_id': assignment.id,
-                        'reasoning': f"Matched to assignment '{assignment.title}' based on type and number."
-                    }
+            assignment = index.assignment_with_title(class_id, assignment_type, assignment_num)
+            if assignment:
+                return {
+                    'assignment_id': assignment[0],
+                    'reasoning': f"Matched to assignment '{assignment[1]}' based on type and number."
+                }
 
         # Fallback: most recent assignment in class
-        most_recent = max(class_assignments, key=lambda a: a.created_at)
+        most_recent_id, most_recent_title = index.most_recent_assignment[class_id]
         return {
-            'assignment_id': most_recent.id,
-            'reasoning': f"Suggested most recent assignment: '{most_recent.title}'."
+            'assignment_id': most_recent_id,
+            'reasoning': f"Suggested most recent assignment: '{most_recent_title}'."
         }
 
     def classify_item(
@@ -13,9 +13,12 @@ NO LLM required - fast, reliable, local classification.
 """
 
 import re
+import threading
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
-from sqlalchemy.orm import Session
+from typing import Optional, Dict, List, Any, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 
 from marcus_app.core.models import Class
 
@@ -28,13 +31,15 @@ CLASS_CODE_PATTERNS = [
     r'\b([A-Z]{2,4})\s*(\d{3,4})\b',  # PHYS214, ECE 347, CS101
     r'\b([A-Z]{2,4})[-_](\d{3,4})\b',  # PHYS-214, ECE_347
 ]
+CLASS_CODE_REGEXES = [re.compile(pattern) for pattern in CLASS_CODE_PATTERNS]
 
 
 def extract_class_codes(text: str) -> List[str]:
     """Extract class codes from text (e.g., 'PHYS214', 'ECE347')."""
     codes = []
-    for pattern in CLASS_CODE_PATTERNS:
-        matches = re.findall(pattern, text.upper())
+    text_upper = text.upper()
+    for regex in CLASS_CODE_REGEXES:
+        matches = regex.findall(text_upper)
         for match in matches:
             # Combine department and number (e.g., ('PHYS', '214') -> 'PHYS214')
             code = ''.join(match).strip()
@@ -42,21 +47,127 @@ def extract_class_codes(text: str) -> List[str]:
     return list(set(codes))  # deduplicate
 
 
-def match_class_code_to_db(codes: List[str], db: Session) -> Optional[int]:
-    """Match extracted class codes to actual Class records."""
-    if not codes:
+class ClassCodeIndex:
+    """
+    In-memory class code lookup, shared by the classifier, the agent intent
+    parsers and DefaultsService.
+
+    Built from one SELECT of (id, code) on first use after a change. Class
+    insert/update/delete invalidates it, and so does the commit or rollback
+    of the session that wrote the change, so no reader keeps a stale or
+    uncommitted view.
+
+    Codes are normalized (uppercase, no spaces/dashes/underscores). A code
+    resolves to the lowest class id with an exact match, else a prefix
+    match, else a substring match (the previous ILIKE '%code%'). Results
+    are memoized per code until the next invalidation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._snapshot: Optional[Tuple[Dict[str, int], List[Tuple[str, int]], List[Tuple[str, int]], Dict]] = None
+        self.builds = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(code: str) -> str:
+        return re.sub(r'[\s_-]', '', code).upper()
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def _get_snapshot(self, db: Session):
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            generation = self._generation
+
+        rows = db.query(Class.id, Class.code).order_by(Class.id).all()
+        by_id = [(self.normalize(code), class_id) for class_id, code in rows]
+        exact = {}
+        for code, class_id in by_id:
+            exact.setdefault(code, class_id)
+        snapshot = (exact, sorted(by_id), by_id, {})
+
+        with self._lock:
+            # A change during the build leaves the index empty for the next caller
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self.builds += 1
+        return snapshot
+
+    def lookup(self, code: str, db: Session) -> Optional[int]:
+        """Class id for one extracted code, or None."""
+        exact, sorted_codes, by_id, memo = self._get_snapshot(db)
+        code = self.normalize(code)
+        if code in memo:
+            self.hits += 1
+            return memo[code]
+        self.misses += 1
+
+        class_id = exact.get(code)
+        if class_id is None:
+            start = bisect_left(sorted_codes, (code,))
+            prefixed = []
+            for candidate, candidate_id in sorted_codes[start:]:
+                if not candidate.startswith(code):
+                    break
+                prefixed.append(candidate_id)
+            class_id = min(prefixed) if prefixed else None
+        if class_id is None and code:
+            class_id = next((candidate_id for candidate, candidate_id in by_id if code in candidate), None)
+
+        memo[code] = class_id
+        return class_id
+
+    def match(self, codes: List[str], db: Session) -> Optional[int]:
+        """Class id for the first of codes that matches a class."""
+        for code in codes:
+            class_id = self.lookup(code, db)
+            if class_id is not None:
+                return class_id
         return None
 
-    # Try exact match first
-    for code in codes:
-        cls = db.query(Class).filter(
-            (Class.class_code == code) |
-            (Class.class_code.ilike(f"%{code}%"))
-        ).first()
-        if cls:
-            return cls.id
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'classes': len(self._snapshot[2]) if self._snapshot else None,
+                'builds': self.builds,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+CLASS_CODE_INDEX = ClassCodeIndex()
+
+
+def _class_changed(mapper, connection, target):
+    CLASS_CODE_INDEX.invalidate()
+    session = object_session(target)
+    if session is not None:
+        session.info['class_codes_changed'] = True
+
+
+def _session_finished(session, *args):
+    if session.info.pop('class_codes_changed', False):
+        CLASS_CODE_INDEX.invalidate()
 
-    return None
+
+for _event_name in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Class, _event_name, _class_changed)
+event.listen(Session, 'after_commit', _session_finished)
+event.listen(Session, 'after_soft_rollback', _session_finished)
+
+
+def match_class_code_to_db(codes: List[str], db: Session) -> Optional[int]:
+    """Match extracted class codes to actual Class records (via CLASS_CODE_INDEX)."""
+    if not codes:
+        return None
+    return CLASS_CODE_INDEX.match(codes, db)
 
 
 # ============================================================================
@@ -73,6 +184,11 @@ EVENT_KEYWORDS = [
     'exam', 'test', 'quiz', 'presentation', 'office hours'
 ]
 
+# Keyword lists are short, so substring checks (`kw in text`) beat a
+# combined regex/automaton pass here; only the regexes are precompiled.
+TIME_REGEX = re.compile(r'\b\d{1,2}:\d{2}\b|\b\d{1,2}\s*(am|pm)\b')
+DAY_REGEX = re.compile(r'\b(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b')
+
 DOCUMENT_EXTENSIONS = [
     '.pdf', '.docx', '.doc', '.txt', '.md', '.pptx', '.ppt',
     '.xlsx', '.xls', '.csv'
@@ -102,9 +218,9 @@ def detect_item_type(text: str, filename: Optional[str], file_type: Optional[str
     # Event detection
     event_score = sum(1 for kw in EVENT_KEYWORDS if kw in text_lower)
     # Check for time patterns
-    has_time = bool(re.search(r'\b\d{1,2}:\d{2}\b|\b\d{1,2}\s*(am|pm)\b', text_lower))
+    has_time = bool(TIME_REGEX.search(text_lower))
     # Check for date patterns
-    has_date = bool(re.search(r'\b(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', text_lower))
+    has_date = bool(DAY_REGEX.search(text_lower))
 
     if event_score >= 2 or (event_score >= 1 and (has_time or has_date)):
         return 'event', 0.85
@@ -119,6 +235,10 @@ def detect_item_type(text: str, filename: Optional[str], file_type: Optional[str
 # DATE/TIME PARSING
 # ============================================================================
 
+CLOCK_TIME_REGEX = re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)?')
+HOUR_TIME_REGEX = re.compile(r'(\d{1,2})\s*(am|pm)')
+
+
 def parse_due_date(text: str) -> Optional[datetime]:
     """
     Extract due date/time from text.
@@ -162,7 +282,7 @@ def parse_due_date(text: str) -> Optional[datetime]:
             return None
 
     # Extract time if present
-    time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm)?', text_lower)
+    time_match = CLOCK_TIME_REGEX.search(text_lower)
     if time_match:
         hour = int(time_match.group(1))
         minute = int(time_match.group(2))
@@ -176,7 +296,7 @@ def parse_due_date(text: str) -> Optional[datetime]:
         return base_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
     # Check for simple hour format (e.g., "3pm", "5am")
-    simple_time_match = re.search(r'(\d{1,2})\s*(am|pm)', text_lower)
+    simple_time_match = HOUR_TIME_REGEX.search(text_lower)
     if simple_time_match:
         hour = int(simple_time_match.group(1))
         period = simple_time_match.group(2)
@@ -196,9 +316,12 @@ def parse_due_date(text: str) -> Optional[datetime]:
 # TAG EXTRACTION
 # ============================================================================
 
+HASHTAG_REGEX = re.compile(r'#(\w+)')
+
+
 def extract_tags(text: str) -> List[str]:
     """Extract hashtags from text."""
-    return re.findall(r'#(\w+)', text)
+    return HASHTAG_REGEX.findall(text)
 
 
 # ============================================================================
@@ -0,0 +1,380 @@
+"""
+MissionExecutor - v0.53
+
+Runs a whole mission as a dependency graph instead of one box per request.
+
+- Graph: derived from box types (BOX_DEPENDENCIES) and order_index
+- Parallelism: boxes whose upstream boxes are finished run concurrently
+  on a worker pool, each with its own database session
+- Progress: every box state transition is emitted to an on_event callback
+- Resume: a MissionRun record tracks per-box state; re-running an
+  unfinished run skips boxes that already finished (boxes skipped for
+  missing input are retried, with their downstream boxes, once it is given)
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from marcus_app.core.models import Mission, MissionBox, MissionRun, BoxState
+from marcus_app.services.box_runner import BoxRunner
+
+
+class MissionExecutorError(Exception):
+    """Mission execution could not start."""
+    pass
+
+
+# Upstream box types each box type reads from. Only boxes with a lower
+# order_index count, so the graph is always acyclic. Unknown box types
+# depend on every earlier box (sequential fallback).
+BOX_DEPENDENCIES: Dict[str, Set[str]] = {
+    'inbox': set(),
+    'extract': {'inbox'},
+    'ask': {'extract'},
+    'practice': {'extract'},
+    'checker': {'practice'},
+    'citations': {'ask', 'practice', 'checker'},
+}
+
+# Boxes that cannot run without user input (any one of the keys);
+# skipped when none is given
+REQUIRED_INPUTS = {
+    'inbox': ('artifact_ids',),
+    'ask': ('question',),
+    'checker': ('item_id', 'answers'),
+}
+
+# Run-record box states (BoxState values plus pending/skipped)
+PENDING = 'pending'
+SKIPPED = 'skipped'
+RUNNING = BoxState.RUNNING.value
+DONE = BoxState.DONE.value
+ERROR = BoxState.ERROR.value
+BLOCKED = BoxState.BLOCKED.value
+
+# Upstream states that let a box start within a run. Only DONE boxes are
+# kept when a run is resumed; skipped ones are checked for input again.
+SATISFIED_STATES = {DONE, SKIPPED}
+FAILED_STATES = {ERROR, BLOCKED}
+
+RUN_RUNNING = 'running'
+RUN_DONE = 'done'
+RUN_ERROR = 'error'
+
+# Missions executing in this process (a 'running' record not listed here
+# was interrupted and can be resumed)
+_active_missions: Set[int] = set()
+_active_lock = threading.Lock()
+
+
+def box_payload(inputs: Dict[str, Any], box: MissionBox) -> Optional[Dict[str, Any]]:
+    """Input for box: keyed by str(box_id), else by box type."""
+    return inputs.get(str(box.id), inputs.get(box.box_type))
+
+
+def missing_input(box: MissionBox, payload: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Name of the required input the box lacks, or None if it can run."""
+    required = REQUIRED_INPUTS.get(box.box_type)
+    if required and not any((payload or {}).get(key) for key in required):
+        return required[0]
+    return None
+
+
+def build_dependency_graph(boxes: List[MissionBox]) -> Dict[int, Set[int]]:
+    """Map box_id → ids of boxes that must finish first."""
+    graph = {}
+    for box in boxes:
+        upstream_types = BOX_DEPENDENCIES.get(box.box_type)
+        graph[box.id] = {
+            other.id for other in boxes
+            if other.order_index < box.order_index
+            and (upstream_types is None or other.box_type in upstream_types)
+        }
+    return graph
+
+
+class MissionExecutor:
+    """
+    Executes all boxes of a mission with dependency-aware parallelism.
+
+    Usage:
+        executor = MissionExecutor(SessionLocal, on_event=print)
+        run = executor.run(mission_id, inputs={
+            'inbox': {'artifact_ids': [1, 2]},
+            'ask': {'question': 'What is torque?'}
+        })
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_workers: int = 4,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Args:
+            session_factory: Creates a new Session (one per worker/box)
+            max_workers: Max boxes running at once
+            on_event: Called with each state transition event
+        """
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.on_event = on_event
+
+    def run(
+        self,
+        mission_id: int,
+        inputs: Optional[Dict[str, Any]] = None,
+        resume: bool = True,
+        rerun: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute the mission to completion.
+
+        Args:
+            mission_id: Mission ID
+            inputs: Input payloads keyed by box type or str(box_id)
+            resume: Continue the latest unfinished run if there is one
+            rerun: Re-execute boxes already DONE from earlier runs
+
+        Returns:
+            Run summary (see _serialize_run)
+
+        Raises:
+            MissionExecutorError: Mission not found or already executing
+        """
+        with _active_lock:
+            if mission_id in _active_missions:
+                raise MissionExecutorError(f"Mission {mission_id} is already running")
+            _active_missions.add(mission_id)
+
+        db = self.session_factory()
+        try:
+            return self._run(db, mission_id, inputs, resume, rerun)
+        finally:
+            db.close()
+            with _active_lock:
+                _active_missions.discard(mission_id)
+
+    # ------------------------------------------------------------------
+    # Coordinator
+    # ------------------------------------------------------------------
+
+    def _run(
+        self,
+        db: Session,
+        mission_id: int,
+        inputs: Optional[Dict[str, Any]],
+        resume: bool,
+        rerun: bool
+    ) -> Dict[str, Any]:
+        mission = db.query(Mission).filter(Mission.id == mission_id).first()
+        if not mission:
+            raise MissionExecutorError(f"Mission {mission_id} not found")
+
+        boxes = db.query(MissionBox).filter(
+            MissionBox.mission_id == mission_id
+        ).order_by(MissionBox.order_index).all()
+        boxes_by_id = {box.id: box for box in boxes}
+        graph = build_dependency_graph(boxes)
+
+        run = self._latest_unfinished_run(db, mission_id) if resume else None
+        if run:
+            if inputs is None:
+                inputs = json.loads(run.inputs_json or '{}')
+            states = self._resume_states(db, run, boxes_by_id, graph, inputs)
+            run.state = RUN_RUNNING
+            run.error = None
+            run.finished_at = None
+        else:
+            states = {}
+            run = MissionRun(mission_id=mission_id, state=RUN_RUNNING)
+            db.add(run)
+
+        inputs = inputs or {}
+        for box in boxes:
+            if box.id in states:
+                continue
+            if box.state == DONE and not rerun:
+                # Finished before this run (manual run or earlier mission run)
+                states[box.id] = {'state': DONE, 'error': None, 'artifact_ids': [], 'reused': True}
+                continue
+            if box.state == DONE:
+                box.state = BoxState.READY.value
+            states[box.id] = {'state': PENDING, 'error': None, 'artifact_ids': []}
+
+        run.inputs_json = json.dumps(inputs)
+        run.box_states_json = json.dumps({str(k): v for k, v in states.items()})
+        db.commit()
+
+        self._emit(run, None, RUN_RUNNING)
+
+        pending = [box_id for box_id in boxes_by_id if states[box_id]['state'] == PENDING]
+        in_flight = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mission-box") as pool:
+            while pending or in_flight:
+                scheduled = len(pending)
+                for box_id in list(pending):
+                    deps = graph[box_id]
+                    box = boxes_by_id[box_id]
+
+                    if any(states[d]['state'] in FAILED_STATES for d in deps):
+                        pending.remove(box_id)
+                        self._set_state(db, run, states, box, BLOCKED, error="Upstream box failed")
+                        continue
+
+                    if not all(states[d]['state'] in SATISFIED_STATES for d in deps):
+                        continue
+                    if len(in_flight) >= self.max_workers:
+                        continue
+
+                    pending.remove(box_id)
+                    payload = box_payload(inputs, box)
+                    missing = missing_input(box, payload)
+                    if missing:
+                        self._set_state(db, run, states, box, SKIPPED, error=f"No '{missing}' input")
+                        continue
+
+                    self._set_state(db, run, states, box, RUNNING)
+                    future = pool.submit(self._run_box, mission_id, box_id, payload or {}, rerun)
+                    in_flight[future] = box_id
+
+                if not in_flight:
+                    if len(pending) == scheduled:
+                        raise MissionExecutorError(f"Mission {mission_id} has unschedulable boxes: {pending}")
+                    # Skips/blocks may have made more boxes ready
+                    continue
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    box = boxes_by_id[in_flight.pop(future)]
+                    try:
+                        result = future.result()
+                        artifact_ids = [a['id'] for a in result.get('artifacts', [])]
+                        self._set_state(db, run, states, box, DONE, artifact_ids=artifact_ids)
+                    except Exception as e:
+                        self._set_state(db, run, states, box, ERROR, error=str(e))
+
+        failed = [str(box_id) for box_id, s in states.items() if s['state'] in FAILED_STATES]
+        run.box_states_json = json.dumps({str(k): v for k, v in states.items()})
+        run.state = RUN_ERROR if failed else RUN_DONE
+        run.error = f"Boxes failed or blocked: {', '.join(failed)}" if failed else None
+        run.finished_at = datetime.utcnow()
+        db.commit()
+
+        self._emit(run, None, run.state, error=run.error)
+        return self._serialize_run(run)
+
+    def _run_box(self, mission_id: int, box_id: int, payload: Dict[str, Any], force: bool) -> Dict[str, Any]:
+        """Worker: run one box in its own session (force bypasses memoized results)."""
+        db = self.session_factory()
+        try:
+            return BoxRunner.run_box(db=db, mission_id=mission_id, box_id=box_id, input_payload=payload, force=force)
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # Run record
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _latest_unfinished_run(db: Session, mission_id: int) -> Optional[MissionRun]:
+        run = db.query(MissionRun).filter(
+            MissionRun.mission_id == mission_id
+        ).order_by(MissionRun.id.desc()).first()
+        if run and run.state != RUN_DONE:
+            return run
+        return None
+
+    @staticmethod
+    def _resume_states(
+        db: Session,
+        run: MissionRun,
+        boxes_by_id: Dict[int, MissionBox],
+        graph: Dict[int, Set[int]],
+        inputs: Dict[str, Any]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Keep DONE boxes from the record; everything else runs again. A box
+        skipped for missing input that has it now runs, and so does every
+        DONE box downstream of it (those ran without its output).
+        """
+        recorded = {int(k): v for k, v in json.loads(run.box_states_json or '{}').items()}
+        states = {}
+        # Boxes producing new output in this run (boxes_by_id is in order_index order)
+        refreshed = set()
+        for box_id, box in boxes_by_id.items():
+            entry = recorded.get(box_id)
+            state = entry['state'] if entry else None
+            if state == DONE and not graph[box_id] & refreshed:
+                states[box_id] = entry
+            elif state == DONE or (state == SKIPPED and not missing_input(box, box_payload(inputs, box))):
+                if box.state == DONE:
+                    box.state = BoxState.READY.value
+                refreshed.add(box_id)
+            elif box.state == RUNNING and (box.lease_expires_at is None or BoxRunner.lease_expired(box)):
+                # Interrupted mid-box by a crash/restart - make it runnable again.
+                # A live lease means another process is still running it.
+                box.state = BoxState.READY.value
+                box.lease_owner = None
+                box.lease_expires_at = None
+        return states
+
+    def _set_state(
+        self,
+        db: Session,
+        run: MissionRun,
+        states: Dict[int, Dict[str, Any]],
+        box: MissionBox,
+        state: str,
+        error: Optional[str] = None,
+        artifact_ids: Optional[List[int]] = None
+    ):
+        states[box.id] = {'state': state, 'error': error, 'artifact_ids': artifact_ids or []}
+        # Only box results are written to the record as they happen; running/
+        # skipped/blocked are re-derived on resume (BoxRunner persists RUNNING on
+        # the box itself). Leaving no pending change on the coordinator session
+        # also keeps autoflush from holding the SQLite write lock on workers.
+        if state in (DONE, ERROR):
+            run.box_states_json = json.dumps({str(k): v for k, v in states.items()})
+            db.commit()
+        self._emit(run, box, state, error=error)
+
+    def _emit(self, run: MissionRun, box: Optional[MissionBox], state: str, error: Optional[str] = None):
+        if not self.on_event:
+            return
+        self.on_event({
+            'run_id': run.id,
+            'mission_id': run.mission_id,
+            'box_id': box.id if box else None,
+            'box_type': box.box_type if box else None,
+            'state': state,
+            'error': error,
+            'at': datetime.utcnow().isoformat()
+        })
+
+    @staticmethod
+    def _serialize_run(run: MissionRun) -> Dict[str, Any]:
+        return {
+            'run_id': run.id,
+            'mission_id': run.mission_id,
+            'state': run.state,
+            'error': run.error,
+            'boxes': {int(k): v for k, v in json.loads(run.box_states_json or '{}').items()},
+            'started_at': run.started_at.isoformat() if run.started_at else None,
+            'finished_at': run.finished_at.isoformat() if run.finished_at else None
+        }
+
+    @staticmethod
+    def get_run(db: Session, mission_id: int, run_id: int) -> Optional[Dict[str, Any]]:
+        run = db.query(MissionRun).filter(
+            MissionRun.id == run_id,
+            MissionRun.mission_id == mission_id
+        ).first()
+        return MissionExecutor._serialize_run(run) if run else None
@@ -6,9 +6,10 @@ Creates missions from templates with pre-configured boxes.
 """
 
 import json
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import func, and_, or_
+from sqlalchemy.orm import Session, selectinload, defer
 
 from marcus_app.core.models import (
     Mission, MissionBox, MissionArtifact, PracticeSession, PracticeItem,
@@ -69,12 +70,42 @@ class MissionService:
 
         return mission
 
+    @staticmethod
+    def _filtered_missions(
+        db: Session,
+        class_id: Optional[int],
+        mission_type: Optional[str],
+        state: Optional[str],
+        cursor: Optional[str],
+        *entities
+    ):
+        """Filtered query in listing order (created_at DESC, id DESC), after cursor."""
+        query = db.query(Mission, *entities)
+
+        if class_id:
+            query = query.filter(Mission.class_id == class_id)
+        if mission_type:
+            query = query.filter(Mission.mission_type == mission_type)
+        if state:
+            query = query.filter(Mission.state == state)
+
+        if cursor:
+            created_at, mission_id = MissionService.decode_cursor(cursor)
+            query = query.filter(or_(
+                Mission.created_at < created_at,
+                and_(Mission.created_at == created_at, Mission.id < mission_id)
+            ))
+
+        return query.order_by(Mission.created_at.desc(), Mission.id.desc())
+
     @staticmethod
     def list_missions(
         db: Session,
         class_id: Optional[int] = None,
         mission_type: Optional[str] = None,
-        state: Optional[str] = None
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[Mission]:
         """
         List missions with optional filters.
@@ -84,20 +115,89 @@ class MissionService:
             class_id: Filter by class ID
             mission_type: Filter by mission type
             state: Filter by mission state
+            limit: Page size (None = all)
+            cursor: Keyset cursor from encode_cursor() of the previous page's last mission
 
         Returns:
             List of Mission objects
         """
-        query = db.query(Mission)
+        query = MissionService._filtered_missions(db, class_id, mission_type, state, cursor)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
-        if class_id:
-            query = query.filter(Mission.class_id == class_id)
-        if mission_type:
-            query = query.filter(Mission.mission_type == mission_type)
-        if state:
-            query = query.filter(Mission.state == state)
+    @staticmethod
+    def list_missions_with_counts(
+        db: Session,
+        class_id: Optional[int] = None,
+        mission_type: Optional[str] = None,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List missions with box/artifact counts in a single query.
 
-        return query.order_by(Mission.created_at.desc()).all()
+        Counts come from GROUP BY subqueries joined to missions, so no
+        relationship collection is loaded.
+
+        Returns:
+            ([{mission, box_count, artifact_count}], next_cursor or None)
+        """
+        box_counts = db.query(
+            MissionBox.mission_id.label('mission_id'),
+            func.count(MissionBox.id).label('n')
+        ).group_by(MissionBox.mission_id).subquery()
+        artifact_counts = db.query(
+            MissionArtifact.mission_id.label('mission_id'),
+            func.count(MissionArtifact.id).label('n')
+        ).group_by(MissionArtifact.mission_id).subquery()
+
+        query = MissionService._filtered_missions(
+            db, class_id, mission_type, state, cursor,
+            func.coalesce(box_counts.c.n, 0),
+            func.coalesce(artifact_counts.c.n, 0)
+        ).outerjoin(
+            box_counts, box_counts.c.mission_id == Mission.id
+        ).outerjoin(
+            artifact_counts, artifact_counts.c.mission_id == Mission.id
+        )
+
+        if limit:
+            # One extra row tells whether there is a next page
+            rows = query.limit(limit + 1).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+        else:
+            rows = query.all()
+            has_more = False
+
+        missions = [
+            {'mission': mission, 'box_count': box_count, 'artifact_count': artifact_count}
+            for mission, box_count, artifact_count in rows
+        ]
+        next_cursor = MissionService.encode_cursor(rows[-1][0]) if has_more else None
+
+        return missions, next_cursor
+
+    @staticmethod
+    def encode_cursor(mission: Mission) -> str:
+        """Keyset cursor: '<created_at ISO>|<id>'."""
+        return f"{mission.created_at.isoformat()}|{mission.id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """
+        Parse a cursor from encode_cursor().
+
+        Raises:
+            MissionServiceError: If cursor is malformed
+        """
+        try:
+            created_at, mission_id = cursor.rsplit('|', 1)
+            return datetime.fromisoformat(created_at), int(mission_id)
+        except (ValueError, AttributeError):
+            raise MissionServiceError(f"Invalid cursor: {cursor}")
 
     @staticmethod
     def get_mission(db: Session, mission_id: int) -> Optional[Mission]:
@@ -122,18 +222,38 @@ class MissionService:
             db: Database session
             mission_id: Mission ID
 
+        Collections are loaded with selectinload (one query each) and
+        artifact bodies are deferred; practice item counts come from one
+        GROUP BY query instead of loading every session's items.
+
         Returns:
-            Dict with mission, boxes, artifacts, practice_sessions
+            Dict with mission, boxes, artifacts, practice_sessions,
+            practice_item_counts ({session_id: count})
         """
-        mission = MissionService.get_mission(db, mission_id)
+        mission = db.query(Mission).options(
+            selectinload(Mission.boxes),
+            selectinload(Mission.artifacts).options(
+                defer(MissionArtifact.content_json),
+                defer(MissionArtifact.source_refs_json)
+            ),
+            selectinload(Mission.practice_sessions)
+        ).filter(Mission.id == mission_id).first()
         if not mission:
             return None
 
+        session_ids = [session.id for session in mission.practice_sessions]
+        item_counts = dict(
+            db.query(PracticeItem.session_id, func.count(PracticeItem.id)).filter(
+                PracticeItem.session_id.in_(session_ids)
+            ).group_by(PracticeItem.session_id).all()
+        ) if session_ids else {}
+
         return {
             'mission': mission,
             'boxes': mission.boxes,
             'artifacts': mission.artifacts,
-            'practice_sessions': mission.practice_sessions
+            'practice_sessions': mission.practice_sessions,
+            'practice_item_counts': item_counts
         }
 
     @staticmethod
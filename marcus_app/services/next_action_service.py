@@ -11,12 +11,31 @@ Ranking algorithm:
 5. Active tasks not started
 
 Returns top 3 actionable items + 1 recommended action.
+
+v0.53: candidates come from one UNION ALL query. Each branch is an
+index-ordered top-N (see the Item/Mission indexes), branches are
+disjoint (an item is listed under its highest-priority reason only),
+and only the final top-N rows are materialized.
 """
 
+from sqlalchemy import select, union_all, literal, null, cast, exists, and_, or_, DateTime
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from marcus_app.core.models import Item, Mission, MissionBox, Inbox
+from typing import List, Dict
+from marcus_app.core.models import Item, Mission, MissionBox, MissionState, BoxState
+
+
+# Item statuses that still need attention
+OPEN_STATUSES = ('inbox', 'active')
+
+# (reason, priority) by rank_order
+REASONS = {
+    1: ("overdue", 100),
+    2: ("due_soon", 85),
+    3: ("pinned_inbox", 75),
+    4: ("blocked_mission", 65),
+    5: ("not_started", 55),
+}
 
 
 class NextActionService:
@@ -39,87 +58,32 @@ class NextActionService:
                     "id": 123,
                     "type": "task",
                     "title": "Finish lab report",
-                    "context": "PHYS214",
-                    "due": "2024-01-15 17:00",
-                    "priority": 95,
-                    "reason": "overdue"
+                    "context": "class",
+                    "due": "2024-01-15T17:00:00",
+                    "priority": 100,
+                    "reason": "overdue",
+                    "status": "active"
                 },
                 ...
             ],
             "recommended_action": {
                 "title": "Finish lab report",
                 "actions": [
-                    {"label": "Open Item", "type": "navigate", "target": "/items/123"},
-                    {"label": "Mark Done", "type": "command", "command": "mark done"}
+                    {"label": "Open Item", "type": "navigate", "target": "/tasks/123"},
+                    {"label": "Mark Done", "type": "command", "command": "mark 123 done"}
                 ]
             },
             "summary": "1 overdue, 2 due soon"
         }
         """
-
-        candidates = []
-
-        # 1. Collect overdue items (highest priority: 95-100)
-        overdue = self._get_overdue_items()
-        for item in overdue:
-            candidates.append({
-                "item": item,
-                "priority": 100,
-                "reason": "overdue",
-                "rank_order": 1
-            })
-
-        # 2. Collect items due in next 48h (priority: 80-94)
-        due_soon = self._get_due_soon_items()
-        for item in due_soon:
-            candidates.append({
-                "item": item,
-                "priority": 85,
-                "reason": "due_soon",
-                "rank_order": 2
-            })
-
-        # 3. Collect pinned inbox items (priority: 70-79)
-        pinned = self._get_pinned_inbox_items()
-        for item in pinned:
-            candidates.append({
-                "item": item,
-                "priority": 75,
-                "reason": "pinned_inbox",
-                "rank_order": 3
-            })
-
-        # 4. Blocked missions with runnable boxes (priority: 60-69)
-        blocked = self._get_blocked_missions()
-        for mission in blocked:
-            candidates.append({
-                "item": mission,
-                "priority": 65,
-                "reason": "blocked_mission",
-                "rank_order": 4
-            })
-
-        # 5. Active tasks not started (priority: 50-59)
-        not_started = self._get_not_started_tasks()
-        for item in not_started:
-            candidates.append({
-                "item": item,
-                "priority": 55,
-                "reason": "not_started",
-                "rank_order": 5
-            })
-
-        # Sort by priority (descending) and then by rank_order
-        candidates.sort(key=lambda x: (-x["priority"], x["rank_order"]))
-
-        # Take top N items
-        top_items = candidates[:limit]
+        try:
+            top_items = self.db.execute(self._ranked_candidates(limit)).all()
+        except Exception as e:
+            print(f"Error ranking next actions: {e}")
+            top_items = []
 
         # Format results
-        formatted_items = [
-            self._format_item_for_response(c["item"], c["reason"])
-            for c in top_items
-        ]
+        formatted_items = [self._format_row_for_response(row) for row in top_items]
 
         # Determine recommended action
         recommended_action = None
@@ -127,7 +91,7 @@ class NextActionService:
             recommended_action = self._get_recommended_action(formatted_items[0])
 
         # Generate summary
-        summary = self._generate_summary(top_items)
+        summary = self._generate_summary(formatted_items)
 
         return {
             "items": formatted_items,
@@ -136,102 +100,118 @@ class NextActionService:
             "timestamp": self.now.isoformat()
         }
 
-    def _get_overdue_items(self) -> List[Item]:
-        """Get items with past due dates."""
-        try:
-            return self.db.query(Item).filter(
-                Item.due_at < self.now,
-                Item.due_at.isnot(None),
-                Item.done_at.is_(None)
-            ).order_by(Item.due_at.asc()).limit(10).all()
-        except Exception as e:
-            print(f"Error fetching overdue items: {e}")
-            return []
-
-    def _get_due_soon_items(self) -> List[Item]:
-        """Get items due in next 48 hours."""
-        try:
-            threshold = self.now + timedelta(hours=48)
-            return self.db.query(Item).filter(
-                Item.due_at >= self.now,
-                Item.due_at <= threshold,
-                Item.due_at.isnot(None),
-                Item.done_at.is_(None)
-            ).order_by(Item.due_at.asc()).limit(10).all()
-        except Exception as e:
-            print(f"Error fetching due-soon items: {e}")
-            return []
-
-    def _get_pinned_inbox_items(self) -> List[Item]:
-        """Get pinned inbox items."""
-        try:
-            return self.db.query(Item).join(
-                Inbox, Item.id == Inbox.item_id
-            ).filter(
-                Inbox.pinned == True,
-                Item.done_at.is_(None)
-            ).order_by(Inbox.created_at.desc()).limit(10).all()
-        except Exception as e:
-            print(f"Error fetching pinned inbox items: {e}")
-            return []
-
-    def _get_blocked_missions(self) -> List[Mission]:
-        """Get blocked missions with runnable boxes."""
-        try:
-            blocked_missions = self.db.query(Mission).filter(
-                Mission.state == "blocked"
-            ).limit(10).all()
-
-            result = []
-            for mission in blocked_missions:
-                # Check if any boxes are runnable
-                runnable_boxes = self.db.query(MissionBox).filter(
-                    MissionBox.mission_id == mission.id,
-                    MissionBox.status != "done"
-                ).limit(1).all()
-
-                if runnable_boxes:
-                    result.append(mission)
-
-            return result
-        except Exception as e:
-            print(f"Error fetching blocked missions: {e}")
-            return []
-
-    def _get_not_started_tasks(self) -> List[Item]:
-        """Get active tasks not started."""
-        try:
-            return self.db.query(Item).filter(
-                Item.item_type == "task",
-                Item.done_at.is_(None),
-                Item.context.isnot(None)
-            ).order_by(Item.created_at.desc()).limit(10).all()
-        except Exception as e:
-            print(f"Error fetching not-started tasks: {e}")
-            return []
+    def _ranked_candidates(self, limit: int):
+        """
+        One statement for all five candidate branches.
 
-    def _format_item_for_response(self, item, reason: str) -> Dict:
-        """Format item for API response."""
-        if isinstance(item, Mission):
+        Every branch selects the same columns, is ordered by its own index
+        and limited to `limit` rows; the outer query orders by
+        (priority desc, rank_order, sort_asc, sort_desc desc, id) and keeps
+        the top `limit`.
+        """
+        threshold = self.now + timedelta(hours=48)
+        no_time = cast(null(), DateTime)
+        is_open = Item.status.in_(OPEN_STATUSES)
+        not_due_soon = or_(Item.due_at.is_(None), Item.due_at > threshold)
+
+        def item_branch(rank_order, where, sort_asc, sort_desc, order_by):
+            return select(
+                literal('item').label('kind'),
+                Item.id.label('id'),
+                Item.title.label('title'),
+                Item.item_type.label('type'),
+                Item.context_kind.label('context'),
+                Item.due_at.label('due'),
+                Item.status.label('status'),
+                literal(REASONS[rank_order][1]).label('priority'),
+                literal(rank_order).label('rank_order'),
+                sort_asc.label('sort_asc'),
+                sort_desc.label('sort_desc'),
+            ).where(*where).order_by(*order_by).limit(limit).subquery()
+
+        # 1. Overdue
+        overdue = item_branch(
+            1, [is_open, Item.due_at < self.now],
+            Item.due_at, no_time, [Item.due_at.asc(), Item.id.asc()]
+        )
+
+        # 2. Due in next 48h
+        due_soon = item_branch(
+            2, [is_open, Item.due_at >= self.now, Item.due_at <= threshold],
+            Item.due_at, no_time, [Item.due_at.asc(), Item.id.asc()]
+        )
+
+        # 3. Pinned inbox items (not already overdue/due soon)
+        pinned = item_branch(
+            3, [Item.status == 'inbox', Item.pinned == 1, not_due_soon],
+            no_time, Item.created_at, [Item.created_at.desc(), Item.id.asc()]
+        )
+
+        # 4. Blocked missions with a box that is not done
+        runnable_box = exists().where(and_(
+            MissionBox.mission_id == Mission.id,
+            MissionBox.state != BoxState.DONE.value
+        ))
+        blocked = select(
+            literal('mission').label('kind'),
+            Mission.id.label('id'),
+            Mission.name.label('title'),
+            literal('mission').label('type'),
+            Mission.mission_type.label('context'),
+            no_time.label('due'),
+            Mission.state.label('status'),
+            literal(REASONS[4][1]).label('priority'),
+            literal(4).label('rank_order'),
+            no_time.label('sort_asc'),
+            no_time.label('sort_desc'),
+        ).where(
+            Mission.state == MissionState.BLOCKED.value,
+            runnable_box
+        ).order_by(Mission.id.asc()).limit(limit).subquery()
+
+        # 5. Active tasks not started (not already overdue/due soon)
+        not_started = item_branch(
+            5, [Item.status == 'active', Item.item_type == 'task', not_due_soon],
+            no_time, Item.created_at, [Item.created_at.desc(), Item.id.asc()]
+        )
+
+        candidates = union_all(
+            *(select(branch) for branch in (overdue, due_soon, pinned, blocked, not_started))
+        ).subquery()
+
+        return select(candidates).order_by(
+            candidates.c.priority.desc(),
+            candidates.c.rank_order,
+            candidates.c.sort_asc.asc(),
+            candidates.c.sort_desc.desc(),
+            candidates.c.id
+        ).limit(limit)
+
+    def _format_row_for_response(self, row) -> Dict:
+        """Format a ranked candidate row for API response."""
+        reason, priority = REASONS[row.rank_order]
+        if row.kind == 'mission':
             return {
-                "id": item.id,
+                "id": row.id,
                 "type": "mission",
-                "title": item.name,
-                "context": item.mission_type,
-                "due": item.deadline.isoformat() if item.deadline else None,
+                "title": row.title,
+                "context": row.context,
+                "due": None,
+                "priority": priority,
                 "reason": reason,
-                "status": item.state
+                "status": row.status
             }
         else:
-            # Item object
+            # Item row
             return {
-                "id": item.id,
-                "type": item.item_type,
-                "title": item.title,
-                "context": item.context or "General",
-                "due": item.due_at.isoformat() if item.due_at else None,
+                "id": row.id,
+                "type": row.type,
+                "title": row.title,
+                "context": row.context or "General",
+                "due": row.due.isoformat() if row.due else None,
+                "priority": priority,
                 "reason": reason,
-                "status": "done" if item.done_at else "active"
+                "status": "active"
             }
 
     def _get_recommended_action(self, top_item: Dict) -> Dict:
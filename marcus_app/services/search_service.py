@@ -23,21 +23,52 @@ class SearchService:
     - Semantic search fallback (if embeddings available)
     """
 
-    def __init__(self):
-        self.embeddings_available = False
-        self.embedding_service = None
+    def __init__(
+        self,
+        embedding_service=None,
+        idle_unload_seconds: Optional[float] = None,
+        embedding_backend: Optional[str] = None
+    ):
+        """
+        Args:
+            embedding_service: Pre-built EmbeddingService (tests/stubs); default
+                creates one for all-MiniLM-L6-v2
+            idle_unload_seconds: Evict the embedding model after this long unused
+            embedding_backend: Embedding backend name (see embedding_service.BACKENDS)
+
+        The embedding model warms up on a background thread. Until it is
+        ready, search serves FTS5 only and switches to hybrid automatically.
+        """
+        self.embedding_service = embedding_service
 
-        # Try to initialize embeddings
-        try:
-            from .embedding_service import EmbeddingService
-            self.embedding_service = EmbeddingService()
-            if self.embedding_service.is_available():
-                self.embeddings_available = True
-                print("[SearchService] Embeddings enabled (hybrid mode)")
-            else:
+        if self.embedding_service is None:
+            try:
+                from .embedding_service import EmbeddingService
+                self.embedding_service = EmbeddingService(
+                    idle_unload_seconds=idle_unload_seconds,
+                    backend=embedding_backend
+                )
+            except ImportError:
                 print("[SearchService] Using FTS5 only")
-        except ImportError:
-            print("[SearchService] Using FTS5 only")
+
+        if self.embedding_service is not None:
+            self.embedding_service.start_warmup()
+            print("[SearchService] Embedding model warming up (FTS5 only until ready)")
+
+    @property
+    def embeddings_available(self) -> bool:
+        """True once the embedding model is loaded (hybrid mode)."""
+        return self.embedding_service is not None and self.embedding_service.is_available()
+
+    def get_status(self) -> Dict:
+        """Readiness summary for /health."""
+        if self.embedding_service is None:
+            return {'mode': 'fts5', 'embeddings': None}
+
+        return {
+            'mode': 'hybrid' if self.embeddings_available else 'fts5',
+            'embeddings': self.embedding_service.get_model_info()
+        }
 
     def normalize_query(self, query: str) -> str:
         """
@@ -135,21 +166,29 @@ class SearchService:
         class_id: Optional[int] = None,
         assignment_id: Optional[int] = None,
         limit: int = 10,
-        db: Session = None
+        db: Session = None,
+        artifact_ids: Optional[List[int]] = None
     ) -> List[Dict]:
         """
         Search chunks with FTS5 + optional semantic search.
+
+        artifact_ids restricts results to chunks of those artifacts
+        (mission-scoped search).
         """
         # Try FTS5 first (always available)
         fts_results = self._fts5_search(
-            query, class_id, assignment_id, limit, db
+            query, class_id, assignment_id, limit, db, artifact_ids
         )
 
+        # Model evicted for idleness - reload in the background, serve FTS5 now
+        if self.embedding_service is not None and not self.embeddings_available:
+            self.embedding_service.start_warmup()
+
         # If semantic search available and FTS5 found few results, augment
         if self.embeddings_available and len(fts_results) < limit:
             try:
                 semantic_results = self._semantic_search(
-                    query, class_id, assignment_id, limit, db
+                    query, class_id, assignment_id, limit, db, artifact_ids
                 )
 
                 # Merge results (deduplicate by chunk_id)
@@ -173,7 +212,8 @@ class SearchService:
         class_id: Optional[int],
         assignment_id: Optional[int],
         limit: int,
-        db: Session
+        db: Session,
+        artifact_ids: Optional[List[int]] = None
     ) -> List[Dict]:
         """
         FTS5 full-text search with BM25 ranking.
@@ -240,6 +280,9 @@ class SearchService:
             sql_parts.append("AND tc.assignment_id = :assignment_id")
             params['assignment_id'] = assignment_id
 
+        if artifact_ids:
+            sql_parts.append("AND " + self._artifact_filter(artifact_ids, params))
+
         # Order by BM25 rank (lower is better in FTS5)
         sql_parts.append("ORDER BY text_chunks_fts.rank")
         sql_parts.append("LIMIT :limit")
@@ -253,7 +296,7 @@ class SearchService:
         except Exception as e:
             print(f"[SearchService] FTS5 search failed: {e}")
             # Fallback to LIKE search
-            return self._fallback_like_search(query, class_id, assignment_id, limit, db)
+            return self._fallback_like_search(query, class_id, assignment_id, limit, db, artifact_ids)
 
         # Format results
         results = []
@@ -297,7 +340,8 @@ class SearchService:
         class_id: Optional[int],
         assignment_id: Optional[int],
         limit: int,
-        db: Session
+        db: Session,
+        artifact_ids: Optional[List[int]] = None
     ) -> List[Dict]:
         """
         Fallback LIKE search if FTS5 fails.
@@ -324,6 +368,9 @@ class SearchService:
             filter_clauses.append("tc.assignment_id = :assignment_id")
             params['assignment_id'] = assignment_id
 
+        if artifact_ids:
+            filter_clauses.append(self._artifact_filter(artifact_ids, params))
+
         # Combine WHERE clauses
         all_where = []
         if where_clauses:
@@ -373,12 +420,13 @@ class SearchService:
         class_id: Optional[int],
         assignment_id: Optional[int],
         limit: int,
-        db: Session
+        db: Session,
+        artifact_ids: Optional[List[int]] = None
     ) -> List[Dict]:
         """
         Semantic search using embeddings (optional augmentation).
         """
-        query_embedding = self.embedding_service.embed_text(query)
+        query_embedding = self.embedding_service.embed_query(query)
 
         query_obj = db.query(TextChunk)
 
@@ -388,7 +436,14 @@ class SearchService:
         if assignment_id:
             query_obj = query_obj.filter(TextChunk.assignment_id == assignment_id)
 
-        query_obj = query_obj.filter(TextChunk.embedding_vector.isnot(None))
+        if artifact_ids:
+            query_obj = query_obj.filter(TextChunk.artifact_id.in_(artifact_ids))
+
+        # Only compare against vectors from the same backend + model
+        query_obj = query_obj.filter(
+            TextChunk.embedding_vector.isnot(None),
+            TextChunk.embedding_model == self.embedding_service.model_id
+        )
         chunks = query_obj.all()
 
         scored_chunks = []
@@ -426,6 +481,14 @@ class SearchService:
 
         return results
 
+    def _artifact_filter(self, artifact_ids: List[int], params: Dict) -> str:
+        """'tc.artifact_id IN (...)' clause; adds one bound parameter per id."""
+        names = []
+        for i, artifact_id in enumerate(artifact_ids):
+            params[f'artifact_id{i}'] = artifact_id
+            names.append(f':artifact_id{i}')
+        return f"tc.artifact_id IN ({', '.join(names)})"
+
     def _generate_snippet(self, content: str, query: str, context_chars: int = 150) -> str:
         """Generate snippet with query context."""
         # Normalize query for matching
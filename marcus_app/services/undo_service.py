@@ -5,7 +5,9 @@ Lightweight undo system for recent actions.
 
 Features:
 - 10-second undo window
-- Persisted in database (undo_events table)
+- Recent events served from an in-memory ring buffer (UNDO_BUFFER), written
+  through to the database (undo_events table) for crash recovery
+- Expired rows pruned in bulk by cleanup_expired_events (background sweeper)
 - Supports: create item, file item, delete item, snooze, pin, mission creation
 - Does NOT support: online ops (push/PR)
 """
@@ -13,10 +15,11 @@ Features:
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional, Dict
+from collections import deque
 from enum import Enum
+import threading
 import json
 
-from marcus_app.core.database import engine
 from sqlalchemy import Column, Integer, String, JSON, DateTime, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -30,6 +33,96 @@ class UndoAction(str, Enum):
     CREATE_MISSION = "create_mission"
 
 
+class UndoBuffer:
+    """
+    Ring buffer of the most recent undo events, shared by every UndoService.
+
+    Only the last few seconds of actions can be undone, so reads never need
+    the undo_events table: record_action writes the row and pushes it here,
+    get_last_action scans at most `capacity` entries. The table is read once
+    per process (first use) to recover events recorded before a restart.
+    """
+
+    def __init__(self, capacity: int = 50):
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=capacity)
+        self._loaded = False
+
+    def ensure_loaded(self, db: Session, now: datetime):
+        """Recover unexpired, unconsumed events from the database once."""
+        if self._loaded:
+            return
+        from marcus_app.core.models import UndoEvent
+
+        rows = db.query(UndoEvent).filter(
+            UndoEvent.is_consumed == False,
+            UndoEvent.expires_at > now
+        ).order_by(UndoEvent.created_at.desc()).limit(self._events.maxlen).all()
+
+        with self._lock:
+            if self._loaded:
+                return
+            known = {event["id"] for event in self._events}
+            recovered = [self.entry(row) for row in reversed(rows) if row.id not in known]
+            self._events.extendleft(reversed(recovered))
+            self._loaded = True
+
+    @staticmethod
+    def entry(event) -> Dict:
+        """Buffer entry for an UndoEvent row."""
+        return {
+            "id": event.id,
+            "action_type": event.action_type,
+            "payload": event.payload,
+            "description": event.description,
+            "created_at": event.created_at,
+            "expires_at": event.expires_at,
+            "is_consumed": bool(event.is_consumed)
+        }
+
+    def push(self, entry: Dict):
+        with self._lock:
+            self._events.append(entry)
+
+    def latest(self, now: datetime) -> Optional[Dict]:
+        """Most recent unconsumed event that has not expired."""
+        with self._lock:
+            best = None
+            for event in self._events:
+                if event["is_consumed"] or event["expires_at"] <= now:
+                    continue
+                if best is None or event["created_at"] >= best["created_at"]:
+                    best = event
+            return dict(best) if best else None
+
+    def consume(self, event_id: int):
+        with self._lock:
+            for event in self._events:
+                if event["id"] == event_id:
+                    event["is_consumed"] = True
+
+    def prune(self, now: datetime) -> int:
+        """Drop expired or consumed events; returns how many were dropped."""
+        with self._lock:
+            live = [e for e in self._events if not e["is_consumed"] and e["expires_at"] > now]
+            dropped = len(self._events) - len(live)
+            self._events.clear()
+            self._events.extend(live)
+            return dropped
+
+    def reset(self):
+        """Forget all events and recover from the database on next use."""
+        with self._lock:
+            self._events.clear()
+            self._loaded = False
+
+    def __len__(self):
+        return len(self._events)
+
+
+UNDO_BUFFER = UndoBuffer()
+
+
 class UndoService:
     """
     Manage undo events for user actions.
@@ -73,8 +166,14 @@ class UndoService:
                 is_consumed=False
             )
 
+            # Recover older events first so the new one stays the most recent
+            UNDO_BUFFER.ensure_loaded(self.db, self.now)
+
             self.db.add(event)
+            self.db.flush()
+            entry = UndoBuffer.entry(event)  # before commit expires the attributes
             self.db.commit()
+            UNDO_BUFFER.push(entry)
 
             return str(event.id)
         except Exception as e:
@@ -98,25 +197,21 @@ class UndoService:
         }
         """
         try:
-            from marcus_app.core.models import UndoEvent
-
-            event = self.db.query(UndoEvent).filter(
-                UndoEvent.is_consumed == False,
-                UndoEvent.expires_at > self.now
-            ).order_by(UndoEvent.created_at.desc()).first()
+            UNDO_BUFFER.ensure_loaded(self.db, self.now)
+            event = UNDO_BUFFER.latest(self.now)
 
             if not event:
                 return None
 
             return {
-                "id": event.id,
-                "action_type": event.action_type,
-                "payload": event.payload,
-                "description": event.description,
-                "created_at": event.created_at.isoformat(),
-                "expires_at": event.expires_at.isoformat(),
-                "can_undo": event.expires_at > self.now,
-                "seconds_remaining": int((event.expires_at - self.now).total_seconds())
+                "id": event["id"],
+                "action_type": event["action_type"],
+                "payload": event["payload"],
+                "description": event["description"],
+                "created_at": event["created_at"].isoformat(),
+                "expires_at": event["expires_at"].isoformat(),
+                "can_undo": event["expires_at"] > self.now,
+                "seconds_remaining": int((event["expires_at"] - self.now).total_seconds())
             }
         except Exception as e:
             print(f"Error getting last undo action: {e}")
@@ -240,13 +335,11 @@ class UndoService:
 
             if result:
                 # Mark event as consumed
-                from marcus_app.core.models import UndoEvent
-                undo_event = self.db.query(UndoEvent).filter(
+                self.db.query(UndoEvent).filter(
                     UndoEvent.id == event["id"]
-                ).first()
-                if undo_event:
-                    undo_event.is_consumed = True
-                    self.db.commit()
+                ).update({UndoEvent.is_consumed: True}, synchronize_session=False)
+                self.db.commit()
+                UNDO_BUFFER.consume(event["id"])
 
                 return result
 
@@ -293,7 +386,10 @@ class UndoService:
 
     def cleanup_expired_events(self) -> int:
         """
-        Delete expired undo events (cron job).
+        Delete expired undo events (background sweeper, see api.py).
+
+        One bulk DELETE over ix_undo_events_expires_at; also drops expired
+        and consumed entries from the ring buffer.
 
         Returns: Number of events deleted
         """
@@ -302,9 +398,10 @@ class UndoService:
 
             expired = self.db.query(UndoEvent).filter(
                 UndoEvent.expires_at < self.now
-            ).delete()
+            ).delete(synchronize_session=False)
 
             self.db.commit()
+            UNDO_BUFFER.prune(self.now)
             return expired
         except Exception as e:
             print(f"Error cleaning up undo events: {e}")
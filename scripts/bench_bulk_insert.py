@@ -0,0 +1,118 @@
+"""
+Marcus - Bulk insert benchmark
+Compares per-object ORM inserts (db.add per TextChunk) against the
+core.bulk executemany path used by ChunkingService.
+
+Usage:
+    python scripts/bench_bulk_insert.py
+    python scripts/bench_bulk_insert.py --chunks 50000
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Assignment, Artifact, ExtractedText, TextChunk
+from marcus_app.core.bulk import bulk_insert
+from marcus_app.services.chunking_service import ChunkingService
+
+
+def setup_db(db_path: Path):
+    """Create a fresh file-backed database with one artifact to hang chunks on."""
+    if db_path.exists():
+        db_path.unlink()
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    cls = Class(code="BENCH101", name="Bench Class")
+    db.add(cls)
+    db.commit()
+    assignment = Assignment(class_id=cls.id, title="Bench Assignment")
+    db.add(assignment)
+    db.commit()
+    artifact = Artifact(
+        assignment_id=assignment.id,
+        filename="bench.txt",
+        original_filename="bench.txt",
+        file_path="/bench/bench.txt",
+        file_type="txt"
+    )
+    db.add(artifact)
+    db.commit()
+    extracted = ExtractedText(artifact_id=artifact.id, content="bench", extraction_method="plain")
+    db.add(extracted)
+    db.commit()
+
+    return engine, db, cls, artifact, extracted
+
+
+def make_raw_chunks(n: int):
+    """Synthetic chunk dicts shaped like ChunkingService._split_into_chunks output."""
+    text = "Torque is the rotational equivalent of force. " * 12
+    return [
+        {
+            'text': f"{text} ({i})",
+            'type': 'paragraph',
+            'section_title': f"Section {i // 50}",
+            'char_start': i * len(text),
+            'char_end': (i + 1) * len(text)
+        }
+        for i in range(n)
+    ]
+
+
+def bench_orm(db, rows):
+    start = time.perf_counter()
+    for row in rows:
+        db.add(TextChunk(**row))
+    db.commit()
+    return time.perf_counter() - start
+
+
+def bench_bulk(db, rows):
+    start = time.perf_counter()
+    bulk_insert(db, TextChunk, rows)
+    db.commit()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ORM vs bulk insert for text chunks")
+    parser.add_argument("--chunks", type=int, default=10000)
+    args = parser.parse_args()
+
+    db_path = Path(__file__).parent.parent / "storage" / "bench_bulk_insert.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 70)
+    print(f"Bulk insert benchmark - {args.chunks} chunks")
+    print("=" * 70)
+
+    results = {}
+    for label, fn in (("orm", bench_orm), ("bulk", bench_bulk)):
+        engine, db, cls, artifact, extracted = setup_db(db_path)
+        rows = ChunkingService.build_chunk_rows(
+            extracted.id, artifact, cls.id, make_raw_chunks(args.chunks)
+        )
+        elapsed = fn(db, rows)
+        count = db.query(TextChunk).count()
+        db.close()
+        engine.dispose()
+        assert count == args.chunks, f"{label}: expected {args.chunks} rows, got {count}"
+        results[label] = elapsed
+        print(f"{label:>5}: {elapsed:8.3f}s  ({args.chunks / elapsed:10.0f} rows/s)")
+
+    db_path.unlink()
+    print(f"\nSpeedup: {results['orm'] / results['bulk']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Marcus - Embedding backend benchmark
+Encodes the vault/*.md chunks with each embedding backend and reports:
+- load time and encode throughput (chunks/s)
+- retrieval agreement: top-k overlap with the reference backend for the
+  queries in scripts/test_queries.json
+
+Backends whose dependencies or model files are missing are skipped. The
+ONNX backends read the exported all-MiniLM-L6-v2 (model.onnx +
+tokenizer.json) from MARCUS_EMBEDDING_ONNX_DIR or models/all-MiniLM-L6-v2-onnx.
+
+Usage:
+    python scripts/bench_embedding_backends.py
+    python scripts/bench_embedding_backends.py --backends onnx onnx-int8 --top-k 10
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from marcus_app.services.embedding_service import EmbeddingService, BACKENDS
+from marcus_app.services.chunking_service import ChunkingService
+
+BASE_PATH = Path(__file__).parent.parent
+
+
+def load_chunks(vault: Path, limit: int):
+    """Chunk the vault markdown files the same way ingestion does."""
+    chunker = ChunkingService()
+    chunks = []
+    for path in sorted(vault.glob("*.md")):
+        for raw in chunker._split_into_chunks(path.read_text(encoding="utf-8", errors="ignore")):
+            chunks.append(raw['text'])
+    return chunks[:limit] if limit else chunks
+
+
+def load_queries():
+    with open(BASE_PATH / "scripts" / "test_queries.json", encoding="utf-8") as f:
+        return [q for queries in json.load(f).values() for q in queries]
+
+
+def run_backend(name: str, model_name: str, chunks, queries, top_k: int):
+    service = EmbeddingService(model_name=model_name, backend=name)
+    start = time.perf_counter()
+    if not service.ensure_loaded():
+        return None
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunk_vectors = np.array(service.embed_batch(chunks), dtype=np.float32)
+    encode_seconds = time.perf_counter() - start
+
+    query_vectors = np.array(service.embed_batch(queries), dtype=np.float32)
+    chunk_vectors /= np.linalg.norm(chunk_vectors, axis=1, keepdims=True)
+    query_vectors /= np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    scores = query_vectors @ chunk_vectors.T
+    rankings = [list(np.argsort(-row)[:top_k]) for row in scores]
+
+    return {
+        'load_seconds': load_seconds,
+        'encode_seconds': encode_seconds,
+        'throughput': len(chunks) / encode_seconds,
+        'rankings': rankings
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare embedding backends")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS),
+                        help="Backends to run; the first available one is the reference")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--limit", type=int, default=0, help="Max chunks to encode (0 = all)")
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    chunks = load_chunks(BASE_PATH / "vault", args.limit)
+    queries = load_queries()
+    print(f"Corpus: {len(chunks)} chunks, {len(queries)} queries")
+
+    results = {}
+    for name in args.backends:
+        print(f"\n--- {name} ---")
+        result = run_backend(name, args.model, chunks, queries, args.top_k)
+        if result is None:
+            print(f"{name}: unavailable, skipped")
+            continue
+        results[name] = result
+
+    if not results:
+        print("\nNo backend available")
+        sys.exit(1)
+
+    reference = next(iter(results))
+    print("")
+    print("=" * 70)
+    print(f"{'backend':<24}{'load s':>10}{'chunks/s':>12}{'speedup':>10}{f'top-{args.top_k} overlap':>16}")
+    print("=" * 70)
+    for name, result in results.items():
+        overlaps = [
+            len(set(a) & set(b)) / args.top_k
+            for a, b in zip(results[reference]['rankings'], result['rankings'])
+        ]
+        speedup = result['throughput'] / results[reference]['throughput']
+        print(f"{name:<24}{result['load_seconds']:>10.2f}{result['throughput']:>12.1f}"
+              f"{speedup:>9.2f}x{sum(overlaps) / len(overlaps):>16.1%}")
+    print(f"\nReference backend: {reference}")
+
+
+if __name__ == "__main__":
+    main()
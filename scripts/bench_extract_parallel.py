@@ -0,0 +1,120 @@
+"""
+Marcus - ExtractBox parallelism benchmark
+Runs ExtractBox over --docs text documents on disk (extraction + chunking)
+with 1 document process (in-process, the old behaviour) and with
+--processes workers on the "documents" pool.
+
+Worker start-up (spawn) is paid once per pool and excluded by a warm-up run.
+
+Usage:
+    python scripts/bench_extract_parallel.py
+    python scripts/bench_extract_parallel.py --docs 60 --processes 4
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core import executors
+from marcus_app.core.models import Base, Class, Assignment, Artifact
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+
+BASE_PATH = Path(__file__).parent.parent
+WORK_DIR = BASE_PATH / "storage" / "bench_extract_parallel"
+
+
+def setup_db(db_path: Path, doc_dir: Path, doc_count: int, repeat: int):
+    """Fresh database with doc_count text artifacts built from vault/*.md."""
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    cls = Class(code="BENCH101", name="Bench Class")
+    db.add(cls)
+    db.commit()
+    assignment = Assignment(class_id=cls.id, title="Bench Assignment")
+    db.add(assignment)
+    db.commit()
+
+    sources = sorted((BASE_PATH / "vault").glob("*.md"))
+    texts = [p.read_text(encoding="utf-8", errors="ignore") for p in sources] or ["Torque is r x F.\n\n"]
+
+    artifact_ids = []
+    for i in range(doc_count):
+        path = doc_dir / f"doc_{i}.txt"
+        path.write_text("\n\n".join(texts[i % len(texts)] for _ in range(repeat)), encoding="utf-8")
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=path.name,
+            original_filename=path.name,
+            file_path=str(path),
+            file_type="text"
+        )
+        db.add(artifact)
+        db.flush()
+        artifact_ids.append(artifact.id)
+    db.commit()
+
+    mission = MissionService.create_from_template(db=db, template_name='exam_prep', mission_name="bench")
+    boxes = {b.box_type: b.id for b in mission.boxes}
+    BoxRunner.run_box(db, mission.id, boxes['inbox'], {'artifact_ids': artifact_ids})
+    return engine, db, mission.id, boxes['extract']
+
+
+def run_extract(label: str, processes: int, doc_dir: Path, args) -> float:
+    os.environ["MARCUS_DOCUMENT_PROCESSES"] = str(processes)
+    db_path = WORK_DIR / f"{label}.db"
+    engine, db, mission_id, extract_box_id = setup_db(db_path, doc_dir, args.docs, args.repeat)
+
+    start = time.perf_counter()
+    result = BoxRunner.run_box(db, mission_id, extract_box_id, {})
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<24} {elapsed * 1000:9.0f} ms   {result['artifacts'][0]['summary']}")
+    db.close()
+    engine.dispose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ExtractBox in-process vs process pool")
+    parser.add_argument("--docs", type=int, default=30, help="Documents in the mission")
+    parser.add_argument("--repeat", type=int, default=20, help="Vault notes concatenated per document")
+    parser.add_argument("--processes", type=int, default=executors.process_pool_size("documents"),
+                        help="Workers for the pooled run")
+    args = parser.parse_args()
+
+    if WORK_DIR.exists():
+        shutil.rmtree(WORK_DIR)
+    doc_dir = WORK_DIR / "docs"
+    doc_dir.mkdir(parents=True)
+
+    print("=" * 70)
+    print(f"ExtractBox over {args.docs} documents (CPUs: {os.cpu_count()})")
+    print("=" * 70)
+
+    try:
+        sequential = run_extract("in-process", 1, doc_dir, args)
+        if args.processes > 1:
+            run_extract("pool warm-up", args.processes, doc_dir, args)
+            pooled = run_extract(f"pool ({args.processes} processes)", args.processes, doc_dir, args)
+            print(f"\nSpeedup: {sequential / pooled:.2f}x")
+        else:
+            print("\nOnly one document process configured; pass --processes N to compare")
+    finally:
+        executors.shutdown_process_pools()
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
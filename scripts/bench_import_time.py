@@ -0,0 +1,100 @@
+"""
+Marcus - Cold start import-time benchmark
+Profiles `import marcus_app.backend.api` with `python -X importtime` in a
+fresh interpreter and checks it against a budget. Also verifies that the
+import does not resolve the storage mount, create the engine, or load the
+embedding model (those belong to first use / the startup hook).
+
+Usage:
+    python scripts/bench_import_time.py
+    python scripts/bench_import_time.py --budget-ms 1500 --top 15
+"""
+
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+
+PROBE = (
+    "import sys, marcus_app.backend.api\n"
+    "from marcus_app.core import database\n"
+    "print('ENGINE_CREATED', database._engine is not None)\n"
+    "print('MOUNT_RESOLVED', database._active_mount is not None)\n"
+    "print('MODEL_LOADED', 'sentence_transformers' in sys.modules)\n"
+)
+
+
+def run_probe(module: str = "marcus_app.backend.api"):
+    """Run one cold import; return (per-module timings, probe flags)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=str(BASE_PATH),
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:])
+        raise SystemExit(f"Import failed with exit code {proc.returncode}")
+
+    timings = []
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    flags = {}
+    for line in proc.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if key in ("ENGINE_CREATED", "MOUNT_RESOLVED", "MODEL_LOADED"):
+            flags[key] = value.strip() == "True"
+
+    return timings, flags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import profile for Marcus API")
+    parser.add_argument("--budget-ms", type=float, default=1500.0,
+                        help="Fail if cumulative import of marcus_app.backend.api exceeds this")
+    parser.add_argument("--top", type=int, default=10, help="Show N slowest modules (self time)")
+    parser.add_argument("--runs", type=int, default=3, help="Take the best of N cold imports")
+    args = parser.parse_args()
+
+    best_ms = None
+    best_timings = None
+    flags = {}
+    for _ in range(args.runs):
+        timings, flags = run_probe()
+        api_entry = next(t for t in timings if t[0] == "marcus_app.backend.api")
+        total_ms = api_entry[2] / 1000
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_timings = total_ms, timings
+
+    print("=" * 70)
+    print("Cold start: import marcus_app.backend.api")
+    print("=" * 70)
+    print(f"Cumulative import time (best of {args.runs}): {best_ms:.0f} ms  (budget {args.budget_ms:.0f} ms)")
+    print("")
+    print(f"Top {args.top} modules by self time:")
+    for name, self_us, cumulative_us in sorted(best_timings, key=lambda t: t[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+    print("")
+    for key, value in flags.items():
+        print(f"  {key}: {value}")
+
+    failures = []
+    if best_ms > args.budget_ms:
+        failures.append(f"import took {best_ms:.0f} ms > budget {args.budget_ms:.0f} ms")
+    failures.extend(f"{key} at import time" for key, value in flags.items() if value)
+
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nPASS")
+
+
+if __name__ == "__main__":
+    main()
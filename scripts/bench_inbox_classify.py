@@ -0,0 +1,209 @@
+"""
+Marcus - Inbox auto-classification benchmark
+Classifies a bulk drop of filenames against a seeded database
+(--classes classes with --assignments assignments each):
+
+- old:    pre-v0.53 _auto_classify (Class/Assignment .all() per file)
+- single: InboxService._auto_classify (one ClassificationIndex per file)
+- batch:  InboxService.classify_filenames (one ClassificationIndex per drop)
+
+Also checks that all three return the same suggestion for every file.
+
+Usage:
+    python scripts/bench_inbox_classify.py
+    python scripts/bench_inbox_classify.py --files 200 --classes 12 --assignments 60
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Assignment
+from marcus_app.services.inbox_service import InboxService
+
+SUBJECTS = ["ECE", "PHYS", "CYENG", "MATH", "CS", "CHEM", "BIO", "ENGL"]
+TITLES = ["HW {n}", "Lab {n} report", "Project {n}", "Quiz {n}", "Exam {n} review", "Reading {n}"]
+NAMES = [
+    "{code}_hw{n}.pdf", "{code} Lab {n}.docx", "{code}-project{n}_final.zip", "lab{n} notes.md",
+    "homework {n}.pdf", "midterm review.pdf", "scan_2026-02-{n:02d}.png", "syllabus.pdf",
+    "IMG_{n}{n}{n}.jpg", "{code}_quiz {n}.pdf", "assignment {n} {code}.txt",
+]
+
+
+def seed(db, class_count, assignments_per_class, rng):
+    start = datetime(2026, 1, 5, 9, 0)
+    codes = []
+    for i in range(class_count):
+        code = f"{SUBJECTS[i % len(SUBJECTS)]}{200 + i * 7}"
+        codes.append(code)
+        cls = Class(code=code, name=f"Course {i}", created_at=start + timedelta(days=i))
+        db.add(cls)
+        db.flush()
+        db.add_all([
+            Assignment(
+                class_id=cls.id,
+                title=rng.choice(TITLES).format(n=j % 12 + 1),
+                created_at=start + timedelta(days=i, hours=rng.randint(0, 2000))
+            )
+            for j in range(assignments_per_class)
+        ])
+    db.commit()
+    return codes
+
+
+def build_filenames(codes, count, rng):
+    return [
+        rng.choice(NAMES).format(code=rng.choice(codes + ["MATH999"]), n=rng.randint(1, 14))
+        for _ in range(count)
+    ]
+
+
+def legacy_auto_classify(filename, db):
+    """Pre-v0.53 InboxService._auto_classify + _match_assignment."""
+    classes = db.query(Class).all()
+    assignments = db.query(Assignment).all()
+
+    if not classes:
+        return {
+            'class_id': None,
+            'assignment_id': None,
+            'confidence': 'low',
+            'reasoning': 'No classes exist yet. Create a class first.'
+        }
+
+    filename_lower = filename.lower()
+    matches = re.findall(r'\b([A-Z]{2,5}\s?\d{3,4})\b', filename.upper())
+
+    for match in matches:
+        normalized_code = match.replace(' ', '')
+        for cls in classes:
+            if normalized_code in cls.code.replace(' ', '').upper():
+                assignment_match = legacy_match_assignment(filename, cls.id, assignments)
+                return {
+                    'class_id': cls.id,
+                    'assignment_id': assignment_match.get('assignment_id'),
+                    'confidence': 'high' if assignment_match.get('assignment_id') else 'medium',
+                    'reasoning': f"Detected class code '{normalized_code}' in filename. " + assignment_match.get('reasoning', '')
+                }
+
+    assignment_keywords = {
+        'lab': ['lab', 'laboratory', 'experiment'],
+        'homework': ['hw', 'homework', 'problem set', 'pset'],
+        'exam': ['exam', 'test', 'quiz', 'midterm', 'final'],
+        'project': ['project', 'proj'],
+        'lecture': ['lecture', 'notes', 'slides'],
+        'syllabus': ['syllabus', 'schedule']
+    }
+
+    detected_type = None
+    for keyword_type, keywords in assignment_keywords.items():
+        if any(kw in filename_lower for kw in keywords):
+            detected_type = keyword_type
+            break
+
+    if detected_type and not matches:
+        most_recent_class = max(classes, key=lambda c: c.created_at)
+        matching_assignments = [
+            a for a in assignments
+            if a.class_id == most_recent_class.id
+            and detected_type in a.title.lower()
+        ]
+        if matching_assignments:
+            return {
+                'class_id': most_recent_class.id,
+                'assignment_id': matching_assignments[0].id,
+                'confidence': 'medium',
+                'reasoning': f"Detected '{detected_type}' keyword. Matched to existing {detected_type} assignment in {most_recent_class.code}."
+            }
+        return {
+            'class_id': most_recent_class.id,
+            'assignment_id': None,
+            'confidence': 'low',
+            'reasoning': f"Detected '{detected_type}' keyword. Suggested class: {most_recent_class.code}. Consider creating a new assignment."
+        }
+
+    most_recent_class = max(classes, key=lambda c: c.created_at)
+    return {
+        'class_id': most_recent_class.id,
+        'assignment_id': None,
+        'confidence': 'low',
+        'reasoning': f"No strong pattern detected. Suggesting most recent class: {most_recent_class.code}."
+    }
+
+
+def legacy_match_assignment(filename, class_id, all_assignments):
+    filename_lower = filename.lower()
+    class_assignments = [a for a in all_assignments if a.class_id == class_id]
+    if not class_assignments:
+        return {
+            'assignment_id': None,
+            'reasoning': 'No assignments exist for this class yet.'
+        }
+
+    match = re.search(r'\b(hw|lab|assignment|project|quiz|exam)\s?(\d+)\b', filename_lower)
+    if match:
+        assignment_type = match.group(1)
+        assignment_num = match.group(2)
+        for assignment in class_assignments:
+            assignment_title_lower = assignment.title.lower()
+            if assignment_type in assignment_title_lower and assignment_num in assignment_title_lower:
+                return {
+                    'assignment_id': assignment.id,
+                    'reasoning': f"Matched to assignment '{assignment.title}' based on type and number."
+                }
+
+    most_recent = max(class_assignments, key=lambda a: a.created_at)
+    return {
+        'assignment_id': most_recent.id,
+        'reasoning': f"Suggested most recent assignment: '{most_recent.title}'."
+    }
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inbox bulk-drop classification latency")
+    parser.add_argument("--files", type=int, default=100, help="Files in the drop")
+    parser.add_argument("--classes", type=int, default=8, help="Classes to seed")
+    parser.add_argument("--assignments", type=int, default=40, help="Assignments per class")
+    args = parser.parse_args()
+
+    rng = random.Random(53)
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    codes = seed(db, args.classes, args.assignments, rng)
+    filenames = build_filenames(codes, args.files, rng)
+    service = InboxService(Path("storage") / "inbox")
+
+    old, old_ms = timed(lambda: [legacy_auto_classify(name, db) for name in filenames])
+    db.expire_all()
+    single, single_ms = timed(lambda: [service._auto_classify(name, 'unknown', b'', db) for name in filenames])
+    db.expire_all()
+    batch, batch_ms = timed(lambda: service.classify_filenames(filenames, db))
+
+    print("=" * 60)
+    print(f"Drop: {len(filenames)} files, {args.classes} classes x {args.assignments} assignments")
+    print("=" * 60)
+    print(f"old (.all() per file):   {old_ms:8.1f} ms")
+    print(f"index per file:          {single_ms:8.1f} ms ({old_ms / single_ms:.1f}x)")
+    print(f"one index per drop:      {batch_ms:8.1f} ms ({old_ms / batch_ms:.1f}x)")
+    print(f"Identical results: {old == single == batch}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Marcus - Agent intent detection benchmark
+Times detect_intent over a corpus of agent chat commands (the commands from
+the v0.47b agent smoke test plus --variants generated phrasings):
+
+- old:  re.search(pattern_string, text) for every pattern of every intent
+- new:  detect_intent (one precompiled regex pass, IntentMatcher)
+
+Also checks that both return the same (intent, confidence) for every
+command, and times classify_item on the same corpus.
+
+Usage:
+    python scripts/bench_intent_matcher.py
+    python scripts/bench_intent_matcher.py --variants 5000 --repeats 7
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marcus_app.services.agent_router import INTENT_PATTERNS, detect_intent
+from marcus_app.services.item_classifier import classify_item
+
+# Commands from tests/test_v047b_agent_smoke.md
+RECORDED_COMMANDS = [
+    "add task finish homework by Friday",
+    "add task PHYS214 lab report due tomorrow",
+    "add note learned about thermodynamics today",
+    "schedule meeting tomorrow at 2pm",
+    "show inbox",
+    "what's next?",
+    "what's due today?",
+    "what's due this week?",
+    "create mission exam prep for PHYS214",
+    "mission status",
+    "show blocked",
+    "clear inbox",
+    "do something random and unrecognized",
+    "maybe add task",
+    "add task PHYS214 homework due Friday",
+]
+
+PREFIXES = ["", "please ", "hey marcus, ", "can you ", "ok "]
+PHRASES = [
+    "add a task", "create task", "todo:", "task:", "need to", "have to", "must", "should",
+    "make a note", "note:", "learned", "reviewed", "remember that", "schedule a meeting",
+    "meeting at", "exam on", "quiz at", "deadline", "due by", "submit by", "file this into",
+    "attach it to", "move that to", "new mission", "start a mission", "run next step",
+    "continue mission", "what's blocking", "show missions", "what's in my inbox", "inbox items",
+    "process my inbox", "what should i do", "show me next tasks", "show due items", "what's blocked",
+]
+OBJECTS = [
+    "read chapter 4", "ECE347 problem set", "call mom", "the fourier lecture notes",
+    "PHYS214 lab report", "office hours with the TA", "buy groceries", "review eigenstates",
+]
+SUFFIXES = ["", " tomorrow", " on monday", " at 3pm", " by friday 17:00", " #urgent", " next week"]
+
+
+def build_corpus(variants: int, seed: int = 53):
+    rng = random.Random(seed)
+    corpus = list(RECORDED_COMMANDS)
+    for _ in range(variants):
+        phrases = rng.sample(PHRASES, rng.choice((1, 1, 2)))
+        corpus.append(
+            rng.choice(PREFIXES) + " ".join(phrases) + " " + rng.choice(OBJECTS) + rng.choice(SUFFIXES)
+        )
+    return corpus
+
+
+def old_detect_intent(text):
+    """Pre-v0.53 detect_intent: re.search per pattern string."""
+    text_lower = text.lower()
+    best_intent = None
+    best_confidence = 0.0
+    for intent_name, patterns in INTENT_PATTERNS.items():
+        matches = sum(1 for pattern in patterns if re.search(pattern, text_lower))
+        if matches > 0:
+            confidence = min(0.6 + (matches * 0.2), 1.0)
+            if confidence > best_confidence:
+                best_intent = intent_name
+                best_confidence = confidence
+    return best_intent, best_confidence
+
+
+def per_command_us(fn, corpus, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for command in corpus:
+            fn(command)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(corpus) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent intent detection latency")
+    parser.add_argument("--variants", type=int, default=2000, help="Generated commands added to the corpus")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats (best is reported)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.variants)
+    mismatches = [c for c in corpus if old_detect_intent(c) != detect_intent(c)]
+    recognized = sum(1 for c in corpus if detect_intent(c)[0])
+
+    old_us = per_command_us(old_detect_intent, corpus, args.repeats)
+    new_us = per_command_us(detect_intent, corpus, args.repeats)
+    classify_us = per_command_us(classify_item, corpus, args.repeats)
+
+    print("=" * 60)
+    print(f"Corpus: {len(corpus)} commands ({recognized} with an intent), "
+          f"{sum(len(p) for p in INTENT_PATTERNS.values())} patterns")
+    print("=" * 60)
+    print(f"detect_intent old: {old_us:8.2f} us/command")
+    print(f"detect_intent new: {new_us:8.2f} us/command ({old_us / new_us:.1f}x)")
+    print(f"classify_item:     {classify_us:8.2f} us/command")
+    print(f"Identical results: {not mismatches} ({len(mismatches)} mismatches)")
+    for command in mismatches[:5]:
+        print(f"  {command!r}: old={old_detect_intent(command)} new={detect_intent(command)}")
+
+
+if __name__ == "__main__":
+    main()
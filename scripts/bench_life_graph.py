@@ -0,0 +1,113 @@
+"""
+Marcus - Life-graph benchmark
+Seeds --classes classes, each with missions, boxes and mission artifacts,
+then measures:
+
+- build:    sync_life_graph() over every entity (the old generator stopped
+            at 20-50 rows per type and never updated afterwards)
+- writes:   --renames mission renames committed one by one, with and
+            without the incremental hooks installed
+- refresh:  what a client pulls after one change: the whole live graph
+            (previous behaviour) vs changes_since(version)
+- focus:    neighbourhood() of one class node, 2 hops
+
+Usage:
+    python scripts/bench_life_graph.py
+    python scripts/bench_life_graph.py --classes 200 --renames 500
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Mission, MissionBox, MissionArtifact, LifeGraphNode
+from marcus_app.core.life_graph import (
+    install_life_graph_hooks, sync_life_graph, current_version, changes_since, live_graph, neighbourhood
+)
+
+
+def seed(db, classes, missions_per_class=4, boxes_per_mission=5):
+    for c in range(classes):
+        cls = Class(code=f"26SPECE{c:05d}", name=f"Class {c}")
+        db.add(cls)
+        db.flush()
+        for m in range(missions_per_class):
+            mission = Mission(name=f"Mission {c}.{m}", mission_type="exam_prep", class_id=cls.id)
+            db.add(mission)
+            db.flush()
+            for b in range(boxes_per_mission):
+                box = MissionBox(mission_id=mission.id, box_type="ask", order_index=b)
+                db.add(box)
+                db.flush()
+                db.add(MissionArtifact(mission_id=mission.id, box_id=box.id, artifact_type="qa", title=f"Answer {b}"))
+    db.commit()
+
+
+def rename_ms(session_factory, renames):
+    db = session_factory()
+    ids = [m.id for m in db.query(Mission.id).limit(renames)]
+    start = time.perf_counter()
+    for i, mission_id in enumerate(ids):
+        db.get(Mission, mission_id).name = f"Renamed {i}"
+        db.commit()
+    elapsed = (time.perf_counter() - start) * 1000
+    db.close()
+    return elapsed / len(ids)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Life-graph build, write overhead and refresh cost")
+    parser.add_argument("--classes", type=int, default=100, help="Classes to seed (each with 4 missions x 5 boxes)")
+    parser.add_argument("--renames", type=int, default=200, help="Committed mission renames for the write timing")
+    args = parser.parse_args()
+
+    results = {}
+    for label, hooks in (("old", False), ("new", True)):
+        engine = create_engine("sqlite:///:memory:", echo=False)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+        if hooks:
+            install_life_graph_hooks(session_factory)
+        db = session_factory()
+        seed(db, args.classes)
+        stats, build_ms = timed(lambda: sync_life_graph(db))
+        db.close()
+        results[label] = (rename_ms(session_factory, args.renames), build_ms, engine, session_factory)
+
+    engine, session_factory = results["new"][2:]
+    db = session_factory()
+    nodes = db.query(LifeGraphNode).count()
+    version = current_version(db.connection())
+    mission = db.query(Mission).first()
+    mission.name = "One more change"
+    db.commit()
+    (full_nodes, full_edges), full_ms = timed(lambda: live_graph(db))
+    (delta_nodes, delta_edges), delta_ms = timed(lambda: changes_since(db, version))
+    focus = db.query(LifeGraphNode.id).filter_by(node_type="class").first()[0]
+    (focus_nodes, focus_edges), focus_ms = timed(lambda: neighbourhood(db, focus, hops=2))
+
+    print("=" * 60)
+    print(f"Life-graph: {nodes} nodes ({args.classes} classes), {args.renames} committed renames")
+    print("=" * 60)
+    print(f"build:   {results['new'][1]:.1f} ms for every entity")
+    print(f"writes:  old {results['old'][0]:.3f} ms/commit, new {results['new'][0]:.3f} ms/commit (hooks on)")
+    print(f"refresh: full {len(full_nodes)} nodes + {len(full_edges)} edges in {full_ms:.1f} ms; "
+          f"since_version {len(delta_nodes)} nodes + {len(delta_edges)} edges in {delta_ms:.2f} ms")
+    print(f"focus:   2-hop {len(focus_nodes)} nodes + {len(focus_edges)} edges in {focus_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
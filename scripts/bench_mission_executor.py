@@ -0,0 +1,148 @@
+"""
+Marcus - Mission executor benchmark
+Runs the exam_prep template end to end two ways on the same corpus:
+- manual: one BoxRunner.run_box call per box in order_index order, each in
+  a fresh session (what the frontend does, one request per step)
+- executor: MissionExecutor with dependency-aware parallelism
+
+Documents are the vault/*.md files (repeated to reach --docs), stored as
+already-extracted text so ExtractBox does chunking only.
+
+Usage:
+    python scripts/bench_mission_executor.py
+    python scripts/bench_mission_executor.py --docs 200 --workers 4
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Assignment, Artifact, ExtractedText, MissionBox
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+from marcus_app.services.mission_executor import MissionExecutor
+
+BASE_PATH = Path(__file__).parent.parent
+
+
+def setup_db(db_path: Path, doc_count: int):
+    """Fresh file-backed database with doc_count extracted artifacts."""
+    if db_path.exists():
+        db_path.unlink()
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        echo=False
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    cls = Class(code="BENCH101", name="Bench Class")
+    db.add(cls)
+    db.commit()
+    assignment = Assignment(class_id=cls.id, title="Bench Assignment")
+    db.add(assignment)
+    db.commit()
+
+    sources = sorted((BASE_PATH / "vault").glob("*.md"))
+    texts = [p.read_text(encoding="utf-8", errors="ignore") for p in sources] or ["Torque is r x F.\n"]
+
+    artifact_ids = []
+    for i in range(doc_count):
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=f"doc_{i}.md",
+            original_filename=f"doc_{i}.md",
+            file_path=f"/bench/doc_{i}.md",
+            file_type="md"
+        )
+        db.add(artifact)
+        db.flush()
+        db.add(ExtractedText(
+            artifact_id=artifact.id,
+            content=texts[i % len(texts)],
+            extraction_method="plain",
+            extraction_status="success"
+        ))
+        artifact_ids.append(artifact.id)
+    db.commit()
+    db.close()
+
+    return engine, SessionLocal, artifact_ids
+
+
+def new_mission(SessionLocal, name: str):
+    db = SessionLocal()
+    try:
+        mission = MissionService.create_from_template(db=db, template_name='exam_prep', mission_name=name)
+        boxes = [(b.id, b.box_type) for b in sorted(mission.boxes, key=lambda b: b.order_index)]
+        return mission.id, boxes
+    finally:
+        db.close()
+
+
+def bench_manual(SessionLocal, inputs):
+    mission_id, boxes = new_mission(SessionLocal, "manual")
+    start = time.perf_counter()
+    for box_id, box_type in boxes:
+        if box_type == 'checker':
+            continue  # Needs an answered practice item - skipped in both flows
+        db = SessionLocal()
+        try:
+            BoxRunner.run_box(db, mission_id, box_id, inputs.get(box_type, {}))
+        finally:
+            db.close()
+    return time.perf_counter() - start
+
+
+def bench_executor(SessionLocal, inputs, workers: int):
+    mission_id, _ = new_mission(SessionLocal, "executor")
+    start = time.perf_counter()
+    run = MissionExecutor(SessionLocal, max_workers=workers).run(mission_id, inputs=inputs)
+    elapsed = time.perf_counter() - start
+    if run['state'] != 'done':
+        raise SystemExit(f"Executor run failed: {run['error']}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manual box-by-box flow vs MissionExecutor")
+    parser.add_argument("--docs", type=int, default=100, help="Documents linked to each mission")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3, help="Take the best of N runs")
+    args = parser.parse_args()
+
+    db_path = BASE_PATH / "storage" / "bench_mission_executor.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    engine, SessionLocal, artifact_ids = setup_db(db_path, args.docs)
+
+    inputs = {
+        'inbox': {'artifact_ids': artifact_ids},
+        'ask': {'question': 'How is torque calculated?'},
+        'practice': {'question_count': 10}
+    }
+
+    manual = min(bench_manual(SessionLocal, inputs) for _ in range(args.runs))
+    executor = min(bench_executor(SessionLocal, inputs, args.workers) for _ in range(args.runs))
+
+    print("=" * 70)
+    print(f"exam_prep mission, {args.docs} documents, best of {args.runs}")
+    print("=" * 70)
+    print(f"Manual (sequential run_box):  {manual * 1000:8.1f} ms")
+    print(f"MissionExecutor ({args.workers} workers):  {executor * 1000:8.1f} ms")
+    print(f"Speedup: {manual / executor:.2f}x")
+
+    engine.dispose()
+    db_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
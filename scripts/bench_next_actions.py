@@ -0,0 +1,162 @@
+"""
+Marcus - "What's next" ranking benchmark
+Builds --items items (mixed statuses, due dates, pins) plus --missions
+missions and times get_next_actions:
+
+- old:  one query per reason, every candidate materialized, a box query
+        per blocked mission, then a Python sort (pre-v0.53 shape)
+- new:  NextActionService (one UNION ALL query, index-ordered branches,
+        only the top N rows materialized)
+
+Usage:
+    python scripts/bench_next_actions.py
+    python scripts/bench_next_actions.py --items 100000 --limit 3
+"""
+
+import sys
+import time
+import random
+import shutil
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text, or_
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Item, Mission, MissionBox
+from marcus_app.services.next_action_service import NextActionService, OPEN_STATUSES, REASONS
+from migrate_to_v053 import INDEXES
+
+BASE_PATH = Path(__file__).parent.parent
+WORK_DIR = BASE_PATH / "storage" / "bench_next_actions"
+
+
+def setup_db(db_path: Path, item_count: int, mission_count: int):
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    rng = random.Random(53)
+    now = datetime.utcnow()
+    rows = []
+    for i in range(item_count):
+        roll = rng.random()
+        due_at = None
+        if roll < 0.05:
+            due_at = now - timedelta(hours=rng.randint(1, 24 * 60))
+        elif roll < 0.10:
+            due_at = now + timedelta(hours=rng.randint(1, 47))
+        elif roll < 0.40:
+            due_at = now + timedelta(days=rng.randint(3, 120))
+        rows.append({
+            'item_type': rng.choice(('task', 'task', 'note', 'event')),
+            'title': f"Item {i}",
+            'status': rng.choice(('inbox', 'active', 'active', 'done', 'done', 'archived')),
+            'pinned': 1 if rng.random() < 0.02 else 0,
+            'due_at': due_at,
+            'created_at': now - timedelta(minutes=item_count - i),
+        })
+    db.bulk_insert_mappings(Item, rows)
+
+    for i in range(mission_count):
+        mission = Mission(name=f"Mission {i}", mission_type="exam_prep",
+                          state=rng.choice(('draft', 'active', 'blocked', 'done')))
+        db.add(mission)
+        db.flush()
+        for order in range(4):
+            db.add(MissionBox(mission_id=mission.id, box_type='ask', order_index=order,
+                              state=rng.choice(('idle', 'done', 'done'))))
+    db.commit()
+
+    with engine.begin() as conn:
+        for statement in INDEXES:
+            conn.execute(text(statement))
+        conn.execute(text("ANALYZE"))
+
+    return engine, db
+
+
+def old_next_actions(db, limit):
+    """Candidate lists per reason, materialized and sorted in Python."""
+    now = datetime.utcnow()
+    threshold = now + timedelta(hours=48)
+    open_items = db.query(Item).filter(Item.status.in_(OPEN_STATUSES))
+    not_due_soon = or_(Item.due_at.is_(None), Item.due_at > threshold)
+
+    candidates = []
+    for item in open_items.filter(Item.due_at < now).all():
+        candidates.append((1, item.due_at, item))
+    for item in open_items.filter(Item.due_at >= now, Item.due_at <= threshold).all():
+        candidates.append((2, item.due_at, item))
+    for item in db.query(Item).filter(Item.status == 'inbox', Item.pinned == 1, not_due_soon).all():
+        candidates.append((3, None, item))
+    for mission in db.query(Mission).filter(Mission.state == 'blocked').all():
+        boxes = db.query(MissionBox).filter(MissionBox.mission_id == mission.id).all()
+        if any(box.state != 'done' for box in boxes):
+            candidates.append((4, None, mission))
+    for item in db.query(Item).filter(Item.status == 'active', Item.item_type == 'task', not_due_soon).all():
+        candidates.append((5, None, item))
+
+    def key(candidate):
+        rank_order, due, obj = candidate
+        created = getattr(obj, 'created_at', None)
+        return (-REASONS[rank_order][1], due or datetime.max,
+                -(created.timestamp() if created and rank_order in (3, 5) else 0), obj.id)
+
+    return [(REASONS[c[0]][0], c[2].id) for c in sorted(candidates, key=key)[:limit]]
+
+
+def new_next_actions(db, limit):
+    return [(i['reason'], i['id']) for i in NextActionService(db).get_next_actions(limit=limit)['items']]
+
+
+def timed(fn, repeats):
+    best, result = None, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What's next ranking latency")
+    parser.add_argument("--items", type=int, default=100000, help="Items in the database")
+    parser.add_argument("--missions", type=int, default=500, help="Missions in the database")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats (best is reported)")
+    args = parser.parse_args()
+
+    if WORK_DIR.exists():
+        shutil.rmtree(WORK_DIR)
+    WORK_DIR.mkdir(parents=True)
+
+    try:
+        engine, db = setup_db(WORK_DIR / "bench.db", args.items, args.missions)
+
+        print("=" * 60)
+        print(f"What's next: {args.items} items, {args.missions} missions")
+        print("=" * 60)
+        print(f"{'limit':>6} {'old ms':>10} {'new ms':>10} {'speedup':>9}  same")
+
+        for limit in (3, 10, 50):
+            db.expire_all()
+            old_time, old_result = timed(lambda: old_next_actions(db, limit), args.repeats)
+            db.expire_all()
+            new_time, new_result = timed(lambda: new_next_actions(db, limit), args.repeats)
+            print(f"{limit:>6} {old_time * 1000:10.1f} {new_time * 1000:10.1f} "
+                  f"{old_time / new_time:8.1f}x  {old_result == new_result}")
+
+        db.close()
+        engine.dispose()
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Marcus - PracticeBox chunk selection benchmark
+Builds a large mission (--docs documents x --chunks chunks, plus as many
+chunks in documents outside the mission) and times chunk selection:
+
+- old:  TextChunk.content LIKE '%keywords%' ... LIMIT 50 (storage order)
+- new:  ChunkSelectionService (FTS5 bm25 scoped to mission artifacts + MMR)
+
+Also reports how many distinct sections and topics the picked chunks cover.
+
+Usage:
+    python scripts/bench_practice_selection.py
+    python scripts/bench_practice_selection.py --docs 40 --chunks 2500 --questions 10
+"""
+
+import sys
+import time
+import random
+import shutil
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Assignment, Artifact, ExtractedText, TextChunk
+from marcus_app.services.chunk_selection import ChunkSelectionService
+from migrate_to_v053 import sync_chunk_fts, INDEXES
+
+BASE_PATH = Path(__file__).parent.parent
+WORK_DIR = BASE_PATH / "storage" / "bench_practice_selection"
+
+TOPICS = [
+    "torque lever arm rotation", "momentum impulse collision", "entropy heat engine",
+    "electric field gauss flux", "wave interference phase", "orbital gravity kepler",
+    "friction normal force incline", "circuit resistor voltage", "photon photoelectric energy",
+    "fluid pressure buoyancy",
+]
+FILLER = "the of and a to in is for that with as on by this be are from at".split()
+
+
+def setup_db(db_path: Path, doc_count: int, chunk_count: int):
+    """Mission documents 0..doc_count-1; the same amount again outside the mission."""
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE VIRTUAL TABLE text_chunks_fts USING fts5(
+                content, section_title,
+                content='text_chunks', content_rowid='id',
+                tokenize='porter unicode61'
+            )
+        """))
+    db = sessionmaker(bind=engine)()
+
+    cls = Class(code="BENCH101", name="Bench Class")
+    db.add(cls)
+    db.commit()
+    assignment = Assignment(class_id=cls.id, title="Bench Assignment")
+    db.add(assignment)
+    db.commit()
+
+    rng = random.Random(53)
+    mission_artifact_ids = []
+    for doc in range(doc_count * 2):
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=f"doc_{doc}.md",
+            original_filename=f"doc_{doc}.md",
+            file_path=f"/bench/doc_{doc}.md",
+            file_type="md"
+        )
+        db.add(artifact)
+        db.flush()
+        extracted = ExtractedText(artifact_id=artifact.id, content="", extraction_method="bench")
+        db.add(extracted)
+        db.flush()
+        if doc < doc_count:
+            mission_artifact_ids.append(artifact.id)
+
+        rows = []
+        section_length = rng.choice((15, 25, 40))
+        for index in range(chunk_count):
+            section = index // section_length
+            topic = TOPICS[(doc + section) % len(TOPICS)]
+            words = topic.split() + [rng.choice(FILLER) for _ in range(60)]
+            rng.shuffle(words)
+            rows.append({
+                'extracted_text_id': extracted.id,
+                'chunk_index': index,
+                'content': ' '.join(words),
+                'artifact_id': artifact.id,
+                'section_title': f"{topic.split()[0].title()} {section}",
+                'word_count': len(words),
+            })
+        db.bulk_insert_mappings(TextChunk, rows)
+    db.commit()
+
+    with engine.begin() as conn:
+        for statement in INDEXES:
+            conn.execute(text(statement))
+        sync_chunk_fts(conn)
+
+    return engine, db, mission_artifact_ids
+
+
+def old_selection(db, artifact_ids, keywords, count):
+    query = db.query(TextChunk).filter(TextChunk.artifact_id.in_(artifact_ids))
+    if keywords:
+        query = query.filter(TextChunk.content.like(f'%{keywords}%'))
+    return query.limit(50).all()[:count]
+
+
+def new_selection(db, artifact_ids, keywords, count):
+    return ChunkSelectionService.select_for_practice(db, artifact_ids, count, keywords)
+
+
+def coverage(chunks, sections=False):
+    if sections:
+        return len({(c.artifact_id, c.section_title) for c in chunks})
+    return len({c.section_title.split()[0] for c in chunks})
+
+
+def timed(fn, repeats):
+    best, result = None, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PracticeBox chunk selection latency")
+    parser.add_argument("--docs", type=int, default=20, help="Documents in the mission")
+    parser.add_argument("--chunks", type=int, default=2500, help="Chunks per document")
+    parser.add_argument("--questions", type=int, default=10, help="question_count")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats (best is reported)")
+    args = parser.parse_args()
+
+    if WORK_DIR.exists():
+        shutil.rmtree(WORK_DIR)
+    WORK_DIR.mkdir(parents=True)
+
+    try:
+        engine, db, artifact_ids = setup_db(WORK_DIR / "bench.db", args.docs, args.chunks)
+        total = db.query(TextChunk).count()
+
+        print("=" * 70)
+        print(f"Mission: {args.docs} documents, {args.docs * args.chunks} chunks "
+              f"({total} chunks in database), {args.questions} questions")
+        print("=" * 70)
+        print(f"{'case':<26} {'old ms':>8} {'new ms':>8}   {'sections old/new':>16}   {'topics old/new':>14}")
+
+        for label, keywords in [("topic: 'gravity'", "gravity"),
+                                ("topic: 'photoelectric'", "photoelectric"),
+                                ("topic: 'no such topic'", "no such topic"),
+                                ("no topic", "")]:
+            old_time, old_chunks = timed(lambda: old_selection(db, artifact_ids, keywords, args.questions), args.repeats)
+            new_time, new_chunks = timed(lambda: new_selection(db, artifact_ids, keywords, args.questions), args.repeats)
+            print(f"{label:<26} {old_time * 1000:8.1f} {new_time * 1000:8.1f}   "
+                  f"{coverage(old_chunks, sections=True):>7} / {coverage(new_chunks, sections=True):<6}   "
+                  f"{coverage(old_chunks):>5} / {coverage(new_chunks):<6}")
+
+        db.close()
+        engine.dispose()
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Marcus - Route concurrency benchmark
+Measures latency of light requests (GET /api/missions/{id}) while a heavy
+ExtractBox run is in flight, for two handler models:
+
+- inline:  `async def` handler calling BoxRunner directly (the old model -
+           blocks the event loop for the whole box run)
+- pooled:  the real mission_routes run endpoint (sync handler on the
+           bounded extraction pool)
+
+Requests go through httpx's ASGI transport on one event loop, like uvicorn.
+
+Usage:
+    python scripts/bench_route_concurrency.py
+    python scripts/bench_route_concurrency.py --docs 400 --probes 50
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI, Depends
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, Session
+
+from marcus_app.core.database import get_db
+from marcus_app.core.models import Base, Class, Assignment, Artifact, ExtractedText
+from marcus_app.backend.mission_routes import router as mission_router, RunBoxRequest
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+
+BASE_PATH = Path(__file__).parent.parent
+
+
+def setup_db(db_path: Path, doc_count: int):
+    """File-backed database with doc_count extracted artifacts."""
+    if db_path.exists():
+        db_path.unlink()
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        echo=False
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    cls = Class(code="BENCH101", name="Bench Class")
+    db.add(cls)
+    db.commit()
+    assignment = Assignment(class_id=cls.id, title="Bench Assignment")
+    db.add(assignment)
+    db.commit()
+
+    sources = sorted((BASE_PATH / "vault").glob("*.md"))
+    texts = [p.read_text(encoding="utf-8", errors="ignore") for p in sources] or ["Torque is r x F.\n"]
+
+    artifact_ids = []
+    for i in range(doc_count):
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=f"doc_{i}.md",
+            original_filename=f"doc_{i}.md",
+            file_path=f"/bench/doc_{i}.md",
+            file_type="md"
+        )
+        db.add(artifact)
+        db.flush()
+        db.add(ExtractedText(artifact_id=artifact.id, content=texts[i % len(texts)], extraction_method="plain"))
+        artifact_ids.append(artifact.id)
+    db.commit()
+    db.close()
+
+    return engine, SessionLocal, artifact_ids
+
+
+def prepare_mission(SessionLocal, artifact_ids):
+    """exam_prep mission with documents linked; returns (mission_id, extract_box_id)."""
+    db = SessionLocal()
+    try:
+        mission = MissionService.create_from_template(db=db, template_name='exam_prep', mission_name="bench")
+        boxes = {b.box_type: b.id for b in mission.boxes}
+        BoxRunner.run_box(db, mission.id, boxes['inbox'], {'artifact_ids': artifact_ids})
+        return mission.id, boxes['extract']
+    finally:
+        db.close()
+
+
+def make_app(SessionLocal):
+    app = FastAPI()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.include_router(mission_router)
+
+    @app.post("/inline/{mission_id}/boxes/{box_id}/run")
+    async def inline_run_box(mission_id: int, box_id: int, request: RunBoxRequest, db: Session = Depends(get_db)):
+        return BoxRunner.run_box(db=db, mission_id=mission_id, box_id=box_id, input_payload=request.input_payload)
+
+    return app
+
+
+async def measure(app, heavy_path: str, light_path: str, probes: int, interval: float):
+    """
+    Light probes are scheduled on a fixed clock and their latency counted from
+    the scheduled start, so time spent waiting for a blocked event loop shows up.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        loop = asyncio.get_running_loop()
+
+        async def probe(slot: float):
+            await asyncio.sleep(max(0.0, slot - loop.time()))
+            await client.get(light_path)
+            return loop.time() - slot
+
+        async def probe_series():
+            start = loop.time()
+            return await asyncio.gather(*(probe(start + i * interval) for i in range(probes)))
+
+        idle = await probe_series()
+
+        heavy_start = time.perf_counter()
+        heavy = asyncio.create_task(client.post(heavy_path, json={"input_payload": {}}))
+        loaded = await probe_series()
+        response = await heavy
+        heavy_seconds = time.perf_counter() - heavy_start
+        if response.status_code != 200:
+            raise SystemExit(f"Heavy request failed: {response.status_code} {response.text[:200]}")
+
+    return idle, loaded, heavy_seconds
+
+
+def summarize(label: str, samples, heavy_seconds=None):
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    line = f"{label:<26} n={len(ms):<4} p50={statistics.median(ms):8.1f} ms  p95={p95:8.1f} ms  max={ms[-1]:8.1f} ms"
+    if heavy_seconds is not None:
+        line += f"  (heavy {heavy_seconds * 1000:.0f} ms)"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Light-request latency while a heavy box runs")
+    parser.add_argument("--docs", type=int, default=300, help="Documents for the ExtractBox run")
+    parser.add_argument("--probes", type=int, default=30, help="Light requests per phase")
+    parser.add_argument("--interval-ms", type=float, default=20.0, help="Spacing between light requests")
+    args = parser.parse_args()
+
+    db_path = BASE_PATH / "storage" / "bench_route_concurrency.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    engine, SessionLocal, artifact_ids = setup_db(db_path, args.docs)
+    app = make_app(SessionLocal)
+
+    print("=" * 90)
+    print(f"Light GET /api/missions/{{id}} while ExtractBox chunks {args.docs} documents")
+    print("=" * 90)
+
+    for label, prefix in (("inline async handler", "/inline"), ("pooled sync handler", "/api/missions")):
+        mission_id, extract_box_id = prepare_mission(SessionLocal, artifact_ids)
+        idle, loaded, heavy_seconds = asyncio.run(measure(
+            app,
+            heavy_path=f"{prefix}/{mission_id}/boxes/{extract_box_id}/run",
+            light_path=f"/api/missions/{mission_id}",
+            probes=args.probes,
+            interval=args.interval_ms / 1000
+        ))
+        print(summarize(f"{label} - idle", idle))
+        print(summarize(f"{label} - under load", loaded, heavy_seconds))
+
+    engine.dispose()
+    db_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Marcus - Session validation benchmark
+Measures AuthService.validate_session throughput, the check every API call
+and every /static asset request runs:
+
+- old:  dict of dicts, two datetime.utcnow() calls and an activity write
+        per validation, expired sessions only dropped when validated again
+- new:  SessionStore (one monotonic read, coalesced activity writes)
+
+Also times sweeping --sessions idle sessions out of the store.
+
+Usage:
+    python scripts/bench_session_validation.py
+    python scripts/bench_session_validation.py --validations 1000000 --sessions 50000
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marcus_app.services.auth_service import AuthService
+
+
+class LegacySessions:
+    """Pre-v0.53 AuthService session handling."""
+
+    def __init__(self):
+        self.sessions = {}
+        self.session_timeout = timedelta(minutes=15)
+
+    def create_session(self, token, user_id="default"):
+        self.sessions[token] = {
+            "user_id": user_id,
+            "created_at": datetime.utcnow(),
+            "last_activity": datetime.utcnow()
+        }
+
+    def validate_session(self, token):
+        if token not in self.sessions:
+            return False
+        session = self.sessions[token]
+        elapsed = datetime.utcnow() - session["last_activity"]
+        if elapsed > self.session_timeout:
+            del self.sessions[token]
+            return False
+        session["last_activity"] = datetime.utcnow()
+        return True
+
+
+def validations_per_second(validate, tokens, count):
+    start = time.perf_counter()
+    for i in range(count):
+        validate(tokens[i % len(tokens)])
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Session validation throughput")
+    parser.add_argument("--validations", type=int, default=300000, help="validate_session calls")
+    parser.add_argument("--sessions", type=int, default=10000, help="Sessions for the sweep timing")
+    args = parser.parse_args()
+
+    legacy = LegacySessions()
+    legacy.create_session("token")
+    service = AuthService()
+    token = service.create_session()
+    # Mostly valid cookies, some stale ones (e.g. after a restart)
+    legacy_tokens = ["token"] * 9 + ["unknown"]
+    tokens = [token] * 9 + ["unknown"]
+
+    old_rate = validations_per_second(legacy.validate_session, legacy_tokens, args.validations)
+    new_rate = validations_per_second(service.validate_session, tokens, args.validations)
+
+    now = [0.0]
+    swept = AuthService(clock=lambda: now[0])
+    rng = random.Random(53)
+    for i in range(args.sessions):
+        now[0] = rng.random() * 60
+        swept.create_session()
+    now[0] = swept.session_timeout.total_seconds() + 30
+    start = time.perf_counter()
+    removed = swept.sweep_expired_sessions()
+    sweep_ms = (time.perf_counter() - start) * 1000
+
+    print("=" * 60)
+    print(f"validate_session, {args.validations} calls (10% unknown tokens)")
+    print("=" * 60)
+    print(f"old: {old_rate:12,.0f} validations/s")
+    print(f"new: {new_rate:12,.0f} validations/s ({new_rate / old_rate:.1f}x)")
+    print(f"sweep: {removed} of {args.sessions} idle sessions removed in {sweep_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
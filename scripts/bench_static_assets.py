@@ -0,0 +1,184 @@
+"""
+Marcus - Frontend page-load benchmark
+Loads the main page (/ plus every /static asset it references) through
+two app setups with a simple browser cache model:
+
+- old:  StaticFiles behind a Request-building auth check, index.html as a
+        FileResponse; no Cache-Control, so the browser revalidates every
+        asset on each navigation (If-None-Match / If-Modified-Since)
+- new:  static_assets.AuthStaticFiles (content-versioned URLs cached as
+        immutable, precompressed variants, strong ETags, 304s)
+
+Reports requests and bytes on the wire for a first visit and for repeat
+navigations, and the per-request cost of an authenticated repeat asset hit
+at the ASGI level (auth check included).
+
+Usage:
+    python scripts/bench_static_assets.py
+    python scripts/bench_static_assets.py --navigations 20 --hits 20000
+"""
+
+import re
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+
+from marcus_app.backend.static_assets import AuthStaticFiles, asset_response
+from marcus_app.services.auth_service import AuthService
+
+FRONTEND_PATH = Path(__file__).parent.parent / "marcus_app" / "frontend"
+STATIC_URL = re.compile(r'(?:src|href)=["\'](/static/[^"\']+)["\']')
+
+
+def legacy_app(auth_service):
+    """Pre-v0.53 frontend serving."""
+    app = FastAPI()
+
+    class LegacyAuthStaticFiles(StaticFiles):
+        async def __call__(self, scope, receive, send):
+            request = Request(scope, receive=receive)
+            if request.url.path.endswith("login.html"):
+                return await super().__call__(scope, receive, send)
+            session_token = request.cookies.get("marcus_session")
+            if not session_token or not auth_service.validate_session(session_token):
+                response = RedirectResponse(url="/login")
+                await response(scope, receive, send)
+                return
+            return await super().__call__(scope, receive, send)
+
+    @app.get("/")
+    async def serve_frontend():
+        return FileResponse(FRONTEND_PATH / "index.html")
+
+    static = LegacyAuthStaticFiles(directory=str(FRONTEND_PATH))
+    app.mount("/static", static, name="static")
+    return app, static
+
+
+def new_app(auth_service):
+    app = FastAPI()
+    static = AuthStaticFiles(directory=str(FRONTEND_PATH), validate_session=auth_service.validate_session)
+
+    @app.get("/")
+    async def serve_frontend(request: Request):
+        return asset_response(static.manifest.get("index.html"), request.headers)
+
+    app.mount("/static", static, name="static")
+    return app, static
+
+
+class Browser:
+    """Private HTTP cache: fresh immutable entries skip the network, others revalidate."""
+
+    def __init__(self, client):
+        self.client = client
+        self.cache = {}
+        self.requests = 0
+        self.bytes = 0
+
+    def fetch(self, url):
+        cached = self.cache.get(url)
+        if cached and "immutable" in cached["cache_control"]:
+            return cached["text"]
+
+        headers = {"Accept-Encoding": "gzip, deflate, br"}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+        response = self.client.get(url, headers=headers)
+        self.requests += 1
+        self.bytes += int(response.headers.get("content-length", 0))
+        if response.status_code == 304:
+            return cached["text"]
+
+        self.cache[url] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "cache_control": response.headers.get("cache-control", ""),
+            "text": response.text,
+        }
+        return response.text
+
+    def navigate(self):
+        html = self.fetch("/")
+        for url in STATIC_URL.findall(html):
+            self.fetch(url)
+
+    def snapshot(self):
+        requests, transferred = self.requests, self.bytes
+        self.requests = self.bytes = 0
+        return requests, transferred
+
+
+def asgi_us(app, path, token, hits):
+    """Per-request time of an authenticated GET straight through the ASGI app."""
+    scope_template = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [
+            (b"host", b"127.0.0.1:8000"),
+            (b"accept-encoding", b"gzip, deflate, br"),
+            (b"cookie", f"theme=dark; marcus_session={token}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def run():
+        for _ in range(hits):
+            await app(dict(scope_template), receive, send)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return (time.perf_counter() - start) / hits * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frontend page-load requests and bytes")
+    parser.add_argument("--navigations", type=int, default=10, help="Repeat navigations after the first visit")
+    parser.add_argument("--hits", type=int, default=5000, help="Repeat asset requests for the latency timing")
+    args = parser.parse_args()
+
+    results = {}
+    for label, factory in (("old", legacy_app), ("new", new_app)):
+        auth_service = AuthService()
+        token = auth_service.create_session()
+        app, static = factory(auth_service)
+        client = TestClient(app, cookies={"marcus_session": token})
+
+        browser = Browser(client)
+        browser.navigate()
+        first = browser.snapshot()
+        for _ in range(args.navigations):
+            browser.navigate()
+        repeat = browser.snapshot()
+        results[label] = (first, repeat, asgi_us(static, "/app.js", token, args.hits))
+
+    print("=" * 60)
+    print(f"Main page: / + {len(STATIC_URL.findall((FRONTEND_PATH / 'index.html').read_text()))} static assets, "
+          f"{args.navigations} repeat navigations")
+    print("=" * 60)
+    for label, ((first_requests, first_bytes), (requests, transferred), hit_us) in results.items():
+        print(f"{label}: first visit {first_requests} requests / {first_bytes:,} bytes; "
+              f"repeat {requests / args.navigations:.1f} requests / {transferred / args.navigations:,.0f} bytes "
+              f"per navigation; asset hit {hit_us:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
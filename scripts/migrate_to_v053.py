@@ -0,0 +1,212 @@
+"""
+Database migration for v0.53 - Performance work.
+
+- Creates new tables (mission_runs, box_runs, mission_citations) via create_all
+- Adds indexes used by mission listing/detail count queries and keyset
+  pagination (names match SQLAlchemy's index=True naming, so fresh
+  databases created by init_db get the same indexes)
+- Adds the box run lease columns (mission_boxes.lease_owner,
+  lease_expires_at); init_db() does the same on startup
+- Backfills mission_citations from existing QA artifacts
+  (source_refs_json) and practice sessions (practice item citations)
+- Fills dashboard_counters (inbox/mission dashboard counts) from items
+  and missions
+- Creates undo_events if v0.48 never ran, indexes it for the undo
+  recovery read and the expired-row sweeper, and deletes expired rows
+- Adds life-graph version/deleted columns and indexes, and brings graphs
+  generated by earlier versions (capped at 20-50 rows per type, no
+  versions) up to date so incremental maintenance can take over
+- Keeps text_chunks_fts (created by v0.37) in sync with text_chunks via
+  triggers and rebuilds it once, so chunks added since v0.37 are indexed
+
+Idempotent: safe to run repeatedly.
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_missions_created_at ON missions(created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_mission_boxes_mission_id ON mission_boxes(mission_id)",
+    "CREATE INDEX IF NOT EXISTS ix_mission_artifacts_mission_id ON mission_artifacts(mission_id)",
+    "CREATE INDEX IF NOT EXISTS ix_practice_sessions_mission_id ON practice_sessions(mission_id)",
+    "CREATE INDEX IF NOT EXISTS ix_practice_items_session_id ON practice_items(session_id)",
+    "CREATE INDEX IF NOT EXISTS ix_text_chunks_artifact_id ON text_chunks(artifact_id)",
+    "CREATE INDEX IF NOT EXISTS ix_missions_state ON missions(state)",
+    "CREATE INDEX IF NOT EXISTS ix_items_status_due_at ON items(status, due_at)",
+    "CREATE INDEX IF NOT EXISTS ix_items_status_pinned_created_at ON items(status, pinned, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_items_status_type_created_at ON items(status, item_type, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_items_status_created_at ON items(status, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_undo_events_is_consumed_created_at ON undo_events(is_consumed, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_undo_events_expires_at ON undo_events(expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_life_graph_nodes_type_entity ON life_graph_nodes(node_type, entity_id)",
+    "CREATE INDEX IF NOT EXISTS ix_life_graph_nodes_version ON life_graph_nodes(version)",
+    "CREATE INDEX IF NOT EXISTS ix_life_graph_edges_source_node_id ON life_graph_edges(source_node_id)",
+    "CREATE INDEX IF NOT EXISTS ix_life_graph_edges_target_node_id ON life_graph_edges(target_node_id)",
+    "CREATE INDEX IF NOT EXISTS ix_life_graph_edges_version ON life_graph_edges(version)",
+]
+
+# External-content FTS5 table: mirror text_chunks writes into the index
+FTS_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS text_chunks_fts_ai AFTER INSERT ON text_chunks BEGIN
+        INSERT INTO text_chunks_fts(rowid, content, section_title)
+        VALUES (new.id, new.content, new.section_title);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS text_chunks_fts_ad AFTER DELETE ON text_chunks BEGIN
+        INSERT INTO text_chunks_fts(text_chunks_fts, rowid, content, section_title)
+        VALUES ('delete', old.id, old.content, old.section_title);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS text_chunks_fts_au AFTER UPDATE ON text_chunks BEGIN
+        INSERT INTO text_chunks_fts(text_chunks_fts, rowid, content, section_title)
+        VALUES ('delete', old.id, old.content, old.section_title);
+        INSERT INTO text_chunks_fts(rowid, content, section_title)
+        VALUES (new.id, new.content, new.section_title);
+    END""",
+]
+
+
+def sync_chunk_fts(conn) -> bool:
+    """Install FTS sync triggers and rebuild the index; False if there is no FTS table."""
+    exists = conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='text_chunks_fts'"
+    )).fetchone()
+    if not exists:
+        return False
+
+    for statement in FTS_TRIGGERS:
+        conn.execute(text(statement))
+    conn.execute(text("INSERT INTO text_chunks_fts(text_chunks_fts) VALUES('rebuild')"))
+    return True
+
+
+def backfill_mission_citations(engine, batch_size: int = 500) -> int:
+    """Index citations of artifacts created before mission_citations existed."""
+    import json
+    from sqlalchemy.orm import Session
+    from marcus_app.core.models import MissionArtifact, MissionCitation, PracticeItem
+    from marcus_app.services.box_runner import BoxRunner
+
+    written = 0
+    with Session(engine) as db:
+        indexed = db.query(MissionCitation.mission_artifact_id)
+        pending = [row.id for row in db.query(MissionArtifact.id).filter(
+            ~MissionArtifact.id.in_(indexed),
+            (MissionArtifact.artifact_type == 'practice_session')
+            | MissionArtifact.source_refs_json.like('%"citations"%')
+        ).order_by(MissionArtifact.id)]
+
+        for start in range(0, len(pending), batch_size):
+            artifacts = db.query(MissionArtifact).filter(
+                MissionArtifact.id.in_(pending[start:start + batch_size])
+            ).order_by(MissionArtifact.id).all()
+
+            for artifact in artifacts:
+                try:
+                    refs = json.loads(artifact.source_refs_json or '{}')
+                except ValueError:
+                    continue
+                if not isinstance(refs, dict):
+                    continue
+
+                if artifact.artifact_type == 'practice_session':
+                    citations = []
+                    items = db.query(PracticeItem.citations_json).filter(
+                        PracticeItem.session_id == refs.get('session_id')
+                    ).order_by(PracticeItem.id)
+                    for item in items:
+                        citations.extend(json.loads(item.citations_json or '[]'))
+                else:
+                    citations = refs.get('citations')
+
+                if isinstance(citations, list):
+                    written += BoxRunner.record_citations(db, artifact.mission_id, artifact.id, citations)
+            db.commit()
+
+    return written
+
+
+def rebuild_dashboard_counters(engine) -> int:
+    """Recount dashboard_counters from items/missions; returns counters changed."""
+    from sqlalchemy.orm import sessionmaker
+    from marcus_app.core.counters import reconcile_counters
+
+    db = sessionmaker(bind=engine)()
+    try:
+        return len(reconcile_counters(db))
+    finally:
+        db.close()
+
+
+def sync_existing_life_graph(engine) -> Optional[dict]:
+    """Reconcile a previously generated life-graph; None if there is none yet."""
+    from sqlalchemy.orm import sessionmaker
+    from marcus_app.core.life_graph import current_version, sync_life_graph
+    from marcus_app.core.models import LifeGraphNode
+
+    db = sessionmaker(bind=engine)()
+    try:
+        if current_version(db.connection()) is None and not db.query(LifeGraphNode.id).first():
+            return None  # Built on first GET /api/life-graph
+        return sync_life_graph(db)
+    finally:
+        db.close()
+
+
+def run_v053_migration(engine=None):
+    """Run v0.53 migration against engine (default: the app database)."""
+    from marcus_app.core.database import get_engine, add_missing_columns
+    from marcus_app.core.models import Base
+
+    engine = engine or get_engine()
+
+    print("[v0.53 Migration] Creating new tables...")
+    Base.metadata.create_all(engine)
+
+    print("[v0.53 Migration] Adding columns...")
+    for column in add_missing_columns(engine):
+        print(f"  + {column}")
+
+    print("[v0.53 Migration] Creating indexes...")
+    with engine.begin() as conn:
+        for statement in INDEXES:
+            conn.execute(text(statement))
+
+    print("[v0.53 Migration] Backfilling mission citations...")
+    print(f"  + {backfill_mission_citations(engine)} citations indexed")
+
+    print("[v0.53 Migration] Rebuilding dashboard counters...")
+    print(f"  + {rebuild_dashboard_counters(engine)} counters corrected")
+
+    print("[v0.53 Migration] Pruning expired undo events...")
+    with engine.begin() as conn:
+        pruned = conn.execute(
+            text("DELETE FROM undo_events WHERE expires_at < :now"), {"now": datetime.utcnow().isoformat(sep=" ")}
+        ).rowcount
+    print(f"  + {pruned} expired undo events deleted")
+
+    print("[v0.53 Migration] Syncing life-graph...")
+    synced = sync_existing_life_graph(engine)
+    if synced is None:
+        print("  [SKIP] life-graph not generated yet")
+    else:
+        print(f"  + version {synced['version']}: {synced['upserted']} nodes upserted, "
+              f"{synced['relinked']} relinked, {synced['deleted']} removed")
+
+    print("[v0.53 Migration] Syncing chunk search index...")
+    if engine.dialect.name == 'sqlite':
+        with engine.begin() as conn:
+            if not sync_chunk_fts(conn):
+                print("  [SKIP] text_chunks_fts not found (run migrate_to_v037 first)")
+
+    print("[v0.53 Migration] ✓ Done")
+
+
+if __name__ == "__main__":
+    run_v053_migration()
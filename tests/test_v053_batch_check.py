@@ -0,0 +1,205 @@
+"""
+Tests for v0.53: Batch answer checking for practice sessions
+
+Tests:
+- Batch grading leaves items and score exactly as sequential single checks
+- Batch run commits the same number of times for 3 or 20 answers and
+  creates one verification artifact
+- POST /api/missions/practice/{session_id}/check: answered items by
+  default, explicit answers, 404/400 validation
+"""
+
+import sys
+import json
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from marcus_app.core.database import get_db
+from marcus_app.core.models import (
+    Base, MissionArtifact, PracticeSession, PracticeItem
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner, BoxRunnerError
+
+
+def setup_test_db(item_count=4):
+    """Shared in-memory database with a mission and one practice session."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Batch")
+    boxes = {box.box_type: box.id for box in mission.boxes}
+
+    session = PracticeSession(
+        mission_id=mission.id,
+        state='active',
+        score_json=json.dumps({'attempted': 0, 'correct': 0, 'incorrect': 0})
+    )
+    db.add(session)
+    db.flush()
+    item_ids = []
+    for i in range(item_count):
+        item = PracticeItem(
+            session_id=session.id,
+            prompt_md=f"Q{i + 1}: Explain torque.",
+            state='unanswered',
+            citations_json=json.dumps([{'chunk_id': 100 + i, 'artifact_id': 1, 'page': i}])
+        )
+        db.add(item)
+        db.flush()
+        item_ids.append(item.id)
+    db.commit()
+
+    return engine, SessionLocal, db, mission.id, boxes, session.id, item_ids
+
+
+def answers_for(item_ids):
+    """Alternating substantive / too-short answers."""
+    return [
+        {'item_id': item_id, 'user_answer': "Torque is the rotational analogue of force." if i % 2 == 0 else "r x F"}
+        for i, item_id in enumerate(item_ids)
+    ]
+
+
+def snapshot(db, session_id):
+    db.expire_all()
+    items = db.query(PracticeItem).filter(PracticeItem.session_id == session_id).order_by(PracticeItem.id)
+    state = [
+        (item.user_answer, item.state, {k: v for k, v in json.loads(item.checks_json).items() if k != 'timestamp'})
+        for item in items
+    ]
+    score = json.loads(db.query(PracticeSession).get(session_id).score_json)
+    return state, score
+
+
+def item_states(db, session_id):
+    db.expire_all()
+    items = db.query(PracticeItem).filter(PracticeItem.session_id == session_id).order_by(PracticeItem.id)
+    return [item.state for item in items], json.loads(db.query(PracticeSession).get(session_id).score_json)
+
+
+def test_batch_matches_sequential_checks():
+    """Same item states, checks and score as one CheckerBox run per answer."""
+    results = {}
+    for mode in ('sequential', 'batch'):
+        engine, SessionLocal, db, mission_id, boxes, session_id, item_ids = setup_test_db()
+        answers = answers_for(item_ids)
+        if mode == 'sequential':
+            for answer in answers:
+                BoxRunner.run_box(db, mission_id, boxes['checker'], dict(answer, session_id=session_id))
+        else:
+            result = BoxRunner.run_box(db, mission_id, boxes['checker'], {'session_id': session_id, 'answers': answers})
+            verification = result['artifacts'][0]
+            assert verification['results'] == [
+                {'item_id': item_ids[0], 'result': 'correct'}, {'item_id': item_ids[1], 'result': 'incorrect'},
+                {'item_id': item_ids[2], 'result': 'correct'}, {'item_id': item_ids[3], 'result': 'incorrect'},
+            ]
+            assert verification['score'] == {'attempted': 4, 'correct': 2, 'incorrect': 2}
+            assert verification['title'] == 'Check Results: 2/4 acceptable'
+            assert "Chunk 103 (Page 3)" in verification['verification_md']
+
+        verifications = db.query(MissionArtifact).filter(MissionArtifact.artifact_type == 'verification').count()
+        results[mode] = (snapshot(db, session_id), verifications)
+
+    assert results['batch'][0] == results['sequential'][0]
+    assert results['sequential'][1] == 4
+    assert results['batch'][1] == 1
+
+    print("[PASS] test_batch_matches_sequential_checks")
+
+
+def test_batch_commit_count_is_constant():
+    """Commits per batch run do not grow with the number of answers."""
+    commits = {}
+    for count in (3, 20):
+        engine, SessionLocal, db, mission_id, boxes, session_id, item_ids = setup_test_db(item_count=count)
+        seen = []
+        event.listen(engine, "commit", lambda conn: seen.append(1))
+        BoxRunner.run_box(db, mission_id, boxes['checker'], {'session_id': session_id, 'answers': answers_for(item_ids)})
+        commits[count] = len(seen)
+
+    assert commits[3] == commits[20]
+
+    print("[PASS] test_batch_commit_count_is_constant")
+
+
+def test_batch_rejects_foreign_items():
+    """Items outside the session fail the whole batch; nothing is graded."""
+    engine, SessionLocal, db, mission_id, boxes, session_id, item_ids = setup_test_db()
+    try:
+        BoxRunner.run_box(db, mission_id, boxes['checker'], {
+            'session_id': session_id,
+            'answers': answers_for(item_ids[:2]) + [{'item_id': 999, 'user_answer': 'x'}]
+        })
+        assert False, "Should have raised error"
+    except BoxRunnerError as e:
+        assert "999" in str(e)
+
+    state, score = item_states(db, session_id)
+    assert state == ['unanswered'] * 4
+    assert score['attempted'] == 0
+
+    print("[PASS] test_batch_rejects_foreign_items")
+
+
+def test_check_answers_endpoint():
+    """Default: answered items; explicit answers override; validation errors."""
+    from marcus_app.backend.mission_routes import router
+
+    engine, SessionLocal, db, mission_id, boxes, session_id, item_ids = setup_test_db()
+    app = FastAPI()
+
+    def override_get_db():
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert client.post("/api/missions/practice/999/check").status_code == 404
+    assert client.post(f"/api/missions/practice/{session_id}/check").status_code == 400
+
+    for item_id in item_ids[:2]:
+        response = client.post(
+            f"/api/missions/practice/{session_id}/items/{item_id}/answer",
+            json={'user_answer': "Torque equals r cross F for a point force."}
+        )
+        assert response.status_code == 200
+
+    response = client.post(f"/api/missions/practice/{session_id}/check")
+    assert response.status_code == 200
+    assert [r['item_id'] for r in response.json()['artifacts'][0]['results']] == item_ids[:2]
+
+    response = client.post(f"/api/missions/practice/{session_id}/check", json={'answers': [
+        {'item_id': item_ids[2], 'user_answer': "short"},
+        {'item_id': item_ids[0]},
+    ]})
+    assert response.status_code == 200
+    assert response.json()['artifacts'][0]['results'] == [
+        {'item_id': item_ids[2], 'result': 'incorrect'}, {'item_id': item_ids[0], 'result': 'correct'}
+    ]
+    assert response.json()['artifacts'][0]['score'] == {'attempted': 4, 'correct': 3, 'incorrect': 1}
+
+    response = client.post(f"/api/missions/practice/{session_id}/check", json={'answers': [{'item_id': item_ids[3]}]})
+    assert response.status_code == 400
+    response = client.post(f"/api/missions/practice/{session_id}/check", json={'answers': [{'item_id': 999}]})
+    assert response.status_code == 404
+
+    print("[PASS] test_check_answers_endpoint")
@@ -0,0 +1,195 @@
+"""
+Tests for v0.53: Streaming box progress (Server-Sent Events)
+
+Tests:
+- BoxEventBus fan-out, unsubscribe, and isolation from broken listeners
+- ExtractBox publishes started -> per-document progress -> done(artifacts)
+- Failing box publishes an error event
+- GET /api/missions/{id}/events streams a box run and closes after done
+"""
+
+import sys
+import json
+import time
+import asyncio
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from marcus_app.core.models import Base, Class, Assignment, Artifact, ExtractedText
+from marcus_app.services.box_events import BoxEventBus, get_box_event_bus
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner, BoxRunnerError
+
+
+def setup_test_db(doc_count=3):
+    """Shared in-memory database (usable from worker threads) with extracted documents."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    test_class = Class(code="PHYS214", name="Quantum Mechanics")
+    db.add(test_class)
+    db.commit()
+    assignment = Assignment(class_id=test_class.id, title="Midterm Prep")
+    db.add(assignment)
+    db.commit()
+
+    artifact_ids = []
+    for i in range(doc_count):
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=f"notes_{i}.md",
+            original_filename=f"notes_{i}.md",
+            file_path=f"/fake/notes_{i}.md",
+            file_type="md"
+        )
+        db.add(artifact)
+        db.flush()
+        db.add(ExtractedText(
+            artifact_id=artifact.id,
+            content=f"# Topic {i}\n\nThe Schrodinger equation is H*psi = E*psi.\n",
+            extraction_method="test",
+            extraction_status="success"
+        ))
+        artifact_ids.append(artifact.id)
+    db.commit()
+
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Events")
+    boxes = {box.box_type: box.id for box in mission.boxes}
+    BoxRunner.run_box(db, mission.id, boxes['inbox'], {'artifact_ids': artifact_ids})
+
+    return SessionLocal, db, mission.id, boxes
+
+
+def test_event_bus_fanout():
+    """Subscribers of a mission get its events; unsubscribe and errors are isolated."""
+    bus = BoxEventBus()
+    received_a, received_b, other = [], [], []
+
+    def broken(event):
+        raise RuntimeError("listener bug")
+
+    token_a = bus.subscribe(1, received_a.append)
+    bus.subscribe(1, received_b.append)
+    bus.subscribe(1, broken)
+    bus.subscribe(2, other.append)
+
+    bus.publish(1, {'event': 'started'})
+    bus.unsubscribe(1, token_a)
+    bus.publish(1, {'event': 'done'})
+
+    assert [e['event'] for e in received_a] == ['started']
+    assert [e['event'] for e in received_b] == ['started', 'done']
+    assert other == []
+    assert bus.subscriber_count(1) == 2
+
+    print("[PASS] test_event_bus_fanout")
+
+
+def test_extract_box_publishes_progress():
+    """started, an initial progress event plus one per finished document, then done with artifacts."""
+    SessionLocal, db, mission_id, boxes = setup_test_db(doc_count=3)
+    bus = get_box_event_bus()
+    events = []
+    token = bus.subscribe(mission_id, events.append)
+    try:
+        result = BoxRunner.run_box(db, mission_id, boxes['extract'], {})
+    finally:
+        bus.unsubscribe(mission_id, token)
+
+    kinds = [e['event'] for e in events]
+    assert kinds == ['started'] + ['progress'] * 4 + ['done']
+
+    progress = [e for e in events if e['event'] == 'progress']
+    assert [(e['done'], e['total']) for e in progress] == [(0, 3), (1, 3), (2, 3), (3, 3)]
+    assert progress[0]['detail'] == 'Processing 3 documents'
+    assert progress[1]['detail'] == 'Processed notes_0.md'
+    assert progress[-1]['chunks'] > 0
+
+    assert events[-1]['artifacts'] == result['artifacts']
+    assert events[-1]['cached'] is False
+    assert all(e['box_id'] == boxes['extract'] and e['box_type'] == 'extract' for e in events)
+
+    print("[PASS] test_extract_box_publishes_progress")
+
+
+def test_failed_box_publishes_error():
+    """A box failure publishes an error event carrying the message."""
+    SessionLocal, db, mission_id, boxes = setup_test_db()
+    bus = get_box_event_bus()
+    events = []
+    token = bus.subscribe(mission_id, events.append)
+    try:
+        BoxRunner.run_box(db, mission_id, boxes['ask'], {})
+        assert False, "Should have raised error"
+    except BoxRunnerError:
+        pass
+    finally:
+        bus.unsubscribe(mission_id, token)
+
+    assert [e['event'] for e in events] == ['started', 'error']
+    assert "question" in events[-1]['error']
+
+    print("[PASS] test_failed_box_publishes_error")
+
+
+def test_sse_endpoint_streams_box_run():
+    """SSE stream for one box delivers its events in order and then closes."""
+    from marcus_app.backend.mission_routes import router
+
+    SessionLocal, db, mission_id, boxes = setup_test_db(doc_count=2)
+    bus = get_box_event_bus()
+
+    app = FastAPI()
+    app.include_router(router)
+
+    def run_extract():
+        session = SessionLocal()
+        try:
+            return BoxRunner.run_box(session, mission_id, boxes['extract'], {})
+        finally:
+            session.close()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=10) as client:
+            stream = asyncio.create_task(
+                client.get(f"/api/missions/{mission_id}/events", params={"box_id": boxes['extract']})
+            )
+            deadline = time.monotonic() + 5
+            while not bus.subscriber_count(mission_id):
+                assert time.monotonic() < deadline, "SSE endpoint never subscribed"
+                await asyncio.sleep(0.01)
+
+            result = await asyncio.to_thread(run_extract)
+            response = await stream
+            return response, result
+
+    response, result = asyncio.run(scenario())
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+    frames = [frame.splitlines() for frame in response.text.split('\n\n') if frame]
+    assert frames[0] == ['event: connected', 'data: {}']
+    events = [
+        json.loads(frame[0][len('data: '):])
+        for frame in frames[1:]
+        if frame[0].startswith('data: ')
+    ]
+    assert [e['event'] for e in events] == ['started', 'progress', 'progress', 'progress', 'done']
+    assert events[-1]['artifacts'] == result['artifacts']
+    assert bus.subscriber_count(mission_id) == 0
+
+    print("[PASS] test_sse_endpoint_streams_box_run")
@@ -0,0 +1,273 @@
+"""
+Tests for v0.53: Memoized box outputs
+
+Tests:
+- Repeated AskBox run returns the cached answer without a new artifact
+- force=True recomputes
+- Changed question / re-chunked documents invalidate the fingerprint
+- AskBox with search: cached per search backend; failed searches are not
+- ExtractBox with a failed document is not memoized
+- ExtractBox and CitationsBox reuse their report when nothing changed
+- Hit rate reported on the box detail endpoint
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import (
+    Base, MissionArtifact, BoxRun, BoxState,
+    Artifact, Assignment, Class, ExtractedText, TextChunk
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+from marcus_app.services.embedding_service import EmbeddingService
+from marcus_app.services.search_service import SearchService
+
+
+def setup_test_db():
+    """In-memory database with one chunked artifact and an exam_prep mission."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    test_class = Class(code="PHYS214", name="Quantum Mechanics")
+    db.add(test_class)
+    db.commit()
+
+    assignment = Assignment(class_id=test_class.id, title="Midterm Prep")
+    db.add(assignment)
+    db.commit()
+
+    artifact = Artifact(
+        assignment_id=assignment.id,
+        filename="notes.md",
+        original_filename="notes.md",
+        file_path="/fake/notes.md",
+        file_type="md"
+    )
+    db.add(artifact)
+    db.commit()
+
+    extracted = ExtractedText(
+        artifact_id=artifact.id,
+        content="The Schrodinger equation is H*psi = E*psi.",
+        extraction_method="test",
+        extraction_status="success"
+    )
+    db.add(extracted)
+    db.commit()
+
+    db.add(TextChunk(
+        extracted_text_id=extracted.id,
+        chunk_index=0,
+        content="The Schrodinger equation is H*psi = E*psi.",
+        artifact_id=artifact.id,
+        assignment_id=assignment.id,
+        class_id=test_class.id,
+        chunk_type="paragraph",
+        word_count=6
+    ))
+    db.commit()
+
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Memo")
+    boxes = {box.box_type: box for box in mission.boxes}
+    BoxRunner.run_box(db, mission.id, boxes['inbox'].id, {'artifact_ids': [artifact.id]})
+
+    return db, mission, boxes, artifact
+
+
+def _count_artifacts(db, box):
+    return db.query(MissionArtifact).filter(MissionArtifact.box_id == box.id).count()
+
+
+class _StubModel:
+    def encode(self, texts):
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class StubEmbeddingService(EmbeddingService):
+    """Loads a stub model (ready=True) or reports unavailable (FTS5 only)."""
+
+    def __init__(self, ready, **kwargs):
+        self.ready = ready
+        super().__init__(model_name="stub-model", **kwargs)
+
+    def _initialize_model(self):
+        self.model = _StubModel() if self.ready else None
+        self._available = self.ready
+
+
+class FailingSearchService(SearchService):
+    def search(self, *args, **kwargs):
+        raise RuntimeError("index locked")
+
+
+def _search_service(ready):
+    embeddings = StubEmbeddingService(ready)
+    service = SearchService(embedding_service=embeddings)
+    embeddings.wait_until_ready(timeout=5)
+    return service
+
+
+def test_repeated_ask_is_cached():
+    """Same question twice: second run is a cache hit with the same artifact."""
+    db, mission, boxes, _ = setup_test_db()
+    payload = {'question': 'What is the Schrodinger equation?', 'use_search': False}
+
+    first = BoxRunner.run_box(db, mission.id, boxes['ask'].id, payload)
+    second = BoxRunner.run_box(db, mission.id, boxes['ask'].id, payload)
+
+    assert first['cached'] is False
+    assert second['cached'] is True
+    assert second['state'] == BoxState.DONE.value
+    assert second['artifacts'] == first['artifacts']
+    assert _count_artifacts(db, boxes['ask']) == 1
+
+    print("[PASS] test_repeated_ask_is_cached")
+
+
+def test_force_bypasses_cache():
+    """force=True re-executes and creates a new artifact."""
+    db, mission, boxes, _ = setup_test_db()
+    payload = {'question': 'What is psi?', 'use_search': False}
+
+    BoxRunner.run_box(db, mission.id, boxes['ask'].id, payload)
+    forced = BoxRunner.run_box(db, mission.id, boxes['ask'].id, payload, force=True)
+
+    assert forced['cached'] is False
+    assert _count_artifacts(db, boxes['ask']) == 2
+
+    print("[PASS] test_force_bypasses_cache")
+
+
+def test_changed_inputs_miss():
+    """A different question or new chunks change the fingerprint."""
+    db, mission, boxes, artifact = setup_test_db()
+
+    BoxRunner.run_box(db, mission.id, boxes['ask'].id, {'question': 'What is psi?', 'use_search': False})
+    other = BoxRunner.run_box(db, mission.id, boxes['ask'].id, {'question': 'What is H?', 'use_search': False})
+    assert other['cached'] is False
+
+    # Re-chunk the document
+    chunk = db.query(TextChunk).filter(TextChunk.artifact_id == artifact.id).first()
+    db.add(TextChunk(
+        extracted_text_id=chunk.extracted_text_id,
+        chunk_index=1,
+        content="H is the Hamiltonian operator.",
+        artifact_id=artifact.id,
+        assignment_id=chunk.assignment_id,
+        class_id=chunk.class_id,
+        chunk_type="paragraph",
+        word_count=5
+    ))
+    db.commit()
+
+    rechunked = BoxRunner.run_box(db, mission.id, boxes['ask'].id, {'question': 'What is H?', 'use_search': False})
+    assert rechunked['cached'] is False
+    assert _count_artifacts(db, boxes['ask']) == 3
+
+    print("[PASS] test_changed_inputs_miss")
+
+
+def test_extract_and_citations_reuse_report():
+    """ExtractBox/CitationsBox hit on the second run; cached artifact deleted -> recompute."""
+    db, mission, boxes, _ = setup_test_db()
+
+    first = BoxRunner.run_box(db, mission.id, boxes['extract'].id, {})
+    second = BoxRunner.run_box(db, mission.id, boxes['extract'].id, {})
+    assert first['cached'] is False
+    assert second['cached'] is True
+    assert second['artifacts'] == first['artifacts']
+
+    report = BoxRunner.run_box(db, mission.id, boxes['citations'].id, {})
+    again = BoxRunner.run_box(db, mission.id, boxes['citations'].id, {})
+    assert again['cached'] is True
+    assert again['artifacts'][0]['id'] == report['artifacts'][0]['id']
+
+    # New mission artifact from another box invalidates the citations report
+    BoxRunner.run_box(db, mission.id, boxes['ask'].id, {'question': 'What is psi?', 'use_search': False})
+    assert BoxRunner.run_box(db, mission.id, boxes['citations'].id, {})['cached'] is False
+
+    # Cached artifact no longer exists -> recompute
+    db.query(MissionArtifact).filter(MissionArtifact.id == first['artifacts'][0]['id']).delete()
+    db.commit()
+    assert BoxRunner.run_box(db, mission.id, boxes['extract'].id, {})['cached'] is False
+
+    print("[PASS] test_extract_and_citations_reuse_report")
+
+
+def test_box_detail_reports_hit_rate():
+    """get_box_detail exposes runs/hits/hit_rate from BoxRun."""
+    from marcus_app.backend.mission_routes import get_box_detail
+
+    db, mission, boxes, _ = setup_test_db()
+    payload = {'question': 'What is psi?', 'use_search': False}
+    for _ in range(4):
+        BoxRunner.run_box(db, mission.id, boxes['ask'].id, payload)
+
+    detail = get_box_detail(mission.id, boxes['ask'].id, db=db, _=True)
+    assert detail['cache'] == {'runs': 4, 'hits': 3, 'hit_rate': 0.75}
+    assert db.query(BoxRun).filter(BoxRun.box_id == boxes['ask'].id, BoxRun.cache_hit == True).count() == 3  # noqa: E712
+
+    print("[PASS] test_box_detail_reports_hit_rate")
+
+
+def test_ask_with_search_keyed_on_backend():
+    """Searched answers are cached per search mode/model; failed searches are not cached."""
+    db, mission, boxes, artifact = setup_test_db()
+    ask = boxes['ask']
+    payload = {'question': 'Schrodinger equation'}
+    try:
+        BoxRunner.search_service = _search_service(ready=False)
+        first = BoxRunner.run_box(db, mission.id, ask.id, payload)
+        assert first['cached'] is False
+        assert [c['artifact_id'] for c in first['artifacts'][0]['citations']] == [artifact.id]
+        assert first['artifacts'][0]['citations'][0]['filename'] == 'notes.md'
+        assert BoxRunner.run_box(db, mission.id, ask.id, payload)['cached'] is True
+
+        # Embedding model became available: hybrid answers may differ
+        BoxRunner.search_service = _search_service(ready=True)
+        hybrid = BoxRunner.run_box(db, mission.id, ask.id, payload)
+        assert hybrid['cached'] is False
+        assert BoxRunner.run_box(db, mission.id, ask.id, payload)['cached'] is True
+
+        # Search errors degrade to a fallback answer that must not be memoized
+        BoxRunner.search_service = FailingSearchService(embedding_service=StubEmbeddingService(ready=True))
+        BoxRunner.search_service.embedding_service.wait_until_ready(timeout=5)
+        runs = db.query(BoxRun).filter(BoxRun.box_id == ask.id, BoxRun.cache_hit == False).count()  # noqa: E712
+        failed = BoxRunner.run_box(db, mission.id, ask.id, payload, force=True)
+        assert failed['artifacts'][0]['answer'].startswith('Search failed: index locked')
+        assert db.query(BoxRun).filter(BoxRun.box_id == ask.id, BoxRun.cache_hit == False).count() == runs  # noqa: E712
+        assert BoxRunner.run_box(db, mission.id, ask.id, payload)['cached'] is True
+    finally:
+        BoxRunner.search_service = None
+
+    print("[PASS] test_ask_with_search_keyed_on_backend")
+
+
+def test_extract_with_failed_document_not_cached():
+    """A document that failed extraction may succeed later: no memoized report."""
+    db, mission, boxes, artifact = setup_test_db()
+    missing = Artifact(
+        assignment_id=artifact.assignment_id,
+        filename="missing.pdf",
+        original_filename="missing.pdf",
+        file_path="/fake/missing.pdf",
+        file_type="pdf"
+    )
+    db.add(missing)
+    db.commit()
+    BoxRunner.run_box(db, mission.id, boxes['inbox'].id, {'artifact_ids': [missing.id]})
+
+    first = BoxRunner.run_box(db, mission.id, boxes['extract'].id, {})
+    assert first['cached'] is False
+    assert 'Extraction failed' in db.get(MissionArtifact, first['artifacts'][0]['id']).content_json
+    assert BoxRunner.run_box(db, mission.id, boxes['extract'].id, {})['cached'] is False
+    assert db.query(BoxRun).filter(BoxRun.box_id == boxes['extract'].id).count() == 0
+
+    print("[PASS] test_extract_with_failed_document_not_cached")
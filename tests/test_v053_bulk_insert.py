@@ -0,0 +1,138 @@
+"""
+Tests for v0.53: Bulk persistence fast path
+
+Tests:
+- bulk_insert returns ids aligned with input rows
+- Column defaults applied on bulk path
+- ChunkingService persists chunks via bulk path
+- PracticeBox returns real item ids
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import (
+    Base, Class, Assignment, Artifact, ExtractedText, TextChunk, PracticeItem
+)
+from marcus_app.core.bulk import bulk_insert
+from marcus_app.services.chunking_service import ChunkingService
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+
+
+def setup_test_db():
+    """Create in-memory test database with one artifact."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    test_class = Class(code="TEST101", name="Test Class")
+    db.add(test_class)
+    db.commit()
+
+    test_assignment = Assignment(class_id=test_class.id, title="Test Assignment")
+    db.add(test_assignment)
+    db.commit()
+
+    test_artifact = Artifact(
+        assignment_id=test_assignment.id,
+        filename="test.md",
+        original_filename="test.md",
+        file_path="/fake/path/test.md",
+        file_type="md"
+    )
+    db.add(test_artifact)
+    db.commit()
+
+    return db, test_class, test_artifact
+
+
+def test_bulk_insert_returns_ordered_ids():
+    """Ids come back in input order and match stored rows."""
+    db, test_class, test_artifact = setup_test_db()
+
+    extracted = ExtractedText(artifact_id=test_artifact.id, content="x")
+    db.add(extracted)
+    db.commit()
+
+    rows = [
+        {
+            'extracted_text_id': extracted.id,
+            'artifact_id': test_artifact.id,
+            'chunk_index': i,
+            'content': f"chunk {i}"
+        }
+        for i in range(250)
+    ]
+    ids = bulk_insert(db, TextChunk, rows)
+    db.commit()
+
+    assert len(ids) == 250
+    for chunk_id, row in zip(ids, rows):
+        chunk = db.get(TextChunk, chunk_id)
+        assert chunk.content == row['content']
+        assert chunk.created_at is not None  # Python-side default applied
+
+    assert bulk_insert(db, TextChunk, []) == []
+
+    print("[PASS] test_bulk_insert_returns_ordered_ids")
+
+
+def test_chunking_service_bulk_path():
+    """chunk_extracted_text writes all chunks with denormalized context."""
+    db, test_class, test_artifact = setup_test_db()
+
+    content = "\n".join(
+        f"# Section {s}\n" + ("Angular velocity is the rate of change of angle. " * 20)
+        for s in range(5)
+    )
+    extracted = ExtractedText(artifact_id=test_artifact.id, content=content)
+    db.add(extracted)
+    db.commit()
+
+    service = ChunkingService()
+    chunk_ids = service.chunk_extracted_text(extracted, db)
+
+    chunks = db.query(TextChunk).order_by(TextChunk.chunk_index).all()
+    assert [c.id for c in chunks] == chunk_ids
+    assert len(chunks) == len(service._split_into_chunks(content))
+    assert all(c.class_id == test_class.id for c in chunks)
+    assert chunks[0].section_title == "Section 0"
+
+    print("[PASS] test_chunking_service_bulk_path")
+
+
+def test_practice_box_returns_item_ids():
+    """PracticeBox items are bulk inserted and report their ids."""
+    db, test_class, test_artifact = setup_test_db()
+
+    extracted = ExtractedText(artifact_id=test_artifact.id, content="Torque = r x F " * 30)
+    db.add(extracted)
+    db.commit()
+    ChunkingService().chunk_extracted_text(extracted, db)
+
+    mission = MissionService.create_from_template(
+        db=db, template_name="exam_prep", mission_name="Bulk Mission"
+    )
+    inbox_box = next(b for b in mission.boxes if b.box_type == 'inbox')
+    inbox_result = BoxRunner.run_box(
+        db=db, mission_id=mission.id, box_id=inbox_box.id,
+        input_payload={'artifact_ids': [test_artifact.id]}
+    )
+    assert inbox_result['artifacts'][0]['id'] is not None
+
+    practice_box = next(b for b in mission.boxes if b.box_type == 'practice')
+    BoxRunner.run_box(
+        db=db, mission_id=mission.id, box_id=practice_box.id,
+        input_payload={'question_count': 5}
+    )
+
+    items = db.query(PracticeItem).all()
+    assert len(items) >= 1
+    assert all(item.state == 'unanswered' for item in items)
+
+    print("[PASS] test_practice_box_returns_item_ids")
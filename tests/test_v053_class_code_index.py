@@ -0,0 +1,118 @@
+"""
+Tests for v0.53: In-memory class code index
+
+Tests:
+- Exact, prefix and substring tiers; normalized codes
+- Repeated lookups and both agent parsers share one build (no SELECT)
+- Class insert/update/delete invalidate the index; rolled-back inserts
+  are never served
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class
+from marcus_app.services.item_classifier import CLASS_CODE_INDEX, match_class_code_to_db
+from marcus_app.services.agent_router import parse_create_item_intent, parse_create_mission_intent
+
+
+@contextmanager
+def setup_test_db():
+    """Yields (engine, SessionLocal, db, statements); closes and disposes on exit."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    db.add_all([
+        Class(code="26SPECE34701", name="Embedded System Design"),
+        Class(code="PHYS214-01", name="Quantum Mechanics"),
+        Class(code="PHYS214", name="Quantum Mechanics (lecture)"),
+        Class(code="CS 101", name="Intro to Programming"),
+    ])
+    db.commit()
+    # Process-wide index: start from this database
+    CLASS_CODE_INDEX.invalidate()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    try:
+        yield engine, SessionLocal, db, statements
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def class_id(db, code):
+    return db.query(Class.id).filter(Class.code == code).scalar()
+
+
+def test_lookup_tiers():
+    """Exact beats prefix beats substring; codes are normalized."""
+    with setup_test_db() as (engine, SessionLocal, db, statements):
+        assert match_class_code_to_db(["PHYS214"], db) == class_id(db, "PHYS214")
+        assert match_class_code_to_db(["phys-214"], db) == class_id(db, "PHYS214")
+        assert match_class_code_to_db(["PHYS2140"], db) == class_id(db, "PHYS214-01")
+        assert match_class_code_to_db(["ECE347"], db) == class_id(db, "26SPECE34701")
+        assert match_class_code_to_db(["CS101"], db) == class_id(db, "CS 101")
+        assert match_class_code_to_db(["MATH999", "ECE347"], db) == class_id(db, "26SPECE34701")
+        assert match_class_code_to_db(["MATH999"], db) is None
+        assert match_class_code_to_db([], db) is None
+
+        print("[PASS] test_lookup_tiers")
+
+
+def test_parsers_share_one_build():
+    """One SELECT for the first lookup, none after - across both parsers."""
+    with setup_test_db() as (engine, SessionLocal, db, statements):
+        expected = {code: class_id(db, code) for code in ("PHYS214", "26SPECE34701")}
+        builds = CLASS_CODE_INDEX.stats()['builds']
+        statements.clear()
+
+        item = parse_create_item_intent("add task PHYS214 lab report", db)
+        mission = parse_create_mission_intent("create mission exam prep for ECE347", db)
+        for _ in range(50):
+            match_class_code_to_db(["PHYS214"], db)
+
+        assert item['context_kind'] == 'class' and item['context_id'] == expected["PHYS214"]
+        assert mission['class_id'] == expected["26SPECE34701"]
+        assert sum(1 for s in statements if 'FROM classes' in s) == 1
+        assert CLASS_CODE_INDEX.stats()['builds'] == builds + 1
+
+        print("[PASS] test_parsers_share_one_build")
+
+
+def test_class_changes_invalidate():
+    """Insert/update/delete are visible on the next lookup; rollbacks are not."""
+    with setup_test_db() as (engine, SessionLocal, db, statements):
+        assert match_class_code_to_db(["BIO110"], db) is None
+
+        bio = Class(code="BIO110", name="Biology")
+        db.add(bio)
+        db.commit()
+        assert match_class_code_to_db(["BIO110"], db) == bio.id
+
+        bio.code = "BIO120"
+        db.commit()
+        assert match_class_code_to_db(["BIO110"], db) is None
+        assert match_class_code_to_db(["BIO120"], db) == bio.id
+
+        db.delete(bio)
+        db.commit()
+        assert match_class_code_to_db(["BIO120"], db) is None
+
+        # Uncommitted insert seen by its own session, gone after rollback
+        db.add(Class(code="CHEM101", name="Chemistry"))
+        db.flush()
+        assert match_class_code_to_db(["CHEM101"], db) is not None
+        db.rollback()
+        other = SessionLocal()
+        assert match_class_code_to_db(["CHEM101"], other) is None
+        other.close()
+
+        print("[PASS] test_class_changes_invalidate")
@@ -0,0 +1,151 @@
+"""
+Tests for v0.53: Materialized dashboard counters
+
+Tests:
+- Item/mission inserts, status/state/due changes (loaded or expired) and
+  deletes keep dashboard_counters equal to a full recount
+- Rolled-back changes leave the counters untouched
+- inbox_stats() matches the previous COUNT(*) queries
+- reconcile_counters() corrects drift from writes that bypass the ORM
+- Mission status command reads the counters
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Item, Mission, DashboardCounter
+from marcus_app.core.counters import (
+    install_counter_hooks, inbox_stats, count_from_source, reconcile_counters
+)
+
+
+def setup_test_db():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    install_counter_hooks(SessionLocal)
+    return engine, SessionLocal()
+
+
+def stored(db):
+    return {(c.scope, c.key): c.count for c in db.query(DashboardCounter) if c.count}
+
+
+def assert_in_sync(db):
+    assert stored(db) == count_from_source(db)
+
+
+def legacy_inbox_stats(db, now):
+    tomorrow = now.replace(hour=23, minute=59, second=59)
+    return {
+        'inbox_count': db.query(Item).filter(Item.status == 'inbox').count(),
+        'due_soon_count': db.query(Item).filter(
+            Item.status == 'active', Item.due_at.isnot(None), Item.due_at <= tomorrow, Item.due_at >= now
+        ).count(),
+        'overdue_count': db.query(Item).filter(
+            Item.status == 'active', Item.due_at.isnot(None), Item.due_at < now
+        ).count(),
+    }
+
+
+def test_counters_follow_item_and_mission_changes():
+    """Every ORM write path keeps counters equal to a recount."""
+    engine, db = setup_test_db()
+    now = datetime.utcnow()
+
+    items = [
+        Item(item_type='note', title='Inbox note'),
+        Item(item_type='task', title='Due', status='active', due_at=now + timedelta(days=1)),
+        Item(item_type='task', title='Overdue', status='active', due_at=now - timedelta(days=3)),
+        Item(item_type='task', title='Done', status='done', due_at=now - timedelta(days=3)),
+    ]
+    mission = Mission(name='Exam', mission_type='exam_prep')
+    db.add_all(items + [mission])
+    db.commit()
+    assert stored(db)[('item_status', 'inbox')] == 1
+    assert stored(db)[('mission_state', 'draft')] == 1
+    assert_in_sync(db)
+
+    # Loaded attribute change
+    items[0].status = 'active'
+    items[0].due_at = now - timedelta(days=1)
+    db.commit()
+    assert_in_sync(db)
+
+    # Assignment while expired (after commit, old value never loaded)
+    items[1].status = 'done'
+    mission.state = 'blocked'
+    db.commit()
+    assert_in_sync(db)
+    assert ('item_due_day', (now + timedelta(days=1)).date().isoformat()) not in stored(db)
+
+    db.delete(items[2])
+    db.commit()
+    assert_in_sync(db)
+
+    from marcus_app.backend.agent_routes import execute_mission_status
+    response = execute_mission_status(db)
+    assert response.action_card['stats'] == {'active': 0, 'blocked': 1, 'done': 0, 'draft': 0, 'total': 1}
+
+    print("[PASS] test_counters_follow_item_and_mission_changes")
+
+
+def test_rollback_leaves_counters_unchanged():
+    """Counter writes share the item's transaction."""
+    engine, db = setup_test_db()
+    db.add(Item(item_type='note', title='Kept'))
+    db.commit()
+    before = stored(db)
+
+    db.add(Item(item_type='note', title='Discarded'))
+    db.flush()
+    assert stored(db)[('item_status', 'inbox')] == 2
+    db.rollback()
+
+    assert stored(db) == before
+    print("[PASS] test_rollback_leaves_counters_unchanged")
+
+
+def test_inbox_stats_match_count_queries():
+    """Counter-backed stats equal the previous three COUNT(*) scans."""
+    engine, db = setup_test_db()
+    now = datetime(2026, 3, 10, 14, 30)
+    offsets = [-24 * 20, -30, -14, -2, -0.5, 0.5, 3, 9, 9.49, 12, 30, 24 * 5]
+    for i, hours in enumerate(offsets):
+        for status in ('active', 'inbox', 'done'):
+            db.add(Item(item_type='task', title=f'{status} {i}', status=status, due_at=now + timedelta(hours=hours)))
+    db.add(Item(item_type='task', title='No due date', status='active'))
+    db.commit()
+
+    assert inbox_stats(db, now) == legacy_inbox_stats(db, now)
+    assert inbox_stats(db, now) == {'inbox_count': 12, 'due_soon_count': 4, 'overdue_count': 5}
+
+    print("[PASS] test_inbox_stats_match_count_queries")
+
+
+def test_reconcile_corrects_drift():
+    """Raw SQL writes drift; reconciliation rewrites the counters once."""
+    engine, db = setup_test_db()
+    db.add_all([Item(item_type='note', title=f'Note {i}') for i in range(3)])
+    db.commit()
+
+    db.execute(text("UPDATE items SET status = 'archived' WHERE id = 1"))
+    db.execute(text("INSERT INTO missions (name, mission_type, state) VALUES ('Raw', 'exam_prep', 'active')"))
+    db.commit()
+    assert stored(db)[('item_status', 'inbox')] == 3
+
+    drift = reconcile_counters(db)
+    assert drift == {
+        ('item_status', 'archived'): (0, 1),
+        ('item_status', 'inbox'): (3, 2),
+        ('mission_state', 'active'): (0, 1),
+    }
+    assert_in_sync(db)
+    assert reconcile_counters(db) == {}
+
+    print("[PASS] test_reconcile_corrects_drift")
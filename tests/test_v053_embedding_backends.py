@@ -0,0 +1,219 @@
+"""
+Tests for v0.53: Pluggable embedding backends
+
+Uses a deterministic stub backend, plus a tiny generated ONNX model
+(Gather over a 6-word vocabulary) for the ONNX Runtime path - no model
+download needed.
+
+Tests:
+- Backend selection by name; unknown names rejected
+- embed_pending_chunks records model_id in TextChunk.embedding_model
+- Semantic search only compares vectors from the active backend
+- OnnxBackend mean-pools + normalizes, int8 quantization produced on demand
+"""
+
+import sys
+import json
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Assignment, Artifact, ExtractedText, TextChunk
+from marcus_app.services.embedding_service import (
+    EmbeddingService, EmbeddingBackend, OnnxBackend, SentenceTransformerBackend, create_backend
+)
+from marcus_app.services.search_service import SearchService
+
+
+class StubBackend(EmbeddingBackend):
+    """Deterministic 3-d vectors from keyword presence."""
+
+    name = "stub"
+    KEYWORDS = ("torque", "voltage", "recursion")
+
+    def load(self):
+        self.dimension = 3
+        self.max_seq_length = 16
+
+    def encode(self, texts):
+        return [[1.0 if k in t.lower() else 0.01 for k in self.KEYWORDS] for t in texts]
+
+
+def setup_test_db():
+    """Create in-memory test database with three chunks."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    test_class = Class(code="TEST101", name="Test Class")
+    db.add(test_class)
+    db.commit()
+
+    test_assignment = Assignment(class_id=test_class.id, title="Test Assignment")
+    db.add(test_assignment)
+    db.commit()
+
+    test_artifact = Artifact(
+        assignment_id=test_assignment.id,
+        filename="test.md",
+        original_filename="test.md",
+        file_path="/fake/path/test.md",
+        file_type="md"
+    )
+    db.add(test_artifact)
+    db.commit()
+
+    extracted = ExtractedText(artifact_id=test_artifact.id, content="x")
+    db.add(extracted)
+    db.commit()
+
+    for i, content in enumerate(["Torque is force times radius", "Voltage drop", "Recursion base case"]):
+        db.add(TextChunk(
+            extracted_text_id=extracted.id,
+            artifact_id=test_artifact.id,
+            class_id=test_class.id,
+            chunk_index=i,
+            content=content
+        ))
+    db.commit()
+
+    return db
+
+
+def test_backend_selection():
+    """Backends are chosen by name; model_id records backend + model."""
+    assert isinstance(create_backend("sentence-transformers", "m"), SentenceTransformerBackend)
+    assert create_backend("onnx", "m").name == "onnx"
+    assert create_backend("onnx-int8", "m").name == "onnx-int8"
+
+    with pytest.raises(ValueError):
+        create_backend("cuda-magic", "m")
+
+    service = EmbeddingService(model_name="all-MiniLM-L6-v2", backend="onnx-int8")
+    assert service.model_id == "onnx-int8:all-MiniLM-L6-v2"
+
+    print("[PASS] test_backend_selection")
+
+
+def test_embed_pending_chunks_records_model():
+    """Vectors are written with the producing backend, and re-embedded on switch."""
+    db = setup_test_db()
+
+    service = EmbeddingService(backend=StubBackend("stub-model"))
+    assert service.ensure_loaded()
+    assert service.get_model_info()['embedding_dim'] == 3
+
+    assert service.embed_pending_chunks(db, batch_size=2) == 3
+    chunks = db.query(TextChunk).order_by(TextChunk.id).all()
+    assert all(c.embedding_model == "stub:stub-model" for c in chunks)
+    assert json.loads(chunks[0].embedding_vector) == [1.0, 0.01, 0.01]
+
+    # Nothing left to do for the same backend
+    assert service.embed_pending_chunks(db) == 0
+
+    # A different backend re-embeds everything
+    other = StubBackend("stub-model")
+    other.name = "stub-v2"
+    switched = EmbeddingService(backend=other)
+    switched.ensure_loaded()
+    assert switched.embed_pending_chunks(db) == 3
+
+    print("[PASS] test_embed_pending_chunks_records_model")
+
+
+def test_semantic_search_filters_by_model():
+    """Vectors from another backend are never compared against the query."""
+    db = setup_test_db()
+
+    service = EmbeddingService(backend=StubBackend("stub-model"))
+    service.ensure_loaded()
+    service.embed_pending_chunks(db)
+
+    search = SearchService(embedding_service=service)
+    results = search._semantic_search("torque", None, None, 5, db)
+    assert results[0]['content'].startswith("Torque")
+
+    other = StubBackend("stub-model")
+    other.name = "stub-v2"
+    foreign = EmbeddingService(backend=other)
+    foreign.ensure_loaded()
+    search = SearchService(embedding_service=foreign)
+    assert search._semantic_search("torque", None, None, 5, db) == []
+
+    print("[PASS] test_semantic_search_filters_by_model")
+
+
+def _write_tiny_onnx_model(model_dir: Path):
+    """token_embeddings = Gather(E, input_ids) with a 6-word vocab, dim 4."""
+    onnx = pytest.importorskip("onnx")
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("onnxruntime")
+    tokenizers = pytest.importorskip("tokenizers")
+    from onnx import helper, TensorProto, numpy_helper
+
+    vocab = {"[PAD]": 0, "[UNK]": 1, "torque": 2, "voltage": 3, "recursion": 4, "force": 5}
+    weights = np.zeros((len(vocab), 4), dtype=np.float32)
+    weights[2] = [1, 0, 0, 0]
+    weights[3] = [0, 1, 0, 0]
+    weights[4] = [0, 0, 1, 0]
+    weights[5] = [1, 0, 0, 1]
+    # Make the table large enough for int8 quantization to kick in
+    weights = np.tile(weights, (1, 64))
+
+    graph = helper.make_graph(
+        [helper.make_node("Gather", ["E", "input_ids"], ["token_embeddings"])],
+        "tiny",
+        [
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, ["batch", "seq"]),
+            helper.make_tensor_value_info("attention_mask", TensorProto.INT64, ["batch", "seq"]),
+        ],
+        [helper.make_tensor_value_info("token_embeddings", TensorProto.FLOAT, ["batch", "seq", 256])],
+        [numpy_helper.from_array(weights, "E")]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(model_dir / "model.onnx"))
+
+    from tokenizers import Tokenizer, models, pre_tokenizers, normalizers
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token="[UNK]"))
+    tokenizer.normalizer = normalizers.Lowercase()
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.save(str(model_dir / "tokenizer.json"))
+
+
+def test_onnx_backend_pooling_and_quantization(tmp_path):
+    """Masked mean pooling + L2 norm; padding does not change a sentence's vector."""
+    _write_tiny_onnx_model(tmp_path)
+
+    backend = OnnxBackend("tiny", model_dir=tmp_path)
+    backend.load()
+    assert backend.dimension == 256
+
+    single = backend.encode(["torque"])[0]
+    batched = backend.encode(["torque", "torque force voltage recursion"])[0]
+    assert single == pytest.approx(batched, abs=1e-6)
+    assert sum(v * v for v in single) == pytest.approx(1.0, abs=1e-5)
+
+    int8 = OnnxBackend("tiny", model_dir=tmp_path, quantized=True)
+    service = EmbeddingService(model_name="tiny", backend=int8)
+    assert service.ensure_loaded()
+    assert (tmp_path / "model_int8.onnx").exists()
+    assert service.model_id == "onnx-int8:tiny"
+
+    quantized = service.embed_text("torque")
+    cosine = sum(a * b for a, b in zip(single, quantized))
+    assert cosine > 0.99
+
+    print("[PASS] test_onnx_backend_pooling_and_quantization")
+
+
+def test_missing_onnx_model_is_unavailable(tmp_path):
+    """No model files: service degrades to FTS5 instead of raising."""
+    service = EmbeddingService(backend=OnnxBackend("absent", model_dir=tmp_path / "nope"))
+    assert service.ensure_loaded() is False
+    assert service.state == EmbeddingService.STATE_UNAVAILABLE
+
+    print("[PASS] test_missing_onnx_model_is_unavailable")
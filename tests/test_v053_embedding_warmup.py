@@ -0,0 +1,104 @@
+"""
+Tests for v0.53: Background embedding warm-up + idle unload
+
+Uses a stub model (no sentence-transformers download) gated by an Event so
+the test controls exactly when "loading" finishes.
+
+Tests:
+- SearchService starts in FTS5 mode and switches to hybrid once ready
+- Idle unload evicts the model; next search triggers a background reload
+- Missing dependencies leave the service unavailable (no retry loop)
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marcus_app.services.embedding_service import EmbeddingService
+from marcus_app.services.search_service import SearchService
+
+
+class _StubModel:
+    """Minimal EmbeddingBackend.encode() stand-in."""
+
+    def encode(self, texts):
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class GatedEmbeddingService(EmbeddingService):
+    """EmbeddingService whose model 'loads' only when release() is called."""
+
+    def __init__(self, **kwargs):
+        super().__init__(model_name="stub-model", **kwargs)
+        self.gate = threading.Event()
+        self.load_count = 0
+
+    def _initialize_model(self):
+        self.gate.wait(timeout=5)
+        self.load_count += 1
+        self.model = _StubModel()
+        self._available = True
+
+
+class UnavailableEmbeddingService(EmbeddingService):
+    def _initialize_model(self):
+        self._available = False
+
+
+def test_search_switches_to_hybrid_when_ready():
+    """FTS5-only until warm-up completes, then hybrid without a restart."""
+    embeddings = GatedEmbeddingService()
+    service = SearchService(embedding_service=embeddings)
+
+    assert embeddings.state == EmbeddingService.STATE_LOADING
+    assert service.embeddings_available is False
+    assert service.get_status()['mode'] == 'fts5'
+
+    embeddings.gate.set()
+    assert embeddings.wait_until_ready(timeout=5)
+
+    assert service.embeddings_available is True
+    status = service.get_status()
+    assert status['mode'] == 'hybrid'
+    assert status['embeddings']['state'] == 'ready'
+    assert status['embeddings']['load_seconds'] is not None
+
+    print("[PASS] test_search_switches_to_hybrid_when_ready")
+
+
+def test_idle_unload_and_reload():
+    """Model is evicted after idle timeout and reloaded on demand."""
+    embeddings = GatedEmbeddingService(idle_unload_seconds=0.2)
+    embeddings.gate.set()
+    assert embeddings.ensure_loaded()
+    assert embeddings.embed_text("torque") == [6.0, 1.0]
+
+    deadline = time.monotonic() + 5
+    while embeddings.state != EmbeddingService.STATE_UNLOADED and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert embeddings.state == EmbeddingService.STATE_UNLOADED
+    assert embeddings.model is None
+    assert embeddings.is_available() is False
+
+    # Next warm-up (what SearchService.search triggers) reloads it
+    assert embeddings.start_warmup() is True
+    assert embeddings.wait_until_ready(timeout=5)
+    assert embeddings.load_count == 2
+
+    print("[PASS] test_idle_unload_and_reload")
+
+
+def test_unavailable_does_not_retry():
+    """Missing sentence-transformers: stays unavailable, warm-up not restarted."""
+    embeddings = UnavailableEmbeddingService()
+    service = SearchService(embedding_service=embeddings)
+    embeddings.wait_until_ready(timeout=5)
+
+    assert embeddings.state == EmbeddingService.STATE_UNAVAILABLE
+    assert embeddings.start_warmup() is False
+    assert service.get_status()['mode'] == 'fts5'
+
+    print("[PASS] test_unavailable_does_not_retry")
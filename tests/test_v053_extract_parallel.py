@@ -0,0 +1,142 @@
+"""
+Tests for v0.53: Parallel per-document processing inside ExtractBox
+
+Tests:
+- Process-pool run creates the same chunks and an identical report to the
+  in-process run
+- Extraction failures are reported per document, other documents continue
+- In-memory databases fall back to in-process processing
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core import executors
+from marcus_app.core.models import (
+    Base, Class, Assignment, Artifact, ExtractedText, TextChunk, MissionArtifact
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+
+
+def setup_test_db(db_url, source_dir, doc_count=4):
+    """Database with doc_count text artifacts on disk plus one missing PDF."""
+    engine = create_engine(db_url, echo=False, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    test_class = Class(code="PHYS214", name="Quantum Mechanics")
+    db.add(test_class)
+    db.commit()
+    assignment = Assignment(class_id=test_class.id, title="Midterm Prep")
+    db.add(assignment)
+    db.commit()
+
+    source_dir.mkdir(parents=True, exist_ok=True)
+    artifact_ids = []
+    for i in range(doc_count):
+        path = source_dir / f"lecture_{i}.txt"
+        sections = [
+            f"# Lecture {i} part {j}\n\n" + ("Angular momentum is conserved when net torque is zero. " * 8)
+            for j in range(i + 2)
+        ]
+        path.write_text("\n\n".join(sections), encoding="utf-8")
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=path.name,
+            original_filename=path.name,
+            file_path=str(path),
+            file_type="text"
+        )
+        db.add(artifact)
+        db.flush()
+        artifact_ids.append(artifact.id)
+
+    missing = Artifact(
+        assignment_id=assignment.id,
+        filename="missing.pdf",
+        original_filename="missing.pdf",
+        file_path=str(source_dir / "missing.pdf"),
+        file_type="pdf"
+    )
+    db.add(missing)
+    db.commit()
+    artifact_ids.append(missing.id)
+
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Parallel")
+    boxes = {box.box_type: box.id for box in mission.boxes}
+    BoxRunner.run_box(db, mission.id, boxes['inbox'], {'artifact_ids': artifact_ids})
+
+    return engine, db, mission.id, boxes
+
+
+def _run_extract(db, mission_id, boxes):
+    result = BoxRunner.run_box(db, mission_id, boxes['extract'], {})
+    report = db.query(MissionArtifact).get(result['artifacts'][0]['id'])
+    chunk_counts = dict(
+        db.query(TextChunk.artifact_id, func.count(TextChunk.id)).group_by(TextChunk.artifact_id).all()
+    )
+    return result, report.content_json, chunk_counts
+
+
+def test_pool_matches_in_process(tmp_path, monkeypatch):
+    """Same report markdown and chunks with 1 or 2 document processes."""
+    runs = {}
+    try:
+        for processes in (1, 2):
+            monkeypatch.setenv("MARCUS_DOCUMENT_PROCESSES", str(processes))
+            engine, db, mission_id, boxes = setup_test_db(
+                f"sqlite:///{tmp_path / f'p{processes}.db'}", tmp_path / "docs"
+            )
+            runs[processes] = _run_extract(db, mission_id, boxes)
+            db.close()
+            engine.dispose()
+    finally:
+        executors.shutdown_process_pools()
+
+    (_, report_1, chunks_1), (result_2, report_2, chunks_2) = runs[1], runs[2]
+    assert report_1 == report_2
+    assert chunks_1 == chunks_2
+    assert len(chunks_1) == 4
+    assert "**Artifacts Processed:** 4" in report_2
+    assert "- missing.pdf: Extraction failed" in report_2
+    assert report_2.index("lecture_0.txt") < report_2.index("lecture_3.txt") < report_2.index("missing.pdf")
+    assert result_2['artifacts'][0]['summary'] == f"4 artifacts, {sum(chunks_2.values())} chunks"
+
+    print("[PASS] test_pool_matches_in_process")
+
+
+def test_second_run_reports_already_chunked(tmp_path, monkeypatch):
+    """Workers see earlier commits: a forced re-run reports existing chunks."""
+    monkeypatch.setenv("MARCUS_DOCUMENT_PROCESSES", "2")
+    try:
+        engine, db, mission_id, boxes = setup_test_db(f"sqlite:///{tmp_path / 'again.db'}", tmp_path / "docs")
+        _, _, chunks = _run_extract(db, mission_id, boxes)
+        result = BoxRunner.run_box(db, mission_id, boxes['extract'], {}, force=True)
+        report = db.query(MissionArtifact).get(result['artifacts'][0]['id']).content_json
+    finally:
+        executors.shutdown_process_pools()
+
+    assert f"- lecture_0.txt: Already chunked ({chunks[1]} chunks)" in report
+    assert db.query(ExtractedText).count() == 5
+
+    print("[PASS] test_second_run_reports_already_chunked")
+
+
+def test_in_memory_database_runs_in_process(tmp_path, monkeypatch):
+    """sqlite :memory: cannot be shared with workers; no pool is started."""
+    monkeypatch.setenv("MARCUS_DOCUMENT_PROCESSES", "4")
+    engine, db, mission_id, boxes = setup_test_db("sqlite:///:memory:", tmp_path / "docs", doc_count=2)
+
+    result, report, chunks = _run_extract(db, mission_id, boxes)
+
+    assert "documents" not in executors._process_pools
+    assert len(chunks) == 2
+    assert "**Artifacts Processed:** 2" in report
+
+    print("[PASS] test_in_memory_database_runs_in_process")
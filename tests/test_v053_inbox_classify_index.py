@@ -0,0 +1,116 @@
+"""
+Tests for v0.53: Inbox classification index and batch classify
+
+Tests:
+- _auto_classify with a ClassificationIndex gives the previous suggestion
+  for every filename, including created_at ties and substring code matches
+- A batch classifies N files with two SELECTs, none per file
+- add_many_to_inbox stores a batch in one commit and reuses duplicates
+"""
+
+import sys
+import random
+from contextlib import contextmanager
+from pathlib import Path
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Class, Assignment, InboxItem
+from marcus_app.services.inbox_service import InboxService, ClassificationIndex
+from bench_inbox_classify import seed, build_filenames, legacy_auto_classify
+
+
+@contextmanager
+def setup_test_db():
+    """Yields (engine, db, statements); closes and disposes on exit."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    try:
+        yield engine, db, statements
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_index_matches_legacy_classifier(tmp_path):
+    """Same class, assignment, confidence and reasoning as the per-file scans."""
+    with setup_test_db() as (engine, db, statements):
+        service = InboxService(tmp_path / "inbox")
+        assert service._auto_classify("ECE347_hw1.pdf", 'pdf', b'', db) == legacy_auto_classify("ECE347_hw1.pdf", db)
+
+        rng = random.Random(7)
+        codes = seed(db, 6, 25, rng)
+        # created_at ties: max() keeps the first row, so must the index
+        tie = datetime(2026, 1, 5, 9, 0) + timedelta(days=5)
+        db.add(Class(code="PHYS 2140", name="Tie", created_at=tie))
+        first = db.query(Class).filter(Class.code == codes[0]).one()
+        db.add_all([Assignment(class_id=first.id, title=f"Essay {i}", created_at=tie) for i in range(3)])
+        db.add(Class(code="NOASSIGN100", name="Empty"))
+        db.commit()
+
+        filenames = build_filenames(codes, 300, rng) + [
+            "PHYS 2140 notes.pdf", "phys214_hw2.pdf", f"{codes[0]} essay.pdf", "NOASSIGN100 lab 1.pdf", "",
+        ]
+        for filename in filenames:
+            expected = legacy_auto_classify(filename, db)
+            assert service._auto_classify(filename, 'pdf', b'', db) == expected, filename
+        assert service.classify_filenames(filenames, db) == [legacy_auto_classify(f, db) for f in filenames]
+
+        print("[PASS] test_index_matches_legacy_classifier")
+
+
+def test_batch_uses_one_snapshot(tmp_path):
+    """Two narrow SELECTs for the whole batch, no text columns loaded."""
+    with setup_test_db() as (engine, db, statements):
+        codes = seed(db, 4, 10, random.Random(3))
+        service = InboxService(tmp_path / "inbox")
+        filenames = build_filenames(codes, 50, random.Random(4))
+
+        statements.clear()
+        suggestions = service.classify_filenames(filenames, db)
+        assert len(suggestions) == 50
+        assert len(statements) == 2
+        assert not any('description' in s or 'notes' in s for s in statements)
+
+        index = ClassificationIndex.build(db)
+        class_id = index.classes[0][0]
+        assert index.assignment_with_title(class_id, 'zzz') is None
+        assert index.most_recent_assignment[class_id][0] in {a[0] for a in index.assignments_by_class[class_id]}
+
+        print("[PASS] test_batch_uses_one_snapshot")
+
+
+def test_add_many_to_inbox(tmp_path):
+    """One commit for the batch; repeated content returns the pending item."""
+    with setup_test_db() as (engine, db, statements):
+        seed(db, 2, 5, random.Random(5))
+        service = InboxService(tmp_path / "inbox")
+        existing = service.add_to_inbox(b"already here", "old.pdf", db)
+
+        commits = []
+        event.listen(db, "after_commit", lambda session: commits.append(1))
+        items = service.add_many_to_inbox([
+            ("ECE200 hw1.pdf", b"one"),
+            ("lab 2.docx", b"two"),
+            ("copy of one.pdf", b"one"),
+            ("old again.pdf", b"already here"),
+        ], db)
+
+        assert len(commits) == 1
+        assert items[0].id == items[2].id
+        assert items[3].id == existing.id
+        assert db.query(InboxItem).count() == 3
+        assert items[0].suggested_class_id is not None and items[0].classification_confidence == 'high'
+        assert items[1].file_type == 'docx' and (tmp_path / "inbox").joinpath(Path(items[1].file_path).name).exists()
+
+        print("[PASS] test_add_many_to_inbox")
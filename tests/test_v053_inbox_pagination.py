@@ -0,0 +1,154 @@
+"""
+Tests for v0.53: Inbox list keyset pagination, field projection, ETag
+
+Tests:
+- Cursor pages walk (created_at DESC, id DESC) without gaps or repeats,
+  including items created in the same instant
+- fields= returns only the requested fields and skips unselected columns
+  in SQL; default response keeps the full ItemResponse shape
+- If-None-Match with the page ETag -> 304 without loading item columns;
+  any change to a listed item -> new ETag
+"""
+
+import sys
+import json
+from pathlib import Path
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from marcus_app.core.database import get_db
+from marcus_app.core.models import Base, Item
+from marcus_app.backend.inbox_routes import router
+
+
+def setup_test_db(item_count=25):
+    """Inbox items with pairwise identical created_at, plus a few active ones."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    start = datetime(2026, 1, 1, 9, 0)
+    for i in range(item_count):
+        db.add(Item(
+            item_type='note',
+            title=f"Note {i}",
+            content_md="body " * 200,
+            status='inbox',
+            tags_json=json.dumps(['t']) if i % 2 else None,
+            created_at=start + timedelta(minutes=i // 2)
+        ))
+    db.add_all([Item(item_type='task', title=f"Task {i}", status='active') for i in range(3)])
+    db.commit()
+
+    app = FastAPI()
+
+    def override_get_db():
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.include_router(router)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    return engine, db, TestClient(app), statements
+
+
+def test_cursor_pages_cover_every_item_once():
+    """Pages of 4 walk all 25 inbox items in (created_at, id) DESC order."""
+    engine, db, client, statements = setup_test_db()
+    expected = [
+        item.id for item in
+        db.query(Item).filter(Item.status == 'inbox').order_by(Item.created_at.desc(), Item.id.desc())
+    ]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {'limit': 4, 'fields': 'id'}
+        if cursor:
+            params['cursor'] = cursor
+        response = client.get("/api/inbox/items", params=params)
+        assert response.status_code == 200
+        seen += [row['id'] for row in response.json()]
+        pages += 1
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert seen == expected
+    assert pages == 7
+    assert client.get("/api/inbox/items", params={'cursor': 'not-a-cursor'}).status_code == 400
+    assert client.get("/api/inbox/items", params={'limit': 0}).status_code == 422
+
+    print("[PASS] test_cursor_pages_cover_every_item_once")
+
+
+def test_fields_projection():
+    """Only requested fields are returned and read."""
+    engine, db, client, statements = setup_test_db()
+
+    full = client.get("/api/inbox/items", params={'limit': 2}).json()
+    assert set(full[0]) == {
+        'id', 'item_type', 'title', 'content_md', 'status', 'context_kind', 'context_id', 'confidence',
+        'suggested_route_json', 'tags', 'pinned', 'due_at', 'created_at', 'filed_at'
+    }
+    assert full[0]['tags'] == [] and full[1]['tags'] == ['t']
+    assert full[0]['pinned'] is False
+    assert full[0]['created_at'] == '2026-01-01T09:12:00'
+
+    statements.clear()
+    slim = client.get("/api/inbox/items", params={'limit': 2, 'fields': 'title,tags,id'}).json()
+    assert slim == [{'id': row['id'], 'title': row['title'], 'tags': row['tags']} for row in full]
+    assert not any('content_md' in s for s in statements)
+
+    response = client.get("/api/inbox/items", params={'fields': 'title,password'})
+    assert response.status_code == 400
+    assert 'password' in response.json()['detail']
+
+    print("[PASS] test_fields_projection")
+
+
+def test_etag_short_circuit():
+    """Matching If-None-Match -> 304 from a key-only query; changes -> new ETag."""
+    engine, db, client, statements = setup_test_db()
+
+    first = client.get("/api/inbox/items", params={'limit': 5})
+    etag = first.headers['ETag']
+
+    statements.clear()
+    cached = client.get("/api/inbox/items", params={'limit': 5}, headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.content == b''
+    assert cached.headers['ETag'] == etag
+    assert len(statements) == 1 and 'content_md' not in statements[0]
+
+    # Other representation of the same page
+    other = client.get("/api/inbox/items", params={'limit': 5, 'fields': 'id'}, headers={'If-None-Match': etag})
+    assert other.status_code == 200 and other.headers['ETag'] != etag
+
+    newest = db.query(Item).get(first.json()[0]['id'])
+    newest.title = "Renamed"
+    db.commit()
+    changed = client.get("/api/inbox/items", params={'limit': 5}, headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+    assert changed.json()[0]['title'] == "Renamed"
+
+    print("[PASS] test_etag_short_circuit")
@@ -0,0 +1,75 @@
+"""
+Tests for v0.53: Precompiled intent matcher
+
+Tests:
+- detect_intent returns the same (intent, confidence) as a re.search per
+  pattern, including overlapping patterns and tie-breaking by intent order
+- IntentMatcher counts each pattern once, wherever and however often it matches
+- Classifier helpers give the same results with precompiled regexes
+"""
+
+import re
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from marcus_app.services.agent_router import INTENT_PATTERNS, IntentMatcher, detect_intent
+from marcus_app.services.item_classifier import (
+    extract_class_codes, detect_item_type, parse_due_date, extract_tags
+)
+from bench_intent_matcher import build_corpus, old_detect_intent
+
+
+def test_detect_intent_matches_per_pattern_search():
+    """Recorded + generated commands: identical intent and confidence."""
+    corpus = build_corpus(500) + [
+        "",
+        "DEADLINE: submit by Friday, what's due?",   # create_deadline vs whats_due tie -> first intent
+        "add task: need to finish task: todo: now",  # 4 create_task patterns -> capped at 1.0
+        "what's in my inbox and show my inbox",
+        "tasks and notes",                            # no word-boundary match
+    ]
+    for command in corpus:
+        assert detect_intent(command) == old_detect_intent(command), command
+
+    assert detect_intent("add task: need to finish task: todo: now") == ('create_task', 1.0)
+    assert detect_intent("tasks and notes") == (None, 0.0)
+
+    print("[PASS] test_detect_intent_matches_per_pattern_search")
+
+
+def test_matcher_counts_each_pattern_once():
+    """Overlapping and repeated matches count one per pattern."""
+    matcher = IntentMatcher({
+        'a': [r'\bdead\w*', r'\bdeadlines?\b', r'\b(line|lines)\b'],
+        'b': [r'\bline\b'],
+    })
+    assert matcher.match_counts("deadline deadline line") == {'a': 3, 'b': 1}
+    assert matcher.match_counts("headline") == {}
+
+    try:
+        IntentMatcher({'a': [r'(?P<name>x)']})
+        assert False, "Should have raised error"
+    except ValueError:
+        pass
+
+    for intent, patterns in INTENT_PATTERNS.items():
+        for pattern in patterns:
+            assert IntentMatcher._non_capturing(pattern).count('(?:') >= pattern.count('(')
+
+    print("[PASS] test_matcher_counts_each_pattern_once")
+
+
+def test_classifier_helpers_unchanged():
+    """Precompiled classifier regexes give the previous results."""
+    assert sorted(extract_class_codes("PHYS214 and ece-347 and CS 101")) == ['CS101', 'ECE347', 'PHYS214']
+    assert detect_item_type("meeting tomorrow at 3pm", None, None) == ('event', 0.85)
+    assert detect_item_type("exam", None, None) == ('event', 0.60)
+    assert detect_item_type("finish homework task", None, None) == ('task', 0.85)
+    due = parse_due_date("quiz tomorrow at 9:45 pm")
+    assert (due.hour, due.minute) == (21, 45)
+    assert parse_due_date("call on friday 7am").hour == 7
+    assert extract_tags("read #ch4 and #exam_prep") == ['ch4', 'exam_prep']
+
+    print("[PASS] test_classifier_helpers_unchanged")
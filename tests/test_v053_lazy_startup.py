@@ -0,0 +1,55 @@
+"""
+Tests for v0.53: Lazy startup
+
+Tests:
+- Importing the API does not resolve the mount, create the engine or load models
+- Legacy module attributes (engine, ACTIVE_MOUNT) still resolve on access
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+
+
+def _run(code: str) -> str:
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(BASE_PATH),
+        capture_output=True,
+        text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout
+
+
+def test_api_import_has_no_storage_side_effects():
+    """Importing marcus_app.backend.api is cheap: no engine, mount or model."""
+    out = _run(
+        "import sys, marcus_app.backend.api\n"
+        "from marcus_app.core import database\n"
+        "print(database._engine is None, database._active_mount is None,"
+        " 'sentence_transformers' not in sys.modules)\n"
+    )
+    assert out.strip() == "True True True"
+
+    print("[PASS] test_api_import_has_no_storage_side_effects")
+
+
+def test_legacy_attributes_resolve_lazily():
+    """`from database import engine` still works and creates the engine on demand."""
+    from marcus_app.core import database
+
+    engine = database.engine
+    assert engine is database.get_engine()
+    assert database.ACTIVE_MOUNT == database.get_active_mount()
+    assert str(database.DB_PATH).endswith("marcus.db")
+
+    db = database.SessionLocal()
+    try:
+        assert db.get_bind() is engine
+    finally:
+        db.close()
+
+    print("[PASS] test_legacy_attributes_resolve_lazily")
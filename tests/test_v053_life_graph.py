@@ -0,0 +1,218 @@
+"""
+Tests for v0.53: Incremental life-graph
+
+Tests:
+- First build covers every entity (no 20/50-row caps) with class ->
+  mission -> box -> mission artifact edges
+- Creates, renames, re-parenting and deletes update nodes/edges in the
+  same flush; changes_since() returns exactly those rows, tombstones
+  included; rolled-back changes leave the graph untouched
+- sync_life_graph() reconciles writes that bypass the ORM and is a no-op
+  when nothing changed
+- neighbourhood() returns the k-hop subgraph and honours max_nodes
+- Core write paths (InboxBox bulk insert, box state compare-and-set)
+  update the graph too
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import (
+    Base, Class, Project, Mission, MissionBox, MissionArtifact, LifeGraphNode, LifeGraphEdge,
+    Assignment, Artifact, BoxState
+)
+from marcus_app.core.life_graph import (
+    install_life_graph_hooks, sync_life_graph, ensure_life_graph, current_version,
+    changes_since, live_graph, neighbourhood
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+
+
+def setup_test_db():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    install_life_graph_hooks(SessionLocal)
+    return engine, SessionLocal()
+
+
+def node(db, node_type, entity_id):
+    return db.query(LifeGraphNode).filter_by(node_type=node_type, entity_id=entity_id).one()
+
+
+def live_edges(db):
+    nodes = {n.id: (n.node_type, n.entity_id) for n in db.query(LifeGraphNode)}
+    return {
+        (nodes[e.source_node_id], nodes[e.target_node_id])
+        for e in db.query(LifeGraphEdge).filter(LifeGraphEdge.deleted == False)
+    }
+
+
+def seed_mission(db, cls, name="Exam prep", boxes=1):
+    mission = Mission(name=name, mission_type="exam_prep", class_id=cls.id)
+    db.add(mission)
+    db.flush()
+    for i in range(boxes):
+        box = MissionBox(mission_id=mission.id, box_type="ask", order_index=i)
+        db.add(box)
+        db.flush()
+        db.add(MissionArtifact(mission_id=mission.id, box_id=box.id, artifact_type="qa", title=f"Answer {i}"))
+    db.commit()
+    return mission
+
+
+def test_build_and_incremental_updates():
+    """Hooks keep the graph current once built; changes_since() sees each change."""
+    engine, db = setup_test_db()
+    classes = [Class(code=f"26SPECE{i:05d}", name=f"Class {i}") for i in range(25)]
+    db.add_all(classes)
+    db.commit()
+    mission = seed_mission(db, classes[0], boxes=60)
+
+    # Not built yet: hooks are a no-op
+    assert db.query(LifeGraphNode).count() == 0
+    version = ensure_life_graph(db)
+    assert version == 1
+    assert db.query(LifeGraphNode).filter_by(node_type="class").count() == 25
+    assert db.query(LifeGraphNode).filter_by(node_type="mission_box").count() == 60
+    assert db.query(LifeGraphNode).filter_by(node_type="mission_artifact").count() == 60
+    assert (("class", classes[0].id), ("mission", mission.id)) in live_edges(db)
+    assert len(live_edges(db)) == 1 + 60 + 60
+    assert ensure_life_graph(db) == version
+
+    # Create
+    project = Project(name="RedByte", root_path="/tmp/redbyte")
+    db.add(project)
+    db.commit()
+    nodes, edges = changes_since(db, version)
+    assert [(n.node_type, n.label, n.description) for n in nodes] == [("project", "RedByte", "Project: No description")]
+    assert edges == []
+    version = current_version(db.connection())
+
+    # Rename + re-parent (mission moves to another class)
+    mission.name = "Final review"
+    mission.class_id = classes[1].id
+    db.commit()
+    nodes, edges = changes_since(db, version)
+    assert [n.label for n in nodes] == ["Final review"]
+    assert [e.deleted for e in edges] == [True, False]
+    assert (("class", classes[1].id), ("mission", mission.id)) in live_edges(db)
+    assert (("class", classes[0].id), ("mission", mission.id)) not in live_edges(db)
+    version = current_version(db.connection())
+
+    # Irrelevant column: no new version
+    classes[2].status = "archived"
+    db.commit()
+    assert current_version(db.connection()) == version
+
+    # Delete -> tombstones for the node and its edges
+    artifact = db.query(MissionArtifact).first()
+    db.delete(artifact)
+    db.commit()
+    nodes, edges = changes_since(db, version)
+    assert [(n.node_type, n.deleted) for n in nodes] == [("mission_artifact", True)]
+    assert [e.deleted for e in edges] == [True]
+    assert node(db, "mission_artifact", artifact.id).deleted
+
+    # Rolled back with the entity change
+    version = current_version(db.connection())
+    db.add(Project(name="Scratch", root_path="/tmp/scratch"))
+    db.flush()
+    db.rollback()
+    assert current_version(db.connection()) == version
+    assert db.query(LifeGraphNode).filter_by(node_type="project").count() == 1
+
+    print("[PASS] test_build_and_incremental_updates")
+
+
+def test_sync_reconciles_out_of_band_writes():
+    """Raw SQL writes are picked up by sync_life_graph(); unchanged graph -> no new version."""
+    engine, db = setup_test_db()
+    cls = Class(code="26SPECE34701", name="Embedded")
+    db.add(cls)
+    db.commit()
+    mission = seed_mission(db, cls)
+    ensure_life_graph(db)
+    version = current_version(db.connection())
+
+    assert sync_life_graph(db) == {'upserted': 0, 'relinked': 0, 'deleted': 0, 'version': version}
+
+    db.execute(text("UPDATE classes SET name = 'Embedded Systems'"))
+    db.execute(text("UPDATE missions SET class_id = NULL"))
+    db.execute(text("DELETE FROM mission_artifacts"))
+    db.commit()
+    stats = sync_life_graph(db)
+    assert stats == {'upserted': 1, 'relinked': 1, 'deleted': 1, 'version': version + 1}
+    assert node(db, "class", cls.id).label == "Embedded Systems"
+    assert live_edges(db) == {(("mission", mission.id), ("mission_box", mission.boxes[0].id))}
+
+    print("[PASS] test_sync_reconciles_out_of_band_writes")
+
+
+def test_neighbourhood():
+    """k-hop subgraph around a focus node, capped at max_nodes."""
+    engine, db = setup_test_db()
+    cls = Class(code="26SPECE34701", name="Embedded")
+    db.add(cls)
+    db.commit()
+    ensure_life_graph(db)
+    mission = seed_mission(db, cls, boxes=3)
+    focus = node(db, "mission", mission.id).id
+
+    nodes, edges = neighbourhood(db, focus, hops=1)
+    assert sorted(n.node_type for n in nodes) == ["class", "mission", "mission_box", "mission_box", "mission_box"]
+    assert len(edges) == 4
+
+    nodes, edges = neighbourhood(db, focus, hops=2)
+    assert len(nodes) == 8 and len(edges) == 7
+
+    nodes, edges = neighbourhood(db, focus, hops=2, max_nodes=3)
+    assert len(nodes) == 3
+    assert all(e.source_node_id in {n.id for n in nodes} and e.target_node_id in {n.id for n in nodes} for e in edges)
+
+    all_nodes, all_edges = live_graph(db)
+    assert len(all_nodes) == 8 and len(all_edges) == 7
+
+    print("[PASS] test_neighbourhood")
+
+
+def test_core_write_paths():
+    """InboxBox's bulk-inserted artifacts and box state changes reach the graph."""
+    engine, db = setup_test_db()
+    cls = Class(code="PHYS214", name="Quantum Mechanics")
+    db.add(cls)
+    db.commit()
+    assignment = Assignment(class_id=cls.id, title="Midterm Prep")
+    db.add(assignment)
+    db.commit()
+    artifact = Artifact(
+        assignment_id=assignment.id, filename="notes.md", original_filename="notes.md",
+        file_path="/fake/notes.md", file_type="md"
+    )
+    db.add(artifact)
+    db.commit()
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Graph")
+    inbox = next(box for box in mission.boxes if box.box_type == "inbox")
+    ensure_life_graph(db)
+    version = current_version(db.connection())
+
+    BoxRunner.run_box(db, mission.id, inbox.id, {'artifact_ids': [artifact.id]})
+
+    created = db.query(MissionArtifact).filter_by(box_id=inbox.id).one()
+    assert node(db, "mission_artifact", created.id).label == "notes.md"
+    assert (("mission_box", inbox.id), ("mission_artifact", created.id)) in live_edges(db)
+    db.refresh(inbox)
+    assert inbox.state == BoxState.DONE.value
+    assert node(db, "mission_box", inbox.id).description == f"Box: inbox ({BoxState.DONE.value})"
+    assert current_version(db.connection()) > version
+
+    # Nothing left for a full reconcile to fix
+    stats = sync_life_graph(db)
+    assert (stats['upserted'], stats['relinked'], stats['deleted']) == (0, 0, 0)
+
+    print("[PASS] test_core_write_paths")
@@ -0,0 +1,203 @@
+"""
+Tests for v0.53: Mission citation index (mission_citations)
+
+Tests:
+- AskBox and PracticeBox index their citations with the artifact
+- CitationsBox report comes from GROUP BY queries; query count does not
+  grow with mission history
+- Backfill indexes pre-v0.53 artifacts once and matches the old report
+- Deleting a mission removes its citations
+"""
+
+import sys
+import json
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import (
+    Base, Class, Assignment, Artifact, ExtractedText, TextChunk,
+    MissionArtifact, MissionCitation, PracticeSession, PracticeItem
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.search_service import SearchService
+from marcus_app.services.box_runner import BoxRunner
+from migrate_to_v053 import backfill_mission_citations
+
+
+def setup_test_db():
+    """In-memory database with a mission over one chunked document."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    test_class = Class(code="PHYS214", name="Quantum Mechanics")
+    db.add(test_class)
+    db.commit()
+    assignment = Assignment(class_id=test_class.id, title="Midterm Prep")
+    db.add(assignment)
+    db.commit()
+
+    artifact = Artifact(
+        assignment_id=assignment.id,
+        filename="notes.md",
+        original_filename="notes.md",
+        file_path="/fake/notes.md",
+        file_type="md"
+    )
+    db.add(artifact)
+    db.flush()
+    extracted = ExtractedText(artifact_id=artifact.id, content="notes", extraction_method="test")
+    db.add(extracted)
+    db.flush()
+    chunk_ids = []
+    for index, section in enumerate(("Hamiltonian", "Eigenstates", "Tunneling")):
+        chunk = TextChunk(
+            extracted_text_id=extracted.id,
+            chunk_index=index,
+            content=f"{section}: the Schrodinger equation is H psi = E psi.",
+            artifact_id=artifact.id,
+            section_title=section,
+            word_count=8
+        )
+        db.add(chunk)
+        db.flush()
+        chunk_ids.append(chunk.id)
+    db.commit()
+
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Citations")
+    boxes = {box.box_type: box.id for box in mission.boxes}
+    BoxRunner.run_box(db, mission.id, boxes['inbox'], {'artifact_ids': [artifact.id]})
+
+    return engine, db, mission.id, boxes, artifact.id, chunk_ids
+
+
+def fake_search(monkeypatch, artifact_id, chunk_ids):
+    """AskBox search returning the given chunks as results."""
+    def search(**kwargs):
+        return [
+            {'chunk_id': chunk_id, 'artifact_id': artifact_id, 'snippet': 'H psi = E psi', 'score': 0.9}
+            for chunk_id in chunk_ids
+        ]
+    monkeypatch.setattr(SearchService, 'search', staticmethod(search))
+
+
+def ask(db, mission_id, boxes, question):
+    return BoxRunner.run_box(db, mission_id, boxes['ask'], {'question': question})
+
+
+def citations_report(db, mission_id, boxes):
+    return BoxRunner.run_box(db, mission_id, boxes['citations'], {}, force=True)['artifacts'][0]
+
+
+def test_boxes_index_citations(monkeypatch):
+    """QA and practice artifacts write one mission_citations row per citation."""
+    engine, db, mission_id, boxes, artifact_id, chunk_ids = setup_test_db()
+    fake_search(monkeypatch, artifact_id, chunk_ids[:2])
+
+    qa = ask(db, mission_id, boxes, "What is H?")['artifacts'][0]
+    practice = BoxRunner.run_box(db, mission_id, boxes['practice'], {'question_count': 3})['artifacts'][0]
+
+    rows = db.query(MissionCitation).order_by(MissionCitation.id).all()
+    assert [(r.mission_artifact_id, r.chunk_id) for r in rows if r.mission_artifact_id == qa['id']] == [
+        (qa['id'], chunk_ids[0]), (qa['id'], chunk_ids[1])
+    ]
+    practice_chunks = sorted(r.chunk_id for r in rows if r.mission_artifact_id == practice['id'])
+    assert practice_chunks == sorted(chunk_ids)
+    assert all(r.mission_id == mission_id and r.artifact_id == artifact_id for r in rows)
+
+    report = citations_report(db, mission_id, boxes)
+    assert report['total_citations'] == 5
+    assert f"- Chunk {chunk_ids[0]}: cited 2 time(s)" in report['report']
+    assert "- Unique chunks: 3" in report['report']
+    assert report['report'].index(f"Chunk {chunk_ids[0]}:") < report['report'].index(f"Chunk {chunk_ids[2]}:")
+
+    print("[PASS] test_boxes_index_citations")
+
+
+def test_report_query_count_is_constant(monkeypatch):
+    """Ten times more QA artifacts -> same number of SELECTs for the report."""
+    engine, db, mission_id, boxes, artifact_id, chunk_ids = setup_test_db()
+    fake_search(monkeypatch, artifact_id, chunk_ids)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    def report_selects():
+        statements.clear()
+        citations_report(db, mission_id, boxes)
+        return sum(1 for s in statements if s.lstrip().upper().startswith('SELECT'))
+
+    ask(db, mission_id, boxes, "Q0")
+    small = report_selects()
+    for i in range(1, 11):
+        ask(db, mission_id, boxes, f"Q{i}")
+    large = report_selects()
+
+    assert large == small
+    # Artifact blobs are only loaded by primary key, never for the whole mission
+    assert not any(
+        'mission_artifacts_source_refs_json' in s and 'WHERE mission_artifacts.id = ?' not in s
+        for s in statements
+    )
+
+    print("[PASS] test_report_query_count_is_constant")
+
+
+def test_backfill_indexes_old_artifacts():
+    """Pre-v0.53 QA/practice artifacts are indexed once by the migration."""
+    engine, db, mission_id, boxes, artifact_id, chunk_ids = setup_test_db()
+
+    qa = MissionArtifact(
+        mission_id=mission_id, box_id=boxes['ask'], artifact_type='qa', title='Old question',
+        content_json='{}',
+        source_refs_json=json.dumps({'citations': [
+            {'chunk_id': chunk_ids[1], 'artifact_id': artifact_id},
+            {'chunk_id': chunk_ids[1], 'artifact_id': artifact_id},
+        ]})
+    )
+    session = PracticeSession(mission_id=mission_id, state='active', score_json='{}')
+    db.add_all([qa, session])
+    db.flush()
+    db.add(PracticeItem(
+        session_id=session.id, prompt_md='Q1', state='unanswered',
+        citations_json=json.dumps([{'chunk_id': chunk_ids[2], 'artifact_id': artifact_id, 'page': None}])
+    ))
+    db.add(MissionArtifact(
+        mission_id=mission_id, box_id=boxes['practice'], artifact_type='practice_session',
+        title='Old practice', content_json='{}',
+        source_refs_json=json.dumps({'session_id': session.id, 'chunks_used': 1})
+    ))
+    db.add(MissionArtifact(
+        mission_id=mission_id, box_id=boxes['checker'], artifact_type='verification',
+        title='Check', content_json='ok', source_refs_json='not json'
+    ))
+    db.commit()
+
+    assert backfill_mission_citations(engine) == 3
+    assert backfill_mission_citations(engine) == 0
+
+    report = citations_report(db, mission_id, boxes)
+    assert report['total_citations'] == 3
+    assert f"- Chunk {chunk_ids[1]}: cited 2 time(s)" in report['report']
+    assert f"- Chunk {chunk_ids[2]}: cited 1 time(s)" in report['report']
+
+    print("[PASS] test_backfill_indexes_old_artifacts")
+
+
+def test_delete_mission_removes_citations(monkeypatch):
+    """Citations go with their mission."""
+    engine, db, mission_id, boxes, artifact_id, chunk_ids = setup_test_db()
+    fake_search(monkeypatch, artifact_id, chunk_ids)
+    ask(db, mission_id, boxes, "What is H?")
+    assert db.query(MissionCitation).count() == 3
+
+    MissionService.delete_mission(db, mission_id)
+
+    assert db.query(MissionCitation).count() == 0
+
+    print("[PASS] test_delete_mission_removes_citations")
@@ -0,0 +1,259 @@
+"""
+Tests for v0.53: DAG mission executor
+
+Uses a file-backed SQLite database (one session per worker thread).
+
+Tests:
+- Dependency graph derived from exam_prep box types/order
+- Full run: ask and practice run concurrently after extract
+- Boxes without required input are skipped, dependents still run
+- Failed box blocks dependents; resuming re-runs only unfinished boxes
+- Boxes skipped for missing input run on resume once it is supplied,
+  together with the DONE boxes downstream of them
+- Interrupted run (box left RUNNING) resumes
+"""
+
+import sys
+import json
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import (
+    Base, Class, Assignment, Artifact, ExtractedText, MissionBox, MissionRun, BoxState
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+from marcus_app.services.mission_executor import MissionExecutor, build_dependency_graph
+
+
+def setup_test_db(tmp_path):
+    """File-backed test database with one extracted artifact and an exam_prep mission."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'missions.db'}",
+        connect_args={"check_same_thread": False},
+        echo=False
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    test_class = Class(code="PHYS214", name="Physics")
+    db.add(test_class)
+    db.commit()
+
+    test_assignment = Assignment(class_id=test_class.id, title="Midterm")
+    db.add(test_assignment)
+    db.commit()
+
+    test_artifact = Artifact(
+        assignment_id=test_assignment.id,
+        filename="notes.md",
+        original_filename="notes.md",
+        file_path="/fake/path/notes.md",
+        file_type="md"
+    )
+    db.add(test_artifact)
+    db.commit()
+
+    db.add(ExtractedText(
+        artifact_id=test_artifact.id,
+        content="Torque is defined as r x F.\n\nMoment of inertia resists angular acceleration.",
+        extraction_method="test",
+        extraction_status="success"
+    ))
+    db.commit()
+
+    mission = MissionService.create_from_template(
+        db=db, template_name='exam_prep', mission_name="Midterm Prep"
+    )
+
+    return SessionLocal, db, mission, test_artifact
+
+
+def _inputs(artifact):
+    return {
+        'inbox': {'artifact_ids': [artifact.id]},
+        'ask': {'question': 'What is torque?'}
+    }
+
+
+def test_dependency_graph_exam_prep(tmp_path):
+    """ask/practice depend only on extract; citations waits for ask, practice, checker."""
+    _, db, mission, _ = setup_test_db(tmp_path)
+    boxes = {b.box_type: b.id for b in mission.boxes}
+    graph = build_dependency_graph(mission.boxes)
+
+    assert graph[boxes['inbox']] == set()
+    assert graph[boxes['extract']] == {boxes['inbox']}
+    assert graph[boxes['ask']] == {boxes['extract']}
+    assert graph[boxes['practice']] == {boxes['extract']}
+    assert graph[boxes['checker']] == {boxes['practice']}
+    assert graph[boxes['citations']] == {boxes['ask'], boxes['practice'], boxes['checker']}
+
+    print("[PASS] test_dependency_graph_exam_prep")
+
+
+def test_full_run_parallel_branches(tmp_path, monkeypatch):
+    """ask and practice overlap; checker is skipped (no answer); citations runs last."""
+    SessionLocal, db, mission, artifact = setup_test_db(tmp_path)
+
+    # Both branches must be inside the barrier at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    original_ask = BoxRunner._run_ask_box
+    original_practice = BoxRunner._run_practice_box
+
+    def ask(*args, **kwargs):
+        barrier.wait()
+        return original_ask(*args, **kwargs)
+
+    def practice(*args, **kwargs):
+        barrier.wait()
+        return original_practice(*args, **kwargs)
+
+    monkeypatch.setattr(BoxRunner, '_run_ask_box', staticmethod(ask))
+    monkeypatch.setattr(BoxRunner, '_run_practice_box', staticmethod(practice))
+
+    events = []
+    run = MissionExecutor(SessionLocal, on_event=events.append).run(mission.id, inputs=_inputs(artifact))
+
+    boxes = {b.box_type: b.id for b in mission.boxes}
+    states = {box_type: run['boxes'][box_id]['state'] for box_type, box_id in boxes.items()}
+    assert run['state'] == 'done'
+    assert states == {
+        'inbox': 'done', 'extract': 'done', 'ask': 'done',
+        'practice': 'done', 'checker': 'skipped', 'citations': 'done'
+    }
+
+    order = [(e['box_type'], e['state']) for e in events if e['box_id']]
+    assert order.index(('citations', 'running')) > order.index(('ask', 'done'))
+    assert order.index(('citations', 'running')) > order.index(('practice', 'done'))
+    assert events[-1]['box_id'] is None and events[-1]['state'] == 'done'
+
+    db.expire_all()
+    for box in db.query(MissionBox).filter(MissionBox.mission_id == mission.id):
+        expected = BoxState.IDLE.value if box.box_type == 'checker' else BoxState.DONE.value
+        assert box.state == expected
+
+    print("[PASS] test_full_run_parallel_branches")
+
+
+def test_failure_blocks_and_resume(tmp_path, monkeypatch):
+    """A failed box blocks citations; the resumed run re-executes only what is unfinished."""
+    SessionLocal, db, mission, artifact = setup_test_db(tmp_path)
+
+    executed = []
+    original_execute = BoxRunner._execute_box_type
+
+    def counting_execute(db, box, mission_id, input_payload):
+        executed.append(box.box_type)
+        return original_execute(db=db, box=box, mission_id=mission_id, input_payload=input_payload)
+
+    def failing_practice(*args, **kwargs):
+        raise RuntimeError("practice generator crashed")
+
+    monkeypatch.setattr(BoxRunner, '_execute_box_type', staticmethod(counting_execute))
+    monkeypatch.setattr(BoxRunner, '_run_practice_box', staticmethod(failing_practice))
+
+    first = MissionExecutor(SessionLocal).run(mission.id, inputs=_inputs(artifact))
+    boxes = {b.box_type: b.id for b in mission.boxes}
+    assert first['state'] == 'error'
+    assert first['boxes'][boxes['practice']]['state'] == 'error'
+    assert first['boxes'][boxes['citations']]['state'] == 'blocked'
+    assert sorted(executed) == ['ask', 'extract', 'inbox', 'practice']
+
+    monkeypatch.undo()
+    monkeypatch.setattr(BoxRunner, '_execute_box_type', staticmethod(counting_execute))
+    executed.clear()
+
+    # Inputs come from the stored run record
+    second = MissionExecutor(SessionLocal).run(mission.id)
+    assert second['run_id'] == first['run_id']
+    assert second['state'] == 'done'
+    assert executed == ['practice', 'citations']
+
+    print("[PASS] test_failure_blocks_and_resume")
+
+
+def test_interrupted_run_resumes(tmp_path):
+    """Record left 'running' with a box stuck RUNNING (crash) is picked up again."""
+    SessionLocal, db, mission, artifact = setup_test_db(tmp_path)
+    boxes = {b.box_type: b for b in mission.boxes}
+
+    # Simulate a crash after inbox finished and extract started
+    BoxRunner.run_box(db, mission.id, boxes['inbox'].id, {'artifact_ids': [artifact.id]})
+    boxes['extract'].state = BoxState.RUNNING.value
+    db.add(MissionRun(
+        mission_id=mission.id,
+        state='running',
+        inputs_json=json.dumps(_inputs(artifact)),
+        box_states_json=json.dumps({
+            str(boxes['inbox'].id): {'state': 'done', 'error': None, 'artifact_ids': []},
+            str(boxes['extract'].id): {'state': 'running', 'error': None, 'artifact_ids': []}
+        })
+    ))
+    db.commit()
+
+    run = MissionExecutor(SessionLocal).run(mission.id)
+    assert run['state'] == 'done'
+    assert run['boxes'][boxes['extract'].id]['state'] == 'done'
+    assert db.query(MissionRun).count() == 1
+
+    print("[PASS] test_interrupted_run_resumes")
+
+
+def test_resume_retries_skipped_boxes(tmp_path, monkeypatch):
+    """Input supplied on resume: the skipped box runs, and so do boxes that ran without it."""
+    SessionLocal, db, mission, artifact = setup_test_db(tmp_path)
+    boxes = {b.box_type: b.id for b in mission.boxes}
+
+    executed = []
+    original_execute = BoxRunner._execute_box_type
+
+    def counting_execute(db, box, mission_id, input_payload):
+        executed.append(box.box_type)
+        return original_execute(db=db, box=box, mission_id=mission_id, input_payload=input_payload)
+
+    def failing_practice(*args, **kwargs):
+        raise RuntimeError("practice generator crashed")
+
+    monkeypatch.setattr(BoxRunner, '_execute_box_type', staticmethod(counting_execute))
+    monkeypatch.setattr(BoxRunner, '_run_practice_box', staticmethod(failing_practice))
+
+    # No question yet
+    first = MissionExecutor(SessionLocal).run(mission.id, inputs={'inbox': {'artifact_ids': [artifact.id]}})
+    assert first['state'] == 'error'
+    assert first['boxes'][boxes['ask']]['state'] == 'skipped'
+
+    monkeypatch.undo()
+    monkeypatch.setattr(BoxRunner, '_execute_box_type', staticmethod(counting_execute))
+    executed.clear()
+
+    second = MissionExecutor(SessionLocal).run(mission.id, inputs=_inputs(artifact))
+    assert second['run_id'] == first['run_id']
+    assert second['state'] == 'done'
+    assert second['boxes'][boxes['ask']]['state'] == 'done'
+    assert sorted(executed) == ['ask', 'citations', 'practice']
+
+    # Citations finished without the ask output (run stopped before it was
+    # marked done): it is re-run once ask has its question
+    db.add(MissionRun(
+        mission_id=mission.id,
+        state='error',
+        inputs_json=json.dumps({}),
+        box_states_json=json.dumps({
+            str(box_id): {'state': 'skipped' if box_type in ('ask', 'checker') else 'done', 'error': None, 'artifact_ids': []}
+            for box_type, box_id in boxes.items()
+        })
+    ))
+    db.commit()
+    executed.clear()
+
+    third = MissionExecutor(SessionLocal).run(mission.id, inputs={'ask': {'question': 'What is inertia?'}})
+    assert third['state'] == 'done'
+    assert executed == ['ask', 'citations']
+
+    print("[PASS] test_resume_retries_skipped_boxes")
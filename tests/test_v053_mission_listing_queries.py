@@ -0,0 +1,181 @@
+"""
+Tests for v0.53: Eager-loaded mission listing and detail queries
+
+Tests:
+- Listing issues a constant number of queries regardless of mission count
+- Counts match the relationship lengths
+- Keyset pagination walks every mission exactly once
+- Mission detail query count is independent of practice session count
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from contextlib import contextmanager
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from marcus_app.core.database import get_db
+from marcus_app.core.models import (
+    Base, Mission, MissionArtifact, PracticeSession, PracticeItem
+)
+from marcus_app.services.mission_service import MissionService, MissionServiceError
+
+
+def setup_test_db(mission_count=20, sessions_per_mission=3):
+    """In-memory database with exam_prep missions, artifacts and practice sessions."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+
+    same_time = datetime(2026, 1, 1, 12, 0, 0)
+    for i in range(mission_count):
+        mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name=f"M{i}")
+        # Half the missions share a timestamp to exercise the id tie-break
+        if i % 2:
+            mission.created_at = same_time
+        for j in range(i % 4):
+            db.add(MissionArtifact(mission_id=mission.id, artifact_type='note', title=f"note {j}", content_json="x"))
+        for _ in range(sessions_per_mission):
+            session = PracticeSession(mission_id=mission.id)
+            db.add(session)
+            db.flush()
+            for k in range(2):
+                db.add(PracticeItem(session_id=session.id, prompt_md=f"Q{k}"))
+    db.commit()
+
+    return engine, SessionLocal, db
+
+
+@contextmanager
+def count_queries(engine):
+    """Count SQL statements executed on engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def make_client(SessionLocal):
+    from marcus_app.backend.mission_routes import router
+
+    app = FastAPI()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_listing_query_count_is_constant():
+    """GET /api/missions: one query for 5 or 40 missions."""
+    counts = []
+    for mission_count in (5, 40):
+        engine, SessionLocal, db = setup_test_db(mission_count)
+        client = make_client(SessionLocal)
+
+        with count_queries(engine) as statements:
+            response = client.get("/api/missions")
+
+        assert response.status_code == 200
+        assert len(response.json()) == mission_count
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1] == 1, counts
+
+    print("[PASS] test_listing_query_count_is_constant")
+
+
+def test_listing_counts_match_relationships():
+    """box_count/artifact_count equal len(mission.boxes)/len(mission.artifacts)."""
+    engine, SessionLocal, db = setup_test_db(8)
+
+    rows, next_cursor = MissionService.list_missions_with_counts(db)
+    assert next_cursor is None
+    assert len(rows) == 8
+    for row in rows:
+        mission = row['mission']
+        assert row['box_count'] == len(mission.boxes) == 6
+        assert row['artifact_count'] == len(mission.artifacts)
+
+    print("[PASS] test_listing_counts_match_relationships")
+
+
+def test_keyset_pagination():
+    """Pages in (created_at DESC, id DESC) order cover all missions once."""
+    engine, SessionLocal, db = setup_test_db(13)
+    client = make_client(SessionLocal)
+
+    expected = [m.id for m in db.query(Mission).order_by(Mission.created_at.desc(), Mission.id.desc())]
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 5}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/missions", params=params)
+        assert response.status_code == 200
+        seen.extend(m['id'] for m in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == expected
+    assert pages == 3
+
+    assert client.get("/api/missions", params={"cursor": "garbage"}).status_code == 400
+    try:
+        MissionService.decode_cursor("not-a-cursor")
+        assert False, "Should have raised error"
+    except MissionServiceError:
+        pass
+
+    print("[PASS] test_keyset_pagination")
+
+
+def test_detail_query_count_independent_of_sessions():
+    """GET /api/missions/{id}: same query count for 1 or 25 practice sessions."""
+    counts = []
+    for sessions in (1, 25):
+        engine, SessionLocal, db = setup_test_db(1, sessions_per_mission=sessions)
+        mission_id = db.query(Mission.id).scalar()
+        client = make_client(SessionLocal)
+
+        with count_queries(engine) as statements:
+            response = client.get(f"/api/missions/{mission_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data['practice_sessions']) == sessions
+        assert all(s['item_count'] == 2 for s in data['practice_sessions'])
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1] <= 5, counts
+
+    print("[PASS] test_detail_query_count_independent_of_sessions")
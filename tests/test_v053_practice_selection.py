@@ -0,0 +1,194 @@
+"""
+Tests for v0.53: PracticeBox chunk selection (FTS5 ranking + MMR diversity)
+
+Tests:
+- Keyword selection ranks by bm25, stays inside the mission's artifacts and
+  sees chunks added after the index was built (sync triggers)
+- MMR skips near-duplicates in favour of a distinct topic
+- Without keywords, questions are spread across sections
+- Without an FTS table, selection falls back to the LIKE filter
+- PracticeBox cites the selected chunks
+"""
+
+import sys
+import json
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import (
+    Base, Class, Assignment, Artifact, ExtractedText, TextChunk, PracticeItem
+)
+from marcus_app.services.mission_service import MissionService
+from marcus_app.services.box_runner import BoxRunner
+from marcus_app.services.chunk_selection import ChunkSelectionService, mmr
+from migrate_to_v053 import sync_chunk_fts
+
+
+def setup_test_db(with_fts=True):
+    """In-memory database with a mission over two documents and one outside document."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    if with_fts:
+        with engine.begin() as conn:
+            conn.execute(text("""
+                CREATE VIRTUAL TABLE text_chunks_fts USING fts5(
+                    content, section_title,
+                    content='text_chunks', content_rowid='id',
+                    tokenize='porter unicode61'
+                )
+            """))
+            sync_chunk_fts(conn)
+    db = sessionmaker(bind=engine)()
+
+    test_class = Class(code="PHYS214", name="Quantum Mechanics")
+    db.add(test_class)
+    db.commit()
+    assignment = Assignment(class_id=test_class.id, title="Midterm Prep")
+    db.add(assignment)
+    db.commit()
+
+    artifacts = {}
+    for name in ("mechanics", "waves", "outside"):
+        artifact = Artifact(
+            assignment_id=assignment.id,
+            filename=f"{name}.md",
+            original_filename=f"{name}.md",
+            file_path=f"/fake/{name}.md",
+            file_type="md"
+        )
+        db.add(artifact)
+        db.flush()
+        extracted = ExtractedText(
+            artifact_id=artifact.id,
+            content=name,
+            extraction_method="test",
+            extraction_status="success"
+        )
+        db.add(extracted)
+        db.flush()
+        artifacts[name] = (artifact.id, extracted.id)
+    db.commit()
+
+    mission = MissionService.create_from_template(db=db, template_name="exam_prep", mission_name="Practice")
+    boxes = {box.box_type: box.id for box in mission.boxes}
+    BoxRunner.run_box(db, mission.id, boxes['inbox'], {
+        'artifact_ids': [artifacts['mechanics'][0], artifacts['waves'][0]]
+    })
+
+    return db, mission.id, boxes, artifacts
+
+
+def add_chunks(db, artifacts, name, chunks):
+    """Insert (section_title, content) chunks for one document; returns their ids."""
+    artifact_id, extracted_id = artifacts[name]
+    rows = []
+    for index, (section, content) in enumerate(chunks):
+        chunk = TextChunk(
+            extracted_text_id=extracted_id,
+            chunk_index=index,
+            content=content,
+            artifact_id=artifact_id,
+            section_title=section,
+            word_count=len(content.split())
+        )
+        db.add(chunk)
+        rows.append(chunk)
+    db.commit()
+    return [c.id for c in rows]
+
+
+def test_keywords_ranked_and_scoped():
+    """bm25 order, mission artifacts only, trigger-indexed chunks visible."""
+    db, mission_id, boxes, artifacts = setup_test_db()
+    strong, weak, unrelated = add_chunks(db, artifacts, "mechanics", [
+        ("Torque", "Torque torque torque: torque equals r cross F."),
+        ("Rotation", "Angular acceleration follows from the net torque on a rigid body and its moment of inertia."),
+        ("Energy", "Kinetic energy is one half m v squared."),
+    ])
+    add_chunks(db, artifacts, "outside", [("Torque", "Torque torque torque torque torque.")])
+
+    mission_artifact_ids = [artifacts['mechanics'][0], artifacts['waves'][0]]
+    chunks = ChunkSelectionService.select_for_practice(db, mission_artifact_ids, 5, "torque")
+
+    assert [c.id for c in chunks] == [strong, weak]
+    assert unrelated not in [c.id for c in chunks]
+
+    print("[PASS] test_keywords_ranked_and_scoped")
+
+
+def test_mmr_prefers_distinct_topics():
+    """Two near-identical top candidates: the second pick is the distinct one."""
+    topics = [{"torque", "lever", "arm"}, {"torque", "lever", "arm"}, {"photon", "energy"}]
+
+    def similarity(a, b):
+        return len(topics[a] & topics[b]) / len(topics[a] | topics[b])
+
+    assert mmr([1.0, 0.95, 0.6], similarity, 2) == [0, 2]
+    assert mmr([1.0, 0.95, 0.6], similarity, 2, lambda_=1.0) == [0, 1]
+    assert mmr([0.5, 0.5, 0.5], lambda a, b: 0.0, 3) == [0, 1, 2]
+
+    print("[PASS] test_mmr_prefers_distinct_topics")
+
+
+def test_no_keywords_spreads_sections():
+    """Ten chunks of one section and one each of two others: one question per section."""
+    db, mission_id, boxes, artifacts = setup_test_db()
+    add_chunks(db, artifacts, "mechanics", [
+        ("Kinematics", f"Kinematics example {i}: velocity is the derivative of position.") for i in range(10)
+    ])
+    dynamics = add_chunks(db, artifacts, "mechanics", [("Dynamics", "Newton's second law: F equals m a.")])
+    waves = add_chunks(db, artifacts, "waves", [("Waves", "Wave speed equals frequency times wavelength.")])
+
+    chunks = ChunkSelectionService.select_for_practice(
+        db, [artifacts['mechanics'][0], artifacts['waves'][0]], 3
+    )
+
+    assert {c.section_title for c in chunks} == {"Kinematics", "Dynamics", "Waves"}
+    assert dynamics[0] in [c.id for c in chunks] and waves[0] in [c.id for c in chunks]
+
+    print("[PASS] test_no_keywords_spreads_sections")
+
+
+def test_like_fallback_without_fts():
+    """No text_chunks_fts table: keyword selection still works via LIKE."""
+    db, mission_id, boxes, artifacts = setup_test_db(with_fts=False)
+    match, _ = add_chunks(db, artifacts, "waves", [
+        ("Interference", "Constructive interference happens when waves are in phase."),
+        ("Doppler", "The Doppler effect shifts observed frequency."),
+    ])
+
+    chunks = ChunkSelectionService.select_for_practice(db, [artifacts['waves'][0]], 3, "interference")
+
+    assert [c.id for c in chunks] == [match]
+
+    print("[PASS] test_like_fallback_without_fts")
+
+
+def test_practice_box_cites_selected_chunks():
+    """PracticeBox questions come from distinct, on-topic mission chunks."""
+    db, mission_id, boxes, artifacts = setup_test_db()
+    add_chunks(db, artifacts, "mechanics", [
+        ("Torque", "Torque is defined as r cross F and causes angular acceleration."),
+        ("Torque", "Torque is defined as r cross F and causes angular acceleration!"),
+        ("Levers", "A longer lever arm increases torque for the same applied force."),
+        ("Energy", "Kinetic energy is one half m v squared."),
+    ])
+    add_chunks(db, artifacts, "outside", [("Torque", "Torque torque torque.")])
+
+    result = BoxRunner.run_box(db, mission_id, boxes['practice'], {
+        'topic_keywords': 'torque',
+        'question_count': 2
+    })
+    session_id = result['artifacts'][0]['session_id']
+    items = db.query(PracticeItem).filter(PracticeItem.session_id == session_id).all()
+    cited = [db.query(TextChunk).get(json.loads(i.citations_json)[0]['chunk_id']) for i in items]
+
+    assert len(items) == 2
+    assert {c.section_title for c in cited} == {"Torque", "Levers"}
+    assert all(c.artifact_id == artifacts['mechanics'][0] for c in cited)
+
+    print("[PASS] test_practice_box_cites_selected_chunks")
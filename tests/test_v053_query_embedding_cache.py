@@ -0,0 +1,115 @@
+"""
+Tests for v0.53: Query-embedding LRU cache
+
+Tests:
+- Normalized variants of a query share one forward pass
+- LRU eviction at maxsize; hit-rate metrics
+- Entries are keyed by model_id (no cross-backend reuse)
+- Cache is shared between EmbeddingService instances and used by search
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marcus_app.services.embedding_service import (
+    EmbeddingService, EmbeddingBackend, QueryEmbeddingCache
+)
+
+
+class CountingBackend(EmbeddingBackend):
+    name = "counting"
+
+    def __init__(self, model_name="stub-model"):
+        super().__init__(model_name)
+        self.encoded = []
+
+    def load(self):
+        self.dimension = 2
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def make_service(cache, backend=None):
+    service = EmbeddingService(backend=backend or CountingBackend(), query_cache=cache)
+    assert service.ensure_loaded()
+    return service
+
+
+def test_normalized_variants_share_entry():
+    """Case/whitespace variants hit the cache; the normalized text is embedded."""
+    cache = QueryEmbeddingCache(maxsize=8)
+    service = make_service(cache)
+
+    first = service.embed_query("Torque  Calculation")
+    second = service.embed_query("  torque calculation\n")
+
+    assert first == second == [18.0, 1.0]
+    assert service.backend.encoded == ["torque calculation"]
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+
+    # Callers get their own copy
+    first.append(99.0)
+    assert service.embed_query("torque calculation") == [18.0, 1.0]
+
+    print("[PASS] test_normalized_variants_share_entry")
+
+
+def test_lru_eviction():
+    """Least recently used query is evicted at maxsize."""
+    cache = QueryEmbeddingCache(maxsize=2)
+    service = make_service(cache)
+
+    service.embed_query("a")
+    service.embed_query("b")
+    service.embed_query("a")  # a is now most recent
+    service.embed_query("c")  # evicts b
+
+    assert cache.stats()['size'] == 2
+    assert cache.stats()['evictions'] == 1
+
+    service.embed_query("a")
+    assert service.backend.encoded == ["a", "b", "c"]
+    service.embed_query("b")
+    assert service.backend.encoded == ["a", "b", "c", "b"]
+
+    print("[PASS] test_lru_eviction")
+
+
+def test_keyed_by_model():
+    """Two backends sharing a cache never reuse each other's vectors."""
+    cache = QueryEmbeddingCache(maxsize=8)
+    service_a = make_service(cache)
+
+    other = CountingBackend()
+    other.name = "counting-v2"
+    service_b = make_service(cache, backend=other)
+
+    service_a.embed_query("metastability")
+    service_b.embed_query("metastability")
+    service_a.embed_query("metastability")
+
+    assert service_a.backend.encoded == ["metastability"]
+    assert service_b.backend.encoded == ["metastability"]
+    assert cache.stats()['hits'] == 1
+
+    print("[PASS] test_keyed_by_model")
+
+
+def test_shared_default_cache_reported_in_model_info():
+    """Services built without an explicit cache share the process-wide one."""
+    service_a = EmbeddingService(backend=CountingBackend())
+    service_b = EmbeddingService(backend=CountingBackend())
+    assert service_a.query_cache is service_b.query_cache
+
+    service_a.ensure_loaded()
+    info = service_a.get_model_info()
+    assert set(info['query_cache']) >= {'hits', 'misses', 'hit_rate', 'size', 'maxsize'}
+
+    print("[PASS] test_shared_default_cache_reported_in_model_info")
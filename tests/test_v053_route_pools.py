@@ -0,0 +1,131 @@
+"""
+Tests for v0.53: Bounded pools for blocking route work
+
+Tests:
+- run_in_pool keeps the handler's FastAPI parameters and runs it on the named pool
+- Event loop stays responsive while a pooled handler blocks
+- Pool size bounds concurrency per subsystem
+- Converted routers import and expose sync handlers
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI, Depends
+from fastapi.testclient import TestClient
+
+from marcus_app.core import executors
+from marcus_app.core.executors import run_in_pool, run_blocking, pool_stats
+
+
+def _get_token():
+    return "token"
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    @run_in_pool("git")
+    def read_item(item_id: int, verbose: bool = False, token: str = Depends(_get_token)):
+        return {
+            "item_id": item_id,
+            "verbose": verbose,
+            "token": token,
+            "thread": threading.current_thread().name
+        }
+
+    @app.get("/slow")
+    @run_in_pool("extraction")
+    def slow():
+        time.sleep(0.5)
+        return {"done": True}
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    return app
+
+
+def test_run_in_pool_preserves_signature():
+    """Path/query params and dependencies resolve; handler runs on the git pool."""
+    client = TestClient(make_app())
+    response = client.get("/items/7?verbose=true")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["item_id"] == 7
+    assert data["verbose"] is True
+    assert data["token"] == "token"
+    assert data["thread"].startswith("marcus-git")
+    assert pool_stats()["git"]["completed"] >= 1
+
+    print("[PASS] test_run_in_pool_preserves_signature")
+
+
+def test_event_loop_stays_responsive():
+    """A blocking handler on the extraction pool does not delay /ping."""
+    app = make_app()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            slow = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.05)
+
+            start = time.perf_counter()
+            ping = await client.get("/ping")
+            ping_latency = time.perf_counter() - start
+
+            assert ping.status_code == 200
+            assert not slow.done()
+            assert (await slow).status_code == 200
+            return ping_latency
+
+    assert asyncio.run(scenario()) < 0.25
+
+    print("[PASS] test_event_loop_stays_responsive")
+
+
+def test_pool_bounds_concurrency(monkeypatch):
+    """A 1-worker pool runs blocking calls one at a time."""
+    monkeypatch.setitem(executors.POOL_LIMITS, "test-serial", ("MARCUS_TEST_SERIAL_WORKERS", 1))
+
+    async def scenario():
+        start = time.perf_counter()
+        await asyncio.gather(*(run_blocking("test-serial", time.sleep, 0.1) for _ in range(3)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(scenario()) >= 0.3
+    stats = pool_stats()["test-serial"]
+    assert stats["max_workers"] == 1
+    assert stats["completed"] == 3
+    assert stats["active"] == 0 and stats["queued"] == 0
+
+    print("[PASS] test_pool_bounds_concurrency")
+
+
+def test_routers_have_no_blocking_async_handlers():
+    """Converted routers: every endpoint is sync or a pooled wrapper."""
+    import inspect
+    from marcus_app.backend import (
+        mission_routes, inbox_routes, agent_routes, projects_routes,
+        dev_mode_routes, life_graph_routes
+    )
+
+    for module in (mission_routes, inbox_routes, agent_routes, projects_routes,
+                   dev_mode_routes, life_graph_routes):
+        for route in module.router.routes:
+            endpoint = route.endpoint
+            if inspect.iscoroutinefunction(endpoint):
+                # Only run_in_pool wrappers may be async
+                assert hasattr(endpoint, "__wrapped__"), (module.__name__, route.path)
+                assert not inspect.iscoroutinefunction(endpoint.__wrapped__)
+
+    print("[PASS] test_routers_have_no_blocking_async_handlers")
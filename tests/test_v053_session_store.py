@@ -0,0 +1,108 @@
+"""
+Tests for v0.53: In-memory session store with heap expiry
+
+Tests:
+- Sessions expire after 15 minutes idle; activity keeps them alive
+- Activity writes are coalesced to the store's resolution
+- sweep() drops idle sessions without validation, keeps active ones,
+  and ignores logged-out tokens
+- get_session_info reports idle time from the monotonic clock
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marcus_app.services.auth_service import AuthService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def setup_service():
+    clock = FakeClock()
+    return AuthService(clock=clock), clock
+
+
+def test_idle_timeout():
+    """Valid while active, gone after 15 minutes without activity."""
+    service, clock = setup_service()
+    token = service.create_session()
+
+    for _ in range(20):
+        clock.now += 600
+        assert service.validate_session(token)
+
+    clock.now += 900
+    assert service.validate_session(token)   # exactly at the timeout
+    clock.now += 900.5
+    assert not service.validate_session(token)
+    assert token not in service.sessions
+    assert not service.validate_session("unknown")
+
+    print("[PASS] test_idle_timeout")
+
+
+def test_activity_writes_coalesced():
+    """Repeated validations within the resolution leave last_activity alone."""
+    service, clock = setup_service()
+    token = service.create_session()
+    record = service.sessions.get(token)
+    created = record.last_activity
+
+    for _ in range(50):
+        clock.now += 0.01
+        assert service.validate_session(token)
+    assert record.last_activity == created
+
+    clock.now += 0.6
+    assert service.validate_session(token)
+    assert record.last_activity == clock.now
+
+    print("[PASS] test_activity_writes_coalesced")
+
+
+def test_sweep_removes_only_idle_sessions():
+    """Sweep deletes never-revalidated sessions and reschedules active ones."""
+    service, clock = setup_service()
+    idle = [service.create_session() for _ in range(5)]
+    active = service.create_session()
+    logged_out = service.create_session()
+    service.invalidate_session(logged_out)
+
+    clock.now += 800
+    assert service.validate_session(active)
+    assert service.sweep_expired_sessions() == 0
+
+    clock.now += 200
+    assert service.sweep_expired_sessions() == 5
+    assert len(service.sessions) == 1 and active in service.sessions
+    assert service.sweep_expired_sessions() == 0
+
+    clock.now += 1000
+    assert service.sweep_expired_sessions() == 1
+    assert len(service.sessions) == 0
+    assert not any(service.validate_session(token) for token in idle + [active])
+
+    print("[PASS] test_sweep_removes_only_idle_sessions")
+
+
+def test_session_info():
+    """Idle seconds come from the monotonic clock."""
+    service, clock = setup_service()
+    token = service.create_session("student")
+    clock.now += 42
+
+    info = service.get_session_info(token)
+    assert info["user_id"] == "student"
+    assert info["idle_seconds"] == 42
+    assert datetime.utcnow() - datetime.fromisoformat(info["last_activity"]) >= timedelta(seconds=41)
+    assert service.get_session_info("unknown") is None
+
+    print("[PASS] test_session_info")
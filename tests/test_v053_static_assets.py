@@ -0,0 +1,121 @@
+"""
+Tests for v0.53: Static asset delivery
+
+Tests:
+- HTML references point at content-versioned URLs; those are served as
+  immutable, plain URLs revalidate; gzip negotiated from Accept-Encoding
+- If-None-Match with a current ETag -> 304; changed content -> new version
+- Session check on every asset (memoized cookie parse never outlives a
+  logout); login.html public; files added after startup still served
+"""
+
+import gzip
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from marcus_app.backend.static_assets import AuthStaticFiles, IMMUTABLE_CACHE, REVALIDATE_CACHE
+from marcus_app.services.auth_service import AuthService
+
+APP_JS = "function main() {\n" + "    console.log('marcus');\n" * 40 + "}\n"
+
+
+def setup_frontend(tmp_path, app_js=APP_JS):
+    frontend = tmp_path / "frontend"
+    frontend.mkdir(exist_ok=True)
+    (frontend / "app.js").write_text(app_js)
+    (frontend / "tiny.css").write_text("body{}")
+    (frontend / "index.html").write_text(
+        '<link rel="stylesheet" href="/static/tiny.css">\n<script src="/static/app.js"></script>\n'
+        '<a href="/static/missing.js">x</a>'
+    )
+    (frontend / "login.html").write_text("<form>login</form>")
+
+    auth_service = AuthService()
+    app = FastAPI()
+    static = AuthStaticFiles(directory=str(frontend), validate_session=auth_service.validate_session)
+    app.mount("/static", static, name="static")
+    client = TestClient(app, follow_redirects=False)
+    client.cookies.set("marcus_session", auth_service.create_session())
+    return frontend, auth_service, static, client
+
+
+def test_versioned_urls_and_compression(tmp_path):
+    """Versioned URLs are immutable, gzip only when accepted and smaller."""
+    frontend, auth_service, static, client = setup_frontend(tmp_path)
+    app_js = static.manifest.get("app.js")
+
+    html = client.get("/static/index.html").text
+    assert f'src="/static/app.js?v={app_js.version}"' in html
+    assert 'href="/static/missing.js"' in html
+
+    versioned = client.get(f"/static/app.js?v={app_js.version}", headers={"Accept-Encoding": "gzip"})
+    assert versioned.status_code == 200
+    assert versioned.headers["cache-control"] == IMMUTABLE_CACHE
+    assert versioned.headers["content-encoding"] == "gzip"
+    assert versioned.headers["vary"] == "Accept-Encoding"
+    assert int(versioned.headers["content-length"]) == len(gzip.compress(APP_JS.encode(), 9, mtime=0))
+    assert versioned.text == APP_JS
+
+    plain = client.get("/static/app.js", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert plain.headers["cache-control"] == REVALIDATE_CACHE
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == f'"{app_js.version}"'
+    assert plain.headers["content-type"].startswith("text/javascript")
+
+    stale = client.get("/static/app.js?v=0123456789ab")
+    assert stale.headers["cache-control"] == REVALIDATE_CACHE
+
+    tiny = client.get("/static/tiny.css", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in tiny.headers and tiny.text == "body{}"
+
+    print("[PASS] test_versioned_urls_and_compression")
+
+
+def test_not_modified(tmp_path):
+    """Any ETag of the current content -> 304; edited file -> new version."""
+    frontend, auth_service, static, client = setup_frontend(tmp_path)
+    first = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    etag = first.headers["etag"]
+
+    cached = client.get("/static/app.js", headers={"If-None-Match": f'W/"other", {etag}'})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["cache-control"] == REVALIDATE_CACHE
+    assert client.get("/static/app.js", headers={"If-None-Match": '"other"'}).status_code == 200
+
+    # Restart after an edit: new version, old ETag no longer matches
+    frontend, auth_service, restarted, client = setup_frontend(tmp_path, app_js=APP_JS + "main();\n")
+    assert restarted.manifest.get("app.js").version != static.manifest.get("app.js").version
+    assert client.get("/static/app.js", headers={"If-None-Match": etag}).status_code == 200
+
+    print("[PASS] test_not_modified")
+
+
+def test_auth_fast_path(tmp_path):
+    """Every asset is checked against the live session store."""
+    frontend, auth_service, static, client = setup_frontend(tmp_path)
+    token = client.cookies.get("marcus_session")
+
+    for _ in range(3):
+        assert client.get("/static/app.js").status_code == 200
+    assert static.session_token({"headers": [(b"cookie", f"marcus_session={token}".encode())]}) == token
+
+    auth_service.invalidate_session(token)
+    response = client.get("/static/app.js")
+    assert response.status_code == 307 and response.headers["location"] == "/login"
+    assert client.get("/static/login.html").status_code == 200
+
+    anonymous = TestClient(client.app, follow_redirects=False)
+    assert anonymous.get("/static/index.html").status_code == 307
+
+    # Added after startup -> StaticFiles fallback
+    client.cookies.set("marcus_session", auth_service.create_session())
+    (frontend / "late.js").write_text("late();")
+    assert client.get("/static/late.js").text == "late();"
+    assert client.get("/static/nope.js").status_code == 404
+
+    print("[PASS] test_auth_fast_path")
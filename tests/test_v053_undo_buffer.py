@@ -0,0 +1,132 @@
+"""
+Tests for v0.53: Undo ring buffer with write-through persistence
+
+Tests:
+- Recorded actions are written to undo_events and served from the buffer
+  without a SELECT; newest unconsumed, unexpired event wins
+- Undo marks the event consumed in both buffer and table
+- After a restart (buffer reset) unexpired events are recovered once
+- cleanup_expired_events deletes expired rows in one indexed DELETE
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Item, UndoEvent
+from marcus_app.services.undo_service import UndoService, UndoAction, UNDO_BUFFER
+
+
+def setup_test_db():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    # Process-wide buffer: start from this database
+    UNDO_BUFFER.reset()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return engine, SessionLocal, db, statements
+
+
+def service_at(db, now):
+    service = UndoService(db)
+    service.now = now
+    return service
+
+
+def test_last_action_served_from_buffer():
+    """Reads never hit undo_events once the buffer is loaded."""
+    engine, SessionLocal, db, statements = setup_test_db()
+    now = datetime(2026, 3, 1, 12, 0, 0)
+    item = Item(item_type='task', title='Homework')
+    db.add(item)
+    db.commit()
+
+    service_at(db, now).record_action(UndoAction.CREATE_ITEM, {'item_id': item.id}, "Created task: Homework")
+    service_at(db, now + timedelta(seconds=2)).record_action(UndoAction.PIN_ITEM, {'item_id': item.id}, "Pinned")
+    assert db.query(UndoEvent).count() == 2
+
+    statements.clear()
+    last = service_at(db, now + timedelta(seconds=3)).get_last_action()
+    assert last['description'] == "Pinned"
+    assert last['seconds_remaining'] == 9 and last['can_undo']
+    assert service_at(db, now + timedelta(seconds=12)).get_last_action() is None
+    assert service_at(db, now + timedelta(seconds=12)).get_status()['undo_available'] is False
+    assert not any('undo_events' in s for s in statements)
+
+    print("[PASS] test_last_action_served_from_buffer")
+
+
+def test_undo_consumes_event():
+    """Consumed in the table and the buffer; the previous action is next."""
+    engine, SessionLocal, db, statements = setup_test_db()
+    now = datetime.utcnow()
+    item = Item(item_type='task', title='Lab report')
+    db.add(item)
+    db.commit()
+
+    first = service_at(db, now).record_action(UndoAction.CREATE_ITEM, {'item_id': item.id, 'title': 'Lab report'}, "First")
+    second = service_at(db, now).record_action(UndoAction.CREATE_ITEM, {'item_id': item.id, 'title': 'Lab report'}, "Second")
+
+    result = service_at(db, now).undo_last_action()
+    assert result['success'] and result['undone_id'] == item.id
+    assert db.query(UndoEvent).get(int(second)).is_consumed
+    assert service_at(db, now).get_last_action()['id'] == int(first)
+
+    print("[PASS] test_undo_consumes_event")
+
+
+def test_recovery_after_restart():
+    """Unexpired, unconsumed rows come back after the buffer is lost."""
+    engine, SessionLocal, db, statements = setup_test_db()
+    now = datetime(2026, 3, 1, 12, 0, 0)
+    service_at(db, now - timedelta(seconds=30)).record_action(UndoAction.PIN_ITEM, {'item_id': 1}, "Expired")
+    service_at(db, now).record_action(UndoAction.PIN_ITEM, {'item_id': 2}, "Live")
+    service_at(db, now + timedelta(seconds=1)).record_action(UndoAction.PIN_ITEM, {'item_id': 3}, "Consumed")
+    db.query(UndoEvent).filter(UndoEvent.description == "Consumed").update({UndoEvent.is_consumed: True})
+    db.commit()
+
+    UNDO_BUFFER.reset()
+    other = SessionLocal()
+    statements.clear()
+    assert service_at(other, now + timedelta(seconds=2)).get_last_action()['description'] == "Live"
+    assert service_at(other, now + timedelta(seconds=3)).get_last_action()['description'] == "Live"
+    assert sum(1 for s in statements if 'FROM undo_events' in s) == 1
+    assert len(UNDO_BUFFER) == 1
+
+    # Recording before any read recovers first, so the new event stays newest
+    UNDO_BUFFER.reset()
+    service_at(other, now + timedelta(seconds=4)).record_action(UndoAction.PIN_ITEM, {'item_id': 4}, "Newest")
+    assert service_at(other, now + timedelta(seconds=5)).get_last_action()['description'] == "Newest"
+    assert len(UNDO_BUFFER) == 2
+
+    print("[PASS] test_recovery_after_restart")
+
+
+def test_sweeper_bulk_deletes_expired_rows():
+    """One DELETE using the expires_at index; buffer pruned as well."""
+    engine, SessionLocal, db, statements = setup_test_db()
+    start = datetime(2026, 3, 1, 12, 0, 0)
+    for i in range(20):
+        service_at(db, start + timedelta(seconds=i)).record_action(UndoAction.PIN_ITEM, {'item_id': i}, f"Pin {i}")
+
+    statements.clear()
+    deleted = service_at(db, start + timedelta(seconds=25.5)).cleanup_expired_events()
+    assert deleted == 16
+    assert len([s for s in statements if s.lstrip().upper().startswith('DELETE FROM UNDO_EVENTS')]) == 1
+    assert db.query(UndoEvent).count() == 4
+    assert len(UNDO_BUFFER) == 4
+
+    plan = db.execute(text(
+        "EXPLAIN QUERY PLAN DELETE FROM undo_events WHERE expires_at < :now"
+    ), {"now": start}).fetchall()
+    assert any('ix_undo_events_expires_at' in str(row) for row in plan)
+
+    print("[PASS] test_sweeper_bulk_deletes_expired_rows")
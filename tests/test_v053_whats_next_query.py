@@ -0,0 +1,136 @@
+"""
+Tests for v0.53: Single-query "What's next" ranking
+
+Covers the ordering rules of test_v048_whats_next_determinism.py against
+the current Item/Mission models:
+- Overdue first, then due within 48h (by due date), then pinned inbox,
+  blocked missions with a runnable box, active tasks (newest first)
+- Same database state -> same ranking
+- Only future items -> top N in due date order
+Plus:
+- One SQL statement per call, whatever the item count
+- An item is listed once, under its highest-priority reason
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from marcus_app.core.models import Base, Item, Mission, MissionBox
+from marcus_app.services.next_action_service import NextActionService
+
+
+def setup_test_db():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)()
+
+
+def add_item(db, title, **fields):
+    fields.setdefault('item_type', 'task')
+    fields.setdefault('status', 'active')
+    item = Item(title=title, **fields)
+    db.add(item)
+    db.commit()
+    return item.id
+
+
+def ranking(db, limit=10):
+    return [(i['title'], i['reason']) for i in NextActionService(db).get_next_actions(limit=limit)['items']]
+
+
+def test_rank_order_across_reasons():
+    """overdue > due soon > pinned > blocked mission > not started."""
+    engine, db = setup_test_db()
+    now = datetime.utcnow()
+
+    add_item(db, "Plain task")
+    add_item(db, "Pinned note", item_type='note', status='inbox', pinned=1)
+    add_item(db, "Due later", due_at=now + timedelta(days=5))
+    add_item(db, "Due in 24h", due_at=now + timedelta(hours=24))
+    add_item(db, "Due in 2h", due_at=now + timedelta(hours=2))
+    add_item(db, "Past due", due_at=now - timedelta(days=1))
+    add_item(db, "Done overdue", status='done', due_at=now - timedelta(days=2))
+
+    blocked = Mission(name="Blocked mission", mission_type="exam_prep", state="blocked")
+    finished = Mission(name="Blocked, nothing to run", mission_type="exam_prep", state="blocked")
+    db.add_all([blocked, finished])
+    db.flush()
+    db.add(MissionBox(mission_id=blocked.id, box_type='ask', order_index=0, state='idle'))
+    db.add(MissionBox(mission_id=finished.id, box_type='ask', order_index=0, state='done'))
+    db.commit()
+
+    assert ranking(db) == [
+        ("Past due", "overdue"),
+        ("Due in 2h", "due_soon"),
+        ("Due in 24h", "due_soon"),
+        ("Pinned note", "pinned_inbox"),
+        ("Blocked mission", "blocked_mission"),
+        ("Due later", "not_started"),
+        ("Plain task", "not_started"),
+    ]
+
+    result = NextActionService(db).get_next_actions()
+    assert [i['title'] for i in result['items']] == ["Past due", "Due in 2h", "Due in 24h"]
+    assert result['summary'] == "1 overdue, 2 due soon"
+    assert result['recommended_action']['actions'][0]['target'].startswith("/tasks/")
+
+    print("[PASS] test_rank_order_across_reasons")
+
+
+def test_items_listed_once_under_best_reason():
+    """A pinned, overdue inbox task appears only as overdue."""
+    engine, db = setup_test_db()
+    now = datetime.utcnow()
+    add_item(db, "Pinned and overdue", status='inbox', pinned=1, due_at=now - timedelta(hours=1))
+    add_item(db, "Active and due soon", due_at=now + timedelta(hours=1))
+
+    assert ranking(db) == [("Pinned and overdue", "overdue"), ("Active and due soon", "due_soon")]
+
+    print("[PASS] test_items_listed_once_under_best_reason")
+
+
+def test_deterministic_and_future_due_order():
+    """Repeated calls agree; only-future items come back by due date."""
+    engine, db = setup_test_db()
+    now = datetime.utcnow()
+    for days in (4, 1, 5, 3, 2):
+        add_item(db, f"Day {days}", due_at=now + timedelta(days=days, hours=1))
+
+    first = NextActionService(db).get_next_actions(limit=3)
+    second = NextActionService(db).get_next_actions(limit=3)
+    assert first['items'] == second['items']
+
+    # Only "Day 1" falls in the 48h window; the rest are active tasks by recency
+    assert [i['title'] for i in first['items']] == ["Day 1", "Day 2", "Day 3"]
+
+    print("[PASS] test_deterministic_and_future_due_order")
+
+
+def test_one_statement_per_call():
+    """Five reasons, any number of rows -> a single SELECT."""
+    engine, db = setup_test_db()
+    now = datetime.utcnow()
+    for i in range(200):
+        add_item(db, f"Task {i}", due_at=now + timedelta(hours=i - 50), pinned=i % 7 == 0)
+    for i in range(5):
+        mission = Mission(name=f"Mission {i}", mission_type="exam_prep", state="blocked")
+        db.add(mission)
+        db.flush()
+        db.add(MissionBox(mission_id=mission.id, box_type='ask', order_index=0, state='idle'))
+    db.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    result = NextActionService(db).get_next_actions(limit=5)
+
+    assert len(statements) == 1
+    assert 'UNION ALL' in statements[0]
+    assert [i['reason'] for i in result['items']] == ['overdue'] * 5
+    assert [i['title'] for i in result['items']] == [f"Task {i}" for i in range(5)]
+
+    print("[PASS] test_one_statement_per_call")
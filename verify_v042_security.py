@@ -87,7 +87,7 @@ if check_file_contains(
     "marcus_app/backend/dev_mode_routes.py",
     [
         "/git/push",
-        "async def push_branch",
+        "def push_branch",
         "require_online_mode",
         "subprocess.run"
     ],
@@ -102,7 +102,7 @@ if check_file_contains(
     "marcus_app/backend/dev_mode_routes.py",
     [
         "/github/create-pr",
-        "async def create_pull_request",
+        "def create_pull_request",
         "require_online_mode",
         "gh_available"
     ],